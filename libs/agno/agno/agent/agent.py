@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from collections import ChainMap, defaultdict, deque
 from dataclasses import asdict, dataclass
+from functools import partial
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -25,13 +28,15 @@ from typing import (
 from uuid import uuid4
 
 from pydantic import BaseModel
+from typing_extensions import TypeGuard
 
+import agno.knowledge
+import agno.memory
 from agno.agent.metrics import SessionMetrics
 from agno.exceptions import ModelProviderError, StopAgentRun
-from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
-from agno.memory.agent import AgentMemory, AgentRun
 from agno.memory.v2.memory import Memory, SessionSummary
+from agno.memory.v2.runs import SessionRuns
 from agno.memory.v2.schema import UserMemory
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageMetrics, MessageReferences
@@ -50,6 +55,8 @@ from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.tracing.exporter import SpanExporter, export_trace
+from agno.tracing.span import NOOP_SPAN, Span, atrace_iterator, span, start_trace, trace_iterator
 from agno.utils.events import (
     create_memory_update_completed_event,
     create_memory_update_started_event,
@@ -90,6 +97,17 @@ from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
 
+# Knowledge and memory v1 are only imported when they are used. The annotations of Agent refer to them through
+# their lazy package exports, so they can still be resolved with typing.get_type_hints.
+if TYPE_CHECKING:
+    from agno.memory.agent import AgentMemory
+
+
+def _is_agent_memory(memory: Any) -> TypeGuard["AgentMemory"]:
+    """Check if the memory is an AgentMemory (memory v1) without importing agno.memory.agent if it was never used"""
+    agent_memory_module = sys.modules.get("agno.memory.agent")
+    return agent_memory_module is not None and isinstance(memory, agent_memory_module.AgentMemory)
+
 
 @dataclass(init=False)
 class Agent:
@@ -126,7 +144,7 @@ class Agent:
     resolve_context: bool = True
 
     # --- Agent Memory ---
-    memory: Optional[Union[AgentMemory, Memory]] = None
+    memory: Optional[Union[agno.memory.AgentMemory, Memory]] = None
     # Enable the agent to manage memories of the user
     enable_agentic_memory: bool = False
     # If True, the agent creates/updates user memories at the end of runs
@@ -147,7 +165,7 @@ class Agent:
     num_history_runs: int = 3
 
     # --- Agent Knowledge ---
-    knowledge: Optional[AgentKnowledge] = None
+    knowledge: Optional[agno.knowledge.AgentKnowledge] = None
     # Enable RAG by adding references from AgentKnowledge to the user prompt.
     # Add knowledge_filters to the Agent class attributes
     knowledge_filters: Optional[Dict[str, Any]] = None
@@ -175,6 +193,9 @@ class Agent:
     show_tool_calls: bool = True
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from a single model response to run in parallel (sync runs only).
+    # Async runs always run tool calls concurrently.
+    max_parallel_tool_calls: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -327,6 +348,10 @@ class Agent:
     # telemetry=True logs minimal telemetry for analytics
     # This helps us improve the Agent and provide better support
     telemetry: bool = True
+    # tracing=True records the timings of the phases of each run in RunResponse.trace
+    tracing: bool = False
+    # Exporters that receive the trace of each run, e.g. to send it to OpenTelemetry
+    span_exporters: Optional[List[SpanExporter]] = None
 
     def __init__(
         self,
@@ -344,7 +369,7 @@ class Agent:
         context: Optional[Dict[str, Any]] = None,
         add_context: bool = False,
         resolve_context: bool = True,
-        memory: Optional[Union[AgentMemory, Memory]] = None,
+        memory: Optional[Union[agno.memory.AgentMemory, Memory]] = None,
         enable_agentic_memory: bool = False,
         enable_user_memories: bool = False,
         add_memory_references: Optional[bool] = None,
@@ -353,7 +378,7 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
-        knowledge: Optional[AgentKnowledge] = None,
+        knowledge: Optional[agno.knowledge.AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
         add_references: bool = False,
@@ -364,6 +389,7 @@ class Agent:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         reasoning: bool = False,
@@ -417,6 +443,8 @@ class Agent:
         debug_mode: bool = False,
         monitoring: bool = False,
         telemetry: bool = True,
+        tracing: bool = False,
+        span_exporters: Optional[List[SpanExporter]] = None,
     ):
         self.model = model
         self.name = name
@@ -458,6 +486,7 @@ class Agent:
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        self.max_parallel_tool_calls = max_parallel_tool_calls
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -527,6 +556,8 @@ class Agent:
         self.debug_mode = debug_mode
         self.monitoring = monitoring
         self.telemetry = telemetry
+        self.tracing = tracing
+        self.span_exporters = span_exporters
 
         # --- Params not to be set by user ---
         self.session_metrics: Optional[SessionMetrics] = None
@@ -554,6 +585,9 @@ class Agent:
 
         self._memory_deepcopy_done: bool = False
 
+        # Root span of the current run, a no-op span if tracing is disabled
+        self._run_trace: Span = NOOP_SPAN
+
     def set_agent_id(self) -> str:
         if self.agent_id is None:
             self.agent_id = str(uuid4())
@@ -626,6 +660,21 @@ class Agent:
         self.run_input = None
         self.run_messages = None
         self.run_response = None
+        self._run_trace = NOOP_SPAN
+
+    def _start_run_trace(self) -> Span:
+        """Start the trace of a run. It is nested in the current span if the Agent runs inside a traced run."""
+        self._run_trace = start_trace("agent.run", enabled=self.tracing, agent_id=self.agent_id, agent_name=self.name)
+        return self._run_trace
+
+    def _end_run_trace(self, run_response: RunResponse) -> None:
+        """End the trace of the run, add it to the run response and export it"""
+        trace, self._run_trace = self._run_trace, NOOP_SPAN
+        if not trace.is_recording:
+            return
+        trace.set_attribute("run_id", run_response.run_id)
+        export_trace(trace, self.span_exporters)
+        run_response.trace = trace.to_dict()
 
     def initialize_agent(self) -> None:
         self.set_defaults()
@@ -688,6 +737,7 @@ class Agent:
         7. Save output to file if save_response_to_file is set
         """
         log_debug(f"Agent Run Start: {run_response.run_id}", center=True)
+        trace = self._run_trace
 
         # 1. Reason about the task
         self._handle_reasoning(run_messages=run_messages)
@@ -698,24 +748,27 @@ class Agent:
 
         # 2. Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
-        model_response: ModelResponse = self.model.response(
-            messages=run_messages.messages,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-            response_format=response_format,
-        )
+        with trace.span("model.response"):
+            model_response: ModelResponse = self.model.response(
+                messages=run_messages.messages,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                max_parallel_tool_calls=self.max_parallel_tool_calls,
+                response_format=response_format,
+            )
 
         # If a parser model is provided, structure the response separately
         if self.parser_model is not None:
             if self.response_model is not None:
                 parser_response_format = self._get_response_format(self.parser_model)
                 messages_for_parser_model = self.get_messages_for_parser_model(model_response, parser_response_format)
-                parser_model_response: ModelResponse = self.parser_model.response(
-                    messages=messages_for_parser_model,
-                    response_format=parser_response_format,
-                )
+                with trace.span("parser_model.response"):
+                    parser_model_response: ModelResponse = self.parser_model.response(
+                        messages=messages_for_parser_model,
+                        response_format=parser_response_format,
+                    )
                 parser_model_response_message: Optional[Message] = None
                 for message in reversed(messages_for_parser_model):
                     if message.role == "assistant":
@@ -747,19 +800,21 @@ class Agent:
             )
 
         # 4. Update Agent Memory
-        response_iterator = self._update_memory(
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
-        )
-        # Consume the response iterator to ensure the memory is updated before the run is completed
-        deque(response_iterator, maxlen=0)
+        with trace.span("memory.update"):
+            response_iterator = self._update_memory(
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+            )
+            # Consume the response iterator to ensure the memory is updated before the run is completed
+            deque(response_iterator, maxlen=0)
 
         # 5. Calculate session metrics
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        with trace.span("storage.write"):
+            self.write_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -771,6 +826,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
         return run_response
 
@@ -795,6 +851,7 @@ class Agent:
         7. Save session to storage
         """
         log_debug(f"Agent Run Start: {run_response.run_id}", center=True)
+        trace = self._run_trace
 
         # Start the Run by yielding a RunStarted event
         if stream_intermediate_steps:
@@ -808,13 +865,15 @@ class Agent:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Process model response
-        for event in self._handle_model_response_stream(
-            run_response=run_response,
-            run_messages=run_messages,
-            response_format=response_format,
-            stream_intermediate_steps=stream_intermediate_steps,
-        ):
-            yield event
+        yield from trace_iterator(
+            trace.span("model.response"),
+            self._handle_model_response_stream(
+                run_response=run_response,
+                run_messages=run_messages,
+                response_format=response_format,
+                stream_intermediate_steps=stream_intermediate_steps,
+            ),
+        )
 
         # 3. Add the run to memory
         self._add_run_to_memory(
@@ -832,11 +891,14 @@ class Agent:
             return
 
         # 4. Update Agent Memory
-        yield from self._update_memory(
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
-            stream_intermediate_steps=stream_intermediate_steps,
+        yield from trace_iterator(
+            trace.span("memory.update"),
+            self._update_memory(
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+                stream_intermediate_steps=stream_intermediate_steps,
+            ),
         )
 
         # 5. Calculate session metrics
@@ -849,12 +911,14 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(from_run_response=run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        with trace.span("storage.write"):
+            self.write_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         self._log_agent_run(user_id=user_id, session_id=session_id)
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
     @overload
     def run(
@@ -922,6 +986,9 @@ class Agent:
         # Initialize the Agent
         self.initialize_agent()
 
+        # Start the trace of the run, a no-op if tracing is disabled
+        trace = self._start_run_trace()
+
         # Initialize Session
         # Use the default user_id and session_id when necessary
         user_id = user_id if user_id is not None else self.user_id
@@ -979,7 +1046,8 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        with trace.span("storage.read"):
+            self.read_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -995,13 +1063,14 @@ class Agent:
         response_format = self._get_response_format() if self.parser_model is None else None
         self.model = cast(Model, self.model)
 
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=False,
-            knowledge_filters=effective_filters,
-        )
+        with trace.span("tools.determine"):
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=False,
+                knowledge_filters=effective_filters,
+            )
 
         # Create a run_id for this specific run
         run_id = str(uuid4())
@@ -1041,18 +1110,19 @@ class Agent:
                     self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
 
                 # Prepare run messages
-                run_messages: RunMessages = self.get_run_messages(
-                    message=message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    audio=audio,
-                    images=images,
-                    videos=videos,
-                    files=files,
-                    messages=messages,
-                    knowledge_filters=effective_filters,
-                    **kwargs,
-                )
+                with trace.span("messages.build"):
+                    run_messages: RunMessages = self.get_run_messages(
+                        message=message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        audio=audio,
+                        images=images,
+                        videos=videos,
+                        files=files,
+                        messages=messages,
+                        knowledge_filters=effective_filters,
+                        **kwargs,
+                    )
                 if len(run_messages.messages) == 0:
                     log_error("No messages to be sent to the model.")
 
@@ -1135,6 +1205,7 @@ class Agent:
         7. Save output to file if save_response_to_file is set
         """
         log_debug(f"Agent Run Start: {run_response.run_id}", center=True)
+        trace = self._run_trace
 
         self.model = cast(Model, self.model)
         # 1. Reason about the task if reasoning is enabled
@@ -1145,24 +1216,26 @@ class Agent:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Generate a response from the Model (includes running function calls)
-        model_response: ModelResponse = await self.model.aresponse(
-            messages=run_messages.messages,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-            response_format=response_format,
-        )
+        with trace.span("model.response"):
+            model_response: ModelResponse = await self.model.aresponse(
+                messages=run_messages.messages,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                response_format=response_format,
+            )
 
         # If a parser model is provided, structure the response separately
         if self.parser_model is not None:
             if self.response_model is not None:
                 parser_response_format = self._get_response_format(self.parser_model)
                 messages_for_parser_model = self.get_messages_for_parser_model(model_response, parser_response_format)
-                parser_model_response: ModelResponse = await self.parser_model.aresponse(
-                    messages=messages_for_parser_model,
-                    response_format=parser_response_format,
-                )
+                with trace.span("parser_model.response"):
+                    parser_model_response: ModelResponse = await self.parser_model.aresponse(
+                        messages=messages_for_parser_model,
+                        response_format=parser_response_format,
+                    )
                 parser_model_response_message: Optional[Message] = None
                 for message in reversed(messages_for_parser_model):
                     if message.role == "assistant":
@@ -1194,18 +1267,20 @@ class Agent:
             )
 
         # 4. Update Agent Memory
-        async for _ in self._aupdate_memory(
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
-        ):
-            pass
+        with trace.span("memory.update"):
+            async for _ in self._aupdate_memory(
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+            ):
+                pass
 
         # 5. Calculate session metrics
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        with trace.span("storage.write"):
+            await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -1217,6 +1292,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
         return run_response
 
@@ -1241,6 +1317,8 @@ class Agent:
         7. Save session to storage
         """
         log_debug(f"Agent Run Start: {run_response.run_id}", center=True)
+        trace = self._run_trace
+
         # Start the Run by yielding a RunStarted event
         if stream_intermediate_steps:
             yield self._handle_event(create_run_response_started_event(run_response), run_response)
@@ -1254,11 +1332,14 @@ class Agent:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Generate a response from the Model
-        async for event in self._ahandle_model_response_stream(
-            run_response=run_response,
-            run_messages=run_messages,
-            response_format=response_format,
-            stream_intermediate_steps=stream_intermediate_steps,
+        async for event in atrace_iterator(
+            trace.span("model.response"),
+            self._ahandle_model_response_stream(
+                run_response=run_response,
+                run_messages=run_messages,
+                response_format=response_format,
+                stream_intermediate_steps=stream_intermediate_steps,
+            ),
         ):
             yield event
 
@@ -1279,11 +1360,14 @@ class Agent:
             return
 
         # 4. Update Agent Memory
-        async for event in self._aupdate_memory(
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
-            stream_intermediate_steps=stream_intermediate_steps,
+        async for event in atrace_iterator(
+            trace.span("memory.update"),
+            self._aupdate_memory(
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+                stream_intermediate_steps=stream_intermediate_steps,
+            ),
         ):
             yield event
 
@@ -1297,12 +1381,14 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(from_run_response=run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        with trace.span("storage.write"):
+            await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
     async def arun(
         self,
@@ -1331,6 +1417,9 @@ class Agent:
         # Initialize the Agent
         self.initialize_agent()
 
+        # Start the trace of the run, a no-op if tracing is disabled
+        trace = self._start_run_trace()
+
         # Initialize Session
         # Use the default user_id and session_id when necessary
         user_id = user_id if user_id is not None else self.user_id
@@ -1387,7 +1476,8 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        with trace.span("storage.read"):
+            await self.aread_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -1403,13 +1493,14 @@ class Agent:
         response_format = self._get_response_format() if self.parser_model is None else None
         self.model = cast(Model, self.model)
 
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=True,
-            knowledge_filters=effective_filters,
-        )
+        with trace.span("tools.determine"):
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=True,
+                knowledge_filters=effective_filters,
+            )
 
         # Create a run_id for this specific run
         run_id = str(uuid4())
@@ -1449,18 +1540,19 @@ class Agent:
                     self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
 
                 # Prepare run messages
-                run_messages: RunMessages = self.get_run_messages(
-                    message=message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    audio=audio,
-                    images=images,
-                    videos=videos,
-                    files=files,
-                    messages=messages,
-                    knowledge_filters=effective_filters,
-                    **kwargs,
-                )
+                with trace.span("messages.build"):
+                    run_messages: RunMessages = self.get_run_messages(
+                        message=message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        audio=audio,
+                        images=images,
+                        videos=videos,
+                        files=files,
+                        messages=messages,
+                        knowledge_filters=effective_filters,
+                        **kwargs,
+                    )
                 if len(run_messages.messages) == 0:
                     log_error("No messages to be sent to the model.")
 
@@ -1661,7 +1753,7 @@ class Agent:
 
             if isinstance(self.memory, Memory):
                 runs = self.memory.get_runs(session_id=session_id)
-                run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
+                run_response = next((r for r in reversed(runs) if r.run_id == run_id), None)  # type: ignore
             else:
                 runs = self.memory.runs  # type: ignore
                 run_response = next((r for r in runs if r.response.run_id == run_id), None)  # type: ignore
@@ -1820,6 +1912,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -2039,7 +2132,7 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2054,7 +2147,7 @@ class Agent:
 
             if isinstance(self.memory, Memory):
                 runs = self.memory.get_runs(session_id=session_id)
-                run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
+                run_response = next((r for r in reversed(runs) if r.run_id == run_id), None)  # type: ignore
             else:
                 runs = self.memory.runs  # type: ignore
                 run_response = next((r for r in runs if r.response.run_id == run_id), None)  # type: ignore
@@ -2250,7 +2343,7 @@ class Agent:
         self._set_session_metrics(run_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -2343,7 +2436,7 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -2373,6 +2466,7 @@ class Agent:
 
         # Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
+        self._end_run_trace(run_response)
 
         # We return and await confirmation/completion for the tools that require it
         return run_response
@@ -2408,6 +2502,7 @@ class Agent:
         self._log_agent_run(user_id=user_id, session_id=session_id)
 
         log_debug(f"Agent Run Paused: {run_response.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
     def _convert_response_to_structured_format(self, run_response: RunResponse):
         # Convert the response to the structured format if needed
@@ -2775,12 +2870,12 @@ class Agent:
         session_id: str,
         index_of_last_user_message: int = 0,
     ):
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Add the system message to the memory
             if run_messages.system_message is not None:
                 self.memory.add_system_message(
@@ -2798,6 +2893,8 @@ class Agent:
             if len(messages_for_memory) > 0:
                 self.memory.add_messages(messages=messages_for_memory)
 
+            from agno.memory.agent import AgentRun
+
             # Create an AgentRun object to add to memory
             agent_run = AgentRun(response=run_response)
             agent_run.message = run_messages.user_message
@@ -2833,12 +2930,12 @@ class Agent:
             self.memory.add_run(session_id=session_id, run=run_response)
 
     def _set_session_metrics(self, run_messages: RunMessages):
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Calculate session metrics
             self.session_metrics = self.calculate_metrics(self.memory.messages)
         elif isinstance(self.memory, Memory):
@@ -2858,12 +2955,12 @@ class Agent:
         stream_intermediate_steps: bool = False,
     ) -> Iterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Update the memories with the user message if needed
             if (
                 self.memory.create_user_memories
@@ -2919,12 +3016,12 @@ class Agent:
         stream_intermediate_steps: bool = False,
     ) -> AsyncIterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Update the memories with the user message if needed
             if (
                 self.memory.create_user_memories
@@ -2990,6 +3087,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
         ):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
@@ -3594,7 +3692,7 @@ class Agent:
             )
             self._rebuild_tools = True
 
-        if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
+        if _is_agent_memory(self.memory) and self.memory.create_user_memories:
             agent_tools.append(self.update_memory)
         elif isinstance(self.memory, Memory) and self.enable_agentic_memory:
             agent_tools.append(self.get_update_user_memory_function(user_id=user_id, async_mode=async_mode))
@@ -3726,6 +3824,14 @@ class Agent:
                         except Exception as e:
                             log_warning(f"Could not add tool {tool}: {e}")
 
+    def get_tool_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns the cache hits and misses of each tool that caches its results"""
+        return {
+            name: function.get_cache_stats()
+            for name, function in (self._functions_for_model or {}).items()
+            if function.cache_results
+        }
+
     def _model_should_return_structured_output(self):
         self.model = cast(Model, self.model)
         return bool(
@@ -3847,8 +3953,8 @@ class Agent:
 
         """Get an AgentSession object, which can be saved to the database"""
         if self.memory is not None:
-            if isinstance(self.memory, AgentMemory):
-                self.memory = cast(AgentMemory, self.memory)
+            if _is_agent_memory(self.memory):
+                self.memory = cast("AgentMemory", self.memory)
                 memory_dict = self.memory.to_dict()
                 # We only persist the runs for the current session ID (not all runs in memory)
                 memory_dict["runs"] = [
@@ -3861,7 +3967,11 @@ class Agent:
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 run_responses = self.memory.runs.get(session_id, [])  # type: ignore
                 memory_dict = self.memory.to_dict()
-                memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                memory_dict["runs"] = (
+                    run_responses.to_dicts()
+                    if isinstance(run_responses, SessionRuns)
+                    else [rr.to_dict() for rr in run_responses]
+                )
         else:
             memory_dict = None
 
@@ -3977,23 +4087,28 @@ class Agent:
         if self.memory is None:
             self.memory = session.memory  # type: ignore
 
-        if not (isinstance(self.memory, AgentMemory) or isinstance(self.memory, Memory)):
+        if not (_is_agent_memory(self.memory) or isinstance(self.memory, Memory)):
             # Is it a dict of `AgentMemory`?
             if isinstance(self.memory, dict) and "create_user_memories" in self.memory:
+                from agno.memory.agent import AgentMemory
+
                 # Convert dict to AgentMemory
                 self.memory = AgentMemory(**self.memory)
                 # Convert dict to Memory
             elif isinstance(self.memory, dict):
                 memory_dict = self.memory
                 memory_dict.pop("runs")
+                memory_dict.pop("run_ids", None)
                 self.memory = Memory(**memory_dict)
             else:
                 raise TypeError(f"Expected memory to be a dict or AgentMemory, but got {type(self.memory)}")
 
         if session.memory is not None:
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 try:
                     if "runs" in session.memory:
+                        from agno.memory.agent import AgentRun
+
                         try:
                             self.memory.runs = []
                             for run in session.memory["runs"]:
@@ -4037,13 +4152,21 @@ class Agent:
                     try:
                         if self.memory.runs is None:
                             self.memory.runs = {}
-                        self.memory.runs[session.session_id] = []
-                        for run in session.memory["runs"]:
-                            run_session_id = run["session_id"]
-                            if "team_id" in run:
-                                self.memory.runs[run_session_id].append(TeamRunResponse.from_dict(run))
-                            else:
-                                self.memory.runs[run_session_id].append(RunResponse.from_dict(run))
+                        if self.storage is not None and self.storage.separate_runs:
+                            # Runs are deserialized when used, and runs that were not read are loaded from storage
+                            self.memory.runs[session.session_id] = SessionRuns(
+                                runs=session.memory["runs"],
+                                run_ids=session.memory.get("run_ids"),
+                                loader=partial(self.storage.read_runs, session.session_id),
+                            )
+                        else:
+                            self.memory.runs[session.session_id] = []
+                            for run in session.memory["runs"]:
+                                run_session_id = run["session_id"]
+                                if "team_id" in run:
+                                    self.memory.runs[run_session_id].append(TeamRunResponse.from_dict(run))
+                                else:
+                                    self.memory.runs[run_session_id].append(RunResponse.from_dict(run))
                     except Exception as e:
                         log_warning(f"Failed to load runs from memory: {e}")
                 if "memories" in session.memory:
@@ -4093,7 +4216,40 @@ class Agent:
         """
         if self.storage is not None:
             # Get a single session from storage
-            self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            if self.storage.separate_runs and isinstance(self.memory, Memory):
+                # Only read the runs used for history, older runs are loaded from storage when needed
+                self.agent_session = cast(
+                    AgentSession,
+                    self.storage.read(session_id=session_id, last_n_runs=self.num_history_runs),  # type: ignore
+                )
+            else:
+                self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            if self.agent_session is not None:
+                # Load the agent session
+                self.load_agent_session(session=self.agent_session)
+        return self.agent_session
+
+    async def aread_from_storage(
+        self,
+        session_id: str,
+    ) -> Optional[AgentSession]:
+        """Load the AgentSession from storage, without blocking the event loop
+
+        Args:
+            session_id: The session_id to load from storage.
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None:
+            if self.storage.separate_runs and isinstance(self.memory, Memory):
+                # Only read the runs used for history, older runs are loaded from storage when needed
+                self.agent_session = cast(
+                    AgentSession,
+                    await self.storage.aread(session_id=session_id, last_n_runs=self.num_history_runs),
+                )
+            else:
+                self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
             if self.agent_session is not None:
                 # Load the agent session
                 self.load_agent_session(session=self.agent_session)
@@ -4112,10 +4268,25 @@ class Agent:
             )
         return self.agent_session
 
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Save the AgentSession to storage, without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.agent_session = cast(
+                AgentSession,
+                await self.storage.aupsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+            )
+        return self.agent_session
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
+            from agno.memory.agent import AgentRun
+
             if introduction is not None:
                 # Add an introduction as the first response from the Agent
                 if len(self.memory.runs) == 0:
@@ -4178,7 +4349,7 @@ class Agent:
         """
         self.agent_session = None
         if self.memory is not None:
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 self.memory.clear()
             elif isinstance(self.memory, Memory):
                 self.memory.clear()
@@ -4413,7 +4584,7 @@ class Agent:
             system_message_content += "Stop running when the success_criteria is met.\n\n"
         # 3.3.10 Then add memories to the system prompt
         if self.memory:
-            if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
+            if _is_agent_memory(self.memory) and self.memory.create_user_memories:
                 if self.memory.memories and len(self.memory.memories) > 0:
                     system_message_content += (
                         "You have access to memories from previous interactions with the user that you can use:\n\n"
@@ -4438,7 +4609,8 @@ class Agent:
             elif isinstance(self.memory, Memory) and self.add_memory_references:
                 if not user_id:
                     user_id = "default"
-                user_memories = self.memory.get_user_memories(user_id=user_id)  # type: ignore
+                with span("memory.retrieve"):
+                    user_memories = self.memory.get_user_memories(user_id=user_id)  # type: ignore
                 if user_memories and len(user_memories) > 0:
                     system_message_content += (
                         "You have access to memories from previous interactions with the user that you can use:\n\n"
@@ -4470,7 +4642,7 @@ class Agent:
                     )
 
             # 3.3.11 Then add a summary of the interaction to the system prompt
-            if isinstance(self.memory, AgentMemory) and self.memory.create_session_summary:
+            if _is_agent_memory(self.memory) and self.memory.create_session_summary:
                 if self.memory.summary is not None:
                     system_message_content += "Here is a brief summary of your previous interactions:\n\n"
                     system_message_content += "<summary_of_previous_interactions>\n"
@@ -4701,7 +4873,8 @@ class Agent:
         self.run_response = cast(RunResponse, self.run_response)
 
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(session_id=session_id, user_id=user_id)
+        with span("system_message"):
+            system_message = self.get_system_message(session_id=session_id, user_id=user_id)
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -4741,7 +4914,7 @@ class Agent:
             from copy import deepcopy
 
             history: List[Message] = []
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 history = self.memory.get_messages_from_last_n_runs(
                     last_n=self.num_history_runs, skip_role=self.system_message_role
                 )
@@ -4879,7 +5052,7 @@ class Agent:
             if user_id is None:
                 user_id = "default"
             return self.memory.get_session_summary(session_id=session_id, user_id=user_id)
-        elif isinstance(self.memory, AgentMemory):
+        elif _is_agent_memory(self.memory):
             return self.memory.summary
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
@@ -4894,7 +5067,7 @@ class Agent:
 
         if isinstance(self.memory, Memory):
             return self.memory.get_user_memories(user_id=user_id)
-        elif isinstance(self.memory, AgentMemory):
+        elif _is_agent_memory(self.memory):
             raise ValueError("AgentMemory does not support get_user_memories")
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
@@ -4910,13 +5083,16 @@ class Agent:
         """
         from dataclasses import fields
 
+        from agno.utils.common import split_init_kwargs
+
         # Do not copy agent_session and session_name to the new agent
         excluded_fields = ["agent_session"]
         # Extract the fields to set for the new Agent
         fields_for_new_agent: Dict[str, Any] = {}
 
         for f in fields(self):
-            if f.name in excluded_fields:
+            # Fields that are updated are not copied
+            if f.name in excluded_fields or (update and f.name in update):
                 continue
             field_value = getattr(self, f.name)
             if field_value is not None:
@@ -4925,8 +5101,12 @@ class Agent:
         # Update fields if provided
         if update:
             fields_for_new_agent.update(update)
+        # Fields that are not arguments of __init__ (e.g. team_id) are set on the new Agent
+        init_kwargs, attributes = split_init_kwargs(self.__class__, fields_for_new_agent)
         # Create a new Agent
-        new_agent = self.__class__(**fields_for_new_agent)
+        new_agent = self.__class__(**init_kwargs)
+        for field_name, field_value in attributes.items():
+            setattr(new_agent, field_name, field_value)
         log_debug(f"Created new {self.__class__.__name__}")
         return new_agent
 
@@ -4938,6 +5118,10 @@ class Agent:
         if field_name in ("memory", "reasoning_agent"):
             return field_value.deep_copy()
 
+        # Span exporters are shared, so copies export to the same destination
+        elif field_name == "span_exporters":
+            return copy(field_value)
+
         # For storage, model and reasoning_model, use a deep copy
         elif field_name in ("storage", "model", "reasoning_model"):
             try:
@@ -5139,7 +5323,8 @@ class Agent:
                 if "filters" in sig.parameters:
                     retriever_kwargs["filters"] = filters
                 retriever_kwargs.update({"query": query, "num_documents": num_documents, **kwargs})
-                return self.retriever(**retriever_kwargs)
+                with span("knowledge.search", retriever=True):
+                    return self.retriever(**retriever_kwargs)
             except Exception as e:
                 log_warning(f"Retriever failed: {e}")
                 raise e
@@ -5156,9 +5341,10 @@ class Agent:
                 num_documents = self.knowledge.num_documents
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = self.knowledge.search(
-                query=query, num_documents=num_documents, filters=filters
-            )
+            with span("knowledge.search", num_documents=num_documents):
+                relevant_docs: List[Document] = self.knowledge.search(
+                    query=query, num_documents=num_documents, filters=filters
+                )
 
             if not relevant_docs or len(relevant_docs) == 0:
                 log_debug("No relevant documents found for query")
@@ -5200,10 +5386,11 @@ class Agent:
                 if "filters" in sig.parameters:
                     retriever_kwargs["filters"] = filters
                 retriever_kwargs.update({"query": query, "num_documents": num_documents, **kwargs})
-                result = self.retriever(**retriever_kwargs)
+                with span("knowledge.search", retriever=True):
+                    result = self.retriever(**retriever_kwargs)
 
-                if isawaitable(result):
-                    result = await result
+                    if isawaitable(result):
+                        result = await result
 
                 return result
             except Exception as e:
@@ -5222,9 +5409,10 @@ class Agent:
                 num_documents = self.knowledge.num_documents
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = await self.knowledge.async_search(
-                query=query, num_documents=num_documents, filters=filters
-            )
+            with span("knowledge.search", num_documents=num_documents):
+                relevant_docs: List[Document] = await self.knowledge.async_search(
+                    query=query, num_documents=num_documents, filters=filters
+                )
 
             if not relevant_docs or len(relevant_docs) == 0:
                 log_debug("No relevant documents found for query")
@@ -5419,7 +5607,7 @@ class Agent:
 
         gen_session_name_prompt = "Conversation\n"
         messages_for_generating_session_name = []
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             try:
                 message_pairs = self.memory.get_message_pairs()
                 for message_pair in message_pairs[:3]:
@@ -5490,7 +5678,7 @@ class Agent:
         if self.memory is None:
             return []
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             return self.memory.messages
         elif isinstance(self.memory, Memory):
             return self.memory.get_messages_from_last_n_runs(
@@ -5547,27 +5735,29 @@ class Agent:
 
     def _handle_reasoning(self, run_messages: RunMessages) -> None:
         if self.reasoning or self.reasoning_model is not None:
-            reasoning_generator = self.reason(run_messages=run_messages)
+            with self._run_trace.span("reasoning"):
+                reasoning_generator = self.reason(run_messages=run_messages)
 
-            # Consume the generator without yielding
-            deque(reasoning_generator, maxlen=0)
+                # Consume the generator without yielding
+                deque(reasoning_generator, maxlen=0)
 
     def _handle_reasoning_stream(self, run_messages: RunMessages) -> Iterator[RunResponseEvent]:
         if self.reasoning or self.reasoning_model is not None:
-            reasoning_generator = self.reason(run_messages=run_messages)
-            yield from reasoning_generator
+            yield from trace_iterator(self._run_trace.span("reasoning"), self.reason(run_messages=run_messages))
 
     async def _ahandle_reasoning(self, run_messages: RunMessages) -> None:
         if self.reasoning or self.reasoning_model is not None:
-            reason_generator = self.areason(run_messages=run_messages)
-            # Consume the generator without yielding
-            async for _ in reason_generator:
-                pass
+            with self._run_trace.span("reasoning"):
+                reason_generator = self.areason(run_messages=run_messages)
+                # Consume the generator without yielding
+                async for _ in reason_generator:
+                    pass
 
     async def _ahandle_reasoning_stream(self, run_messages: RunMessages) -> AsyncIterator[RunResponseEvent]:
         if self.reasoning or self.reasoning_model is not None:
-            reason_generator = self.areason(run_messages=run_messages)
-            async for item in reason_generator:
+            async for item in atrace_iterator(
+                self._run_trace.span("reasoning"), self.areason(run_messages=run_messages)
+            ):
                 yield item
 
     def _format_reasoning_step_content(self, reasoning_step: ReasoningStep) -> str:
@@ -6107,7 +6297,7 @@ class Agent:
             import json
 
             history: List[Dict[str, Any]] = []
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 agent_chats = self.memory.get_message_pairs()
 
                 if len(agent_chats) == 0:
@@ -6157,7 +6347,7 @@ class Agent:
             """
             import json
 
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 tool_calls = self.memory.get_tool_calls(num_calls=num_calls)
             elif isinstance(self.memory, Memory):
                 tool_calls = self.memory.get_tool_calls(session_id=session_id, num_calls=num_calls)
@@ -6388,7 +6578,7 @@ class Agent:
         Returns:
             str: A string indicating the status of the task.
         """
-        self.memory = cast(AgentMemory, self.memory)
+        self.memory = cast("AgentMemory", self.memory)
         try:
             return self.memory.update_memory(input=task, force=True) or "Memory updated successfully"
         except Exception as e:
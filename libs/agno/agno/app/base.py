@@ -12,6 +12,7 @@ from starlette.middleware.cors import CORSMiddleware
 from agno.agent.agent import Agent
 from agno.api.app import AppCreate, create_app
 from agno.app.settings import APIAppSettings
+from agno.app.utils import model_clients_lifespan
 from agno.team.team import Team
 from agno.utils.log import log_debug, log_info
 
@@ -93,6 +94,7 @@ class BaseAPIApp(ABC):
         if not self.api_app:
             kwargs = {
                 "title": self.settings.title,
+                "lifespan": model_clients_lifespan,
             }
             if self.version:
                 kwargs["version"] = self.version
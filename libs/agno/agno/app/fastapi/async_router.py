@@ -1,7 +1,7 @@
 import json
 from dataclasses import asdict
 from io import BytesIO
-from typing import AsyncGenerator, List, Optional, cast
+from typing import AsyncGenerator, Dict, List, Optional, cast
 from uuid import uuid4
 
 from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
@@ -9,6 +9,7 @@ from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.utils import get_instance_pool
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.run.response import RunResponseErrorEvent
@@ -16,6 +17,7 @@ from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.team.team import Team
 from agno.utils.log import logger
+from agno.utils.pool import InstancePool
 from agno.workflow.workflow import Workflow
 
 
@@ -91,6 +93,9 @@ def get_async_router(
     if agents is None and teams is None and workflows is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
 
+    # Requests to a workflow run on pooled copies of it
+    workflow_pools: Dict[int, InstancePool] = {}
+
     @router.get("/status")
     async def status():
         return {"status": "available"}
@@ -351,19 +356,22 @@ def get_async_router(
                     media_type="text/event-stream",
                 )
             elif workflow:
-                workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
+                workflow_pool = get_instance_pool(workflow_pools, workflow)
+                workflow_instance = workflow_pool.acquire()
                 workflow_instance.user_id = user_id
                 workflow_instance.session_name = None
-                if isinstance(workflow_input, dict):
-                    return StreamingResponse(
-                        (json.dumps(asdict(result)) for result in await workflow_instance.arun(**workflow_input)),
-                        media_type="text/event-stream",
-                    )
-                else:
-                    return StreamingResponse(
-                        (json.dumps(asdict(result)) for result in await workflow_instance.arun(workflow_input)),  # type: ignore
-                        media_type="text/event-stream",
-                    )
+                try:
+                    if isinstance(workflow_input, dict):
+                        results = await workflow_instance.arun(**workflow_input)
+                    else:
+                        results = await workflow_instance.arun(workflow_input)  # type: ignore
+                except Exception:
+                    workflow_pool.release(workflow_instance)
+                    raise
+                return StreamingResponse(
+                    (json.dumps(asdict(result)) for result in workflow_pool.release_after(workflow_instance, results)),
+                    media_type="text/event-stream",
+                )
         else:
             if agent:
                 run_response = cast(
@@ -392,12 +400,12 @@ def get_async_router(
                 )
                 return team_run_response.to_dict()
             elif workflow:
-                workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
-                workflow_instance.user_id = user_id
-                workflow_instance.session_name = None
-                if isinstance(workflow_input, dict):
-                    return (await workflow_instance.arun(**workflow_input)).to_dict()
-                else:
-                    return (await workflow_instance.arun(workflow_input)).to_dict()  # type: ignore
+                with get_instance_pool(workflow_pools, workflow).instance() as workflow_instance:
+                    workflow_instance.user_id = user_id
+                    workflow_instance.session_name = None
+                    if isinstance(workflow_input, dict):
+                        return (await workflow_instance.arun(**workflow_input)).to_dict()
+                    else:
+                        return (await workflow_instance.arun(workflow_input)).to_dict()  # type: ignore
 
     return router
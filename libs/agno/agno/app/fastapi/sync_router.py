@@ -9,6 +9,7 @@ from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.utils import get_instance_pool
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.run.base import RunStatus
@@ -17,6 +18,7 @@ from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.team.team import Team
 from agno.utils.log import logger
+from agno.utils.pool import InstancePool
 from agno.workflow.workflow import Workflow
 
 
@@ -90,6 +92,9 @@ def get_sync_router(
     if agents is None and teams is None and workflows is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
 
+    # Requests to a workflow run on pooled copies of it
+    workflow_pools: Dict[int, InstancePool] = {}
+
     @router.get("/status")
     def status():
         return {"status": "available"}
@@ -339,11 +344,17 @@ def get_sync_router(
                     media_type="text/event-stream",
                 )
             elif workflow:
-                workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
+                workflow_pool = get_instance_pool(workflow_pools, workflow)
+                workflow_instance = workflow_pool.acquire()
                 workflow_instance.user_id = user_id
                 workflow_instance.session_name = None
+                try:
+                    results = workflow_instance.run(**(workflow_input or {}))
+                except Exception:
+                    workflow_pool.release(workflow_instance)
+                    raise
                 return StreamingResponse(
-                    (json.dumps(asdict(result)) for result in workflow_instance.run(**(workflow_input or {}))),
+                    (json.dumps(asdict(result)) for result in workflow_pool.release_after(workflow_instance, results)),
                     media_type="text/event-stream",
                 )
         else:
@@ -374,9 +385,9 @@ def get_sync_router(
                 )
                 return team_run_response.to_dict()
             elif workflow:
-                workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
-                workflow_instance.user_id = user_id
-                workflow_instance.session_name = None
-                return workflow_instance.run(**(workflow_input or {})).to_dict()
+                with get_instance_pool(workflow_pools, workflow).instance() as workflow_instance:
+                    workflow_instance.user_id = user_id
+                    workflow_instance.session_name = None
+                    return workflow_instance.run(**(workflow_input or {})).to_dict()
 
     return router
@@ -15,7 +15,7 @@ from agno.agent.agent import Agent
 from agno.api.playground import PlaygroundEndpointCreate
 from agno.app.playground.async_router import get_async_playground_router
 from agno.app.playground.sync_router import get_sync_playground_router
-from agno.app.utils import generate_id
+from agno.app.utils import generate_id, model_clients_lifespan
 from agno.cli.console import console
 from agno.cli.settings import agno_cli_settings
 from agno.playground.settings import PlaygroundSettings
@@ -117,6 +117,7 @@ class Playground:
                 docs_url="/docs" if self.settings.docs_enabled else None,
                 redoc_url="/redoc" if self.settings.docs_enabled else None,
                 openapi_url="/openapi.json" if self.settings.docs_enabled else None,
+                lifespan=model_clients_lifespan,
             )
 
         if not self.api_app:
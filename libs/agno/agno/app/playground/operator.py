@@ -1,6 +1,7 @@
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
-from agno.agent.agent import Agent, AgentRun, Function, Toolkit
+from agno.agent.agent import Agent, Function, Toolkit
+from agno.memory.agent import AgentRun
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.storage.session.agent import AgentSession
@@ -10,6 +11,15 @@ from agno.team.team import Team
 from agno.utils.log import logger
 from agno.workflow.workflow import Workflow
 
+# Response header with the cursor of the next page of a session list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def get_session_list_fields(mode: str = "agent") -> Tuple[str, ...]:
+    """Returns the fields of the session summaries listed in the Playground.
+    Agent and team sessions are titled by their first user message, and workflow sessions by their first run."""
+    return ("session_id", "session_data", "created_at", "first_run" if mode == "workflow" else "title_run")
+
 
 def format_tools(agent_tools):
     formatted_tools = []
@@ -40,6 +50,41 @@ def get_agent_by_id(agent_id: str, agents: Optional[List[Agent]] = None) -> Opti
     return None
 
 
+def get_title_from_run(run: Dict[str, Any]) -> Optional[str]:
+    """Returns the first user message of an Agent or Team run, None if it has none"""
+    if "response" in run:
+        run_parsed = AgentRun.model_validate(run)
+        if run_parsed.message is not None and run_parsed.message.role == "user":
+            content = run_parsed.message.get_content_string()
+            return content if content else "No title"
+    else:
+        if "agent_id" in run:
+            run_response_parsed = RunResponse.from_dict(run)
+        else:
+            run_response_parsed = TeamRunResponse.from_dict(run)  # type: ignore
+        if run_response_parsed.messages is not None and len(run_response_parsed.messages) > 0:
+            for msg in run_response_parsed.messages:
+                if msg.role == "user":
+                    content = msg.get_content_string()
+                    if content:
+                        return content
+    return None
+
+
+def get_title_from_workflow_run(run: Dict[str, Any]) -> Optional[str]:
+    """Returns the first line of the content of a Workflow run, None if it has no content"""
+    # Try to get content directly from the run first (workflow structure)
+    content = run.get("content")
+    # Fallback to response.content structure (if it exists)
+    if not content and run.get("response"):
+        content = run["response"].get("content")
+    if content:
+        # Split content by newlines and take first line, but limit to 100 chars
+        first_line = content.split("\n")[0]
+        return first_line[:100] + "..." if len(first_line) > 100 else first_line
+    return None
+
+
 def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
     if session is None:
         return "Unnamed session"
@@ -54,26 +99,9 @@ def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
 
         for _run in runs:
             try:
-                if "response" in _run:
-                    run_parsed = AgentRun.model_validate(_run)
-                    if run_parsed.message is not None and run_parsed.message.role == "user":
-                        content = run_parsed.message.get_content_string()
-                        if content:
-                            return content
-                        else:
-                            return "No title"
-                else:
-                    if "agent_id" in _run:
-                        run_response_parsed = RunResponse.from_dict(_run)
-                    else:
-                        run_response_parsed = TeamRunResponse.from_dict(_run)  # type: ignore
-                    if run_response_parsed.messages is not None and len(run_response_parsed.messages) > 0:
-                        for msg in run_response_parsed.messages:
-                            if msg.role == "user":
-                                content = msg.get_content_string()
-                                if content:
-                                    return content
-
+                title = get_title_from_run(_run)
+                if title is not None:
+                    return title
             except Exception as e:
                 import traceback
 
@@ -98,27 +126,31 @@ def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -
         runs = cast(List[Any], runs)
         for _run in runs:
             try:
-                # Try to get content directly from the run first (workflow structure)
-                content = _run.get("content")
-                if content:
-                    # Split content by newlines and take first line, but limit to 100 chars
-                    first_line = content.split("\n")[0]
-                    return first_line[:100] + "..." if len(first_line) > 100 else first_line
-
-                # Fallback to response.content structure (if it exists)
-                response = _run.get("response")
-                if response:
-                    content = response.get("content")
-                    if content:
-                        # Split content by newlines and take first line, but limit to 100 chars
-                        first_line = content.split("\n")[0]
-                        return first_line[:100] + "..." if len(first_line) > 100 else first_line
-
+                title = get_title_from_workflow_run(_run)
+                if title is not None:
+                    return title
             except Exception as e:
                 logger.error(f"Error parsing workflow session: {e}")
     return "Unnamed session"
 
 
+def get_session_title_from_summary(summary: Dict[str, Any], mode: str = "agent") -> str:
+    """Returns the title of a session summary from `Storage.list_sessions`, with the fields of `get_session_list_fields`"""
+    session_data = summary.get("session_data")
+    session_name = session_data.get("session_name") if session_data is not None else None
+    if session_name is not None:
+        return session_name
+    title_run = summary.get("first_run") if mode == "workflow" else summary.get("title_run")
+    if title_run:
+        try:
+            title = get_title_from_workflow_run(title_run) if mode == "workflow" else get_title_from_run(title_run)
+            if title is not None:
+                return title
+        except Exception as e:
+            logger.error(f"Error parsing session: {e}")
+    return "Unnamed session"
+
+
 def get_workflow_by_id(workflow_id: str, workflows: Optional[List[Workflow]] = None) -> Optional[Workflow]:
     if workflows is None or workflow_id is None:
         return None
@@ -152,26 +184,9 @@ def get_session_title_from_team_session(team_session: TeamSession) -> str:
 
         for _run in runs:
             try:
-                if "response" in _run:
-                    run_parsed = AgentRun.model_validate(_run)
-                    if run_parsed.message is not None and run_parsed.message.role == "user":
-                        content = run_parsed.message.get_content_string()
-                        if content:
-                            return content
-                        else:
-                            return "No title"
-                else:
-                    if "agent_id" in _run:
-                        run_response_parsed = RunResponse.from_dict(_run)
-                    else:
-                        run_response_parsed = TeamRunResponse.from_dict(_run)  # type: ignore
-                    if run_response_parsed.messages is not None and len(run_response_parsed.messages) > 0:
-                        for msg in run_response_parsed.messages:
-                            if msg.role == "user":
-                                content = msg.get_content_string()
-                                if content:
-                                    return content
-
+                title = get_title_from_run(_run)
+                if title is not None:
+                    return title
             except Exception as e:
                 logger.error(f"Error parsing chat: {e}")
     return "Unnamed session"
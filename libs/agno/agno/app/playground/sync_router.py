@@ -4,16 +4,16 @@ from io import BytesIO
 from typing import Any, Dict, Generator, List, Optional, cast
 from uuid import uuid4
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
+    NEXT_CURSOR_HEADER,
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_session_list_fields,
+    get_session_title_from_summary,
     get_team_by_id,
     get_workflow_by_id,
 )
@@ -33,6 +33,7 @@ from agno.app.playground.schemas import (
     WorkflowsGetResponse,
 )
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
+from agno.app.utils import get_instance_pool
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.memory.agent import AgentMemory
@@ -44,6 +45,7 @@ from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.team.team import Team
 from agno.utils.log import logger
+from agno.utils.pool import InstancePool
 from agno.workflow.workflow import Workflow
 
 
@@ -158,6 +160,9 @@ def get_sync_playground_router(
     if agents is None and workflows is None and teams is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
 
+    # Requests to a workflow run on pooled copies of it
+    workflow_pools: Dict[int, InstancePool] = {}
+
     @playground_router.get("/status")
     def playground_status(app_id: Optional[str] = None):
         if app_id is None:
@@ -483,7 +488,13 @@ def get_sync_playground_router(
             return run_response_obj.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    def get_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -493,17 +504,29 @@ def get_sync_playground_router(
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        try:
+            session_page = agent.storage.list_sessions(
+                user_id=user_id,
+                entity_id=agent_id,
+                limit=limit,
+                cursor=cursor,
+                fields=get_session_list_fields("agent"),
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        session_summaries = session_page.sessions
+        for summary in session_summaries:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=get_session_title_from_summary(summary, mode="agent"),
+                    session_id=summary["session_id"],
+                    session_name=summary["session_data"].get("session_name") if summary["session_data"] else None,
+                    created_at=summary["created_at"],
                 )
             )
+        # The cursor of the next page of sessions, if there is one
+        if session_page.next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = session_page.next_cursor
         return agent_sessions
 
     @playground_router.get("/agents/{agent_id}/sessions/{session_id}")
@@ -553,11 +576,10 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
+        session = agent.storage.read(session_id, body.user_id)  # type: ignore
+        if session is not None:
+            agent.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -570,11 +592,10 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
+        session = agent.storage.read(session_id, user_id)  # type: ignore
+        if isinstance(session, AgentSession) and session.agent_id == agent_id:
+            agent.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -631,8 +652,9 @@ def get_sync_playground_router(
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-        # Create a new instance of this workflow
-        new_workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
+        # Run on a pooled copy of this workflow
+        workflow_pool = get_instance_pool(workflow_pools, workflow)
+        new_workflow_instance = workflow_pool.acquire()
         new_workflow_instance.user_id = body.user_id
         new_workflow_instance.session_name = None
 
@@ -640,11 +662,22 @@ def get_sync_playground_router(
         try:
             if new_workflow_instance._run_return_type == "RunResponse":
                 # Return as a normal response
-                return new_workflow_instance.run(**body.input)
+                try:
+                    return new_workflow_instance.run(**body.input)
+                finally:
+                    workflow_pool.release(new_workflow_instance)
             else:
-                # Return as a streaming response
+                # Return as a streaming response, releasing the instance once the stream is done
+                try:
+                    results = new_workflow_instance.run(**body.input)
+                except Exception:
+                    workflow_pool.release(new_workflow_instance)
+                    raise
                 return StreamingResponse(
-                    (json.dumps(asdict(result)) for result in new_workflow_instance.run(**body.input)),
+                    (
+                        json.dumps(asdict(result))
+                        for result in workflow_pool.release_after(new_workflow_instance, results)
+                    ),
                     media_type="text/event-stream",
                 )
         except Exception as e:
@@ -652,7 +685,13 @@ def get_sync_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions")
-    def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -664,24 +703,33 @@ def get_sync_playground_router(
 
         # Retrieve all sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            session_page = workflow.storage.list_sessions(
+                user_id=user_id,
+                entity_id=workflow_id,
+                limit=limit,
+                cursor=cursor,
+                fields=get_session_list_fields("workflow"),
+            )
+            session_summaries = session_page.sessions
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         # Return the sessions
         workflow_sessions: List[WorkflowSessionResponse] = []
-        for session in all_workflow_sessions:
-            title = get_session_title_from_workflow_session(session)
+        for summary in session_summaries:
             workflow_sessions.append(
                 {
-                    "title": title,
-                    "session_id": session.session_id,
-                    "session_name": session.session_data.get("session_name") if session.session_data else None,
-                    "created_at": session.created_at,
+                    "title": get_session_title_from_summary(summary, mode="workflow"),
+                    "session_id": summary["session_id"],
+                    "session_name": summary["session_data"].get("session_name") if summary["session_data"] else None,
+                    "created_at": summary["created_at"],
                 }  # type: ignore
             )
+        # The cursor of the next page of sessions, if there is one
+        if session_page.next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = session_page.next_cursor
         return workflow_sessions
 
     @playground_router.get("/workflows/{workflow_id}/sessions/{session_id}", response_model=WorkflowSession)
@@ -852,7 +900,13 @@ def get_sync_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_team_sessions(
+        team_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -861,21 +915,32 @@ def get_sync_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            session_page = team.storage.list_sessions(
+                user_id=user_id,
+                entity_id=team_id,
+                limit=limit,
+                cursor=cursor,
+                fields=get_session_list_fields("team"),
+            )
+            session_summaries = session_page.sessions
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for summary in session_summaries:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=get_session_title_from_summary(summary, mode="team"),
+                    session_id=summary["session_id"],
+                    session_name=summary["session_data"].get("session_name") if summary["session_data"] else None,
+                    created_at=summary["created_at"],
                 )
             )
+        # The cursor of the next page of sessions, if there is one
+        if session_page.next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = session_page.next_cursor
         return team_sessions
 
     @playground_router.get("/teams/{team_id}/sessions/{session_id}")
@@ -930,11 +995,10 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        session = team.storage.read(session_id, body.user_id)  # type: ignore
+        if isinstance(session, TeamSession) and session.team_id == team_id:
+            team.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -947,11 +1011,10 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        session = team.storage.read(session_id, user_id)  # type: ignore
+        if isinstance(session, TeamSession) and session.team_id == team_id:
+            team.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1,11 +1,29 @@
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 from uuid import uuid4
 
-from fastapi import HTTPException, UploadFile
+from fastapi import FastAPI, HTTPException, UploadFile
 
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
+from agno.models.clients import aclose_clients
 from agno.utils.log import logger
+from agno.utils.pool import InstancePool
+
+
+@asynccontextmanager
+async def model_clients_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the shared model provider clients when the app shuts down"""
+    yield
+    await aclose_clients()
+
+
+def get_instance_pool(pools: Dict[int, InstancePool], workflow: Any) -> InstancePool:
+    """Returns the pool of instances of a workflow served by a router, creating it on first use"""
+    pool = pools.get(id(workflow))
+    if pool is None:
+        pool = pools[id(workflow)] = InstancePool(workflow, update={"workflow_id": workflow.workflow_id})
+    return pool
 
 
 def process_image(file: UploadFile) -> Image:
@@ -23,9 +23,21 @@ class Document:
         _embedder = embedder or self.embedder
         if _embedder is None:
             raise ValueError("No embedder provided")
+        if self.has_embedding(_embedder):
+            return
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    def has_embedding(self, embedder: Embedder) -> bool:
+        """Returns True if the document already has an embedding from an equivalent embedder, e.g. from chunking"""
+        if self.embedding is None or self.embedder is None:
+            return False
+        return self.embedder is embedder or (
+            type(self.embedder) is type(embedder)
+            and getattr(self.embedder, "id", None) == getattr(embedder, "id", None)
+            and self.embedder.dimensions == embedder.dimensions
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -46,3 +58,27 @@ class Document:
         import json
 
         return cls(**json.loads(document))
+
+
+def embed_documents(documents: List[Document], embedder: Embedder) -> None:
+    """Embed a list of documents using as few embedder requests as possible"""
+    documents = [document for document in documents if not document.has_embedding(embedder)]
+    if not documents:
+        return
+    embeddings, usage = embedder.get_embeddings_and_usage([document.content for document in documents])
+    if len(embeddings) != len(documents):
+        raise ValueError(f"Expected {len(documents)} embeddings, but got {len(embeddings)}")
+    for document, embedding, document_usage in zip(documents, embeddings, usage):
+        document.embedding, document.usage = embedding, document_usage
+
+
+async def async_embed_documents(documents: List[Document], embedder: Embedder) -> None:
+    """Async version of `embed_documents`"""
+    documents = [document for document in documents if not document.has_embedding(embedder)]
+    if not documents:
+        return
+    embeddings, usage = await embedder.async_get_embeddings_and_usage([document.content for document in documents])
+    if len(embeddings) != len(documents):
+        raise ValueError(f"Expected {len(documents)} embeddings, but got {len(embeddings)}")
+    for document, embedding, document_usage in zip(documents, embeddings, usage):
+        document.embedding, document.usage = embedding, document_usage
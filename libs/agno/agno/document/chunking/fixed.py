@@ -1,8 +1,11 @@
-from typing import List
+from typing import List, Tuple
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
 
+# Characters a chunk can end at without splitting a word
+WORD_SEPARATORS = (" ", "\n", "\r", "\t")
+
 
 class FixedSizeChunking(ChunkingStrategy):
     """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
@@ -15,43 +18,39 @@ class FixedSizeChunking(ChunkingStrategy):
         self.chunk_size = chunk_size
         self.overlap = overlap
 
-    def chunk(self, document: Document) -> List[Document]:
-        """Split document into fixed-size chunks with optional overlap"""
-        content = self.clean_text(document.content)
+    def get_spans(self, content: str) -> List[Tuple[int, int]]:
+        """Returns the (start, end) offsets of the chunks of the content, found without copying the content"""
+        spans: List[Tuple[int, int]] = []
         content_length = len(content)
-        chunked_documents: List[Document] = []
-        chunk_number = 1
-        chunk_meta_data = document.meta_data
         start = 0
         while start + self.overlap < content_length:
             end = min(start + self.chunk_size, content_length)
 
-            # Ensure we're not splitting a word in half
+            # Ensure we're not splitting a word in half: end at the last separator in (start, end]
             if end < content_length:
-                while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
-                    end -= 1
+                end = max(start, *(content.rfind(sep, start + 1, end + 1) for sep in WORD_SEPARATORS))
 
             # If the entire chunk is a word, then just split it at chunk_size
             if end == start:
                 end = start + self.chunk_size
 
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
-            meta_data["chunk_size"] = len(chunk)
+            spans.append((start, end))
+            # Overlap with the previous chunk, unless the chunk ended within the overlap
+            start = end - self.overlap if end - self.overlap > start else end
+        return spans
+
+    def chunk(self, document: Document) -> List[Document]:
+        """Split document into fixed-size chunks with optional overlap"""
+        content = self.clean_text(document.content)
+        chunk_id_prefix = document.id or document.name
+        chunked_documents: List[Document] = []
+        for chunk_number, (start, end) in enumerate(self.get_spans(content), start=1):
             chunked_documents.append(
                 Document(
-                    id=chunk_id,
+                    id=f"{chunk_id_prefix}_{chunk_number}" if chunk_id_prefix else None,
                     name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
+                    meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": end - start},
+                    content=content[start:end],
                 )
             )
-            chunk_number += 1
-            start = end - self.overlap
         return chunked_documents
@@ -0,0 +1,57 @@
+"""Helpers for chunking documents in a pool of processes.
+
+Chunking strategies like `FixedSizeChunking` and `RecursiveChunking` are pure Python string loops, so chunking in
+threads is serialized on the GIL. To chunk in a `ProcessPoolExecutor`, the strategy and the documents are pickled and
+sent to the worker processes in tasks of several documents, to amortize the cost of sending each task.
+
+Strategies holding clients or models (like `SemanticChunking` or `AgenticChunking`) can not be pickled, and are run in
+the current process instead.
+"""
+
+import pickle
+from concurrent.futures import Executor, Future
+from typing import List
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+
+# Number of documents sent to a worker process in each task
+DEFAULT_CHUNKING_TASK_SIZE = 16
+
+
+def chunk_documents(strategy: ChunkingStrategy, documents: List[Document]) -> List[Document]:
+    """Chunk documents with a strategy. Defined at module level, so it can be run by worker processes."""
+    chunked_documents: List[Document] = []
+    for document in documents:
+        chunked_documents.extend(strategy.chunk(document))
+    return chunked_documents
+
+
+def can_chunk_in_processes(strategy: ChunkingStrategy) -> bool:
+    """Returns True if the strategy can be sent to worker processes"""
+    try:
+        pickle.dumps(strategy)
+        return True
+    except Exception:
+        return False
+
+
+def get_chunking_tasks(documents: List[Document], task_size: int = DEFAULT_CHUNKING_TASK_SIZE) -> List[List[Document]]:
+    """Split documents into tasks of at most `task_size` documents"""
+    task_size = max(task_size, 1)
+    return [documents[i : i + task_size] for i in range(0, len(documents), task_size)]
+
+
+def submit_chunking(
+    executor: Executor,
+    strategy: ChunkingStrategy,
+    documents: List[Document],
+    task_size: int = DEFAULT_CHUNKING_TASK_SIZE,
+) -> List["Future[List[Document]]"]:
+    """Submit the chunking of documents to an executor, returns one future per task in the order of the documents"""
+    return [executor.submit(chunk_documents, strategy, task) for task in get_chunking_tasks(documents, task_size)]
+
+
+def get_chunked_documents(futures: List["Future[List[Document]]"]) -> List[Document]:
+    """Wait for chunking tasks and return their chunks in order"""
+    return [chunk for future in futures for chunk in future.result()]
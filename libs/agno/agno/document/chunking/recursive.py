@@ -1,5 +1,5 @@
 import warnings
-from typing import List
+from typing import List, Tuple
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
@@ -22,42 +22,45 @@ class RecursiveChunking(ChunkingStrategy):
         self.chunk_size = chunk_size
         self.overlap = overlap
 
-    def chunk(self, document: Document) -> List[Document]:
-        """Recursively chunk text by finding natural break points"""
-        if len(document.content) <= self.chunk_size:
-            return [document]
-
-        chunks: List[Document] = []
+    def get_spans(self, content: str) -> List[Tuple[int, int]]:
+        """Returns the (start, end) offsets of the chunks of the content, found without copying the content"""
+        spans: List[Tuple[int, int]] = []
+        content_length = len(content)
         start = 0
-        chunk_meta_data = document.meta_data
-        chunk_number = 1
-        content = self.clean_text(document.content)
-
-        while start < len(content):
-            end = min(start + self.chunk_size, len(content))
+        while start < content_length:
+            end = min(start + self.chunk_size, content_length)
 
-            if end < len(content):
+            if end < content_length:
                 for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
+                    last_sep = content.rfind(sep, start, end)
                     if last_sep != -1:
-                        end = start + last_sep + 1
+                        end = last_sep + 1
                         break
 
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            chunk_number += 1
-            meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
+            spans.append((start, end))
 
             new_start = end - self.overlap
             if new_start <= start:  # Prevent infinite loop
                 new_start = min(
-                    len(content), start + max(1, self.chunk_size // 10)
+                    content_length, start + max(1, self.chunk_size // 10)
                 )  # Move forward by at least 10% of chunk size
             start = new_start
+        return spans
 
+    def chunk(self, document: Document) -> List[Document]:
+        """Recursively chunk text by finding natural break points"""
+        if len(document.content) <= self.chunk_size:
+            return [document]
+
+        content = self.clean_text(document.content)
+        chunks: List[Document] = []
+        for chunk_number, (start, end) in enumerate(self.get_spans(content), start=1):
+            chunks.append(
+                Document(
+                    id=f"{document.id}_{chunk_number}" if document.id else None,
+                    name=document.name,
+                    meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": end - start},
+                    content=content[start:end],
+                )
+            )
         return chunks
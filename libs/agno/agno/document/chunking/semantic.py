@@ -1,47 +1,157 @@
-from typing import List, Optional
+import re
+from typing import Any, Iterator, List, Optional
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.embedder.base import Embedder
 from agno.embedder.openai import OpenAIEmbedder
 
-try:
-    from chonkie import SemanticChunker
-except ImportError:
-    raise ImportError("`chonkie` is required for semantic chunking, please install using `pip install chonkie`")
-
 
 class SemanticChunking(ChunkingStrategy):
-    """Chunking strategy that splits text into semantic chunks using chonkie"""
+    """Chunking strategy that splits text into semantic chunks using chonkie, or the embedder when streaming"""
 
     def __init__(
-        self, embedder: Optional[Embedder] = None, chunk_size: int = 5000, similarity_threshold: Optional[float] = 0.5
+        self,
+        embedder: Optional[Embedder] = None,
+        chunk_size: int = 5000,
+        similarity_threshold: Optional[float] = 0.5,
+        streaming: bool = False,
+        window_size: int = 256,
+        reuse_embeddings: bool = True,
     ):
+        """
+        Args:
+            embedder: Embedder used to find the semantic boundaries between sentences.
+            chunk_size: Maximum number of characters in a chunk.
+            similarity_threshold: Start a new chunk when the similarity between consecutive sentences drops below this.
+            streaming: Split the document in windows of sentences with the embedder, instead of in one call to chonkie.
+            window_size: Number of sentences to embed at once when streaming.
+            reuse_embeddings: When streaming, attach the pooled sentence embeddings to each chunk, so the chunks
+                are not embedded again when they are inserted into a vector db with the same embedder.
+        """
         self.embedder = embedder or OpenAIEmbedder(id="text-embedding-3-small")  # type: ignore
         self.chunk_size = chunk_size
         self.similarity_threshold = similarity_threshold
-        self.chunker = SemanticChunker(
-            embedding_model=self.embedder.id,  # type: ignore
-            chunk_size=self.chunk_size,
-            threshold=self.similarity_threshold,
-        )
+        self.streaming = streaming
+        self.window_size = window_size
+        self.reuse_embeddings = reuse_embeddings
+        self.chunker: Optional[Any] = None
+        if not self.streaming:
+            try:
+                from chonkie import SemanticChunker
+            except ImportError:
+                raise ImportError(
+                    "`chonkie` is required for semantic chunking, please install using `pip install chonkie`"
+                )
+
+            self.chunker = SemanticChunker(
+                embedding_model=self.embedder.id,  # type: ignore
+                chunk_size=self.chunk_size,
+                threshold=self.similarity_threshold,
+            )
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into semantic chunks using chokie"""
         if not document.content:
             return [document]
 
+        if self.streaming:
+            return self._chunk_streaming(document)
+
         # Use chonkie to split into semantic chunks
-        chunks = self.chunker.chunk(self.clean_text(document.content))
+        chunks = self.chunker.chunk(self.clean_text(document.content))  # type: ignore
 
         # Convert chunks to Documents
         chunked_documents: List[Document] = []
         for i, chunk in enumerate(chunks, 1):
-            meta_data = document.meta_data.copy()
-            meta_data["chunk"] = i
-            chunk_id = f"{document.id}_{i}" if document.id else None
-            meta_data["chunk_size"] = len(chunk.text)
+            chunked_documents.append(self._create_chunk(document, i, chunk.text))
+
+        return chunked_documents
+
+    def _create_chunk(
+        self, document: Document, chunk_number: int, content: str, embedding: Optional[List[float]] = None
+    ) -> Document:
+        meta_data = document.meta_data.copy()
+        meta_data["chunk"] = chunk_number
+        chunk_id = f"{document.id}_{chunk_number}" if document.id else None
+        meta_data["chunk_size"] = len(content)
+        if embedding is None:
+            return Document(id=chunk_id, name=document.name, meta_data=meta_data, content=content)
+        return Document(
+            id=chunk_id,
+            name=document.name,
+            meta_data=meta_data,
+            content=content,
+            embedder=self.embedder,
+            embedding=embedding,
+        )
+
+    def _get_sentence_windows(self, text: str) -> Iterator[List[str]]:
+        """Yield the sentences of the text in windows of `window_size` sentences"""
+        window: List[str] = []
+        start = 0
+        for match in re.finditer(r"(?<=[.!?])\s+", text):
+            sentence = text[start : match.start()].strip()
+            start = match.end()
+            if sentence:
+                window.append(sentence)
+            if len(window) >= self.window_size:
+                yield window
+                window = []
+        sentence = text[start:].strip()
+        if sentence:
+            window.append(sentence)
+        if window:
+            yield window
+
+    def _chunk_streaming(self, document: Document) -> List[Document]:
+        """Split the document with the embedder, embedding one window of sentences at a time"""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+        threshold = self.similarity_threshold if self.similarity_threshold is not None else 0.0
+        chunked_documents: List[Document] = []
+        # Sentences of the chunk being built, with their normalized embeddings
+        sentences: List[str] = []
+        vectors: List[Any] = []
+        chunk_length = 0
+        previous_vector = None
+
+        def add_chunk() -> None:
+            embedding = None
+            if self.reuse_embeddings:
+                # Pool the sentence embeddings, weighted by sentence length
+                weights = np.array([len(sentence) for sentence in sentences], dtype=np.float32)
+                pooled = np.average(np.stack(vectors), axis=0, weights=weights)
+                norm = np.linalg.norm(pooled)
+                embedding = (pooled / norm if norm > 0 else pooled).tolist()
+            chunked_documents.append(
+                self._create_chunk(document, len(chunked_documents) + 1, " ".join(sentences), embedding)
+            )
+
+        for window in self._get_sentence_windows(self.clean_text(document.content)):
+            embeddings, _ = self.embedder.get_embeddings_and_usage(window)
+            window_vectors = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(window_vectors, axis=1, keepdims=True)
+            window_vectors = (window_vectors / np.where(norms == 0, 1, norms)).astype(np.float32, copy=False)
+
+            # Cosine similarity of each sentence to the sentence before it
+            similarities = np.ones(len(window), dtype=np.float32)
+            similarities[1:] = np.einsum("ij,ij->i", window_vectors[1:], window_vectors[:-1])
+            if previous_vector is not None:
+                similarities[0] = float(window_vectors[0] @ previous_vector)
+            previous_vector = window_vectors[-1]
 
-            chunked_documents.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk.text))
+            for sentence, vector, similarity in zip(window, window_vectors, similarities):
+                if sentences and (similarity < threshold or chunk_length + len(sentence) + 1 > self.chunk_size):
+                    add_chunk()
+                    sentences, vectors, chunk_length = [], [], 0
+                sentences.append(sentence)
+                vectors.append(vector)
+                chunk_length += len(sentence) + 1
 
+        if sentences:
+            add_chunk()
         return chunked_documents
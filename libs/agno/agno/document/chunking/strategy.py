@@ -1,8 +1,13 @@
+import re
 from abc import ABC, abstractmethod
 from typing import List
 
 from agno.document.base import Document
 
+# Runs of whitespace that are not already a single space. Single spaces are most of the whitespace in text,
+# and leaving them unmatched makes cleaning several times faster than substituting every run.
+_WHITESPACE = re.compile(r"\s{2,}|[^\S ]")
+
 
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
@@ -12,20 +17,5 @@ class ChunkingStrategy(ABC):
         raise NotImplementedError
 
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
-
-        return cleaned_text
+        """Clean the text by replacing runs of whitespace (newlines, spaces, tabs, ...) with a single space"""
+        return _WHITESPACE.sub(" ", text)
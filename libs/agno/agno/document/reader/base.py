@@ -1,10 +1,18 @@
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
 from agno.document.base import Document
 from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.parallel import (
+    DEFAULT_CHUNKING_TASK_SIZE,
+    can_chunk_in_processes,
+    chunk_documents,
+    get_chunking_tasks,
+)
 from agno.document.chunking.strategy import ChunkingStrategy
+from agno.utils.log import log_warning
 
 
 @dataclass
@@ -29,21 +37,44 @@ class Reader:
     async def async_read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
 
-    def chunk_document(self, document: Document) -> List[Document]:
+    def get_chunking_strategy(self) -> ChunkingStrategy:
         if self.chunking_strategy is None:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
-        return self.chunking_strategy.chunk(document)  # type: ignore
+        return self.chunking_strategy
+
+    def chunk_document(self, document: Document) -> List[Document]:
+        return self.get_chunking_strategy().chunk(document)
 
-    async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
+    async def chunk_documents_async(
+        self,
+        documents: List[Document],
+        executor: Optional[Executor] = None,
+        task_size: int = DEFAULT_CHUNKING_TASK_SIZE,
+    ) -> List[Document]:
         """
         Asynchronously chunk a list of documents using the instance's chunk_document method.
 
         Args:
             documents: List of documents to be chunked.
+            executor: Executor to chunk the documents in, like a ProcessPoolExecutor to chunk on multiple CPUs.
+                By default, each document is chunked in a thread.
+            task_size: Number of documents chunked in each task submitted to the executor.
 
         Returns:
             A flattened list of chunked documents.
         """
+        if executor is not None:
+            strategy = self.get_chunking_strategy()
+            if not isinstance(executor, ProcessPoolExecutor) or can_chunk_in_processes(strategy):
+                loop = asyncio.get_running_loop()
+                chunked_tasks = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(executor, chunk_documents, strategy, task)
+                        for task in get_chunking_tasks(documents, task_size)
+                    ]
+                )
+                return [chunk for sublist in chunked_tasks for chunk in sublist]
+            log_warning(f"{type(strategy).__name__} can not be sent to other processes, chunking in threads")
 
         async def _chunk_document_async(doc: Document) -> List[Document]:
             return await asyncio.to_thread(self.chunk_document, doc)
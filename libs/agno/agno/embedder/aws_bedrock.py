@@ -1,7 +1,7 @@
 import json
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
 from agno.exceptions import AgnoError, ModelProviderError
@@ -46,6 +46,14 @@ class AwsBedrockEmbedder(Embedder):
     """
 
     id: str = "cohere.embed-multilingual-v3"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = (
+        "input_type",
+        "truncate",
+        "embedding_types",
+        "aws_region",
+        "request_params",
+    )
     dimensions: int = 1024  # Cohere models have 1024 dimensions by default
     input_type: str = "search_query"
     truncate: Optional[str] = None  # 'NONE', 'START', or 'END'
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, get_batch_usage
 from agno.utils.log import logger
 
 try:
@@ -17,6 +17,14 @@ except ImportError:
 @dataclass
 class AzureOpenAIEmbedder(Embedder):
     id: str = "text-embedding-3-small"  # This has to match the model that you deployed at the provided URL
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = (
+        "encoding_format",
+        "azure_endpoint",
+        "azure_deployment",
+        "base_url",
+        "request_params",
+    )
 
     dimensions: int = 1536
     encoding_format: Literal["float", "base64"] = "float"
@@ -61,7 +69,7 @@ class AzureOpenAIEmbedder(Embedder):
 
         return AzureOpenAIClient(**_client_params)
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -90,3 +98,10 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: CreateEmbeddingResponse = self._response(text=texts)
+
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+        usage = response.usage.model_dump() if response.usage else None
+        return embeddings, get_batch_usage(usage, len(embeddings))
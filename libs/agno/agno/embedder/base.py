@@ -1,5 +1,14 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
+
+
+def get_batch_usage(usage: Optional[Dict], num_texts: int) -> List[Optional[Dict]]:
+    """Returns the usage entries of a batch of texts embedded in a single request.
+    The usage of the request is recorded once, on the first text, so adding up the usage of the texts counts it once."""
+    if num_texts == 0:
+        return []
+    return [usage] + [None] * (num_texts - 1)
 
 
 @dataclass
@@ -7,9 +16,81 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts to embed in a single request
+    batch_size: int = 100
+    # Approximate maximum number of tokens to embed in a single request
+    batch_max_tokens: Optional[int] = None
+    # Cache the embeddings of search queries
+    cache_queries: bool = True
+    # QueryEmbeddingCache to use instead of the process-wide default cache
+    query_cache: Optional[Any] = None
+    # Settings besides the id and dimensions that change the embeddings, e.g. an input type or the endpoint.
+    # They are part of the query cache key, so embedders that differ in them do not share cached embeddings.
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ()
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts, packing them into as few provider requests as possible.
+
+        Returns one embedding and one usage entry per text, in the same order as `texts`.
+        When the provider embeds a batch in a single request, the usage of that request is recorded
+        on the first text of the batch and the usage of the other texts is None.
+        """
+        embeddings: List[List[float]] = []
+        usage: List[Optional[Dict]] = []
+        for batch in self.get_batches(texts):
+            batch_embeddings, batch_usage = self._get_batch_embeddings_and_usage(batch)
+            embeddings.extend(batch_embeddings)
+            usage.extend(batch_usage)
+        return embeddings, usage
+
+    async def async_get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Async version of `get_embeddings_and_usage`"""
+        embeddings: List[List[float]] = []
+        usage: List[Optional[Dict]] = []
+        for batch in self.get_batches(texts):
+            batch_embeddings, batch_usage = await self._async_get_batch_embeddings_and_usage(batch)
+            embeddings.extend(batch_embeddings)
+            usage.extend(batch_usage)
+        return embeddings, usage
+
+    def get_batches(self, texts: List[str]) -> Iterator[List[str]]:
+        """Split texts into batches of at most `batch_size` texts and roughly `batch_max_tokens` tokens"""
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            text_tokens = self._estimate_tokens(text)
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.batch_max_tokens is not None and batch_tokens + text_tokens > self.batch_max_tokens)
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += text_tokens
+        if batch:
+            yield batch
+
+    def _estimate_tokens(self, text: str) -> int:
+        # Roughly 4 characters per token for English text
+        return len(text) // 4 + 1
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch. Embedders with a native multi-input API should override this."""
+        embeddings: List[List[float]] = []
+        usage: List[Optional[Dict]] = []
+        for text in texts:
+            embedding, text_usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usage.append(text_usage)
+        return embeddings, usage
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return await asyncio.to_thread(self._get_batch_embeddings_and_usage, texts)
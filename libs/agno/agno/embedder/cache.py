@@ -0,0 +1,175 @@
+"""Cache of query embeddings shared by the vector dbs.
+
+Agents send the same knowledge queries over and over, and every vector db search embeds its query again. Searches
+get the query embedding through `get_query_embedding` instead, which looks it up in a process-wide cache keyed by
+the embedder type, id, dimensions and `cache_key_settings` (e.g. the input type or endpoint) and the query with its
+whitespace normalized. Embedders can turn the cache off with `cache_queries=False` or use a cache of their own with
+`query_cache`.
+"""
+
+import asyncio
+import json
+import threading
+from hashlib import sha256
+from inspect import iscoroutinefunction
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from agno.embedder.base import Embedder
+from agno.utils.cache import InMemoryCache, SqliteCache
+from agno.utils.log import log_debug
+
+
+class QueryEmbeddingCache:
+    """Least-recently-used cache of query embeddings bounded by size, optionally persisted to a SQLite file."""
+
+    def __init__(
+        self,
+        max_size_bytes: int = 32 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        db_file: Optional[Union[str, Path]] = None,
+        table_name: str = "agno_query_embeddings",
+    ):
+        """
+        Args:
+            max_size_bytes (int): Approximate maximum size of the embeddings kept in memory, in bytes.
+            ttl (Optional[float]): Seconds to keep an embedding. Embeddings never expire when None.
+            db_file (Optional[Union[str, Path]]): SQLite file to persist embeddings to, so they survive restarts.
+            table_name (str): Table of the SQLite file the embeddings are stored in.
+        """
+        self.ttl: Optional[float] = ttl
+        self.memory_cache = InMemoryCache(max_size_bytes=max_size_bytes, default_ttl=ttl)
+        self.disk_cache: Optional[SqliteCache] = (
+            SqliteCache(db_file, table_name=table_name) if db_file is not None else None
+        )
+        self.hits: int = 0
+        self.misses: int = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def get_key(embedder: Embedder, text: str) -> str:
+        """Returns the cache key of the text embedded with the embedder"""
+        normalized_text = " ".join(text.split())
+        settings = {name: getattr(embedder, name, None) for name in embedder.cache_key_settings}
+        text_hash = sha256(json.dumps([settings, normalized_text], sort_keys=True, default=str).encode()).hexdigest()
+        return f"{type(embedder).__name__}:{getattr(embedder, 'id', None)}:{embedder.dimensions}:{text_hash}"
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Returns the cached embedding for the key, counting the hit or miss"""
+        embedding = self.memory_cache.get(key)
+        if embedding is None and self.disk_cache is not None:
+            embedding = self.disk_cache.get(key)
+            if embedding is not None:
+                self.memory_cache.set(key, embedding)
+        with self._stats_lock:
+            if embedding is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return embedding
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        self.memory_cache.set(key, embedding)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, embedding, ttl=self.ttl)
+
+    def get_embedding(self, embedder: Embedder, text: str) -> List[float]:
+        """Returns the embedding of the text from the cache, embedding it on a miss"""
+        key = self.get_key(embedder, text)
+        embedding = self.get(key)
+        if embedding is None:
+            embedding = embedder.get_embedding(text)
+            # Embedders return an empty embedding on errors, which should not be cached
+            if embedding:
+                self.set(key, embedding)
+        else:
+            log_debug("Using cached query embedding")
+        return embedding
+
+    async def async_get_embedding(self, embedder: Embedder, text: str) -> List[float]:
+        """Async version of `get_embedding`"""
+        key = self.get_key(embedder, text)
+        embedding = self.get(key)
+        if embedding is None:
+            embedding = await _async_embed_query(embedder, text)
+            if embedding:
+                self.set(key, embedding)
+        else:
+            log_debug("Using cached query embedding")
+        return embedding
+
+    def clear(self) -> None:
+        self.memory_cache.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.memory_cache),
+            "size_bytes": self.memory_cache.size_bytes,
+        }
+
+    def __deepcopy__(self, memo):
+        # The cache is shared, copies of embedders keep using the same cache
+        return self
+
+
+async def _async_embed_query(embedder: Any, text: str) -> List[float]:
+    # Embedders without an async method (e.g. a mock) are called in a thread
+    if not iscoroutinefunction(getattr(embedder, "async_get_embeddings_and_usage", None)):
+        return await asyncio.to_thread(embedder.get_embedding, text)
+    try:
+        embeddings, _ = await embedder.async_get_embeddings_and_usage([text])
+        return embeddings[0] if embeddings else []
+    except NotImplementedError:
+        return await asyncio.to_thread(embedder.get_embedding, text)
+
+
+def _get_query_cache(embedder: Any) -> Optional[QueryEmbeddingCache]:
+    # Only cache for real embedders, anything else (e.g. a mock) is called directly
+    if not isinstance(embedder, Embedder) or not embedder.cache_queries:
+        return None
+    return embedder.query_cache or get_default_query_cache()
+
+
+def get_query_embedding(embedder: Embedder, query: str) -> List[float]:
+    """Returns the embedding of a search query, from the query embedding cache of the embedder when enabled"""
+    cache = _get_query_cache(embedder)
+    if cache is None:
+        return embedder.get_embedding(query)
+    return cache.get_embedding(embedder, query)
+
+
+async def async_get_query_embedding(embedder: Embedder, query: str) -> List[float]:
+    """Async version of `get_query_embedding`, that embeds the query without blocking the event loop"""
+    cache = _get_query_cache(embedder)
+    if cache is None:
+        return await _async_embed_query(embedder, query)
+    return await cache.async_get_embedding(embedder, query)
+
+
+_default_query_cache: Optional[QueryEmbeddingCache] = None
+_default_query_cache_lock = threading.Lock()
+
+
+def get_default_query_cache() -> QueryEmbeddingCache:
+    """Returns the process-wide query embedding cache used by embedders without a cache of their own"""
+    global _default_query_cache
+    if _default_query_cache is None:
+        with _default_query_cache_lock:
+            if _default_query_cache is None:
+                _default_query_cache = QueryEmbeddingCache()
+    return _default_query_cache
+
+
+def set_default_query_cache(cache: QueryEmbeddingCache) -> None:
+    """Replace the process-wide query embedding cache, e.g. with one persisted to disk or with a ttl"""
+    global _default_query_cache
+    _default_query_cache = cache
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, get_batch_usage
 from agno.utils.log import logger
 
 try:
@@ -14,6 +14,8 @@ except ImportError:
 @dataclass
 class CohereEmbedder(Embedder):
     id: str = "embed-english-v3.0"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("input_type", "embedding_types", "request_params")
     input_type: str = "search_query"
     embedding_types: Optional[List[str]] = None
     api_key: Optional[str] = None
@@ -31,7 +33,9 @@ class CohereEmbedder(Embedder):
         self.cohere_client = CohereClient(**client_params)
         return self.cohere_client
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def response(
+        self, text: Union[str, List[str]]
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +46,8 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        texts = text if isinstance(text, list) else [text]
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +76,17 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=texts)
+
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = response.embeddings.float_ or []
+
+        usage = response.meta.billed_units if response.meta else None
+        return embeddings, get_batch_usage(usage.model_dump() if usage else None, len(embeddings))
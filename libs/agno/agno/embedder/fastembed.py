@@ -17,10 +17,17 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    fastembed_client: Optional[TextEmbedding] = None
+
+    @property
+    def client(self) -> TextEmbedding:
+        # Load the model once, loading it is much slower than embedding a batch
+        if self.fastembed_client is None:
+            self.fastembed_client = TextEmbedding(model_name=self.id)
+        return self.fastembed_client
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
+        embeddings = self.client.embed(text)
         embedding_list = list(embeddings)[0]
 
         try:
@@ -35,3 +42,8 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = [list(embedding) for embedding in self.client.embed(texts, batch_size=self.batch_size)]
+        # Currently, FastEmbed does not provide usage information
+        return embeddings, [None] * len(embeddings)
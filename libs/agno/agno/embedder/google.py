@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
 from agno.utils.log import log_error, log_info
@@ -16,6 +16,8 @@ except ImportError:
 @dataclass
 class GeminiEmbedder(Embedder):
     id: str = "gemini-embedding-exp-03-07"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("task_type", "title", "request_params")
     task_type: str = "RETRIEVAL_QUERY"
     title: Optional[str] = None
     dimensions: Optional[int] = 1536
@@ -1,5 +1,5 @@
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from typing_extensions import Literal
 
@@ -15,6 +15,8 @@ except ImportError:
 
 class LangDBEmbedder(Embedder):
     model: str = "text-embedding-ada-002"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("model", "encoding_format", "base_url", "request_params")
     dimensions: int = 1536
     encoding_format: Literal["float", "base64"] = "float"
     user: Optional[str] = None
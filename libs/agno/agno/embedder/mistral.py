@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, get_batch_usage
 from agno.utils.log import logger
 
 try:
@@ -15,6 +15,8 @@ except ImportError:
 @dataclass
 class MistralEmbedder(Embedder):
     id: str = "mistral-embed"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("endpoint", "request_params")
     dimensions: int = 1024
     # -*- Request parameters
     request_params: Optional[Dict[str, Any]] = None
@@ -47,7 +49,7 @@ class MistralEmbedder(Embedder):
 
         return self.mistral_client
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.id,
@@ -80,3 +82,10 @@ class MistralEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], {}
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingResponse = self._response(text=texts)
+
+        embeddings: List[List[float]] = [data.embedding or [] for data in response.data]
+        usage: Optional[Dict[str, Any]] = response.usage.model_dump() if response.usage else None
+        return embeddings, get_batch_usage(usage, len(embeddings))
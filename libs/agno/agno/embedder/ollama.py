@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
@@ -36,6 +36,8 @@ except Exception as e:
 @dataclass
 class OllamaEmbedder(Embedder):
     id: str = "openhermes"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("host", "options")
     dimensions: int = 4096
     host: Optional[str] = None
     timeout: Optional[Any] = None
@@ -88,3 +90,17 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+
+        response = self.client.embed(input=texts, model=self.id, **kwargs)
+        embeddings: List[List[float]] = []
+        for embedding in response["embeddings"] if response and "embeddings" in response else []:
+            if len(embedding) != self.dimensions:
+                logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+                embedding = []
+            embeddings.append(list(embedding))
+        return embeddings, [None] * len(embeddings)
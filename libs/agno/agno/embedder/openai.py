@@ -1,12 +1,13 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, get_batch_usage
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -16,6 +17,8 @@ except ImportError:
 @dataclass
 class OpenAIEmbedder(Embedder):
     id: str = "text-embedding-3-small"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("encoding_format", "base_url", "request_params")
     dimensions: int = 1536
     encoding_format: Literal["float", "base64"] = "float"
     user: Optional[str] = None
@@ -25,12 +28,9 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_openai_client: Optional[AsyncOpenAIClient] = None
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {
             "api_key": self.api_key,
             "organization": self.organization,
@@ -39,10 +39,25 @@ class OpenAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.openai_client = OpenAIClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> OpenAIClient:
+        if self.openai_client:
+            return self.openai_client
+
+        self.openai_client = OpenAIClient(**self._get_client_params())
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    @property
+    def async_client(self) -> AsyncOpenAIClient:
+        if self.async_openai_client:
+            return self.async_openai_client
+
+        self.async_openai_client = AsyncOpenAIClient(**self._get_client_params())
+        return self.async_openai_client
+
+    def _get_request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -54,7 +69,13 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
+
+    async def async_response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return await self.async_client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self.response(text=text)
@@ -72,3 +93,18 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _parse_batch_response(
+        self, response: CreateEmbeddingResponse
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+        usage = response.usage.model_dump() if response.usage else None
+        return embeddings, get_batch_usage(usage, len(embeddings))
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self._parse_batch_response(self.response(text=texts))
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self._parse_batch_response(await self.async_response(text=texts))
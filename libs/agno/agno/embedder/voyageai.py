@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from agno.embedder.base import Embedder
+from agno.embedder.base import Embedder, get_batch_usage
 from agno.utils.log import logger
 
 try:
@@ -14,6 +14,8 @@ except ImportError:
 @dataclass
 class VoyageAIEmbedder(Embedder):
     id: str = "voyage-2"
+    # Settings that change the embeddings, part of the query cache key
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("base_url", "request_params")
     dimensions: int = 1024
     request_params: Optional[Dict[str, Any]] = None
     api_key: Optional[str] = None
@@ -39,9 +41,9 @@ class VoyageAIEmbedder(Embedder):
         self.voyage_client = VoyageClient(**_client_params)
         return self.voyage_client
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": text if isinstance(text, list) else [text],
             "model": self.id,
         }
         if self.request_params:
@@ -62,3 +64,9 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingsObject = self._response(text=texts)
+
+        usage = {"total_tokens": response.total_tokens}
+        return response.embeddings, get_batch_usage(usage, len(response.embeddings))
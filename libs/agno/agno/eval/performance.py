@@ -1,13 +1,19 @@
 import asyncio
 import gc
+import json
+import sys
+import threading
 import tracemalloc
 from dataclasses import dataclass, field
 from os import getenv
-from typing import TYPE_CHECKING, Callable, List, Optional
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from agno.api.schemas.evals import EvalType
 from agno.eval.utils import async_log_eval_run, log_eval_run, store_result_in_file
+from agno.exceptions import EvalError
 from agno.utils.log import logger
 from agno.utils.timer import Timer
 
@@ -145,6 +151,164 @@ class PerformanceResult:
         console.print(results_table)
 
 
+def get_rss_mib() -> Optional[float]:
+    """Returns the resident set size of the current process in MiB, or None if it cannot be measured"""
+    try:
+        import psutil  # type: ignore
+
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        pass
+
+    try:
+        import os
+
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+
+        # Peak resident set size, in bytes on macOS and in KiB elsewhere
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / 1024 / 1024 if sys.platform == "darwin" else max_rss / 1024
+    except ImportError:
+        return None
+
+
+def _percentile(data_sorted: List[float], percentile: float) -> float:
+    """Percentile of sorted data, interpolating linearly between the closest ranks"""
+    if not data_sorted:
+        return 0
+    rank = (len(data_sorted) - 1) * percentile / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(data_sorted) - 1)
+    return data_sorted[lower] + (data_sorted[upper] - data_sorted[lower]) * (rank - lower)
+
+
+@dataclass
+class LoadTestResult:
+    """
+    Holds the throughput, latency and memory statistics of a load test,
+    where concurrent callers run the function for a duration or number of requests.
+    """
+
+    # Latency of each successful request in seconds
+    latencies: List[float] = field(default_factory=list)
+    # Number of requests that raised an exception
+    num_errors: int = 0
+    # Number of concurrent callers
+    concurrency: int = 1
+    # Wall clock duration of the load test in seconds
+    duration: float = 0
+    # Resident set size of the process at the start and end of the load test in MiB
+    rss_start: Optional[float] = None
+    rss_end: Optional[float] = None
+
+    num_requests: int = field(init=False)
+    # Requests per second
+    throughput: float = field(init=False)
+    error_rate: float = field(init=False)
+    avg_latency: float = field(init=False)
+    p50_latency: float = field(init=False)
+    p90_latency: float = field(init=False)
+    p99_latency: float = field(init=False)
+    max_latency: float = field(init=False)
+    # Growth of the resident set size during the load test in MiB
+    rss_growth: Optional[float] = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        """Compute the throughput, error rate, latency percentiles and memory growth."""
+        latencies_sorted = sorted(self.latencies)
+
+        self.num_requests = len(latencies_sorted) + self.num_errors
+        self.throughput = self.num_requests / self.duration if self.duration > 0 else 0
+        self.error_rate = self.num_errors / self.num_requests if self.num_requests > 0 else 0
+        self.avg_latency = sum(latencies_sorted) / len(latencies_sorted) if latencies_sorted else 0
+        self.p50_latency = _percentile(latencies_sorted, 50)
+        self.p90_latency = _percentile(latencies_sorted, 90)
+        self.p99_latency = _percentile(latencies_sorted, 99)
+        self.max_latency = latencies_sorted[-1] if latencies_sorted else 0
+        self.rss_growth = (
+            self.rss_end - self.rss_start if self.rss_start is not None and self.rss_end is not None else None
+        )
+
+    def get_summary(self) -> Dict[str, Optional[float]]:
+        """Returns the statistics of the load test, e.g. to store them as a baseline"""
+        return {
+            "concurrency": self.concurrency,
+            "num_requests": self.num_requests,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "avg_latency": self.avg_latency,
+            "p50_latency": self.p50_latency,
+            "p90_latency": self.p90_latency,
+            "p99_latency": self.p99_latency,
+            "max_latency": self.max_latency,
+            "rss_growth": self.rss_growth,
+        }
+
+    def get_regressions(self, baseline: Dict[str, Optional[float]], threshold: float = 0.2) -> List[str]:
+        """
+        Compare the result with a baseline summary and describe every regression.
+
+        Latencies regress when they grow by more than `threshold` (relative), throughput when it drops by more
+        than `threshold`, and the error rate when it grows by more than one percentage point.
+        """
+        regressions: List[str] = []
+
+        for metric in ("p50_latency", "p90_latency", "p99_latency"):
+            baseline_value = baseline.get(metric)
+            value = getattr(self, metric)
+            if baseline_value and value > baseline_value * (1 + threshold):
+                regressions.append(f"{metric} regressed from {baseline_value:.6f}s to {value:.6f}s")
+
+        baseline_throughput = baseline.get("throughput")
+        if baseline_throughput and self.throughput < baseline_throughput * (1 - threshold):
+            regressions.append(f"throughput regressed from {baseline_throughput:.2f}/s to {self.throughput:.2f}/s")
+
+        baseline_error_rate = baseline.get("error_rate")
+        if baseline_error_rate is not None and self.error_rate > baseline_error_rate + 0.01:
+            regressions.append(f"error_rate regressed from {baseline_error_rate:.2%} to {self.error_rate:.2%}")
+
+        return regressions
+
+    def print_summary(self, console: Optional["Console"] = None):
+        """
+        Prints a summary table of the load test.
+        """
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        load_table = Table(title="Load Test Summary", show_header=True, header_style="bold magenta")
+        load_table.add_column("Metric", style="cyan")
+        load_table.add_column("Value", style="green")
+
+        load_table.add_row("Concurrency", str(self.concurrency))
+        load_table.add_row("Requests", str(self.num_requests))
+        load_table.add_row("Duration (seconds)", f"{self.duration:.6f}")
+        load_table.add_row("Throughput (requests/second)", f"{self.throughput:.2f}")
+        load_table.add_row("Error rate", f"{self.error_rate:.2%}")
+        load_table.add_row("Average latency (seconds)", f"{self.avg_latency:.6f}")
+        load_table.add_row("50th %ile latency (seconds)", f"{self.p50_latency:.6f}")
+        load_table.add_row("90th %ile latency (seconds)", f"{self.p90_latency:.6f}")
+        load_table.add_row("99th %ile latency (seconds)", f"{self.p99_latency:.6f}")
+        load_table.add_row("Maximum latency (seconds)", f"{self.max_latency:.6f}")
+        if self.rss_growth is not None:
+            load_table.add_row("RSS growth (MiB)", f"{self.rss_growth:.6f}")
+
+        console.print(load_table)
+
+
 @dataclass
 class PerformanceEval:
     """
@@ -182,6 +346,20 @@ class PerformanceEval:
     # Log the results to the Agno platform. On by default.
     monitoring: bool = getenv("AGNO_MONITOR", "true").lower() == "true"
 
+    # --- Load tests ---
+    # Number of concurrent callers
+    concurrency: int = 10
+    # Run the load test for this many seconds
+    duration: Optional[float] = None
+    # Run the load test for this many requests. Defaults to num_iterations if no duration is set
+    num_requests: Optional[int] = None
+    # Result of the load test
+    load_result: Optional[LoadTestResult] = None
+    # If set, the load test is compared with the baseline stored in this file, or stored as the baseline if there is none
+    baseline_file_path: Optional[str] = None
+    # Relative change of latency or throughput compared with the baseline that is reported as a regression
+    regression_threshold: float = 0.2
+
     def _measure_time(self) -> float:
         """Measure execution time for a single run."""
         timer = Timer()
@@ -507,3 +685,181 @@ class PerformanceEval:
 
         logger.debug(f"*********** Evaluation End: {self.eval_id} ***********")
         return self.result
+
+    def _get_num_requests(self) -> Optional[int]:
+        """Number of requests of the load test, or None if it is only limited by its duration"""
+        if self.num_requests is not None:
+            return self.num_requests
+        return None if self.duration is not None else self.num_iterations
+
+    def _check_baseline(self, result: LoadTestResult, fail_on_regression: bool) -> None:
+        """Compare the load test result with the baseline, or store it as the baseline if there is none"""
+        if self.baseline_file_path is None:
+            return
+
+        baseline_path = Path(self.baseline_file_path.format(name=self.name, eval_id=self.eval_id))
+        if not baseline_path.exists():
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(result.get_summary(), indent=4))
+            logger.info(f"Stored load test baseline in {baseline_path}")
+            return
+
+        regressions = result.get_regressions(json.loads(baseline_path.read_text()), self.regression_threshold)
+        if regressions:
+            message = "Performance regressed compared with the baseline: " + "; ".join(regressions)
+            if fail_on_regression:
+                raise EvalError(message)
+            logger.warning(message)
+
+    def _finish_load_test(
+        self, result: LoadTestResult, print_summary: bool, fail_on_regression: bool
+    ) -> LoadTestResult:
+        self.load_result = result
+
+        if self.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=result,
+            )
+
+        if self.print_summary or print_summary:
+            result.print_summary()
+
+        self._check_baseline(result, fail_on_regression)
+
+        logger.debug(f"*********** Load Test End: {self.eval_id} ***********")
+        return result
+
+    def run_load_test(self, *, print_summary: bool = False, fail_on_regression: bool = True) -> LoadTestResult:
+        """
+        Run the function from `concurrency` threads until `num_requests` requests are done or `duration` passes.
+        1. Do optional warm-up runs.
+        2. Run the requests
+        3. Collect results
+        4. Save results and print the summary if requested
+        5. Compare the results with the baseline, raising an EvalError on regressions if fail_on_regression is set
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        logger.debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        # 1. Do optional warm-up runs.
+        for _ in range(self.warmup_runs):
+            self.func()
+
+        # 2. Run the requests
+        max_requests = self._get_num_requests()
+        latencies: List[float] = []
+        errors: List[Exception] = []
+        num_started = 0
+        lock = threading.Lock()
+
+        def caller(deadline: Optional[float]) -> None:
+            nonlocal num_started
+            while deadline is None or perf_counter() < deadline:
+                with lock:
+                    if max_requests is not None and num_started >= max_requests:
+                        return
+                    num_started += 1
+                start = perf_counter()
+                try:
+                    self.func()
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    continue
+                elapsed = perf_counter() - start
+                with lock:
+                    latencies.append(elapsed)
+
+        gc.collect()
+        rss_start = get_rss_mib()
+        start_time = perf_counter()
+        deadline = start_time + self.duration if self.duration is not None else None
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for future in [executor.submit(caller, deadline) for _ in range(self.concurrency)]:
+                future.result()
+        duration = perf_counter() - start_time
+        gc.collect()
+        rss_end = get_rss_mib()
+
+        if errors:
+            logger.debug(f"{len(errors)} requests failed. First error: {errors[0]}")
+
+        # 3. Collect results
+        result = LoadTestResult(
+            latencies=latencies,
+            num_errors=len(errors),
+            concurrency=self.concurrency,
+            duration=duration,
+            rss_start=rss_start,
+            rss_end=rss_end,
+        )
+
+        # 4. and 5. Save, print and compare the results
+        return self._finish_load_test(result, print_summary=print_summary, fail_on_regression=fail_on_regression)
+
+    async def arun_load_test(self, *, print_summary: bool = False, fail_on_regression: bool = True) -> LoadTestResult:
+        """
+        Run the async function from `concurrency` asyncio tasks until `num_requests` requests are done or `duration`
+        passes. See `run_load_test` for the steps.
+        """
+        # Validate the function to evaluate is async.
+        if not asyncio.iscoroutinefunction(self.func):
+            raise ValueError(
+                f"The provided function ({self.func.__name__}) is not async. "
+                "Use the run_load_test() method for sync functions."
+            )
+
+        logger.debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        # 1. Do optional warm-up runs.
+        for _ in range(self.warmup_runs):
+            await self.func()
+
+        # 2. Run the requests
+        max_requests = self._get_num_requests()
+        latencies: List[float] = []
+        errors: List[Exception] = []
+        num_started = 0
+
+        async def caller(deadline: Optional[float]) -> None:
+            nonlocal num_started
+            while deadline is None or perf_counter() < deadline:
+                if max_requests is not None and num_started >= max_requests:
+                    return
+                num_started += 1
+                start = perf_counter()
+                try:
+                    await self.func()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                latencies.append(perf_counter() - start)
+
+        gc.collect()
+        rss_start = get_rss_mib()
+        start_time = perf_counter()
+        deadline = start_time + self.duration if self.duration is not None else None
+        await asyncio.gather(*[caller(deadline) for _ in range(self.concurrency)])
+        duration = perf_counter() - start_time
+        gc.collect()
+        rss_end = get_rss_mib()
+
+        if errors:
+            logger.debug(f"{len(errors)} requests failed. First error: {errors[0]}")
+
+        # 3. Collect results
+        result = LoadTestResult(
+            latencies=latencies,
+            num_errors=len(errors),
+            concurrency=self.concurrency,
+            duration=duration,
+            rss_start=rss_start,
+            rss_end=rss_end,
+        )
+
+        # 4. and 5. Save, print and compare the results
+        return self._finish_load_test(result, print_summary=print_summary, fail_on_regression=fail_on_regression)
@@ -8,7 +8,7 @@ from agno.utils.log import log_debug, logger
 
 if TYPE_CHECKING:
     from agno.eval.accuracy import AccuracyResult
-    from agno.eval.performance import PerformanceResult
+    from agno.eval.performance import LoadTestResult, PerformanceResult
     from agno.eval.reliability import ReliabilityResult
 
 
@@ -76,7 +76,7 @@ async def async_log_eval_run(
 
 def store_result_in_file(
     file_path: str,
-    result: Union["AccuracyResult", "PerformanceResult", "ReliabilityResult"],
+    result: Union["AccuracyResult", "PerformanceResult", "LoadTestResult", "ReliabilityResult"],
     eval_id: Optional[str] = None,
     name: Optional[str] = None,
 ):
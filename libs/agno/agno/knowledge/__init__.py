@@ -1,5 +1,19 @@
-from agno.knowledge.agent import AgentKnowledge
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
 
 __all__ = [
     "AgentKnowledge",
 ]
+
+# Exports are imported on first access, so importing a module of the package does not import them all
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "AgentKnowledge": "agno.knowledge.agent",
+    },
+)
@@ -1,15 +1,88 @@
 import asyncio
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import copy
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from time import perf_counter
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.parallel import can_chunk_in_processes, get_chunked_documents, submit_chunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
-from agno.utils.log import log_debug, log_info, logger
-from agno.vectordb import VectorDb
+from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.vectordb import VectorDb, content_hash
+
+
+def get_shared_meta_data(documents: List[Document]) -> Dict[str, Any]:
+    """Returns the meta_data items that all documents have in common, e.g. those of their source but not the chunk
+    numbers added by the chunking strategy"""
+    shared = dict(documents[0].meta_data)
+    for document in documents[1:]:
+        shared = {
+            key: value
+            for key, value in shared.items()
+            if key in document.meta_data and document.meta_data[key] == value
+        }
+        if not shared:
+            break
+    return shared
+
+
+class _LoadStats:
+    """Throughput and latency of a knowledge base load"""
+
+    def __init__(self) -> None:
+        self.start = perf_counter()
+        self.num_read = 0
+        self.num_loaded = 0
+        self.num_batches = 0
+        self.read_wait_time = 0.0
+        self.write_time = 0.0
+
+    def timed_read(self, document_lists: Iterator[List[Document]]) -> Iterator[List[Document]]:
+        while True:
+            start = perf_counter()
+            try:
+                document_list = next(document_lists)
+            except StopIteration:
+                return
+            finally:
+                self.read_wait_time += perf_counter() - start
+            yield document_list
+
+    async def async_timed_read(self, document_lists: AsyncIterator[List[Document]]) -> AsyncIterator[List[Document]]:
+        while True:
+            start = perf_counter()
+            try:
+                document_list = await document_lists.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                self.read_wait_time += perf_counter() - start
+            yield document_list
+
+    def add_batch(self, num_read: int, num_loaded: int, write_time: float) -> None:
+        self.num_read += num_read
+        self.num_loaded += num_loaded
+        self.num_batches += 1
+        self.write_time += write_time
+
+    def log(self) -> None:
+        elapsed = perf_counter() - self.start
+        docs_per_second = self.num_loaded / elapsed if elapsed > 0 else 0.0
+        avg_write_time = self.write_time / self.num_batches if self.num_batches else 0.0
+        log_info(
+            f"Loaded {self.num_loaded}/{self.num_read} documents in {elapsed:.2f}s ({docs_per_second:.1f} docs/s). "
+            f"Waited {self.read_wait_time:.2f}s on reading, spent {self.write_time:.2f}s embedding and writing "
+            f"{self.num_batches} batches ({avg_write_time:.2f}s per batch)"
+        )
 
 
 class AgentKnowledge(BaseModel):
@@ -23,6 +96,16 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Number of documents written to the vector db in each call when loading
+    load_batch_size: int = 100
+    # Number of document lists read and chunked ahead of the vector db writes when loading
+    load_read_ahead: int = 4
+    # Number of processes chunking the documents of the reader when loading.
+    # By default, documents are chunked by the reader as they are read, in the current process.
+    # On platforms that spawn processes (Windows, macOS), load from an `if __name__ == "__main__":` block.
+    chunking_processes: Optional[int] = None
+    # Number of documents chunked in each task sent to the chunking processes
+    chunking_task_size: int = 16
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -112,32 +195,28 @@ class AgentKnowledge(BaseModel):
             self.vector_db.create()
 
         log_info("Loading knowledge base")
-        num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
-
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
+        stats = _LoadStats()
+        batch: List[Document] = []
+        with self._chunking_pool() as (executor, knowledge):
+            document_lists = knowledge.document_lists
+            if executor is not None:
+                document_lists = self._chunk_in_processes(document_lists, executor)
+            for document_list in stats.timed_read(self._read_ahead(document_lists)):
+                # Track metadata for filtering capabilities
                 for doc in document_list:
-                    self.vector_db.upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                    if doc.meta_data:
+                        self._track_metadata_structure(doc.meta_data)
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        self.vector_db.insert(documents=[doc], filters=doc.meta_data)
+                batch.extend(document_list)
+                while len(batch) >= self.load_batch_size:
+                    self._load_batch(
+                        batch[: self.load_batch_size], upsert=upsert, skip_existing=skip_existing, stats=stats
+                    )
+                    batch = batch[self.load_batch_size :]
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+        if batch:
+            self._load_batch(batch, upsert=upsert, skip_existing=skip_existing, stats=stats)
+        stats.log()
 
     async def aload(
         self,
@@ -166,32 +245,197 @@ class AgentKnowledge(BaseModel):
             await self.vector_db.async_create()
 
         log_info("Loading knowledge base")
-        num_documents = 0
-        document_iterator = self.async_document_lists
-        async for document_list in document_iterator:  # type: ignore
-            documents_to_load = document_list
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
-
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
+        stats = _LoadStats()
+        batch: List[Document] = []
+        with self._chunking_pool() as (executor, knowledge):
+            document_lists: AsyncIterator[List[Document]] = knowledge.async_document_lists  # type: ignore
+            if executor is not None:
+                document_lists = self._async_chunk_in_processes(document_lists, executor)
+            async for document_list in stats.async_timed_read(self._async_read_ahead(document_lists)):
+                # Track metadata for filtering capabilities
                 for doc in document_list:
-                    await self.vector_db.async_upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
+                    if doc.meta_data:
+                        self._track_metadata_structure(doc.meta_data)
+
+                batch.extend(document_list)
+                while len(batch) >= self.load_batch_size:
+                    await self._aload_batch(
+                        batch[: self.load_batch_size], upsert=upsert, skip_existing=skip_existing, stats=stats
+                    )
+                    batch = batch[self.load_batch_size :]
+
+        if batch:
+            await self._aload_batch(batch, upsert=upsert, skip_existing=skip_existing, stats=stats)
+        stats.log()
+
+    def _load_batch(self, documents: List[Document], upsert: bool, skip_existing: bool, stats: "_LoadStats") -> None:
+        """Write one batch of documents to the vector db in a single call.
+        The meta_data shared by all documents of the batch is passed as the filters of the call.
+        """
+        self.vector_db = cast(VectorDb, self.vector_db)
+        start = perf_counter()
+        upsert = upsert and self.vector_db.upsert_available()
+        if upsert:
+            documents_to_load = documents
+        else:
+            documents_to_load = self.filter_existing_documents(documents) if skip_existing else documents
+        if documents_to_load:
+            filters = get_shared_meta_data(documents_to_load)
+            if upsert:
+                self.vector_db.upsert(documents=documents_to_load, filters=filters)
             else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                self.vector_db.insert(documents=documents_to_load, filters=filters)
+        stats.add_batch(num_read=len(documents), num_loaded=len(documents_to_load), write_time=perf_counter() - start)
+        log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        await self.vector_db.async_insert(documents=[doc], filters=doc.meta_data)
+    async def _aload_batch(
+        self, documents: List[Document], upsert: bool, skip_existing: bool, stats: "_LoadStats"
+    ) -> None:
+        """Async version of `_load_batch`"""
+        self.vector_db = cast(VectorDb, self.vector_db)
+        start = perf_counter()
+        upsert = upsert and self.vector_db.upsert_available()
+        if upsert:
+            documents_to_load = documents
+        else:
+            documents_to_load = await self.async_filter_existing_documents(documents) if skip_existing else documents
+        if documents_to_load:
+            filters = get_shared_meta_data(documents_to_load)
+            if upsert:
+                await self.vector_db.async_upsert(documents=documents_to_load, filters=filters)
+            else:
+                await self.vector_db.async_insert(documents=documents_to_load, filters=filters)
+        stats.add_batch(num_read=len(documents), num_loaded=len(documents_to_load), write_time=perf_counter() - start)
+        log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+    def _read_ahead(self, document_lists: Iterator[List[Document]]) -> Iterator[List[Document]]:
+        """Read and chunk document lists in a background thread, at most `load_read_ahead` lists ahead of the
+        consumer, so that reading overlaps with embedding and writing to the vector db.
+        """
+        done = object()
+        buffer: "queue.Queue[Any]" = queue.Queue(maxsize=max(self.load_read_ahead, 1))
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for document_list in document_lists:
+                    if not put(document_list):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        reader = threading.Thread(target=produce, name="agno-knowledge-reader", daemon=True)
+        reader.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+
+    async def _async_read_ahead(self, document_lists: AsyncIterator[List[Document]]) -> AsyncIterator[List[Document]]:
+        """Async version of `_read_ahead`, reading in a background task instead of a thread"""
+        done = object()
+        buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(self.load_read_ahead, 1))
+
+        async def produce() -> None:
+            try:
+                async for document_list in document_lists:
+                    await buffer.put(document_list)
+            except Exception as e:
+                await buffer.put(e)
+            finally:
+                await buffer.put(done)
+
+        reader = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await buffer.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not reader.done():
+                reader.cancel()
+
+    @contextmanager
+    def _chunking_pool(self) -> Iterator[Tuple[Optional[ProcessPoolExecutor], "AgentKnowledge"]]:
+        """Yields the pool of processes chunking the documents of the reader while loading, or None if documents are
+        chunked by the reader, and the knowledge base to read the documents from.
+        With a pool, that is a copy of this knowledge base with a copy of the reader which does not chunk documents,
+        so the reader, which may be shared with other knowledge bases, is not changed.
+        """
+        if not self.chunking_processes or self.reader is None or not self.reader.chunk:
+            yield None, self
+            return
+
+        strategy = self.reader.get_chunking_strategy()
+        if not can_chunk_in_processes(strategy):
+            log_warning(f"{type(strategy).__name__} can not be sent to other processes, chunking in the reader")
+            yield None, self
+            return
+
+        reader = copy(self.reader)
+        reader.chunk = False
+        with ProcessPoolExecutor(max_workers=self.chunking_processes) as executor:
+            # Start the workers now, instead of from the read ahead thread
+            executor.submit(int).result()
+            yield executor, self.model_copy(update={"reader": reader})
+
+    def _chunk_in_processes(
+        self, document_lists: Iterator[List[Document]], executor: ProcessPoolExecutor
+    ) -> Iterator[List[Document]]:
+        """Chunk document lists in a pool of processes, keeping up to `load_read_ahead` lists in flight.
+        Chunked lists are yielded in the order they were read.
+        """
+        strategy = self.reader.get_chunking_strategy()  # type: ignore
+        pending: Deque[List[Any]] = deque()
+        for document_list in document_lists:
+            pending.append(submit_chunking(executor, strategy, document_list, self.chunking_task_size))
+            if len(pending) > self.load_read_ahead:
+                yield get_chunked_documents(pending.popleft())
+        while pending:
+            yield get_chunked_documents(pending.popleft())
+
+    async def _async_chunk_in_processes(
+        self, document_lists: AsyncIterator[List[Document]], executor: ProcessPoolExecutor
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of `_chunk_in_processes`"""
+        reader = cast(Reader, self.reader)
+        pending: Deque["asyncio.Future[List[Document]]"] = deque()
+        try:
+            async for document_list in document_lists:
+                pending.append(
+                    asyncio.ensure_future(
+                        reader.chunk_documents_async(
+                            document_list, executor=executor, task_size=self.chunking_task_size
+                        )
+                    )
+                )
+                if len(pending) > self.load_read_ahead:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
 
     def load_documents(
         self,
@@ -223,11 +467,7 @@ class AgentKnowledge(BaseModel):
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
-            documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
-                if skip_existing
-                else documents
-            )
+            documents_to_load = self.filter_existing_documents(documents) if skip_existing else documents
 
             # Insert documents
             if len(documents_to_load) > 0:
@@ -273,23 +513,7 @@ class AgentKnowledge(BaseModel):
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
-            if skip_existing:
-                try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
-                except NotImplementedError:
-                    logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
-            else:
-                documents_to_load = documents
+            documents_to_load = await self.async_filter_existing_documents(documents) if skip_existing else documents
 
             # Insert documents
             if len(documents_to_load) > 0:
@@ -414,28 +638,55 @@ class AgentKnowledge(BaseModel):
         Returns:
             List[Document]: Filtered list of documents that don't exist in the database
         """
-        from agno.utils.log import log_debug, log_info
+        if not self.vector_db:
+            log_debug("No vector database configured, skipping document filtering")
+            return documents
 
+        hashes = [content_hash(doc) for doc in documents]
+        try:
+            existing_hashes = self.vector_db.existing_content_hashes(list(set(hashes)))
+        except NotImplementedError:
+            # Fall back to checking each unique document
+            unique_documents = dict(zip(hashes, documents))
+            existing_hashes = {doc_hash for doc_hash, doc in unique_documents.items() if self.vector_db.doc_exists(doc)}
+        return self._filter_by_content_hash(documents, hashes, existing_hashes)
+
+    async def async_filter_existing_documents(self, documents: List[Document]) -> List[Document]:
+        """Async version of `filter_existing_documents`"""
         if not self.vector_db:
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
+        hashes = [content_hash(doc) for doc in documents]
+        try:
+            existing_hashes = await self.vector_db.async_existing_content_hashes(list(set(hashes)))
+        except NotImplementedError:
+            # Fall back to checking each unique document, in parallel
+            unique_documents = dict(zip(hashes, documents))
+            existence_checks = await asyncio.gather(
+                *[self.vector_db.async_doc_exists(doc) for doc in unique_documents.values()], return_exceptions=True
+            )
+            existing_hashes = {
+                doc_hash for doc_hash, exists in zip(unique_documents, existence_checks) if exists is True
+            }
+        return self._filter_by_content_hash(documents, hashes, existing_hashes)
+
+    def _filter_by_content_hash(
+        self, documents: List[Document], hashes: List[str], existing_hashes: Set[str]
+    ) -> List[Document]:
+        """Drop documents whose content hash exists in the vector db or repeats earlier in the list"""
         # Use set for O(1) lookups
-        seen_content = set()
-        original_count = len(documents)
+        seen_hashes: Set[str] = set()
         filtered_documents = []
-
-        for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
-                seen_content.add(content_hash)
-                filtered_documents.append(doc)
-            else:
+        for doc, doc_hash in zip(documents, hashes):
+            if doc_hash in existing_hashes or doc_hash in seen_hashes:
                 log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+                continue
+            seen_hashes.add(doc_hash)
+            filtered_documents.append(doc)
 
-        if len(filtered_documents) < original_count:
-            log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
+        if len(filtered_documents) < len(documents):
+            log_info(f"Skipped {len(documents) - len(filtered_documents)} existing/duplicate documents.")
 
         return filtered_documents
 
@@ -655,7 +906,7 @@ class AgentKnowledge(BaseModel):
             documents_to_insert = documents
             if skip_existing:
                 log_debug("Filtering out existing documents before insertion.")
-                documents_to_insert = self.filter_existing_documents(documents)
+                documents_to_insert = await self.async_filter_existing_documents(documents)
 
             if documents_to_insert:  # type: ignore
                 log_debug(f"Inserting {len(documents_to_insert)} new documents.")
@@ -1,7 +1,12 @@
-from agno.memory.agent import AgentMemory
-from agno.memory.memory import Memory
-from agno.memory.row import MemoryRow
-from agno.memory.team import TeamMemory
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.memory.agent import AgentMemory
+    from agno.memory.memory import Memory
+    from agno.memory.row import MemoryRow
+    from agno.memory.team import TeamMemory
 
 __all__ = [
     "AgentMemory",
@@ -9,3 +14,15 @@ __all__ = [
     "MemoryRow",
     "TeamMemory",
 ]
+
+# Exports are imported on first access, so importing a module of the package does not import them all
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "AgentMemory": "agno.memory.agent",
+        "Memory": "agno.memory.memory",
+        "MemoryRow": "agno.memory.row",
+        "TeamMemory": "agno.memory.team",
+    },
+)
@@ -1,8 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, TypeVar
 
 from agno.memory.v2.db.schema import MemoryRow
 
+T = TypeVar("T")
+
 
 class MemoryDb(ABC):
     """Base class for the Memory Database."""
@@ -40,3 +43,26 @@ class MemoryDb(ABC):
     @abstractmethod
     def clear(self) -> bool:
         raise NotImplementedError
+
+    # -*- Async methods
+    # Databases with an async client override these. The defaults run the sync method with `_run_sync`.
+    async def _run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a sync method in a thread, so a slow database call does not block the event loop"""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def amemory_exists(self, memory: MemoryRow) -> bool:
+        return await self._run_sync(self.memory_exists, memory)
+
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        return await self._run_sync(self.read_memories, user_id=user_id, limit=limit, sort=sort)
+
+    async def aupsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
+        return await self._run_sync(self.upsert_memory, memory)
+
+    async def adelete_memory(self, memory_id: str) -> None:
+        return await self._run_sync(self.delete_memory, memory_id)
+
+    async def aclear(self) -> bool:
+        return await self._run_sync(self.clear)
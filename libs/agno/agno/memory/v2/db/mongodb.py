@@ -2,16 +2,18 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 try:
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient, MongoClient
+    from pymongo.asynchronous.collection import AsyncCollection
     from pymongo.collection import Collection
     from pymongo.database import Database
     from pymongo.errors import PyMongoError
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
-from agno.memory.v2.db import MemoryDb
+from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.utils.log import log_debug, logger
+from agno.utils.loop import LoopLocal
 
 
 class MongoMemoryDb(MemoryDb):
@@ -21,6 +23,7 @@ class MongoMemoryDb(MemoryDb):
         db_url: Optional[str] = None,
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
+        async_client: Optional[AsyncMongoClient] = None,
     ):
         """
         This class provides a memory store backed by a MongoDB collection.
@@ -30,6 +33,8 @@ class MongoMemoryDb(MemoryDb):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing async MongoDB client, used by the async methods. Defaults to a client
+                for the db_url. If only a client is provided, the async methods run in a thread.
         """
         self._client: Optional[MongoClient] = client
         if self._client is None and db_url is not None:
@@ -43,6 +48,22 @@ class MongoMemoryDb(MemoryDb):
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
 
+        # Async clients are bound to an event loop, so one is created per loop unless a client is provided
+        self._async_client: Optional[AsyncMongoClient] = async_client
+        self._async_clients: Optional[LoopLocal[AsyncMongoClient]] = None
+        if async_client is None and db_url is not None:
+            self._async_clients = LoopLocal(lambda: AsyncMongoClient(db_url))
+
+    @property
+    def async_collection(self) -> Optional[AsyncCollection]:
+        """The async collection of the running event loop, None if there is no async client"""
+        async_client = self._async_client
+        if async_client is None and self._async_clients is not None:
+            async_client = self._async_clients.get()
+        if async_client is None:
+            return None
+        return async_client[self.db_name][self.collection_name]
+
     def __dict__(self) -> Dict[str, Any]:
         return {
             "name": "MongoMemoryDb",
@@ -108,6 +129,30 @@ class MongoMemoryDb(MemoryDb):
             logger.error(f"Error reading memories: {e}")
         return memories
 
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        """Async version of read_memories"""
+        async_collection = self.async_collection
+        if async_collection is None:
+            return await super().aread_memories(user_id=user_id, limit=limit, sort=sort)
+        memories: List[MemoryRow] = []
+        try:
+            query = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+
+            sort_order = -1 if sort != "asc" else 1
+            cursor = async_collection.find(query).sort("created_at", sort_order)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+
+            async for doc in cursor:
+                memories.append(MemoryRow(user_id=doc["user_id"], memory=doc["memory"]))
+        except PyMongoError as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Upsert a memory into the collection
         Args:
@@ -117,30 +162,38 @@ class MongoMemoryDb(MemoryDb):
             None
         """
         try:
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
+            query = {"id": memory.id}
+            update_data = self._get_update_data(memory)
 
-            # Add version field for optimistic locking
-            memory_dict = memory.model_dump()
-            if "_version" not in memory_dict:
-                memory_dict["_version"] = 1
-            else:
-                memory_dict["_version"] += 1
+            # For new documents, set created_at
+            doc = self.collection.find_one(query, {"_id": 1})
+            if not doc:
+                update_data["created_at"] = update_data["updated_at"]
 
-            update_data = {
-                "user_id": memory.user_id,
-                "memory": memory.memory,
-                "updated_at": timestamp,
-                "_version": memory_dict["_version"],
-            }
+            result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
-            # For new documents, set created_at
+            if not result.acknowledged:
+                logger.error("Memory upsert not acknowledged")
+
+        except PyMongoError as e:
+            logger.error(f"Error upserting memory: {e}")
+            raise
+
+    async def aupsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        """Async version of upsert_memory"""
+        async_collection = self.async_collection
+        if async_collection is None:
+            await super().aupsert_memory(memory)
+            return
+        try:
             query = {"id": memory.id}
-            doc = self.collection.find_one(query)
+            update_data = self._get_update_data(memory)
+
+            doc = await async_collection.find_one(query, {"_id": 1})
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
-            result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
+            result = await async_collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if not result.acknowledged:
                 logger.error("Memory upsert not acknowledged")
@@ -149,6 +202,24 @@ class MongoMemoryDb(MemoryDb):
             logger.error(f"Error upserting memory: {e}")
             raise
 
+    def _get_update_data(self, memory: MemoryRow) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Add version field for optimistic locking
+        memory_dict = memory.model_dump()
+        if "_version" not in memory_dict:
+            memory_dict["_version"] = 1
+        else:
+            memory_dict["_version"] += 1
+
+        return {
+            "user_id": memory.user_id,
+            "memory": memory.memory,
+            "updated_at": timestamp,
+            "_version": memory_dict["_version"],
+        }
+
     def delete_memory(self, memory_id: str) -> None:
         """Delete a memory from the collection
         Args:
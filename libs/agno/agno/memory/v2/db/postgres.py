@@ -1,19 +1,24 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
-    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
     from sqlalchemy.sql.expression import delete, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.sql import AsyncSessionFactory
 
 
 class PostgresMemoryDb(MemoryDb):
@@ -23,6 +28,7 @@ class PostgresMemoryDb(MemoryDb):
         schema: Optional[str] = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides a memory store backed by a postgres table.
@@ -36,6 +42,8 @@ class PostgresMemoryDb(MemoryDb):
             schema (Optional[str]): The schema to store the table in. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to. Defaults to None.
             db_engine (Optional[Engine]): The database engine to use. Defaults to None.
+            async_db_engine (Optional[AsyncEngine]): The async engine used by the async methods. Defaults to a
+                psycopg async engine for the database of the db_engine.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -51,6 +59,7 @@ class PostgresMemoryDb(MemoryDb):
         self.inspector = inspect(self.db_engine)
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        self.AsyncSession: AsyncSessionFactory = AsyncSessionFactory(self.db_engine, async_db_engine)
         self.table: Table = self.get_table()
 
     def __dict__(self) -> Dict[str, Any]:
@@ -95,29 +104,51 @@ class PostgresMemoryDb(MemoryDb):
     def read_memories(
         self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
     ) -> List[MemoryRow]:
-        memories: List[MemoryRow] = []
         try:
             with self.Session() as sess, sess.begin():
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                if sort == "asc":
-                    stmt = stmt.order_by(self.table.c.created_at.asc())
-                else:
-                    stmt = stmt.order_by(self.table.c.created_at.desc())
-
-                rows = sess.execute(stmt).fetchall()
-                for row in rows:
-                    if row is not None:
-                        memories.append(MemoryRow.model_validate(row))
+                return self._read_memories(sess, user_id, limit, sort)
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
             log_debug("Creating table for future transactions")
             self.create()
+        return []
+
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await super().aread_memories(user_id=user_id, limit=limit, sort=sort)
+        try:
+            async with async_session() as sess, sess.begin():
+                return await sess.run_sync(self._read_memories, user_id, limit, sort)
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            log_debug(f"Table does not exist: {self.table.name}")
+            log_debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+        return []
+
+    def _read_memories(
+        self, sess: Session, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        stmt = select(self.table)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if sort == "asc":
+            stmt = stmt.order_by(self.table.c.created_at.asc())
+        else:
+            stmt = stmt.order_by(self.table.c.created_at.desc())
+
+        rows = sess.execute(stmt).fetchall()
+        for row in rows:
+            if row is not None:
+                memories.append(MemoryRow.model_validate(row))
         return memories
 
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
@@ -125,24 +156,7 @@ class PostgresMemoryDb(MemoryDb):
 
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    id=memory.id,
-                    user_id=memory.user_id,
-                    memory=memory.memory,
-                )
-
-                # Define the upsert if the memory already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_=dict(
-                        user_id=stmt.excluded.user_id,
-                        memory=stmt.excluded.memory,
-                    ),
-                )
-
-                sess.execute(stmt)
+                self._upsert_memory(sess, memory)
         except Exception as e:
             log_debug(f"Exception upserting into table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -152,6 +166,41 @@ class PostgresMemoryDb(MemoryDb):
                 return self.upsert_memory(memory, create_and_retry=False)
             return None
 
+    async def aupsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await asyncio.to_thread(self.upsert_memory, memory, create_and_retry)
+        try:
+            async with async_session() as sess, sess.begin():
+                await sess.run_sync(self._upsert_memory, memory)
+        except Exception as e:
+            log_debug(f"Exception upserting into table: {e}")
+            log_debug(f"Table does not exist: {self.table.name}")
+            log_debug("Creating table for future transactions")
+            await asyncio.to_thread(self.create)
+            if create_and_retry:
+                return await self.aupsert_memory(memory, create_and_retry=False)
+            return None
+
+    def _upsert_memory(self, sess: Session, memory: MemoryRow) -> None:
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(
+            id=memory.id,
+            user_id=memory.user_id,
+            memory=memory.memory,
+        )
+
+        # Define the upsert if the memory already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_=dict(
+                user_id=stmt.excluded.user_id,
+                memory=stmt.excluded.memory,
+            ),
+        )
+        sess.execute(stmt)
+
     def delete_memory(self, memory_id: str) -> None:
         with self.Session() as sess, sess.begin():
             stmt = delete(self.table).where(self.table.c.id == memory_id)
@@ -4,12 +4,14 @@ from typing import Any, Dict, List, Optional
 
 try:
     from redis import ConnectionError, Redis
+    from redis.asyncio import Redis as AsyncRedis
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.loop import LoopLocal
 
 
 class RedisMemoryDb(MemoryDb):
@@ -42,6 +44,10 @@ class RedisMemoryDb(MemoryDb):
             password=password,
             decode_responses=True,  # Automatically decode responses to str
         )
+        # Async clients used by the async methods, one per event loop as connections can not be shared
+        self._async_clients: LoopLocal[AsyncRedis] = LoopLocal(
+            lambda: AsyncRedis(host=host, port=port, db=db, password=password, decode_responses=True)
+        )
         log_debug(f"Created RedisMemoryDb with prefix: '{self.prefix}'")
 
     def __dict__(self) -> Dict[str, Any]:
@@ -51,6 +57,11 @@ class RedisMemoryDb(MemoryDb):
             "expire": self.expire,
         }
 
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """The async Redis client of the running event loop."""
+        return self._async_clients.get()
+
     def _get_key(self, memory_id: str) -> str:
         """Generate Redis key for a memory."""
         return f"{self.prefix}:{memory_id}"
@@ -96,53 +107,92 @@ class RedisMemoryDb(MemoryDb):
                     if user_id is None or data.get("user_id") == user_id:
                         memory_data.append(data)
 
-            # Sort by created_at timestamp
-            if sort == "asc":
-                memory_data.sort(key=lambda x: x.get("created_at", 0))
-            else:
-                memory_data.sort(key=lambda x: x.get("created_at", 0), reverse=True)
-
-            # Apply limit if specified
-            if limit is not None and limit > 0:
-                memory_data = memory_data[:limit]
-
-            # Convert to MemoryRow objects
-            for data in memory_data:
-                memories.append(MemoryRow.model_validate(data))
-
+            memories = self._to_memory_rows(memory_data, limit=limit, sort=sort)
         except Exception as e:
             logger.error(f"Error reading memories: {e}")
 
         return memories
 
-    def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
-        """Upsert a memory in Redis"""
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        """Read memories from Redis, with the async client"""
+        memories: List[MemoryRow] = []
         try:
-            # Prepare data
-            timestamp = int(time.time())
+            client = self.async_redis_client
+            keys = [key async for key in client.scan_iter(match=f"{self.prefix}:*")]
+            memory_data = []
+            if keys:
+                # Read all memories in a single round trip
+                for data_str in await client.mget(keys):
+                    if data_str:
+                        data = json.loads(data_str)
+                        if user_id is None or data.get("user_id") == user_id:
+                            memory_data.append(data)
+
+            memories = self._to_memory_rows(memory_data, limit=limit, sort=sort)
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+
+        return memories
 
-            # Convert to dict and handle datetime objects
-            memory_data = memory.model_dump(mode="json")
+    def _to_memory_rows(
+        self, memory_data: List[Dict[str, Any]], limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        # Sort by created_at timestamp
+        if sort == "asc":
+            memory_data.sort(key=lambda x: x.get("created_at", 0))
+        else:
+            memory_data.sort(key=lambda x: x.get("created_at", 0), reverse=True)
 
-            # Add timestamps if not present
-            if "created_at" not in memory_data:
-                memory_data["created_at"] = timestamp
+        # Apply limit if specified
+        if limit is not None and limit > 0:
+            memory_data = memory_data[:limit]
 
-            memory_data["updated_at"] = timestamp
+        # Convert to MemoryRow objects
+        return [MemoryRow.model_validate(data) for data in memory_data]
 
+    def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
+        """Upsert a memory in Redis"""
+        try:
             # Save to Redis
             key = self._get_key(memory.id)  # type: ignore
             if self.expire is not None:
-                self.redis_client.set(key, json.dumps(memory_data), ex=self.expire)
+                self.redis_client.set(key, self._serialize_memory(memory), ex=self.expire)
             else:
-                self.redis_client.set(key, json.dumps(memory_data))
+                self.redis_client.set(key, self._serialize_memory(memory))
+
+            return memory
+
+        except Exception as e:
+            logger.error(f"Error upserting memory: {e}")
+            return None
 
+    async def aupsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
+        """Upsert a memory in Redis, with the async client"""
+        try:
+            key = self._get_key(memory.id)  # type: ignore
+            await self.async_redis_client.set(key, self._serialize_memory(memory), ex=self.expire)
             return memory
 
         except Exception as e:
             logger.error(f"Error upserting memory: {e}")
             return None
 
+    def _serialize_memory(self, memory: MemoryRow) -> str:
+        # Prepare data
+        timestamp = int(time.time())
+
+        # Convert to dict and handle datetime objects
+        memory_data = memory.model_dump(mode="json")
+
+        # Add timestamps if not present
+        if "created_at" not in memory_data:
+            memory_data["created_at"] = timestamp
+
+        memory_data["updated_at"] = timestamp
+        return json.dumps(memory_data)
+
     def delete_memory(self, memory_id: str) -> None:
         """Delete a memory from Redis"""
         try:
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 try:
     from sqlalchemy import (
@@ -16,13 +16,17 @@ try:
         text,
     )
     from sqlalchemy.exc import SQLAlchemyError
-    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.orm import Session, scoped_session, sessionmaker
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it with `pip install sqlalchemy`")
 
-from agno.memory.v2.db.base import MemoryDb
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+from agno.memory.v2.db.base import MemoryDb, T
 from agno.memory.v2.db.schema import MemoryRow
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.sql import AsyncSessionFactory, create_in_memory_sqlite_engine, is_in_memory_sqlite
 
 
 class SqliteMemoryDb(MemoryDb):
@@ -32,6 +36,7 @@ class SqliteMemoryDb(MemoryDb):
         db_url: Optional[str] = None,
         db_file: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides a memory store backed by a SQLite table.
@@ -47,6 +52,8 @@ class SqliteMemoryDb(MemoryDb):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The database engine to use.
+            async_db_engine: The async engine used by the async methods. Defaults to an aiosqlite engine for the
+                database file, if aiosqlite is installed. Otherwise the async methods run in a thread.
         """
         self.db_file = db_file
         _engine: Optional[Engine] = db_engine
@@ -59,7 +66,7 @@ class SqliteMemoryDb(MemoryDb):
             db_path.parent.mkdir(parents=True, exist_ok=True)
             _engine = create_engine(f"sqlite:///{db_path}")
         else:
-            _engine = create_engine("sqlite://")
+            _engine = create_in_memory_sqlite_engine()
 
         if _engine is None:
             raise ValueError("Must provide either db_url, db_file or db_engine")
@@ -70,12 +77,21 @@ class SqliteMemoryDb(MemoryDb):
         self.db_engine: Engine = _engine
         self.metadata: MetaData = MetaData()
         self.inspector = inspect(self.db_engine)
+        # In-memory databases are not shared between threads, so the async methods run on the event loop
+        self._in_memory: bool = is_in_memory_sqlite(self.db_engine)
 
         # Database session
         self.Session = scoped_session(sessionmaker(bind=self.db_engine))
+        self.AsyncSession: AsyncSessionFactory = AsyncSessionFactory(self.db_engine, async_db_engine)
         # Database table for memories
         self.table: Table = self.get_table()
 
+    async def _run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # An in-memory database lives in a single connection, run on the event loop instead of in a thread
+        if self._in_memory:
+            return func(*args, **kwargs)
+        return await super()._run_sync(func, *args, **kwargs)
+
     def __dict__(self) -> Dict[str, Any]:
         return {
             "name": "SqliteMemoryDb",
@@ -115,56 +131,64 @@ class SqliteMemoryDb(MemoryDb):
     def read_memories(
         self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
     ) -> List[MemoryRow]:
-        memories: List[MemoryRow] = []
         try:
             with self.Session() as session:
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-
-                if sort == "asc":
-                    stmt = stmt.order_by(self.table.c.created_at.asc())
-                else:
-                    stmt = stmt.order_by(self.table.c.created_at.desc())
-
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                result = session.execute(stmt)
-                for row in result:
-                    memories.append(
-                        MemoryRow(
-                            id=row.id,
-                            user_id=row.user_id,
-                            memory=eval(row.memory),
-                            last_updated=row.updated_at or row.created_at,
-                        )
-                    )
+                return self._read_memories(session, user_id, limit, sort)
         except SQLAlchemyError as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table_name}")
             log_debug("Creating table for future transactions")
             self.create()
+        return []
+
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await super().aread_memories(user_id=user_id, limit=limit, sort=sort)
+        try:
+            async with async_session() as session:
+                return await session.run_sync(self._read_memories, user_id, limit, sort)
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+            log_debug(f"Table does not exist: {self.table_name}")
+            log_debug("Creating table for future transactions")
+            await self._run_sync(self.create)
+        return []
+
+    def _read_memories(
+        self, session: Session, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        stmt = select(self.table)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+
+        if sort == "asc":
+            stmt = stmt.order_by(self.table.c.created_at.asc())
+        else:
+            stmt = stmt.order_by(self.table.c.created_at.desc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = session.execute(stmt)
+        for row in result:
+            memories.append(
+                MemoryRow(
+                    id=row.id,
+                    user_id=row.user_id,
+                    memory=eval(row.memory),
+                    last_updated=row.updated_at or row.created_at,
+                )
+            )
         return memories
 
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         try:
             with self.Session() as session:
-                # Check if the memory already exists
-                existing = session.execute(select(self.table).where(self.table.c.id == memory.id)).first()
-
-                if existing:
-                    # Update existing memory
-                    stmt = (
-                        self.table.update()
-                        .where(self.table.c.id == memory.id)
-                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
-                    )
-                else:
-                    # Insert new memory
-                    stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
-
-                session.execute(stmt)
+                self._upsert_memory(session, memory)
                 session.commit()
         except SQLAlchemyError as e:
             logger.error(f"Exception upserting into table: {e}")
@@ -177,6 +201,42 @@ class SqliteMemoryDb(MemoryDb):
             else:
                 raise
 
+    async def aupsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await self._run_sync(self.upsert_memory, memory, create_and_retry)
+        try:
+            async with async_session() as session:
+                await session.run_sync(self._upsert_memory, memory)
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Exception upserting into table: {e}")
+            if not await self._run_sync(self.table_exists):
+                log_info(f"Table does not exist: {self.table_name}")
+                log_info("Creating table for future transactions")
+                await self._run_sync(self.create)
+                if create_and_retry:
+                    return await self.aupsert_memory(memory, create_and_retry=False)
+            else:
+                raise
+
+    def _upsert_memory(self, session: Session, memory: MemoryRow) -> None:
+        # Check if the memory already exists
+        existing = session.execute(select(self.table.c.id).where(self.table.c.id == memory.id)).first()
+
+        if existing:
+            # Update existing memory
+            stmt = (
+                self.table.update()
+                .where(self.table.c.id == memory.id)
+                .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
+            )
+        else:
+            # Insert new memory
+            stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
+
+        session.execute(stmt)
+
     def delete_memory(self, memory_id: str) -> None:
         with self.Session() as session:
             stmt = delete(self.table).where(self.table.c.id == memory_id)
@@ -211,7 +211,7 @@ class MemoryManager:
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.determine_tools_for_model(
-            self._get_db_tools(
+            self._aget_db_tools(
                 user_id, db, input_string, enable_delete_memory=delete_memories, enable_clear_memory=clear_memories
             ),
         )
@@ -298,7 +298,7 @@ class MemoryManager:
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.determine_tools_for_model(
-            self._get_db_tools(
+            self._aget_db_tools(
                 user_id, db, task, enable_delete_memory=delete_memories, enable_clear_memory=clear_memories
             ),
         )
@@ -334,8 +334,6 @@ class MemoryManager:
         enable_delete_memory: bool = True,
         enable_clear_memory: bool = True,
     ) -> List[Callable]:
-        from datetime import datetime
-
         def add_memory(memory: str, topics: Optional[List[str]] = None) -> str:
             """Use this function to add a memory to the database.
             Args:
@@ -347,22 +345,8 @@ class MemoryManager:
             from uuid import uuid4
 
             try:
-                last_updated = datetime.now()
                 memory_id = str(uuid4())
-                db.upsert_memory(
-                    MemoryRow(
-                        id=memory_id,
-                        user_id=user_id,
-                        memory=UserMemory(
-                            memory_id=memory_id,
-                            memory=memory,
-                            topics=topics,
-                            last_updated=last_updated,
-                            input=input_string,
-                        ).to_dict(),
-                        last_updated=last_updated,
-                    )
-                )
+                db.upsert_memory(self._get_memory_row(memory_id, user_id, memory, topics, input_string))
                 log_debug(f"Memory added: {memory_id}")
                 return "Memory added successfully"
             except Exception as e:
@@ -379,21 +363,7 @@ class MemoryManager:
                 str: A message indicating if the memory was updated successfully or not.
             """
             try:
-                last_updated = datetime.now()
-                db.upsert_memory(
-                    MemoryRow(
-                        id=memory_id,
-                        user_id=user_id,
-                        memory=UserMemory(
-                            memory_id=memory_id,
-                            memory=memory,
-                            topics=topics,
-                            last_updated=last_updated,
-                            input=input_string,
-                        ).to_dict(),
-                        last_updated=last_updated,
-                    )
-                )
+                db.upsert_memory(self._get_memory_row(memory_id, user_id, memory, topics, input_string))
                 log_debug("Memory updated")
                 return "Memory updated successfully"
             except Exception as e:
@@ -435,3 +405,106 @@ class MemoryManager:
         if enable_clear_memory:
             functions.append(clear_memory)
         return functions
+
+    def _aget_db_tools(
+        self,
+        user_id: str,
+        db: MemoryDb,
+        input_string: str,
+        enable_add_memory: bool = True,
+        enable_update_memory: bool = True,
+        enable_delete_memory: bool = True,
+        enable_clear_memory: bool = True,
+    ) -> List[Callable]:
+        """Async version of _get_db_tools, the tools use the async methods of the db"""
+
+        async def add_memory(memory: str, topics: Optional[List[str]] = None) -> str:
+            """Use this function to add a memory to the database.
+            Args:
+                memory (str): The memory to be added.
+                topics (Optional[List[str]]): The topics of the memory (e.g. ["name", "hobbies", "location"]).
+            Returns:
+                str: A message indicating if the memory was added successfully or not.
+            """
+            from uuid import uuid4
+
+            try:
+                memory_id = str(uuid4())
+                await db.aupsert_memory(self._get_memory_row(memory_id, user_id, memory, topics, input_string))
+                log_debug(f"Memory added: {memory_id}")
+                return "Memory added successfully"
+            except Exception as e:
+                log_warning(f"Error storing memory in db: {e}")
+                return f"Error adding memory: {e}"
+
+        async def update_memory(memory_id: str, memory: str, topics: Optional[List[str]] = None) -> str:
+            """Use this function to update an existing memory in the database.
+            Args:
+                memory_id (str): The id of the memory to be updated.
+                memory (str): The updated memory.
+                topics (Optional[List[str]]): The topics of the memory (e.g. ["name", "hobbies", "location"]).
+            Returns:
+                str: A message indicating if the memory was updated successfully or not.
+            """
+            try:
+                await db.aupsert_memory(self._get_memory_row(memory_id, user_id, memory, topics, input_string))
+                log_debug("Memory updated")
+                return "Memory updated successfully"
+            except Exception as e:
+                log_warning("Error storing memory in db: {e}")
+                return f"Error adding memory: {e}"
+
+        async def delete_memory(memory_id: str) -> str:
+            """Use this function to delete a single memory from the database.
+            Args:
+                memory_id (str): The id of the memory to be deleted.
+            Returns:
+                str: A message indicating if the memory was deleted successfully or not.
+            """
+            try:
+                await db.adelete_memory(memory_id=memory_id)
+                log_debug("Memory deleted")
+                return "Memory deleted successfully"
+            except Exception as e:
+                log_warning(f"Error deleting memory in db: {e}")
+                return f"Error deleting memory: {e}"
+
+        async def clear_memory() -> str:
+            """Use this function to remove all (or clear all) memories from the database.
+
+            Returns:
+                str: A message indicating if the memory was cleared successfully or not.
+            """
+            await db.aclear()
+            log_debug("Memory cleared")
+            return "Memory cleared successfully"
+
+        functions: List[Callable] = []
+        if enable_add_memory:
+            functions.append(add_memory)
+        if enable_update_memory:
+            functions.append(update_memory)
+        if enable_delete_memory:
+            functions.append(delete_memory)
+        if enable_clear_memory:
+            functions.append(clear_memory)
+        return functions
+
+    def _get_memory_row(
+        self, memory_id: str, user_id: str, memory: str, topics: Optional[List[str]], input_string: str
+    ) -> MemoryRow:
+        from datetime import datetime
+
+        last_updated = datetime.now()
+        return MemoryRow(
+            id=memory_id,
+            user_id=user_id,
+            memory=UserMemory(
+                memory_id=memory_id,
+                memory=memory,
+                topics=topics,
+                last_updated=last_updated,
+                input=input_string,
+            ).to_dict(),
+            last_updated=last_updated,
+        )
@@ -1,4 +1,5 @@
 import json
+from collections.abc import MutableSequence
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,6 +12,7 @@ from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.manager import MemoryManager
+from agno.memory.v2.runs import SessionRuns
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.memory.v2.summarizer import SessionSummarizer
 from agno.models.base import Model
@@ -96,7 +98,7 @@ class Memory:
     db: Optional[MemoryDb] = None
 
     # runs per session
-    runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
+    runs: Optional[Dict[str, MutableSequence[Union[RunResponse, TeamRunResponse]]]] = None
 
     # Team context per session
     team_context: Optional[Dict[str, TeamContext]] = None
@@ -117,7 +119,7 @@ class Memory:
         db: Optional[MemoryDb] = None,
         memories: Optional[Dict[str, Dict[str, UserMemory]]] = None,
         summaries: Optional[Dict[str, Dict[str, SessionSummary]]] = None,
-        runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None,
+        runs: Optional[Dict[str, MutableSequence[Union[RunResponse, TeamRunResponse]]]] = None,
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
@@ -190,11 +192,21 @@ class Memory:
                 all_memories = self.db.read_memories()
             else:
                 all_memories = self.db.read_memories(user_id=user_id)
-            # Reset the memories
-            self.memories = {}
-            for memory in all_memories:
-                if memory.user_id is not None and memory.id is not None:
-                    self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+            self._set_memories(all_memories)
+
+    async def arefresh_from_db(self, user_id: Optional[str] = None):
+        """Async version of refresh_from_db"""
+        if self.db:
+            # If no user_id is provided, read all memories
+            all_memories = await self.db.aread_memories(user_id=user_id)
+            self._set_memories(all_memories)
+
+    def _set_memories(self, all_memories: List[MemoryRow]) -> None:
+        # Reset the memories
+        self.memories = {}
+        for memory in all_memories:
+            if memory.user_id is not None and memory.id is not None:
+                self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
 
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
@@ -208,7 +220,7 @@ class Memory:
         self.refresh_from_db(user_id=user_id)
 
     def to_dict(self) -> Dict[str, Any]:
-        _memory_dict = {}
+        _memory_dict: Dict[str, Any] = {}
         # Add summary if it exists
         if self.summaries is not None:
             _memory_dict["summaries"] = {
@@ -226,7 +238,10 @@ class Memory:
             _memory_dict["runs"] = {}
             for session_id, runs in self.runs.items():
                 if session_id is not None:
-                    _memory_dict["runs"][session_id] = [run.to_dict() for run in runs]  # type: ignore
+                    if isinstance(runs, SessionRuns):
+                        _memory_dict["runs"][session_id] = runs.to_dicts()
+                    else:
+                        _memory_dict["runs"][session_id] = [run.to_dict() for run in runs]  # type: ignore
 
         if self.team_context is not None:
             _memory_dict["team_context"] = {}
@@ -397,7 +412,7 @@ class Memory:
         """
         del self.summaries[user_id][session_id]  # type: ignore
 
-    def get_runs(self, session_id: str) -> List[Union[RunResponse, TeamRunResponse]]:
+    def get_runs(self, session_id: str) -> MutableSequence[Union[RunResponse, TeamRunResponse]]:
         """Get all runs for a given session id"""
         if self.runs is None:
             return []
@@ -523,7 +538,7 @@ class Memory:
             user_id = "default"
 
         if refresh_from_db:
-            self.refresh_from_db(user_id=user_id)
+            await self.arefresh_from_db(user_id=user_id)
 
         existing_memories = self.memories.get(user_id, {})  # type: ignore
         existing_memories = [
@@ -540,7 +555,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db()
+        await self.arefresh_from_db()
 
         return response
 
@@ -590,7 +605,7 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        self.refresh_from_db(user_id=user_id)
+        await self.arefresh_from_db(user_id=user_id)
 
         existing_memories = self.memories.get(user_id, {})  # type: ignore
         existing_memories = [
@@ -607,7 +622,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        await self.arefresh_from_db(user_id=user_id)
 
         return response
 
@@ -686,13 +701,24 @@ class Memory:
         # Check if run already exists with the same run_id
         if hasattr(run, "run_id") and run.run_id:
             run_id = run.run_id
-            # Look for existing run with same ID
-            for i, existing_run in enumerate(self.runs[session_id]):
-                if hasattr(existing_run, "run_id") and existing_run.run_id == run_id:
-                    # Replace existing run
-                    self.runs[session_id][i] = run
-                    log_debug(f"Replaced existing run with run_id {run_id} in memory")
-                    return
+            session_runs = self.runs[session_id]
+            # Look for existing run with same ID, without loading runs that are only in storage
+            if isinstance(session_runs, SessionRuns):
+                existing_index = session_runs.index_of_run(run_id)
+            else:
+                existing_index = next(
+                    (
+                        i
+                        for i, existing_run in enumerate(session_runs)
+                        if hasattr(existing_run, "run_id") and existing_run.run_id == run_id
+                    ),
+                    None,
+                )
+            if existing_index is not None:
+                # Replace existing run
+                session_runs[existing_index] = run
+                log_debug(f"Replaced existing run with run_id {run_id} in memory")
+                return
 
         self.runs[session_id].append(run)
         log_debug("Added RunResponse to Memory")
@@ -726,17 +752,23 @@ class Memory:
             skip_status = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
 
         session_runs = self.runs.get(session_id, [])
-        # Filter by agent_id and team_id
-        if agent_id:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
 
-        # Filter by status
-        session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_status]  # type: ignore
+        # Walk back from the most recent run, so only the last_n matching runs are loaded and deserialized
+        runs_to_process: List[Union[RunResponse, TeamRunResponse]] = []
+        for run in reversed(session_runs):
+            # Filter by agent_id and team_id
+            if agent_id and not (hasattr(run, "agent_id") and run.agent_id == agent_id):  # type: ignore
+                continue
+            if team_id and not (hasattr(run, "team_id") and run.team_id == team_id):  # type: ignore
+                continue
+            # Filter by status
+            if not (hasattr(run, "status") and run.status not in skip_status):  # type: ignore
+                continue
+            runs_to_process.append(run)
+            if last_n and len(runs_to_process) >= last_n:
+                break
+        runs_to_process.reverse()
 
-        # Filter by last_n
-        runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
         messages_from_history = []
         system_message = None
         for run_response in runs_to_process:
@@ -766,7 +798,7 @@ class Memory:
 
         tool_calls = []
         session_runs = self.runs.get(session_id, []) if self.runs else []
-        for run_response in session_runs[::-1]:
+        for run_response in reversed(session_runs):
             if run_response and run_response.messages:
                 for message in run_response.messages:
                     if message.tool_calls:
@@ -0,0 +1,134 @@
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, overload
+
+from agno.run.response import RunResponse
+from agno.run.team import TeamRunResponse
+from agno.utils.log import log_debug
+
+RunType = Union[RunResponse, TeamRunResponse]
+
+
+def run_from_dict(run: Dict[str, Any]) -> RunType:
+    """Deserialize a stored run into a RunResponse or TeamRunResponse"""
+    if "team_id" in run:
+        return TeamRunResponse.from_dict(run)
+    return RunResponse.from_dict(run)
+
+
+class SessionRuns(MutableSequence):
+    """The runs of a session, deserialized and loaded from storage only when they are accessed.
+
+    Each entry is a run, the dict of a run that is not deserialized yet, or None for a run that is in
+    storage but not loaded yet. Runs that are not loaded are read from storage in pages through `loader`,
+    so walking the most recent runs only reads and deserializes those runs.
+    """
+
+    def __init__(
+        self,
+        runs: Optional[Iterable[Optional[Union[RunType, Dict[str, Any]]]]] = None,
+        run_ids: Optional[List[Optional[str]]] = None,
+        loader: Optional[Callable[[int, int], List[Dict[str, Any]]]] = None,
+        page_size: int = 20,
+    ):
+        """
+        Args:
+            runs: The runs of the session, in order. None marks a run that is stored but not loaded.
+            run_ids: The run_id of every run, used to find runs without loading them.
+            loader: Function that reads the run dicts with an index in [start, end) from storage.
+            page_size: Number of runs to read from storage at once.
+        """
+        self._runs: List[Any] = list(runs or [])
+        self._run_ids: List[Optional[str]] = list(run_ids) if run_ids is not None else [None] * len(self._runs)
+        if len(self._run_ids) != len(self._runs):
+            raise ValueError("run_ids must have one entry per run")
+        self.loader = loader
+        self.page_size = page_size
+
+    def _load_page(self, index: int) -> None:
+        # Find the block of runs that are not loaded around the index and read up to one page of it
+        lo = index
+        while lo > 0 and self._runs[lo - 1] is None:
+            lo -= 1
+        hi = index + 1
+        while hi < len(self._runs) and self._runs[hi] is None:
+            hi += 1
+        start = max(lo, min(index, hi - self.page_size))
+        end = min(hi, start + self.page_size)
+        log_debug(f"Loading runs {start} to {end} from storage")
+        for i, run in enumerate(self.loader(start, end), start):  # type: ignore
+            if i < end and self._runs[i] is None:
+                self._runs[i] = run
+
+    def _get_run(self, index: int) -> Optional[RunType]:
+        run = self._runs[index]
+        if run is None and self.loader is not None:
+            self._load_page(index)
+            run = self._runs[index]
+        if isinstance(run, dict):
+            run = run_from_dict(run)
+            self._runs[index] = run
+        return run
+
+    @overload
+    def __getitem__(self, index: int) -> RunType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[RunType]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get_run(i) for i in range(*index.indices(len(self._runs)))]
+        if index < 0:
+            index += len(self._runs)
+        if not 0 <= index < len(self._runs):
+            raise IndexError("run index out of range")
+        return self._get_run(index)
+
+    def __setitem__(self, index, run) -> None:
+        if isinstance(index, slice):
+            raise TypeError("SessionRuns does not support slice assignment")
+        self._runs[index] = run
+        self._run_ids[index] = getattr(run, "run_id", None)
+
+    def __delitem__(self, index) -> None:
+        del self._runs[index]
+        del self._run_ids[index]
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, SessionRuns)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def insert(self, index: int, run: RunType) -> None:  # type: ignore[override]
+        self._runs.insert(index, run)
+        self._run_ids.insert(index, getattr(run, "run_id", None))
+
+    def index_of_run(self, run_id: str) -> Optional[int]:
+        """Returns the index of the run with the run_id, without loading runs from storage"""
+        for i in range(len(self._runs) - 1, -1, -1):
+            run = self._runs[i]
+            if self._run_ids[i] is None and run is not None:
+                self._run_ids[i] = run.get("run_id") if isinstance(run, dict) else getattr(run, "run_id", None)
+            if self._run_ids[i] == run_id:
+                return i
+        return None
+
+    def to_dicts(self) -> List[Optional[Dict[str, Any]]]:
+        """Serialize the runs, keeping None for runs that were never loaded so storage can skip them"""
+        return [run if run is None or isinstance(run, dict) else run.to_dict() for run in self._runs]
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        copied_obj = self.__class__(
+            runs=deepcopy(self._runs, memo), run_ids=list(self._run_ids), loader=self.loader, page_size=self.page_size
+        )
+        memo[id(self)] = copied_obj
+        return copied_obj
+
+    def __repr__(self) -> str:
+        loaded = sum(1 for run in self._runs if run is not None)
+        return f"SessionRuns(runs={len(self._runs)}, loaded={loaded})"
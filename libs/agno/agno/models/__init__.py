@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+    from agno.models.message import Message
+    from agno.models.response import ModelResponse
+
+__all__ = [
+    "Model",
+    "Message",
+    "ModelResponse",
+]
+
+# Exports are imported on first access, so importing a module of the package does not import them all
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "Model": "agno.models.base",
+        "Message": "agno.models.message",
+        "ModelResponse": "agno.models.response",
+    },
+)
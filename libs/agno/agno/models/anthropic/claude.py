@@ -8,6 +8,7 @@ from pydantic import BaseModel
 
 from agno.exceptions import ModelProviderError, ModelRateLimitError
 from agno.models.base import Model
+from agno.models.clients import get_client_key, get_client_registry
 from agno.models.message import Citations, DocumentCitation, Message, UrlCitation
 from agno.models.response import ModelResponse
 from agno.utils.log import log_error, log_warning
@@ -111,7 +112,12 @@ class Claude(Model):
             return self.client
 
         _client_params = self._get_client_params()
-        self.client = AnthropicClient(**_client_params)
+        # Share the client and its connection pool with other models using the same parameters
+        registry = get_client_registry()
+        self.client = registry.get_client(
+            get_client_key("anthropic", _client_params),
+            lambda: AnthropicClient(**{"http_client": registry.get_http_client(), **_client_params}),
+        )
         return self.client
 
     def get_async_client(self) -> AsyncAnthropicClient:
@@ -122,8 +128,13 @@ class Claude(Model):
             return self.async_client
 
         _client_params = self._get_client_params()
-        self.async_client = AsyncAnthropicClient(**_client_params)
-        return self.async_client
+        # Share the client and its connection pool with other models using the same parameters in this event loop.
+        # It is not kept on the model, as it is bound to the event loop.
+        registry = get_client_registry()
+        return registry.get_async_client(
+            get_client_key("anthropic", _client_params),
+            lambda: AsyncAnthropicClient(**{"http_client": registry.get_async_http_client(), **_client_params}),
+        )
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from agno.exceptions import AgnoError, ModelProviderError
 from agno.models.base import MessageData, Model, _add_usage_metrics_to_assistant_message
+from agno.models.clients import get_client_key, get_client_registry
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import log_error, log_warning
@@ -14,6 +15,7 @@ from agno.utils.log import log_error, log_warning
 try:
     from boto3 import client as AwsClient
     from boto3.session import Session
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`")
@@ -62,7 +64,7 @@ class AwsBedrock(Model):
 
     def get_client(self) -> AwsClient:
         """
-        Get the Bedrock client.
+        Get the Bedrock client. Clients are shared by the models with the same region and credentials.
 
         Returns:
             AwsClient: The Bedrock client.
@@ -71,6 +73,7 @@ class AwsBedrock(Model):
             return self.client
 
         if self.session:
+            # The client of a session uses its credentials, so it is only shared by the copies of this model
             self.client = self.session.client("bedrock-runtime")
             return self.client
 
@@ -78,21 +81,22 @@ class AwsBedrock(Model):
         self.aws_secret_access_key = self.aws_secret_access_key or getenv("AWS_SECRET_ACCESS_KEY")
         self.aws_region = self.aws_region or getenv("AWS_REGION")
 
-        if self.aws_sso_auth:
-            self.client = AwsClient(service_name="bedrock-runtime", region_name=self.aws_region)
-        else:
+        client_params: Dict[str, Any] = {"service_name": "bedrock-runtime", "region_name": self.aws_region}
+        if not self.aws_sso_auth:
             if not self.aws_access_key_id or not self.aws_secret_access_key:
                 raise AgnoError(
                     message="AWS credentials not found. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables or provide a boto3 session.",
                     status_code=400,
                 )
-
-            self.client = AwsClient(
-                service_name="bedrock-runtime",
-                region_name=self.aws_region,
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-            )
+            client_params["aws_access_key_id"] = self.aws_access_key_id
+            client_params["aws_secret_access_key"] = self.aws_secret_access_key
+
+        registry = get_client_registry()
+        # Size the connection pool of the shared client like the shared HTTP clients of the other providers
+        config = Config(max_pool_connections=registry.settings.max_keepalive_connections)
+        self.client = registry.get_client(
+            get_client_key("aws_bedrock", client_params), lambda: AwsClient(config=config, **client_params)
+        )
         return self.client
 
     def _format_tools_for_request(self, tools: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
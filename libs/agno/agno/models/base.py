@@ -1,9 +1,11 @@
 import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncGenerator,
     AsyncIterator,
@@ -29,10 +31,14 @@ from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
+from agno.tracing.span import atrace_iterator, span, trace_iterator
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
+if TYPE_CHECKING:
+    from agno.models.cache import ResponseCache, ResponseCacheLookup
+
 
 @dataclass
 class MessageData:
@@ -230,6 +236,8 @@ class Model(ABC):
     name: Optional[str] = None
     # Provider for this Model. This is not sent to the Model API.
     provider: Optional[str] = None
+    # Cache of the responses of this Model. Identical requests are answered from the cache, without calling the API.
+    response_cache: Optional["ResponseCache"] = None
 
     # -*- Do not set the following attributes directly -*-
     # -*- Set them on the Agent instead -*-
@@ -319,6 +327,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate a response from the model.
@@ -359,6 +368,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    max_parallel_tool_calls=max_parallel_tool_calls,
                 ):
                     if isinstance(function_call_response, ModelResponse):
                         if (
@@ -534,18 +544,33 @@ class Model(ABC):
         # Create assistant message
         assistant_message = Message(role=self.assistant_message_role)
 
-        # Generate response
-        assistant_message.metrics.start_timer()
-        response = self.invoke(
+        # Look up the response in the cache
+        cache_lookup = self._lookup_response_cache(
             messages=messages,
             response_format=response_format,
             tools=tools,
             tool_choice=tool_choice or self._tool_choice,
         )
-        assistant_message.metrics.stop_timer()
 
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+        if cache_lookup is not None and cache_lookup.hit:
+            log_debug("Using cached model response")
+            provider_response: ModelResponse = self.response_cache.get_model_response(  # type: ignore
+                cache_lookup, response_format=response_format
+            )
+        else:
+            # Generate response
+            assistant_message.metrics.start_timer()
+            with span("model.invoke", model=self.id, provider=self.provider):
+                response = self.invoke(
+                    messages=messages,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                )
+            assistant_message.metrics.stop_timer()
+
+            # Parse provider response
+            provider_response = self.parse_provider_response(response, response_format=response_format)
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -554,6 +579,15 @@ class Model(ABC):
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
 
+        # Cache the response
+        if cache_lookup is not None and not cache_lookup.hit:
+            self.response_cache.store(  # type: ignore
+                cache_lookup,
+                assistant_message,
+                extra=provider_response.extra,
+                parsed=provider_response.parsed is not None,
+            )
+
         # Add assistant message to messages
         messages.append(assistant_message)
 
@@ -600,18 +634,33 @@ class Model(ABC):
         # Create assistant message
         assistant_message = Message(role=self.assistant_message_role)
 
-        # Generate response
-        assistant_message.metrics.start_timer()
-        response = await self.ainvoke(
+        # Look up the response in the cache
+        cache_lookup = await self._alookup_response_cache(
             messages=messages,
             response_format=response_format,
             tools=tools,
             tool_choice=tool_choice or self._tool_choice,
         )
-        assistant_message.metrics.stop_timer()
 
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+        if cache_lookup is not None and cache_lookup.hit:
+            log_debug("Using cached model response")
+            provider_response: ModelResponse = self.response_cache.get_model_response(  # type: ignore
+                cache_lookup, response_format=response_format
+            )
+        else:
+            # Generate response
+            assistant_message.metrics.start_timer()
+            with span("model.invoke", model=self.id, provider=self.provider):
+                response = await self.ainvoke(
+                    messages=messages,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                )
+            assistant_message.metrics.stop_timer()
+
+            # Parse provider response
+            provider_response = self.parse_provider_response(response, response_format=response_format)
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -620,6 +669,15 @@ class Model(ABC):
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
 
+        # Cache the response
+        if cache_lookup is not None and not cache_lookup.hit:
+            self.response_cache.store(  # type: ignore
+                cache_lookup,
+                assistant_message,
+                extra=provider_response.extra,
+                parsed=provider_response.parsed is not None,
+            )
+
         # Add assistant message to messages
         messages.append(assistant_message)
 
@@ -724,15 +782,20 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
+        for response_delta in trace_iterator(
+            span("model.invoke_stream", model=self.id, provider=self.provider),
+            self.invoke_stream(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            ),
         ):
             model_response_delta = self.parse_provider_response_delta(response_delta)
             yield from self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
+                stream_data=stream_data,
+                assistant_message=assistant_message,
+                model_response_delta=model_response_delta,
             )
 
     def response_stream(
@@ -743,6 +806,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         """
         Generate a streaming response from the model.
@@ -759,16 +823,27 @@ class Model(ABC):
             assistant_message = Message(role=self.assistant_message_role)
             stream_data = MessageData()
 
-            # Generate response
-            assistant_message.metrics.start_timer()
-            yield from self.process_response_stream(
+            # Look up the response in the cache
+            cache_lookup = self._lookup_response_cache(
                 messages=messages,
-                assistant_message=assistant_message,
-                stream_data=stream_data,
                 response_format=response_format,
                 tools=tools,
                 tool_choice=tool_choice or self._tool_choice,
             )
+
+            # Generate response
+            assistant_message.metrics.start_timer()
+            if cache_lookup is not None and cache_lookup.hit:
+                yield from self._replay_cached_response_stream(cache_lookup, assistant_message, stream_data)
+            else:
+                yield from self.process_response_stream(
+                    messages=messages,
+                    assistant_message=assistant_message,
+                    stream_data=stream_data,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                )
             assistant_message.metrics.stop_timer()
 
             # Populate assistant message from stream data
@@ -787,6 +862,10 @@ class Model(ABC):
             if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                 assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
 
+            # Cache the response
+            if cache_lookup is not None and not cache_lookup.hit:
+                self.response_cache.store(cache_lookup, assistant_message, extra=stream_data.extra)  # type: ignore
+
             # Add assistant message to messages
             messages.append(assistant_message)
             assistant_message.log(metrics=True)
@@ -805,6 +884,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    max_parallel_tool_calls=max_parallel_tool_calls,
                 ):
                     yield function_call_response
 
@@ -858,15 +938,20 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):  # type: ignore
+        async for response_delta in atrace_iterator(
+            span("model.invoke_stream", model=self.id, provider=self.provider),
+            self.ainvoke_stream(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            ),  # type: ignore
+        ):
             model_response_delta = self.parse_provider_response_delta(response_delta)
             for model_response in self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
+                stream_data=stream_data,
+                assistant_message=assistant_message,
+                model_response_delta=model_response_delta,
             ):
                 yield model_response
 
@@ -894,17 +979,29 @@ class Model(ABC):
             assistant_message = Message(role=self.assistant_message_role)
             stream_data = MessageData()
 
-            # Generate response
-            assistant_message.metrics.start_timer()
-            async for response in self.aprocess_response_stream(
+            # Look up the response in the cache
+            cache_lookup = await self._alookup_response_cache(
                 messages=messages,
-                assistant_message=assistant_message,
-                stream_data=stream_data,
                 response_format=response_format,
                 tools=tools,
                 tool_choice=tool_choice or self._tool_choice,
-            ):
-                yield response
+            )
+
+            # Generate response
+            assistant_message.metrics.start_timer()
+            if cache_lookup is not None and cache_lookup.hit:
+                for response in self._replay_cached_response_stream(cache_lookup, assistant_message, stream_data):
+                    yield response
+            else:
+                async for response in self.aprocess_response_stream(
+                    messages=messages,
+                    assistant_message=assistant_message,
+                    stream_data=stream_data,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                ):
+                    yield response
             assistant_message.metrics.stop_timer()
 
             # Populate assistant message from stream data
@@ -921,6 +1018,10 @@ class Model(ABC):
             if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                 assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
 
+            # Cache the response
+            if cache_lookup is not None and not cache_lookup.hit:
+                self.response_cache.store(cache_lookup, assistant_message, extra=stream_data.extra)  # type: ignore
+
             # Add assistant message to messages
             messages.append(assistant_message)
             assistant_message.log(metrics=True)
@@ -980,6 +1081,62 @@ class Model(ABC):
 
         log_debug(f"{self.get_provider()} Async Response Stream End", center=True, symbol="-")
 
+    def _lookup_response_cache(
+        self,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Optional["ResponseCacheLookup"]:
+        """Look up the request in the response cache. Returns None if there is no cache or the lookup failed."""
+        if self.response_cache is None:
+            return None
+        try:
+            with span("model.cache_lookup", model=self.id, provider=self.provider):
+                return self.response_cache.lookup(
+                    self, messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+                )
+        except Exception as e:
+            log_warning(f"Error looking up cached model response: {e}")
+            return None
+
+    async def _alookup_response_cache(
+        self,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Optional["ResponseCacheLookup"]:
+        """Async version of `_lookup_response_cache`"""
+        if self.response_cache is None:
+            return None
+        try:
+            with span("model.cache_lookup", model=self.id, provider=self.provider):
+                return await self.response_cache.alookup(
+                    self, messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+                )
+        except Exception as e:
+            log_warning(f"Error looking up cached model response: {e}")
+            return None
+
+    def _replay_cached_response_stream(
+        self, cache_lookup: "ResponseCacheLookup", assistant_message: Message, stream_data: MessageData
+    ) -> Iterator[ModelResponse]:
+        """Stream a cached response as if it came from the model"""
+        log_debug("Using cached model response")
+        for model_response_delta in self.response_cache.get_stream_deltas(cache_lookup):  # type: ignore
+            yield from self._populate_stream_data_and_assistant_message(
+                stream_data=stream_data,
+                assistant_message=assistant_message,
+                model_response_delta=model_response_delta,
+            )
+        # Cached tool calls and reasoning are complete, so they are not streamed or parsed again
+        entry = cache_lookup.entry or {}
+        if entry.get("tool_calls"):
+            assistant_message.tool_calls = deepcopy(entry["tool_calls"])
+        if entry.get("reasoning_content") is not None:
+            assistant_message.reasoning_content = entry["reasoning_content"]
+
     def _populate_stream_data_and_assistant_message(
         self, stream_data: MessageData, assistant_message: Message, model_response_delta: ModelResponse
     ) -> Iterator[ModelResponse]:
@@ -1148,11 +1305,44 @@ class Model(ABC):
         function_call_results: List[Message],
         additional_messages: Optional[List[Message]] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
-        # Start function call
+        # Yield a tool_call_started event
+        yield self._create_tool_call_started_response(function_call)
+
+        # Run function call
+        function_call_success, function_call_timer, _ = self.execute_function_call(function_call)
+
+        yield from self._handle_function_call_result(
+            function_call=function_call,
+            function_call_success=function_call_success,
+            function_call_timer=function_call_timer,
+            function_call_results=function_call_results,
+            additional_messages=additional_messages,
+        )
+
+    def execute_function_call(
+        self,
+        function_call: FunctionCall,
+    ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+        """Execute a single function call and return its success status, timer, and the FunctionCall object."""
         function_call_timer = Timer()
         function_call_timer.start()
-        # Yield a tool_call_started event
-        yield ModelResponse(
+        success: Union[bool, AgentRunException] = False
+
+        try:
+            with span(f"tool.{function_call.function.name}"):
+                function_execution_result: FunctionExecutionResult = function_call.execute()
+            success = function_execution_result.status == "success"
+        except AgentRunException as a_exc:
+            success = a_exc
+        except Exception as e:
+            log_error(f"Error executing function {function_call.function.name}: {e}")
+            raise e
+
+        function_call_timer.stop()
+        return success, function_call_timer, function_call
+
+    def _create_tool_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
             content=function_call.get_call_str(),
             tool_executions=[
                 ToolExecution(
@@ -1164,22 +1354,20 @@ class Model(ABC):
             event=ModelResponseEvent.tool_call_started.value,
         )
 
-        # Run function calls sequentially
-        function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
-        try:
-            function_execution_result = function_call.execute()
-        except AgentRunException as a_exc:
+    def _handle_function_call_result(
+        self,
+        function_call: FunctionCall,
+        function_call_success: Union[bool, AgentRunException],
+        function_call_timer: Timer,
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Process the output of an executed function call and add its result to the function call results."""
+        if isinstance(function_call_success, AgentRunException):
             # Update additional messages from function call
-            _handle_agent_exception(a_exc, additional_messages)
+            _handle_agent_exception(function_call_success, additional_messages)
             # Set function call success to False if an exception occurred
-        except Exception as e:
-            log_error(f"Error executing function {function_call.function.name}: {e}")
-            raise e
-
-        function_call_success = function_execution_result.status == "success"
-
-        # Stop function call timer
-        function_call_timer.stop()
+            function_call_success = False
 
         # Process function call output
         function_call_output: str = ""
@@ -1240,11 +1428,15 @@ class Model(ABC):
         additional_messages: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
             additional_messages = []
 
+        # Function calls that can run, collected when running them in parallel
+        parallel_function_calls: List[FunctionCall] = []
+
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
@@ -1328,14 +1520,70 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if max_parallel_tool_calls is not None and max_parallel_tool_calls > 1:
+                parallel_function_calls.append(fc)
+                continue
+
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
             )
 
+        if parallel_function_calls:
+            yield from self.run_function_calls_in_parallel(
+                function_calls=parallel_function_calls,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+                max_parallel_tool_calls=max_parallel_tool_calls,  # type: ignore
+            )
+
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
 
+    def run_function_calls_in_parallel(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+        max_parallel_tool_calls: int,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """
+        Run function calls concurrently in a thread pool, yielding their results in the order they were requested.
+
+        Functions marked with `parallel_safe=False` are run one at a time on the calling thread.
+        """
+        from concurrent.futures import Future, ThreadPoolExecutor
+        from contextvars import copy_context
+
+        parallel_safe_calls = [fc for fc in function_calls if fc.function.parallel_safe]
+        log_debug(f"Running {len(parallel_safe_calls)} of {len(function_calls)} function calls in parallel")
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_parallel_tool_calls, len(parallel_safe_calls)))) as executor:
+            futures: Dict[int, Future] = {
+                # Run each call in a copy of the current context, so its span is added to the current run's trace
+                id(fc): executor.submit(copy_context().run, self.execute_function_call, fc)
+                for fc in parallel_safe_calls
+            }
+            for fc in function_calls:
+                yield self._create_tool_call_started_response(fc)
+
+            # Run the functions that are not parallel safe while the others run in the pool
+            results: Dict[int, Tuple[Union[bool, AgentRunException], Timer, FunctionCall]] = {
+                id(fc): self.execute_function_call(fc) for fc in function_calls if not fc.function.parallel_safe
+            }
+            for fc in parallel_safe_calls:
+                results[id(fc)] = futures[id(fc)].result()
+
+        for fc in function_calls:
+            function_call_success, function_call_timer, _ = results[id(fc)]
+            yield from self._handle_function_call_result(
+                function_call=fc,
+                function_call_success=function_call_success,
+                function_call_timer=function_call_timer,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+            )
+
     async def arun_function_call(
         self,
         function_call: FunctionCall,
@@ -1347,30 +1595,31 @@ class Model(ABC):
         function_call_timer.start()
         success: Union[bool, AgentRunException] = False
 
-        try:
-            if (
-                iscoroutinefunction(function_call.function.entrypoint)
-                or isasyncgenfunction(function_call.function.entrypoint)
-                or iscoroutine(function_call.function.entrypoint)
-            ):
-                result = await function_call.aexecute()
-                success = result.status == "success"
+        with span(f"tool.{function_call.function.name}"):
+            try:
+                if (
+                    iscoroutinefunction(function_call.function.entrypoint)
+                    or isasyncgenfunction(function_call.function.entrypoint)
+                    or iscoroutine(function_call.function.entrypoint)
+                ):
+                    result = await function_call.aexecute()
+                    success = result.status == "success"
 
-            # If any of the hooks are async, we need to run the function call asynchronously
-            elif function_call.function.tool_hooks is not None and any(
-                iscoroutinefunction(f) for f in function_call.function.tool_hooks
-            ):
-                result = await function_call.aexecute()
-                success = result.status == "success"
-            else:
-                result = await asyncio.to_thread(function_call.execute)
-                success = result.status == "success"
-        except AgentRunException as e:
-            success = e
-        except Exception as e:
-            log_error(f"Error executing function {function_call.function.name}: {e}")
-            success = False
-            raise e
+                # If any of the hooks are async, we need to run the function call asynchronously
+                elif function_call.function.tool_hooks is not None and any(
+                    iscoroutinefunction(f) for f in function_call.function.tool_hooks
+                ):
+                    result = await function_call.aexecute()
+                    success = result.status == "success"
+                else:
+                    result = await asyncio.to_thread(function_call.execute)
+                    success = result.status == "success"
+            except AgentRunException as e:
+                success = e
+            except Exception as e:
+                log_error(f"Error executing function {function_call.function.name}: {e}")
+                success = False
+                raise e
 
         function_call_timer.stop()
         return success, function_call_timer, function_call
@@ -1660,6 +1909,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            # Clients are shared by the copies, so they keep using the same connection pool
+            if k in {"client", "async_client", "http_client"}:
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
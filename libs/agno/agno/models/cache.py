@@ -0,0 +1,359 @@
+import json
+import threading
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from hashlib import sha256
+from math import sqrt
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from agno.embedder.base import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
+from agno.models.message import Citations, Message
+from agno.models.response import ModelResponse
+from agno.utils.cache import Cache, InMemoryCache
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+
+# Message fields that change between identical requests and are not sent to the model
+_VOLATILE_MESSAGE_FIELDS = ("created_at", "metrics", "from_history", "stop_after_tool_call", "references")
+# Model fields that do not change the response of the model
+_IGNORED_MODEL_FIELDS = {"name", "provider", "response_cache"}
+
+
+@dataclass
+class ResponseCacheLookup:
+    """Result of looking up a request in the ResponseCache, used to store the response on a miss"""
+
+    key: str
+    # Key of the request without the content of the last user message, for semantic lookups
+    context_key: Optional[str] = None
+    # Embedding of the last user message, for semantic lookups
+    embedding: Optional[List[float]] = None
+    # The cached response, None on a miss
+    entry: Optional[Dict[str, Any]] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.entry is not None
+
+
+class ResponseCache:
+    """Cache of model responses, so repeated requests are answered without calling the model provider.
+
+    In "exact" mode, a response is reused when the messages, tools, response format and settings of the model are the
+    same as a cached request. In "semantic" mode, a response is also reused when only the last user message differs
+    and its embedding is at least `similarity_threshold` similar to the one of a cached request.
+
+    Responses are stored in a Cache: in memory by default, or in a SqliteCache or RedisCache to share them
+    between processes. The cache is shared by copies of the model.
+
+    Example:
+        model = OpenAIChat(id="gpt-4o", response_cache=ResponseCache(ttl=3600))
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Cache] = None,
+        ttl: Optional[float] = None,
+        mode: Literal["exact", "semantic"] = "exact",
+        embedder: Optional[Embedder] = None,
+        similarity_threshold: float = 0.95,
+        max_semantic_entries: int = 256,
+        stream_chunk_size: int = 32,
+    ):
+        """
+        Args:
+            backend (Optional[Cache]): Where responses are stored. Defaults to an InMemoryCache.
+            ttl (Optional[float]): Seconds to keep a response. Responses never expire when None.
+            mode (Literal["exact", "semantic"]): How requests are matched to cached responses.
+            embedder (Optional[Embedder]): Embedder of the last user message, required in "semantic" mode.
+            similarity_threshold (float): Minimum cosine similarity of a semantic match.
+            max_semantic_entries (int): Maximum number of user messages compared per conversation context.
+            stream_chunk_size (int): Number of characters per chunk when a cached response is streamed.
+        """
+        if mode == "semantic" and embedder is None:
+            raise ValueError("An embedder is required for the semantic response cache")
+
+        self.backend: Cache = backend or InMemoryCache()
+        self.ttl: Optional[float] = ttl
+        self.mode: Literal["exact", "semantic"] = mode
+        self.embedder: Optional[Embedder] = embedder
+        self.similarity_threshold: float = similarity_threshold
+        self.max_semantic_entries: int = max_semantic_entries
+        self.stream_chunk_size: int = stream_chunk_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+
+    def lookup(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> ResponseCacheLookup:
+        """Look up the cached response of a request"""
+        lookup = self._lookup_exact(model, messages, response_format, tools, tool_choice)
+        if lookup.entry is None and lookup.context_key is not None:
+            query = self._get_query(messages)
+            if query:
+                lookup.embedding = get_query_embedding(self.embedder, query)  # type: ignore
+                lookup.entry = self._lookup_semantic(lookup.context_key, lookup.embedding)
+        self._count(lookup)
+        return lookup
+
+    async def alookup(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> ResponseCacheLookup:
+        """Async version of `lookup`, that embeds the last user message without blocking the event loop"""
+        lookup = self._lookup_exact(model, messages, response_format, tools, tool_choice)
+        if lookup.entry is None and lookup.context_key is not None:
+            query = self._get_query(messages)
+            if query:
+                lookup.embedding = await async_get_query_embedding(self.embedder, query)  # type: ignore
+                lookup.entry = self._lookup_semantic(lookup.context_key, lookup.embedding)
+        self._count(lookup)
+        return lookup
+
+    def store(
+        self,
+        lookup: ResponseCacheLookup,
+        assistant_message: Message,
+        extra: Optional[Dict[str, Any]] = None,
+        parsed: bool = False,
+    ) -> None:
+        """Cache the response of a request that was not in the cache.
+
+        Args:
+            lookup (ResponseCacheLookup): The lookup of the request.
+            assistant_message (Message): The response of the model.
+            extra (Optional[Dict[str, Any]]): Extra data from the provider, used to format tool call results.
+            parsed (bool): True if the model returned a parsed structured output.
+        """
+        if lookup.hit:
+            return
+        # Audio and image outputs are too large to cache, and content parts can not be streamed back
+        if assistant_message.audio_output is not None or assistant_message.image_output is not None:
+            return
+        if assistant_message.content is not None and not isinstance(assistant_message.content, str):
+            return
+        if assistant_message.content is None and not assistant_message.tool_calls:
+            return
+
+        entry: Dict[str, Any] = {
+            "role": assistant_message.role,
+            "content": assistant_message.content,
+            "tool_calls": assistant_message.tool_calls,
+            "thinking": assistant_message.thinking,
+            "redacted_thinking": assistant_message.redacted_thinking,
+            "reasoning_content": assistant_message.reasoning_content,
+            "provider_data": assistant_message.provider_data,
+            "citations": assistant_message.citations.model_dump() if assistant_message.citations else None,
+            "extra": extra,
+            # Native structured outputs are parsed again from the content
+            "parsed": parsed,
+        }
+        try:
+            json.dumps(entry)
+        except Exception as e:
+            log_debug(f"Model response can not be cached: {e}")
+            return
+
+        self.backend.set(lookup.key, entry, ttl=self.ttl)
+        if lookup.context_key is not None and lookup.embedding:
+            index_key = f"response_index_{lookup.context_key}"
+            with self._lock:
+                index = self.backend.get(index_key) or []
+                index.append({"key": lookup.key, "embedding": lookup.embedding})
+                self.backend.set(index_key, index[-self.max_semantic_entries :], ttl=self.ttl)
+
+    def get_model_response(
+        self, lookup: ResponseCacheLookup, response_format: Optional[Union[Dict, Type[BaseModel]]] = None
+    ) -> ModelResponse:
+        """Returns the cached response as a provider response"""
+        entry = deepcopy(lookup.entry) or {}
+        model_response = ModelResponse(
+            role=entry.get("role"),
+            content=entry.get("content"),
+            tool_calls=entry.get("tool_calls") or [],
+            thinking=entry.get("thinking"),
+            redacted_thinking=entry.get("redacted_thinking"),
+            reasoning_content=entry.get("reasoning_content"),
+            provider_data=entry.get("provider_data"),
+            citations=Citations.model_validate(entry["citations"]) if entry.get("citations") else None,
+            extra=entry.get("extra"),
+        )
+        if entry.get("parsed") and isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            try:
+                model_response.parsed = response_format.model_validate_json(model_response.content or "")
+            except Exception as e:
+                log_warning(f"Failed to parse cached structured output: {e}")
+        return model_response
+
+    def get_stream_deltas(self, lookup: ResponseCacheLookup) -> Iterator[ModelResponse]:
+        """Yields the cached response as a stream of deltas. Tool calls are not included, they are already complete."""
+        entry = deepcopy(lookup.entry) or {}
+        citations = Citations.model_validate(entry["citations"]) if entry.get("citations") else None
+        yield ModelResponse(
+            role=entry.get("role"),
+            thinking=entry.get("thinking"),
+            redacted_thinking=entry.get("redacted_thinking"),
+            provider_data=entry.get("provider_data"),
+            citations=citations,
+            extra=entry.get("extra"),
+        )
+        content = entry.get("content") or ""
+        chunk_size = max(self.stream_chunk_size, 1)
+        for start in range(0, len(content), chunk_size):
+            yield ModelResponse(content=content[start : start + chunk_size])
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def _lookup_exact(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: Optional[Union[str, Dict[str, Any]]],
+    ) -> ResponseCacheLookup:
+        request = get_canonical_request(model, messages, response_format, tools, tool_choice)
+        lookup = ResponseCacheLookup(key=f"response_{_hash(request)}")
+        lookup.entry = self.backend.get(lookup.key)
+
+        if self.mode == "semantic":
+            query_index = _get_last_user_message_index(messages)
+            if query_index is not None:
+                # The context of the request is everything but the content of the last user message
+                request["messages"][query_index].pop("content", None)
+                lookup.context_key = _hash(request)
+        return lookup
+
+    def _lookup_semantic(self, context_key: str, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        if not embedding:
+            return None
+        index = self.backend.get(f"response_index_{context_key}") or []
+        best_key, best_similarity = None, self.similarity_threshold
+        for indexed in index:
+            similarity = _cosine_similarity(embedding, indexed["embedding"])
+            if similarity >= best_similarity:
+                best_key, best_similarity = indexed["key"], similarity
+        if best_key is None:
+            return None
+        log_debug(f"Found semantically similar cached response, similarity: {best_similarity:.3f}")
+        return self.backend.get(best_key)
+
+    def _get_query(self, messages: List[Message]) -> Optional[str]:
+        query_index = _get_last_user_message_index(messages)
+        return messages[query_index].get_content_string() if query_index is not None else None
+
+    def _count(self, lookup: ResponseCacheLookup) -> None:
+        with self._lock:
+            if lookup.hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __deepcopy__(self, memo):
+        # The cache is shared, copies of models keep using the same cache
+        return self
+
+
+def get_canonical_request(
+    model: "Model",
+    messages: Sequence[Message],
+    response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Returns the parts of a model request that determine its response, in a form that can be hashed"""
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        response_format = response_format.model_json_schema()  # type: ignore
+
+    # Tool call ids are generated by the provider, so they are replaced by their position in the conversation
+    tool_call_ids: Dict[str, str] = {}
+    return {
+        "model": _get_model_settings(model),
+        "messages": [_get_canonical_message(message, tool_call_ids) for message in messages],
+        "tools": tools,
+        "response_format": response_format,
+        "tool_choice": tool_choice,
+    }
+
+
+def _get_model_settings(model: "Model") -> Dict[str, Any]:
+    settings: Dict[str, Any] = {"class": model.__class__.__name__}
+    for f in fields(model):
+        if f.name.startswith("_") or f.name in _IGNORED_MODEL_FIELDS:
+            continue
+        value = getattr(model, f.name, None)
+        if value is None or isinstance(value, (str, int, float, bool)):
+            settings[f.name] = value
+        elif isinstance(value, (list, dict)):
+            # Only settings that serialize the same way every time, not clients or other objects
+            try:
+                json.dumps(value)
+                settings[f.name] = value
+            except Exception:
+                pass
+    return settings
+
+
+def _get_canonical_message(message: Message, tool_call_ids: Dict[str, str]) -> Dict[str, Any]:
+    message_dict = message.to_dict()
+    for field_name in _VOLATILE_MESSAGE_FIELDS:
+        message_dict.pop(field_name, None)
+    if message.files:
+        message_dict["files"] = [f.to_dict() if hasattr(f, "to_dict") else str(f) for f in message.files]
+
+    def normalize_id(tool_call_id: str) -> str:
+        return tool_call_ids.setdefault(tool_call_id, f"call_{len(tool_call_ids)}")
+
+    if message.tool_calls:
+        tool_calls = []
+        for tool_call in message.tool_calls:
+            tool_call = dict(tool_call)
+            if tool_call.get("id") is not None:
+                tool_call["id"] = normalize_id(tool_call["id"])
+            tool_calls.append(tool_call)
+        message_dict["tool_calls"] = tool_calls
+    if message.tool_call_id is not None:
+        message_dict["tool_call_id"] = normalize_id(message.tool_call_id)
+    return message_dict
+
+
+def _get_last_user_message_index(messages: List[Message]) -> Optional[int]:
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].role == "user":
+            return index
+    return None
+
+
+def _hash(request: Dict[str, Any]) -> str:
+    return sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    if len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = sqrt(sum(x * x for x in a)) * sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
@@ -0,0 +1,206 @@
+"""Process-wide registry of model provider clients.
+
+Creating a provider client, and the HTTP connection pool behind it, on every request means every model call
+pays for a new TCP and TLS handshake. Models get their clients from this registry instead, keyed by the provider
+and the client parameters (base_url, credentials, timeouts, ...), so all models with the same configuration share
+one client and its keep-alive connections, including copies of a model made by `deepcopy`.
+
+Async clients are bound to the event loop they are used in, so they are kept per event loop.
+"""
+
+import asyncio
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import httpx
+
+from agno.utils.log import log_debug, log_warning
+
+T = TypeVar("T")
+
+
+@dataclass
+class HttpClientSettings:
+    """Connection pool settings of the shared HTTP clients"""
+
+    max_connections: int = 1000
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 120.0
+    # Use HTTP/2 when the `h2` package is installed
+    http2: Optional[bool] = None
+
+    def get_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def use_http2(self) -> bool:
+        if self.http2 is not None:
+            return self.http2
+        try:
+            import h2  # noqa: F401
+
+            return True
+        except ImportError:
+            return False
+
+
+def get_client_key(provider: str, params: Dict[str, Any]) -> Tuple[str, str]:
+    """Returns a registry key for a provider client created with the given parameters"""
+    serialized = json.dumps(params, sort_keys=True, default=repr)
+    # Hash the parameters so credentials are not kept in the key
+    return provider, sha256(serialized.encode()).hexdigest()
+
+
+class ClientRegistry:
+    """Shares provider clients and HTTP connection pools between models"""
+
+    def __init__(self, settings: Optional[HttpClientSettings] = None):
+        self.settings: HttpClientSettings = settings or HttpClientSettings()
+        # Reentrant, as client factories get the shared HTTP client while the lock is held
+        self._lock = threading.RLock()
+        self._http_client: Optional[httpx.Client] = None
+        self._clients: Dict[Any, Any] = {}
+        # Async clients per event loop: id(loop) -> (loop reference, http client, provider clients)
+        self._loop_clients: Dict[int, Tuple[weakref.ref, httpx.AsyncClient, Dict[Any, Any]]] = {}
+
+    def get_http_client(self) -> httpx.Client:
+        """Returns the shared synchronous HTTP client"""
+        if self._http_client is None or self._http_client.is_closed:
+            with self._lock:
+                if self._http_client is None or self._http_client.is_closed:
+                    self._http_client = httpx.Client(limits=self.settings.get_limits(), http2=self.settings.use_http2())
+        return self._http_client
+
+    def get_client(self, key: Any, factory: Callable[[], T]) -> T:
+        """Returns the shared client for the key, creating it with `factory` the first time"""
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    log_debug(f"Creating shared client: {key[0] if isinstance(key, tuple) else key}")
+                    client = factory()
+                    self._clients[key] = client
+        return client
+
+    def _get_loop_clients(self) -> Optional[Tuple[httpx.AsyncClient, Dict[Any, Any]]]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        with self._lock:
+            # Forget the clients of event loops that are closed
+            for loop_id, (loop_ref, _, _) in list(self._loop_clients.items()):
+                closed_loop = loop_ref()
+                if closed_loop is None or closed_loop.is_closed():
+                    del self._loop_clients[loop_id]
+            entry = self._loop_clients.get(id(loop))
+            if entry is None:
+                http_client = httpx.AsyncClient(limits=self.settings.get_limits(), http2=self.settings.use_http2())
+                entry = (weakref.ref(loop), http_client, {})
+                self._loop_clients[id(loop)] = entry
+        return entry[1], entry[2]
+
+    def get_async_http_client(self) -> httpx.AsyncClient:
+        """Returns the shared asynchronous HTTP client of the running event loop"""
+        loop_clients = self._get_loop_clients()
+        if loop_clients is None:
+            # Not in an event loop, so the client can not be shared
+            return httpx.AsyncClient(limits=self.settings.get_limits(), http2=self.settings.use_http2())
+        return loop_clients[0]
+
+    def get_async_client(self, key: Any, factory: Callable[[], T]) -> T:
+        """Returns the shared async client for the key in the running event loop, creating it with `factory`"""
+        loop_clients = self._get_loop_clients()
+        if loop_clients is None:
+            return factory()
+        clients = loop_clients[1]
+        client = clients.get(key)
+        if client is None:
+            with self._lock:
+                client = clients.get(key)
+                if client is None:
+                    log_debug(f"Creating shared async client: {key[0] if isinstance(key, tuple) else key}")
+                    client = factory()
+                    clients[key] = client
+        return client
+
+    def close(self) -> None:
+        """Close the shared synchronous clients"""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            http_client, self._http_client = self._http_client, None
+        for client in clients.values():
+            _close_client(client)
+        if http_client is not None:
+            http_client.close()
+
+    async def aclose(self) -> None:
+        """Close the shared clients, including the async clients of the running event loop"""
+        self.close()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._lock:
+            entry = self._loop_clients.pop(id(loop), None)
+        if entry is not None:
+            _, http_client, clients = entry
+            for client in clients.values():
+                close = getattr(client, "close", None)
+                if close is not None:
+                    try:
+                        result = close()
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as e:
+                        log_warning(f"Error closing client: {e}")
+            await http_client.aclose()
+
+
+def _close_client(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if close is not None:
+        try:
+            close()
+        except Exception as e:
+            log_warning(f"Error closing client: {e}")
+
+
+_client_registry: Optional[ClientRegistry] = None
+_client_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Returns the process-wide client registry"""
+    global _client_registry
+    if _client_registry is None:
+        with _client_registry_lock:
+            if _client_registry is None:
+                _client_registry = ClientRegistry()
+    return _client_registry
+
+
+def set_client_registry(registry: ClientRegistry) -> None:
+    """Replace the process-wide client registry, e.g. to change the connection pool settings"""
+    global _client_registry
+    _client_registry = registry
+
+
+def close_clients() -> None:
+    """Close the shared synchronous clients, e.g. when the application shuts down"""
+    if _client_registry is not None:
+        _client_registry.close()
+
+
+async def aclose_clients() -> None:
+    """Close the shared clients from the event loop they are used in, e.g. in a FastAPI lifespan"""
+    if _client_registry is not None:
+        await _client_registry.aclose()
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from agno.exceptions import ModelProviderError
 from agno.models.base import Model
+from agno.models.clients import get_client_key, get_client_registry
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import log_error, log_warning
@@ -100,8 +101,15 @@ class Groq(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+            self.client = GroqClient(**client_params)
+            return self.client
 
-        self.client = GroqClient(**client_params)
+        # Share the client and its connection pool with other models using the same parameters
+        registry = get_client_registry()
+        self.client = registry.get_client(
+            get_client_key("groq", client_params),
+            lambda: GroqClient(**{"http_client": registry.get_http_client(), **client_params}),
+        )
         return self.client
 
     def get_async_client(self) -> AsyncGroqClient:
@@ -117,12 +125,14 @@ class Groq(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncGroqClient(**client_params)
+            return AsyncGroqClient(**client_params)
+
+        # Share the client and its connection pool with other models using the same parameters in this event loop
+        registry = get_client_registry()
+        return registry.get_async_client(
+            get_client_key("groq", client_params),
+            lambda: AsyncGroqClient(**{"http_client": registry.get_async_http_client(), **client_params}),
+        )
 
     def get_request_kwargs(
         self,
@@ -0,0 +1,5 @@
+from agno.models.mock.mock import MockModel
+
+__all__ = [
+    "MockModel",
+]
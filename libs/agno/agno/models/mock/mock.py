@@ -0,0 +1,118 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class MockModel(Model):
+    """
+    A deterministic Model that does not call a model provider, to benchmark and test Agents and Teams offline.
+
+    A request that does not contain tool results yet is answered with the `tool_calls` available to the Model.
+    Other requests are answered with `content`.
+
+    Attributes:
+        id: Model identifier
+        name: Model name
+        provider: Model provider
+        content: Content of the responses
+        tool_calls: Tools to call before responding, as {"name": ..., "arguments": {...}} dicts
+        latency: Simulated time the model provider takes to respond, in seconds
+        stream_chunk_size: Number of characters in each chunk of streamed responses
+    """
+
+    id: str = "mock"
+    name: str = "MockModel"
+    provider: str = "Mock"
+
+    content: str = "This is a mock response."
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    latency: float = 0.0
+    stream_chunk_size: int = 16
+
+    def _get_tool_calls(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Returns the tool calls to make, or an empty list if the tools were already called in this request"""
+        if not self.tool_calls or not tools:
+            return []
+        for message in reversed(messages):
+            if message.role == self.tool_message_role:
+                return []
+            if message.role == "user":
+                break
+
+        tool_names = {tool.get("function", {}).get("name") for tool in tools}
+        return [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {"name": tool_call["name"], "arguments": json.dumps(tool_call.get("arguments") or {})},
+            }
+            for i, tool_call in enumerate(self.tool_calls)
+            if tool_call["name"] in tool_names
+        ]
+
+    def _get_usage(self, messages: List[Message], content: Optional[str]) -> Dict[str, int]:
+        """Count words as tokens, so runs report the same usage every time"""
+        input_tokens = sum(len(message.get_content_string().split()) for message in messages)
+        output_tokens = len(content.split()) if content else 0
+        return {"input_tokens": input_tokens, "output_tokens": output_tokens}
+
+    def _get_response(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]) -> ModelResponse:
+        tool_calls = self._get_tool_calls(messages, tools)
+        content = None if tool_calls else self.content
+        return ModelResponse(
+            role=self.assistant_message_role,
+            content=content,
+            tool_calls=tool_calls,
+            response_usage=self._get_usage(messages, content),
+        )
+
+    def _get_response_deltas(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]]
+    ) -> Iterator[ModelResponse]:
+        response = self._get_response(messages, tools)
+        if response.tool_calls:
+            yield ModelResponse(role=response.role, tool_calls=response.tool_calls)
+        elif response.content:
+            for i in range(0, len(response.content), self.stream_chunk_size):
+                yield ModelResponse(role=response.role, content=response.content[i : i + self.stream_chunk_size])
+        yield ModelResponse(response_usage=response.response_usage)
+
+    def invoke(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs) -> ModelResponse:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return self._get_response(messages, tools)
+
+    async def ainvoke(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs
+    ) -> ModelResponse:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self._get_response(messages, tools)
+
+    def invoke_stream(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs
+    ) -> Iterator[ModelResponse]:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        yield from self._get_response_deltas(messages, tools)
+
+    async def ainvoke_stream(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None, **kwargs
+    ) -> AsyncIterator[ModelResponse]:  # type: ignore
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        for delta in self._get_response_deltas(messages, tools):
+            yield delta
+
+    def parse_provider_response(self, response: ModelResponse, **kwargs) -> ModelResponse:
+        return response
+
+    def parse_provider_response_delta(self, response: ModelResponse) -> ModelResponse:
+        return response
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 from agno.exceptions import ModelProviderError
 from agno.media import AudioResponse
 from agno.models.base import Model
+from agno.models.clients import get_client_key, get_client_registry
 from agno.models.message import Message
 from agno.models.response import ModelResponse
 from agno.utils.log import log_error, log_warning
@@ -123,7 +124,14 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
-        return OpenAIClient(**client_params)
+            return OpenAIClient(**client_params)
+
+        # Share the client and its connection pool with other models using the same parameters
+        registry = get_client_registry()
+        return registry.get_client(
+            get_client_key("openai", client_params),
+            lambda: OpenAIClient(**{"http_client": registry.get_http_client(), **client_params}),
+        )
 
     def get_async_client(self) -> AsyncOpenAIClient:
         """
@@ -135,12 +143,14 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncOpenAIClient(**client_params)
+            return AsyncOpenAIClient(**client_params)
+
+        # Share the client and its connection pool with other models using the same parameters in this event loop
+        registry = get_client_registry()
+        return registry.get_async_client(
+            get_client_key("openai", client_params),
+            lambda: AsyncOpenAIClient(**{"http_client": registry.get_async_http_client(), **client_params}),
+        )
 
     def get_request_kwargs(
         self,
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from agno.exceptions import ModelProviderError
 from agno.media import File
 from agno.models.base import MessageData, Model, _add_usage_metrics_to_assistant_message
+from agno.models.clients import get_client_key, get_client_registry
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
 from agno.utils.log import log_debug, log_error, log_warning
@@ -122,8 +123,15 @@ class OpenAIResponses(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+            self.client = OpenAI(**client_params)
+            return self.client
 
-        self.client = OpenAI(**client_params)
+        # Share the client and its connection pool with other models using the same parameters
+        registry = get_client_registry()
+        self.client = registry.get_client(
+            get_client_key("openai", client_params),
+            lambda: OpenAI(**{"http_client": registry.get_http_client(), **client_params}),
+        )
         return self.client
 
     def get_async_client(self) -> AsyncOpenAI:
@@ -139,14 +147,16 @@ class OpenAIResponses(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            self.async_client = AsyncOpenAI(**client_params)
+            return self.async_client
 
-        self.async_client = AsyncOpenAI(**client_params)
-        return self.async_client
+        # Share the client and its connection pool with other models using the same parameters in this event loop.
+        # It is not kept on the model, as it is bound to the event loop.
+        registry = get_client_registry()
+        return registry.get_async_client(
+            get_client_key("openai", client_params),
+            lambda: AsyncOpenAI(**{"http_client": registry.get_async_http_client(), **client_params}),
+        )
 
     def get_request_params(
         self,
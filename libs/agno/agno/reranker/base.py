@@ -1,14 +1,128 @@
-from typing import List
+import asyncio
+from heapq import nlargest
+from typing import Any, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict
 
 from agno.document import Document
+from agno.reranker.cache import ScoreCache, ScoreKey
+from agno.utils.log import logger
+from agno.vectordb.base import content_hash
 
 
 class Reranker(BaseModel):
-    """Base class for rerankers"""
+    """Base class for rerankers.
+
+    Rerankers implement `_score`, and `_ascore` if their client is async. `rerank` and `arerank` only score the
+    candidates that are not in the score cache, then order them by score and keep the `top_n`.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
 
-    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
+    # Number of documents to return. All reranked documents are returned if not set.
+    top_n: Optional[int] = None
+    # Only rerank the first max_candidates documents, in the order they were retrieved in. The rest are dropped.
+    max_candidates: Optional[int] = None
+    # Number of (query, document) scores to cache. Set to 0 to disable the cache.
+    score_cache_size: int = 4096
+    _score_cache: Optional[ScoreCache] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.score_cache_size > 0:
+            self._score_cache = ScoreCache(max_size=self.score_cache_size)
+
+    @property
+    def score_cache(self) -> Optional[ScoreCache]:
+        return self._score_cache
+
+    def _score(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        """Returns the relevance score of each document for the query, or None for documents the model did not score"""
         raise NotImplementedError
+
+    async def _ascore(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        return await asyncio.to_thread(self._score, query, documents)
+
+    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        try:
+            return self._rerank(query=query, documents=documents)
+        except Exception as e:
+            logger.error(f"Error reranking documents: {e}. Returning original documents")
+            return documents
+
+    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        """Async version of rerank"""
+        try:
+            return await self._arerank(query=query, documents=documents)
+        except Exception as e:
+            logger.error(f"Error reranking documents: {e}. Returning original documents")
+            return documents
+
+    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        candidates = self._get_candidates(documents)
+        keys, scores = self._get_cached_scores(query, candidates)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            new_scores = self._score(query, [candidates[i] for i in missing])
+            self._set_scores(keys, scores, missing, new_scores)
+        return self._rank(candidates, scores)
+
+    async def _arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        candidates = self._get_candidates(documents)
+        keys, scores = self._get_cached_scores(query, candidates)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            new_scores = await self._ascore(query, [candidates[i] for i in missing])
+            self._set_scores(keys, scores, missing, new_scores)
+        return self._rank(candidates, scores)
+
+    def _get_candidates(self, documents: List[Document]) -> List[Document]:
+        if self.max_candidates is not None and self.max_candidates > 0:
+            return documents[: self.max_candidates]
+        return documents
+
+    def _get_cached_scores(
+        self, query: str, candidates: List[Document]
+    ) -> Tuple[List[ScoreKey], List[Optional[float]]]:
+        score_cache = self.score_cache
+        if score_cache is None:
+            return [], [None] * len(candidates)
+        keys = [(query, content_hash(doc)) for doc in candidates]
+        return keys, score_cache.get_many(keys)
+
+    def _set_scores(
+        self,
+        keys: List[ScoreKey],
+        scores: List[Optional[float]],
+        missing: List[int],
+        new_scores: List[Optional[float]],
+    ) -> None:
+        if len(new_scores) != len(missing):
+            raise ValueError(f"Expected {len(missing)} scores, got {len(new_scores)}")
+        to_cache = {}
+        for index, score in zip(missing, new_scores):
+            scores[index] = score
+            if keys and score is not None:
+                to_cache[keys[index]] = score
+        score_cache = self.score_cache
+        if score_cache is not None and to_cache:
+            score_cache.set_many(to_cache)
+
+    def _rank(self, candidates: List[Document], scores: List[Optional[float]]) -> List[Document]:
+        top_n = self.top_n
+        if top_n and not (0 < top_n):
+            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
+            top_n = None
+
+        reranked_docs: List[Document] = []
+        for doc, score in zip(candidates, scores):
+            # Documents the model did not score are dropped
+            if score is None:
+                continue
+            doc.reranking_score = score
+            reranked_docs.append(doc)
+
+        # Order by relevance score, only keeping the top_n if specified
+        if top_n:
+            return nlargest(top_n, reranked_docs, key=lambda x: x.reranking_score)  # type: ignore
+        reranked_docs.sort(key=lambda x: x.reranking_score, reverse=True)  # type: ignore
+        return reranked_docs
@@ -0,0 +1,96 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+Pair = Tuple[str, str]
+
+
+@dataclass
+class _BatchRequest:
+    pairs: List[Pair]
+    scores: Optional[List[float]] = None
+    error: Optional[BaseException] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class PairBatcher:
+    """Scores the (query, document) pairs of concurrent rerank calls together, in one call to the model.
+
+    The first caller of a batch leads it: it waits for the batch before it to be scored, then for up to `max_wait`
+    seconds for more pairs, and scores all pending pairs. Callers that arrive in the meantime wait for its result.
+    With `max_wait=0`, only the calls that queue up while the model is busy are batched, which adds no latency.
+    """
+
+    def __init__(
+        self,
+        score_pairs: Callable[[List[Pair]], List[float]],
+        max_wait: float = 0.0,
+        max_batch_pairs: int = 256,
+    ):
+        """
+        Args:
+            score_pairs (Callable[[List[Pair]], List[float]]): Returns the score of each pair.
+            max_wait (float): Seconds the leader of a batch waits for more pairs.
+            max_batch_pairs (int): The leader stops waiting once this many pairs are pending.
+        """
+        self.score_pairs = score_pairs
+        self.max_wait: float = max_wait
+        self.max_batch_pairs: int = max_batch_pairs
+        self.num_batches: int = 0
+        self._pending: List[_BatchRequest] = []
+        self._num_pending_pairs: int = 0
+        self._has_leader: bool = False
+        self._condition = threading.Condition()
+        # Only one batch is scored at a time
+        self._score_lock = threading.Lock()
+
+    def score(self, pairs: List[Pair]) -> List[float]:
+        """Score the pairs, batched with the pairs of concurrent calls"""
+        if not pairs:
+            return []
+
+        request = _BatchRequest(pairs=pairs)
+        with self._condition:
+            self._pending.append(request)
+            self._num_pending_pairs += len(pairs)
+            is_leader = not self._has_leader
+            self._has_leader = True
+            self._condition.notify_all()
+
+        if is_leader:
+            with self._score_lock:
+                with self._condition:
+                    if self.max_wait > 0:
+                        self._condition.wait_for(
+                            lambda: self._num_pending_pairs >= self.max_batch_pairs, timeout=self.max_wait
+                        )
+                    batch = self._pending
+                    self._pending = []
+                    self._num_pending_pairs = 0
+                    self._has_leader = False
+                self._score_batch(batch)
+
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.scores  # type: ignore
+
+    def _score_batch(self, batch: List[_BatchRequest]) -> None:
+        try:
+            all_pairs = [pair for request in batch for pair in request.pairs]
+            all_scores = self.score_pairs(all_pairs)
+            self.num_batches += 1
+            start = 0
+            for request in batch:
+                request.scores = list(all_scores[start : start + len(request.pairs)])
+                start += len(request.pairs)
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+        finally:
+            for request in batch:
+                request.done.set()
+
+    def __deepcopy__(self, memo):
+        # The batcher is shared, copies of the reranker batch their calls together
+        return self
@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ScoreKey = Tuple[str, str]
+
+
+class ScoreCache:
+    """Least-recently-used cache of reranking scores, keyed by (query, document content hash).
+
+    The cache is shared by copies of the reranker, e.g. the rerankers of agents copied from the same template.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Args:
+            max_size (int): Maximum number of scores to keep.
+        """
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._scores: "OrderedDict[ScoreKey, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[ScoreKey]) -> List[Optional[float]]:
+        """Returns the cached score of each key, or None if it is missing"""
+        scores: List[Optional[float]] = []
+        with self._lock:
+            for key in keys:
+                score = self._scores.get(key)
+                if score is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._scores.move_to_end(key)
+                scores.append(score)
+        return scores
+
+    def set_many(self, scores: Dict[ScoreKey, float]) -> None:
+        with self._lock:
+            for key, score in scores.items():
+                self._scores[key] = score
+                self._scores.move_to_end(key)
+            # Evict the least recently used scores
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._scores)}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __deepcopy__(self, memo):
+        # The cache is shared, copies of the reranker keep using the same cache
+        return self
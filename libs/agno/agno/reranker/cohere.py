@@ -2,9 +2,9 @@ from typing import Any, Dict, List, Optional
 
 from agno.document import Document
 from agno.reranker.base import Reranker
-from agno.utils.log import logger
 
 try:
+    from cohere import AsyncClient as AsyncCohereClient
     from cohere import Client as CohereClient
 except ImportError:
     raise ImportError("cohere not installed, please run pip install cohere")
@@ -14,51 +14,42 @@ class CohereReranker(Reranker):
     model: str = "rerank-multilingual-v3.0"
     api_key: Optional[str] = None
     cohere_client: Optional[CohereClient] = None
-    top_n: Optional[int] = None
+    async_cohere_client: Optional[AsyncCohereClient] = None
+
+    def _get_client_params(self) -> Dict[str, Any]:
+        _client_params: Dict[str, Any] = {}
+        if self.api_key:
+            _client_params["api_key"] = self.api_key
+        return _client_params
 
     @property
     def client(self) -> CohereClient:
         if self.cohere_client:
             return self.cohere_client
 
-        _client_params: Dict[str, Any] = {}
-        if self.api_key:
-            _client_params["api_key"] = self.api_key
-        return CohereClient(**_client_params)
+        self.cohere_client = CohereClient(**self._get_client_params())
+        return self.cohere_client
 
-    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        # Validate input documents and top_n
-        if not documents:
-            return []
+    @property
+    def async_client(self) -> AsyncCohereClient:
+        if self.async_cohere_client:
+            return self.async_cohere_client
 
-        top_n = self.top_n
-        if top_n and not (0 < top_n):
-            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
-            top_n = None
+        self.async_cohere_client = AsyncCohereClient(**self._get_client_params())
+        return self.async_cohere_client
 
-        compressed_docs: list[Document] = []
-        _docs = [doc.content for doc in documents]
-        response = self.client.rerank(query=query, documents=_docs, model=self.model)
+    def _get_scores(self, response: Any, num_documents: int) -> List[Optional[float]]:
+        scores: List[Optional[float]] = [None] * num_documents
         for r in response.results:
-            doc = documents[r.index]
-            doc.reranking_score = r.relevance_score
-            compressed_docs.append(doc)
-
-        # Order by relevance score
-        compressed_docs.sort(
-            key=lambda x: x.reranking_score if x.reranking_score is not None else float("-inf"),
-            reverse=True,
-        )
-
-        # Limit to top_n if specified
-        if top_n:
-            compressed_docs = compressed_docs[:top_n]
+            scores[r.index] = r.relevance_score
+        return scores
 
-        return compressed_docs
+    def _score(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        _docs = [doc.content for doc in documents]
+        response = self.client.rerank(query=query, documents=_docs, model=self.model)
+        return self._get_scores(response, len(documents))
 
-    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        try:
-            return self._rerank(query=query, documents=documents)
-        except Exception as e:
-            logger.error(f"Error reranking documents: {e}. Returning original documents")
-            return documents
+    async def _ascore(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        _docs = [doc.content for doc in documents]
+        response = await self.async_client.rerank(query=query, documents=_docs, model=self.model)
+        return self._get_scores(response, len(documents))
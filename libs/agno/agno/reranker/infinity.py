@@ -1,9 +1,8 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from agno.document import Document
 from agno.reranker.base import Reranker
-from agno.utils.log import logger
 
 try:
     from infinity_client import AuthenticatedClient, Client
@@ -18,7 +17,6 @@ class InfinityReranker(Reranker):
     host: str = "localhost"
     port: int = 7997
     url: Optional[str] = None
-    top_n: Optional[int] = None
     api_key: Optional[str] = None
     verify_ssl: bool = True
     _client: Optional[Any] = None
@@ -58,138 +56,37 @@ class InfinityReranker(Reranker):
 
         return self._client
 
-    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        # Validate input documents and top_n
-        if not documents:
-            return []
-
-        top_n = self.top_n
-        if top_n and not (0 < top_n):
-            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
-            top_n = None
-
-        compressed_docs: list[Document] = []
-
-        try:
-            # Prepare the request body for Infinity reranking
-            rerank_input = {
-                "model": self.model,
-                "query": query,
-                "documents": [doc.content for doc in documents],
-                "return_documents": False,  # We only need scores, we already have documents
-            }
-
-            # Add top_n to payload if specified
-            if top_n:
-                rerank_input["top_n"] = top_n
-
-            # Create the input object
-            body = RerankInput.from_dict(rerank_input)
-
-            # Make request to Infinity rerank endpoint using the client
-            with self.client as client:
-                result = rerank.sync(client=client, body=body)
-
-                if result is None:
-                    logger.error("Rerank request returned None")
-                    return documents
-
-                # Process the response
-                # Infinity returns results with index and relevance_score
-                if hasattr(result, "results") and result.results:
-                    for item in result.results:
-                        doc_index = item.index
-                        relevance_score = item.relevance_score
-
-                        if doc_index < len(documents):
-                            doc = documents[doc_index]
-                            doc.reranking_score = relevance_score
-                            compressed_docs.append(doc)
-
-                # Order by relevance score
-                compressed_docs.sort(
-                    key=lambda x: x.reranking_score if x.reranking_score is not None else float("-inf"),
-                    reverse=True,
-                )
-
-                # Limit to top_n if specified and not already limited by the API
-                if top_n and len(compressed_docs) > top_n:
-                    compressed_docs = compressed_docs[:top_n]
-
-        except Exception as e:
-            logger.error(f"Error connecting to Infinity server at {self.base_url}: {e}")
-            return documents
-
-        return compressed_docs
-
-    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        try:
-            return self._rerank(query=query, documents=documents)
-        except Exception as e:
-            logger.error(f"Error reranking documents: {e}. Returning original documents")
-            return documents
-
-    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
-        """Async version of rerank"""
-        # Validate input documents and top_n
-        if not documents:
-            return []
-
-        top_n = self.top_n
-        if top_n and not (0 < top_n):
-            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
-            top_n = None
-
-        compressed_docs: list[Document] = []
-
-        try:
-            # Prepare the request body for Infinity reranking
-            rerank_input = {
-                "model": self.model,
-                "query": query,
-                "documents": [doc.content for doc in documents],
-                "return_documents": False,  # We only need scores, we already have documents
-            }
-
-            # Add top_n to payload if specified
-            if top_n:
-                rerank_input["top_n"] = top_n
-
-            # Create the input object
-            body = RerankInput.from_dict(rerank_input)
-
-            # Make async request to Infinity rerank endpoint using the client
-            async with self.client as client:
-                result = await rerank.asyncio(client=client, body=body)
-
-                if result is None:
-                    logger.error("Async rerank request returned None")
-                    return documents
-
-                # Process the response
-                # Infinity returns results with index and relevance_score
-                if hasattr(result, "results") and result.results:
-                    for item in result.results:
-                        doc_index = item.index
-                        relevance_score = item.relevance_score
-
-                        if doc_index < len(documents):
-                            doc = documents[doc_index]
-                            doc.reranking_score = relevance_score
-                            compressed_docs.append(doc)
-
-                # Order by relevance score
-                compressed_docs.sort(
-                    key=lambda x: x.reranking_score if x.reranking_score is not None else float("-inf"),
-                    reverse=True,
-                )
-
-                # Limit to top_n if specified and not already limited by the API
-                if top_n and len(compressed_docs) > top_n:
-                    compressed_docs = compressed_docs[:top_n]
-
-        except Exception as e:
-            logger.error(f"Error connecting to Infinity server at {self.base_url}: {e}")
-            return documents
-
-        return compressed_docs
+    def _get_rerank_input(self, query: str, documents: List[Document]) -> Any:
+        rerank_input: Dict[str, Any] = {
+            "model": self.model,
+            "query": query,
+            "documents": [doc.content for doc in documents],
+            "return_documents": False,  # We only need scores, we already have documents
+        }
+        return RerankInput.from_dict(rerank_input)
+
+    def _get_scores(self, result: Any, num_documents: int) -> List[Optional[float]]:
+        if result is None:
+            raise ValueError(f"Rerank request to Infinity server at {self.base_url} returned None")
+
+        # Infinity returns results with index and relevance_score
+        scores: List[Optional[float]] = [None] * num_documents
+        if hasattr(result, "results") and result.results:
+            for item in result.results:
+                if item.index < num_documents:
+                    scores[item.index] = item.relevance_score
+        return scores
+
+    def _score(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        body = self._get_rerank_input(query, documents)
+        # Make request to Infinity rerank endpoint using the client
+        with self.client as client:
+            result = rerank.sync(client=client, body=body)
+        return self._get_scores(result, len(documents))
+
+    async def _ascore(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        body = self._get_rerank_input(query, documents)
+        # Make async request to Infinity rerank endpoint using the client
+        async with self.client as client:
+            result = await rerank.asyncio(client=client, body=body)
+        return self._get_scores(result, len(documents))
@@ -2,7 +2,7 @@ from typing import Any, Dict, List, Optional
 
 from agno.document import Document
 from agno.reranker.base import Reranker
-from agno.utils.log import logger
+from agno.reranker.batch import Pair, PairBatcher
 
 try:
     from sentence_transformers import CrossEncoder
@@ -13,42 +13,23 @@ except ImportError:
 class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
-    top_n: Optional[int] = None
-
-    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        if not documents:
-            return []
-
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
-
-        top_n = self.top_n
-        if top_n and not (0 < top_n):
-            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
-            top_n = None
-
-        compressed_docs: list[Document] = []
-
-        sentence_pairs = [[query, doc.content] for doc in documents]
-
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
-        for index, score in enumerate(scores):
-            doc = documents[index]
-            doc.reranking_score = score
-            compressed_docs.append(doc)
-
-        compressed_docs.sort(
-            key=lambda x: x.reranking_score if x.reranking_score is not None else float("-inf"),
-            reverse=True,
-        )
-
-        if top_n:
-            compressed_docs = compressed_docs[:top_n]
-
-        return compressed_docs
-
-    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        try:
-            return self._rerank(query=query, documents=documents)
-        except Exception as e:
-            logger.error(f"Error reranking documents: {e}. Returning original documents")
-            return documents
+    # Number of (query, document) pairs the model scores at once
+    batch_size: int = 32
+    # Seconds to wait for concurrent rerank calls to join a batch.
+    # With 0, the calls made while the model is busy are still scored together in the next batch.
+    max_batch_wait: float = 0.0
+    _cross_encoder: Optional[Any] = None
+    _batcher: Optional[PairBatcher] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._batcher = PairBatcher(self._score_pairs, max_wait=self.max_batch_wait)
+
+    def _score_pairs(self, pairs: List[Pair]) -> List[float]:
+        # Load the model once, batches are scored one at a time
+        if self._cross_encoder is None:
+            self._cross_encoder = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        return self._cross_encoder.predict(pairs, batch_size=self.batch_size).tolist()
+
+    def _score(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        return self._batcher.score([(query, doc.content) for doc in documents])  # type: ignore
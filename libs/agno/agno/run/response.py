@@ -239,6 +239,9 @@ class RunResponse:
 
     events: Optional[List[RunResponseEvent]] = None
 
+    # Timings of the phases of the run, as a tree of spans. Set when tracing is enabled
+    trace: Optional[Dict[str, Any]] = None
+
     status: RunStatus = RunStatus.running
 
     @property
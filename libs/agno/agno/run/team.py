@@ -218,6 +218,8 @@ class TeamRunResponse:
     model_provider: Optional[str] = None
 
     member_responses: List[Union["TeamRunResponse", RunResponse]] = field(default_factory=list)
+    # Wall time of each member run, keyed by the index of the member in the team
+    member_metrics: Optional[Dict[int, Dict[str, Any]]] = None
 
     run_id: Optional[str] = None
     team_id: Optional[str] = None
@@ -244,6 +246,9 @@ class TeamRunResponse:
 
     events: Optional[List[Union[RunResponseEvent, TeamRunResponseEvent]]] = None
 
+    # Timings of the phases of the run, as a tree of spans. Set when tracing is enabled
+    trace: Optional[Dict[str, Any]] = None
+
     status: RunStatus = RunStatus.running
 
     @property
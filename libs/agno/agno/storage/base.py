@@ -1,10 +1,17 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, TypeVar
 
 from agno.storage.session import Session
+from agno.storage.summary import SessionPage, get_entity_id_field, get_summary_fields, paginate, to_summary
+
+T = TypeVar("T")
 
 
 class Storage(ABC):
+    # Whether runs are stored separately from their session, so they can be read in windows with `read_runs`
+    separate_runs: bool = False
+
     def __init__(self, mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
         self._mode: Literal["agent", "team", "workflow"] = "agent" if mode is None else mode
 
@@ -26,6 +33,10 @@ class Storage(ABC):
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         raise NotImplementedError
 
+    def read_runs(self, session_id: str, start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the runs of a session with a run index in [start, end). Requires `separate_runs`."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
         raise NotImplementedError
@@ -43,6 +54,38 @@ class Storage(ABC):
     ) -> List[Session]:
         raise NotImplementedError
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List summaries of the sessions, ordered by created_at descending, without loading their memory.
+
+        Backends override this with an indexed query that only reads the requested fields. This default
+        implementation reads all sessions with `get_all_sessions`.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): The fields of the summaries, from `SESSION_SUMMARY_FIELDS`.
+
+        Returns:
+            SessionPage: The session summaries, and the cursor of the next page.
+        """
+        summary_fields = get_summary_fields(fields)
+        entity_id_field = get_entity_id_field(self.mode)
+        summaries = [
+            to_summary(session.to_dict(), entity_id_field, summary_fields)
+            for session in self.get_all_sessions(user_id=user_id, entity_id=entity_id)
+        ]
+        return paginate(summaries, limit=limit, cursor=cursor)
+
     @abstractmethod
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
@@ -58,3 +101,47 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    # -*- Async methods
+    # Backends with an async client override these. The defaults run the sync method with `_run_sync`.
+    async def _run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a sync method in a thread, so a slow database call does not block the event loop"""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None, **kwargs: Any) -> Optional[Session]:
+        return await self._run_sync(self.read, session_id, user_id, **kwargs)
+
+    async def aread_runs(self, session_id: str, start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        return await self._run_sync(self.read_runs, session_id, start, end)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return await self._run_sync(self.get_all_session_ids, user_id, entity_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await self._run_sync(self.get_all_sessions, user_id, entity_id)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        return await self._run_sync(self.get_recent_sessions, user_id=user_id, entity_id=entity_id, limit=limit)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        return await self._run_sync(
+            self.list_sessions, user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor, fields=fields
+        )
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        return await self._run_sync(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await self._run_sync(self.delete_session, session_id)
@@ -1,18 +1,27 @@
 import time
 from dataclasses import asdict
 from decimal import Decimal
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, cast
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.summary import (
+    SessionPage,
+    decode_cursor,
+    get_entity_id_field,
+    get_page,
+    get_summary_fields,
+    paginate,
+    to_summary,
+)
 from agno.utils.log import log_debug, log_info, logger
 
 try:
     import boto3
-    from boto3.dynamodb.conditions import Key
+    from boto3.dynamodb.conditions import Attr, Key
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
@@ -500,6 +509,106 @@ class DynamoDbStorage(Storage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List summaries of the sessions, ordered by created_at descending.
+        Sessions of a user or entity are queried from their created_at index, one page at a time. Only the requested
+        attributes are read, and only the first run of each session for `first_run`. Projections can not filter the
+        runs by their messages, so the runs of each session are read for `title_run`.
+
+        Args:
+            user_id (Optional[str]): User ID to filter by.
+            entity_id (Optional[str]): Entity ID to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): The fields of the summaries, from `SESSION_SUMMARY_FIELDS`.
+
+        Returns:
+            SessionPage: The session summaries, and the cursor of the next page.
+        """
+        summary_fields = get_summary_fields(fields)
+        start_after = decode_cursor(cursor)
+        entity_id_field = get_entity_id_field(self.mode)
+
+        # Attribute names are aliased, so they can not clash with DynamoDB reserved words
+        attribute_names: Dict[str, str] = {}
+        projection: List[str] = []
+        for field in summary_fields:
+            if field == "entity_id":
+                attribute_names["#entity_id"] = entity_id_field
+                projection.append("#entity_id")
+            elif field in ("first_run", "title_run"):
+                attribute_names["#memory"] = "memory"
+                attribute_names["#runs"] = "runs"
+                # Document paths can not overlap, so the runs are read whole if both fields are requested
+                runs_path = "#memory.#runs" if "title_run" in summary_fields else "#memory.#runs[0]"
+                if runs_path not in projection:
+                    projection.append(runs_path)
+            else:
+                attribute_names[f"#{field}"] = field
+                projection.append(f"#{field}")
+        request: Dict[str, Any] = {
+            "ProjectionExpression": ", ".join(projection),
+            "ExpressionAttributeNames": attribute_names,
+        }
+
+        summaries: List[Dict[str, Any]] = []
+        try:
+            if user_id is None and entity_id is None:
+                # Without a filter there is no index to read in order, so all sessions are sorted in memory
+                while True:
+                    response = self.table.scan(**request)
+                    summaries.extend(self._to_summary(item, summary_fields) for item in response.get("Items", []))
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                return paginate(summaries, limit=limit, cursor=cursor)
+
+            if user_id is not None:
+                index_name, hash_key, hash_value = "user_id-index", "user_id", user_id
+                if entity_id is not None:
+                    request["FilterExpression"] = Attr(entity_id_field).eq(entity_id)
+            else:
+                # entity_id is set, as sessions without filters were read above
+                index_name, hash_key, hash_value = f"{entity_id_field}-index", entity_id_field, cast(str, entity_id)
+            request.update(
+                IndexName=index_name,
+                KeyConditionExpression=Key(hash_key).eq(hash_value),
+                ScanIndexForward=False,
+            )
+            # Start after the last session of the previous page
+            if start_after is not None:
+                created_at, session_id = start_after
+                request["ExclusiveStartKey"] = {
+                    "session_id": session_id,
+                    hash_key: hash_value,
+                    "created_at": created_at,
+                }
+
+            while limit is None or len(summaries) <= limit:
+                if limit is not None and "FilterExpression" not in request:
+                    # Read one more session to know if there is a next page
+                    request["Limit"] = limit + 1 - len(summaries)
+                response = self.table.query(**request)
+                summaries.extend(self._to_summary(item, summary_fields) for item in response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            return get_page(summaries[: limit + 1] if limit is not None else summaries, limit)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+        return SessionPage()
+
+    def _to_summary(self, item: Dict[str, Any], summary_fields: List[str]) -> Dict[str, Any]:
+        return to_summary(self._deserialize_item(item), get_entity_id_field(self.mode), summary_fields)
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Create or update a Session in the database.
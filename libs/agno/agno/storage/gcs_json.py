@@ -1,12 +1,13 @@
 import json
 import time
-from typing import Any, List, Literal, Optional
+from typing import Any, List, Literal, Optional, Sequence
 
 from agno.storage.json import JsonStorage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.summary import SessionPage
 from agno.utils.log import logger
 
 try:
@@ -208,6 +209,21 @@ class GCSJsonStorage(JsonStorage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        Lists summaries of the sessions. Blobs are not indexed like local JSON files, so every session is read.
+        """
+        return Storage.list_sessions(
+            self, user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor, fields=fields
+        )
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Inserts or updates a session JSON blob in the GCS bucket.
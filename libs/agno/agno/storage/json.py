@@ -1,22 +1,41 @@
 import json
+import os
+import threading
 import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.summary import (
+    SessionPage,
+    decode_cursor,
+    get_entity_id_field,
+    get_page,
+    get_summary_fields,
+    to_summary,
+)
 from agno.utils.log import logger
 
+# Index entry of a session: (user_id, entity_id, created_at)
+IndexEntry = Tuple[Optional[str], Optional[str], int]
+
 
 class JsonStorage(Storage):
     def __init__(self, dir_path: Union[str, Path], mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
+        # Index of the user, entity and created_at of every session, so sessions are listed without reading every file.
+        # It does not end in .json, so it is not read as a session.
+        self.index_path = self.dir_path / ".sessions_index"
+        self._index: Optional[Dict[str, IndexEntry]] = None
+        self._index_mtime: Optional[float] = None
+        self._index_lock = threading.RLock()
 
     def serialize(self, data: dict) -> str:
         return json.dumps(data, ensure_ascii=False, indent=4)
@@ -187,6 +206,93 @@ class JsonStorage(Storage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions, ordered by created_at descending.
+        Sessions are filtered and sorted with the index, and only the files of the sessions in the page are read."""
+        summary_fields = get_summary_fields(fields)
+        start_after = decode_cursor(cursor)
+        entity_id_field = get_entity_id_field(self.mode)
+
+        sort_keys: List[Tuple[int, str]] = []
+        for session_id, (_user_id, _entity_id, created_at) in self._get_index().items():
+            if user_id is not None and _user_id != user_id:
+                continue
+            if entity_id is not None and _entity_id != entity_id:
+                continue
+            if start_after is not None and (created_at, session_id) >= start_after:
+                continue
+            sort_keys.append((created_at, session_id))
+        sort_keys.sort(reverse=True)
+        if limit is not None:
+            sort_keys = sort_keys[: limit + 1]
+
+        summaries: List[Dict[str, Any]] = []
+        for _, session_id in sort_keys:
+            try:
+                with open(self.dir_path / f"{session_id}.json", "r", encoding="utf-8") as f:
+                    summaries.append(to_summary(self.deserialize(f.read()), entity_id_field, summary_fields))
+            except FileNotFoundError:
+                continue
+        return get_page(summaries, limit)
+
+    def _get_index(self) -> Dict[str, IndexEntry]:
+        """Returns the index of the sessions, building it from the session files if it does not exist"""
+        with self._index_lock:
+            try:
+                mtime = self.index_path.stat().st_mtime
+            except FileNotFoundError:
+                mtime = None
+            # The index is only read again when another storage instance or process changed it
+            if self._index is not None and mtime is not None and mtime == self._index_mtime:
+                return self._index
+
+            if mtime is not None:
+                try:
+                    self._index = {k: tuple(v) for k, v in json.loads(self.index_path.read_text("utf-8")).items()}  # type: ignore
+                    self._index_mtime = mtime
+                    return self._index  # type: ignore
+                except Exception as e:
+                    logger.warning(f"Error reading sessions index, rebuilding it: {e}")
+
+            entity_id_field = get_entity_id_field(self.mode)
+            index: Dict[str, IndexEntry] = {}
+            for file in self.dir_path.glob("*.json"):
+                try:
+                    data = self.deserialize(file.read_text("utf-8"))
+                    index[data["session_id"]] = self._get_index_entry(data, entity_id_field)
+                except Exception as e:
+                    logger.error(f"Error reading session file {file}: {e}")
+            self._write_index(index)
+            return index
+
+    def _update_index(self, session_id: str, entry: Optional[IndexEntry]) -> None:
+        """Add, update or remove (if entry is None) the index entry of a session"""
+        with self._index_lock:
+            index = dict(self._get_index())
+            if entry is None:
+                index.pop(session_id, None)
+            else:
+                index[session_id] = entry
+            self._write_index(index)
+
+    def _write_index(self, index: Dict[str, IndexEntry]) -> None:
+        # Write to a temporary file first, so the index is never read half written
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+        self._index = index
+        self._index_mtime = self.index_path.stat().st_mtime
+
+    def _get_index_entry(self, data: Dict[str, Any], entity_id_field: str) -> IndexEntry:
+        return data.get("user_id"), data.get(entity_id_field), data.get("created_at") or 0
+
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in storage."""
         try:
@@ -197,6 +303,7 @@ class JsonStorage(Storage):
 
             with open(self.dir_path / f"{session.session_id}.json", "w", encoding="utf-8") as f:
                 f.write(self.serialize(data))
+            self._update_index(session.session_id, self._get_index_entry(data, get_entity_id_field(self.mode)))
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -208,6 +315,7 @@ class JsonStorage(Storage):
             return
         try:
             (self.dir_path / f"{session_id}.json").unlink(missing_ok=True)
+            self._update_index(session_id, None)
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
@@ -215,7 +323,23 @@ class JsonStorage(Storage):
         """Drop all sessions from storage."""
         for file in self.dir_path.glob("*.json"):
             file.unlink()
+        self.index_path.unlink(missing_ok=True)
+        self._index = None
 
     def upgrade_schema(self) -> None:
         """Upgrade the schema of the storage."""
         pass
+
+    def __deepcopy__(self, memo):
+        """Create a deep copy of the JsonStorage instance, with its own index lock"""
+        from copy import deepcopy
+
+        cls = self.__class__
+        copied_obj = cls.__new__(cls)
+        memo[id(self)] = copied_obj
+        for k, v in self.__dict__.items():
+            if k == "_index_lock":
+                setattr(copied_obj, k, threading.RLock())
+            else:
+                setattr(copied_obj, k, deepcopy(v, memo))
+        return copied_obj
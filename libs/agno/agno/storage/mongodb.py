@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 from uuid import UUID
 
 from agno.storage.base import Storage
@@ -7,10 +7,13 @@ from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.summary import SessionPage, decode_cursor, get_entity_id_field, get_page, get_summary_fields
 from agno.utils.log import log_debug, logger
+from agno.utils.loop import LoopLocal
 
 try:
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient, MongoClient
+    from pymongo.asynchronous.collection import AsyncCollection
     from pymongo.collection import Collection
     from pymongo.database import Database
     from pymongo.errors import PyMongoError
@@ -26,6 +29,7 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_client: Optional[AsyncMongoClient] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -35,6 +39,8 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing async MongoDB client, used by the async methods. Defaults to a client
+                for the db_url. If only a client is provided, the async methods run in a thread.
         """
         super().__init__(mode)
         self._client: Optional[MongoClient] = client
@@ -51,6 +57,41 @@ class MongoDbStorage(Storage):
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
 
+        # Async clients are bound to an event loop, so one is created per loop unless a client is provided
+        self._async_client: Optional[AsyncMongoClient] = async_client
+        self._async_clients: Optional[LoopLocal[AsyncMongoClient]] = None
+        if async_client is None and (db_url is not None or client is None):
+            self._async_clients = LoopLocal(lambda: AsyncMongoClient(db_url))
+
+    @property
+    def async_collection(self) -> Optional[AsyncCollection]:
+        """The async collection of the running event loop, None if there is no async client"""
+        async_client = self._async_client
+        if async_client is None and self._async_clients is not None:
+            async_client = self._async_clients.get()
+        if async_client is None:
+            return None
+        return async_client[self.db_name][self.collection_name]
+
+    def _to_session(self, doc: Dict[str, Any]) -> Optional[Session]:
+        # Remove MongoDB _id before converting to a Session
+        doc.pop("_id", None)
+        if self.mode == "agent":
+            return AgentSession.from_dict(doc)
+        elif self.mode == "team":
+            return TeamSession.from_dict(doc)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(doc)
+        return None
+
+    def _get_query(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Dict[str, Any]:
+        query: Dict[str, Any] = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if entity_id is not None:
+            query[get_entity_id_field(self.mode)] = entity_id
+        return query
+
     def create(self) -> None:
         """Create necessary indexes for the collection"""
         try:
@@ -64,6 +105,10 @@ class MongoDbStorage(Storage):
                 self.collection.create_index("team_id")
             elif self.mode == "workflow":
                 self.collection.create_index("workflow_id")
+            # Indexes to list the sessions of a user or entity in created_at order
+            entity_id_field = get_entity_id_field(self.mode)
+            self.collection.create_index([("user_id", 1), ("created_at", -1), ("session_id", -1)])
+            self.collection.create_index([(entity_id_field, 1), ("created_at", -1), ("session_id", -1)])
         except PyMongoError as e:
             logger.error(f"Error creating indexes: {e}")
             raise
@@ -83,14 +128,25 @@ class MongoDbStorage(Storage):
 
             doc = self.collection.find_one(query)
             if doc:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    return AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(doc)
+                return self._to_session(doc)
+            return None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Async version of read"""
+        async_collection = self.async_collection
+        if async_collection is None:
+            return await super().aread(session_id, user_id)
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = await async_collection.find_one(query)
+            if doc:
+                return self._to_session(doc)
             return None
         except PyMongoError as e:
             logger.error(f"Error reading session: {e}")
@@ -182,46 +238,125 @@ class MongoDbStorage(Storage):
             List[Session]: List of most recent sessions
         """
         try:
-            # Build the query
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-
             # Execute query with sort and limit
-            cursor = self.collection.find(query)
+            cursor = self.collection.find(self._get_query(user_id, entity_id))
             cursor = cursor.sort("created_at", -1)  # Sort by created_at descending
             if limit is not None:
                 cursor = cursor.limit(limit)
 
             sessions: List[Session] = []
             for doc in cursor:
-                # Remove MongoDB _id before converting to Session object
-                doc.pop("_id", None)
-                session: Optional[Session] = None
+                session = self._to_session(doc)
+                if session is not None:
+                    sessions.append(session)
+            return sessions
 
-                if self.mode == "agent":
-                    session = AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    session = TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    session = WorkflowSession.from_dict(doc)
+        except PyMongoError as e:
+            logger.error(f"Error getting last {limit} sessions: {e}")
+            return []
 
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of get_recent_sessions"""
+        async_collection = self.async_collection
+        if async_collection is None:
+            return await super().aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=limit)
+        try:
+            cursor = async_collection.find(self._get_query(user_id, entity_id)).sort("created_at", -1)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+
+            sessions: List[Session] = []
+            async for doc in cursor:
+                session = self._to_session(doc)
                 if session is not None:
                     sessions.append(session)
-
             return sessions
 
         except PyMongoError as e:
             logger.error(f"Error getting last {limit} sessions: {e}")
             return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions, ordered by created_at descending.
+        Only the requested fields are returned by the server, and only the first run of each session for `first_run`,
+        or the first run with a user message for `title_run`.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. Defaults to all sessions.
+            cursor: The `next_cursor` of the previous page
+            fields: The fields of the summaries, from `SESSION_SUMMARY_FIELDS`
+
+        Returns:
+            SessionPage: The session summaries, and the cursor of the next page
+        """
+        summary_fields = get_summary_fields(fields)
+        start_after = decode_cursor(cursor)
+        entity_id_field = get_entity_id_field(self.mode)
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if entity_id is not None:
+                query[entity_id_field] = entity_id
+            # Start after the last session of the previous page
+            if start_after is not None:
+                created_at, session_id = start_after
+                query["$or"] = [
+                    {"created_at": {"$lt": created_at}},
+                    {"created_at": created_at, "session_id": {"$lt": session_id}},
+                ]
+
+            projection: Dict[str, Any] = {"_id": 0}
+            for field in summary_fields:
+                if field == "entity_id":
+                    projection["entity_id"] = f"${entity_id_field}"
+                elif field == "first_run":
+                    projection["first_run"] = {"$arrayElemAt": ["$memory.runs", 0]}
+                elif field == "title_run":
+                    user_runs = {
+                        "$filter": {
+                            "input": {"$ifNull": ["$memory.runs", []]},
+                            "as": "run",
+                            "cond": {
+                                "$or": [
+                                    {"$eq": ["$$run.message.role", "user"]},
+                                    {"$in": ["user", {"$ifNull": ["$$run.messages.role", []]}]},
+                                ]
+                            },
+                        }
+                    }
+                    projection["title_run"] = {"$arrayElemAt": [user_runs, 0]}
+                else:
+                    projection[field] = 1
+
+            pipeline: List[Dict[str, Any]] = [{"$match": query}, {"$sort": {"created_at": -1, "session_id": -1}}]
+            if limit is not None:
+                # Read one more session to know if there is a next page
+                pipeline.append({"$limit": limit + 1})
+            pipeline.append({"$project": projection})
+
+            summaries = [
+                {field: doc.get(field) for field in summary_fields} for doc in self.collection.aggregate(pipeline)
+            ]
+            return get_page(summaries, limit)
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionPage()
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """Upsert a session
         Args:
@@ -231,40 +366,63 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
+            query, update_data = self._get_upsert(session)
+            doc = self.collection.find_one(query, {"_id": 1})
+            if not doc:
+                # For new documents, set created_at
+                update_data["created_at"] = update_data["updated_at"]
 
-            update_data = {**session_dict, "updated_at": timestamp}
+            result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
-            # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
+            if result.acknowledged:
+                return self.read(session_id=query["session_id"])
+            return None
 
-            doc = self.collection.find_one(query)
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Async version of upsert"""
+        async_collection = self.async_collection
+        if async_collection is None:
+            return await super().aupsert(session)
+        try:
+            query, update_data = self._get_upsert(session)
+            doc = await async_collection.find_one(query, {"_id": 1})
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
-            result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
+            result = await async_collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return await self.aread(session_id=query["session_id"])
             return None
 
         except PyMongoError as e:
             logger.warning(f"Error upserting session: {e}")
             return None
 
+    def _get_upsert(self, session: Session) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns the query and the update of a session upsert"""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        update_data = {**session_dict, "updated_at": timestamp}
+        return {"session_id": session_dict["session_id"]}, update_data
+
     def delete_session(self, session_id: Optional[str] = None) -> None:
         """Delete an agent session
         Args:
@@ -310,7 +468,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "db", "collection", "_async_client", "_async_clients"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
@@ -1,24 +1,40 @@
+import asyncio
 import time
-from typing import List, Literal, Optional
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
 
 from agno.storage.base import Storage
+from agno.storage.runs import (
+    RunHashCache,
+    get_changed_runs,
+    get_run_hashes,
+    merge_runs,
+    refresh_run_ids,
+    split_runs,
+)
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.summary import SessionPage, decode_cursor, get_entity_id_field, get_page, get_summary_fields
 from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.utils.sql import AsyncSessionFactory
 
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
+    from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.schema import Column, Index, MetaData, Table
+    from sqlalchemy.sql.expression import and_, func, or_, select, text, type_coerce
     from sqlalchemy.types import BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
 
 class PostgresStorage(Storage):
     def __init__(
@@ -30,6 +46,8 @@ class PostgresStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        separate_runs: bool = False,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
@@ -47,6 +65,10 @@ class PostgresStorage(Storage):
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
             mode (Optional[Literal["agent", "team", "workflow"]]): The mode of the storage.
+            separate_runs (bool): Store runs in a separate `<table_name>_runs` table and only write new or changed
+                runs on upsert.
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async engine used by the async methods.
+                Defaults to a psycopg async engine for the database of the db_engine.
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
         """
@@ -71,11 +93,22 @@ class PostgresStorage(Storage):
         # Automatically upgrade schema if True
         self.auto_upgrade_schema: bool = auto_upgrade_schema
         self._schema_up_to_date: bool = False
+        # Indexes used to list sessions, created on tables that existed before they were added
+        self._list_indexes_created: bool = False
+
+        # Store runs in a separate table
+        self.separate_runs: bool = separate_runs
+        # Hashes of the stored runs of recently written sessions
+        self._run_hashes: RunHashCache = RunHashCache()
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database session, used by the async methods
+        self.AsyncSession: AsyncSessionFactory = AsyncSessionFactory(self.db_engine, async_db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for runs, if stored separately
+        self.runs_table: Optional[Table] = self.get_runs_table() if self.separate_runs else None
         log_debug(f"Created PostgresStorage: '{self.schema}.{self.table_name}'")
 
     @property
@@ -89,6 +122,7 @@ class PostgresStorage(Storage):
         super(PostgresStorage, type(self)).mode.fset(self, value)  # type: ignore
         if value is not None:
             self.table = self.get_table()
+            self._list_indexes_created = False
 
     def get_table_v1(self) -> Table:
         """
@@ -134,6 +168,9 @@ class PostgresStorage(Storage):
             self.metadata,
             *common_columns,
             *specific_columns,
+            # Indexes to list the sessions of a user or entity in created_at order
+            Index(f"idx_{self.table_name}_user_id_created_at", "user_id", "created_at"),
+            Index(f"idx_{self.table_name}_{self.mode}_id_created_at", f"{self.mode}_id", "created_at"),
             extend_existing=True,
             schema=self.schema,  # type: ignore
         )
@@ -155,13 +192,38 @@ class PostgresStorage(Storage):
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
-    def table_exists(self) -> bool:
+    def get_runs_table(self) -> Table:
+        """
+        Define the table schema for runs stored separately from their session.
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs table.
+        """
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            Column("session_id", String, primary_key=True),
+            Column("run_index", BigInteger, primary_key=True),
+            Column("run_id", String),
+            Column("run_hash", String),
+            Column("run_data", postgresql.JSONB),
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            Column("updated_at", BigInteger, server_onupdate=text("(extract(epoch from now()))::bigint")),
+            extend_existing=True,
+            schema=self.schema,  # type: ignore
+        )
+
+    def table_exists(self, table_name: Optional[str] = None) -> bool:
         """
         Check if the table exists in the database.
 
+        Args:
+            table_name (Optional[str]): Name of the table to check. Defaults to the sessions table.
+
         Returns:
             bool: True if the table exists, False otherwise.
         """
+        table_name = table_name or self.table_name
         try:
             # Use a direct SQL query to check if the table exists
             with self.Session() as sess:
@@ -170,14 +232,13 @@ class PostgresStorage(Storage):
                         "SELECT 1 FROM information_schema.tables WHERE table_schema = :schema AND table_name = :table"
                     )
                     exists = (
-                        sess.execute(exists_query, {"schema": self.schema, "table": self.table_name}).scalar()
-                        is not None
+                        sess.execute(exists_query, {"schema": self.schema, "table": table_name}).scalar() is not None
                     )
                 else:
                     exists_query = text("SELECT 1 FROM information_schema.tables WHERE table_name = :table")
-                    exists = sess.execute(exists_query, {"table": self.table_name}).scalar() is not None
+                    exists = sess.execute(exists_query, {"table": table_name}).scalar() is not None
 
-            log_debug(f"Table '{self.table.fullname}' does{' not ' if not exists else ' '}exist")
+            log_debug(f"Table '{table_name}' does{' not ' if not exists else ' '}exist")
             return exists
 
         except Exception as e:
@@ -189,7 +250,9 @@ class PostgresStorage(Storage):
         Create the table if it does not exist.
         """
         self.table = self.get_table()
-        if not self.table_exists():
+        if self.table_exists():
+            self._create_list_indexes()
+        else:
             try:
                 with self.Session() as sess, sess.begin():
                     if self.schema is not None:
@@ -236,33 +299,33 @@ class PostgresStorage(Storage):
                         # Log the error but continue with other indexes
                         logger.warning(f"Error creating index {idx.name}: {e}")
 
+                self._list_indexes_created = True
             except Exception as e:
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
                 raise
 
-    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        if self.runs_table is not None and not self.table_exists(self.runs_table.name):
+            log_debug(f"Creating table: {self.runs_table.name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
+    def read(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
         """
         Read an Session from the database.
 
         Args:
             session_id (str): ID of the session to read.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): If runs are stored separately, only load the last n runs of the session.
+                The other runs are None in `memory["runs"]` and can be read with `read_runs`. Defaults to all runs.
 
         Returns:
             Optional[Session]: Session object if found, None otherwise.
         """
         try:
             with self.Session() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None
+                return self._read(sess, session_id, user_id, last_n_runs)
         except Exception as e:
             if "does not exist" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -272,6 +335,43 @@ class PostgresStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return None
 
+    async def aread(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        """Async version of read"""
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await super().aread(session_id, user_id, last_n_runs=last_n_runs)
+        try:
+            async with async_session() as sess:
+                return await sess.run_sync(self._read, session_id, user_id, last_n_runs)
+        except Exception as e:
+            if "does not exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                await asyncio.to_thread(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    def _read(
+        self, sess: SqlSession, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        result = sess.execute(stmt).fetchone()
+        if result is None:
+            return None
+        data = self._with_runs(sess, [result], last_n_runs=last_n_runs)[0]
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """
         Get all session IDs, optionally filtered by user_id and/or entity_id.
@@ -338,12 +438,13 @@ class PostgresStorage(Storage):
                 # execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
+                    data = self._with_runs(sess, rows)
                     if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [AgentSession.from_dict(d) for d in data]  # type: ignore
                     elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [TeamSession.from_dict(d) for d in data]  # type: ignore
                     else:
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [WorkflowSession.from_dict(d) for d in data]  # type: ignore
                 else:
                     return []
         except Exception as e:
@@ -371,43 +472,7 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # Build the base query
-                stmt = select(self.table)
-
-                # Add filters
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-
-                # Order by created_at desc and limit results
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                # Execute query
-                rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    sessions: List[Session] = []
-                    for row in rows:
-                        session: Optional[Session] = None
-                        if self.mode == "agent":
-                            session = AgentSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "team":
-                            session = TeamSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "workflow":
-                            session = WorkflowSession.from_dict(row._mapping)  # type: ignore
-
-                        if session is not None:
-                            sessions.append(session)
-                    return sessions
-                return []
-
+                return self._get_recent_sessions(sess, user_id, entity_id, limit)
         except Exception as e:
             if "does not exist" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -417,15 +482,222 @@ class PostgresStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
             return []
 
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of get_recent_sessions"""
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await super().aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=limit)
+        try:
+            async with async_session() as sess, sess.begin():
+                return await sess.run_sync(self._get_recent_sessions, user_id, entity_id, limit)
+        except Exception as e:
+            if "does not exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                await asyncio.to_thread(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+            return []
+
+    def _get_recent_sessions(
+        self,
+        sess: SqlSession,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        # Build the base query
+        stmt = select(self.table)
+
+        # Add filters
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode == "workflow":
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+
+        # Order by created_at desc and limit results
+        stmt = stmt.order_by(self.table.c.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        # Execute query
+        rows = sess.execute(stmt).fetchall()
+        if rows is not None:
+            sessions: List[Session] = []
+            for row_data in self._with_runs(sess, rows):
+                session: Optional[Session] = None
+                if self.mode == "agent":
+                    session = AgentSession.from_dict(row_data)  # type: ignore
+                elif self.mode == "team":
+                    session = TeamSession.from_dict(row_data)  # type: ignore
+                elif self.mode == "workflow":
+                    session = WorkflowSession.from_dict(row_data)  # type: ignore
+
+                if session is not None:
+                    sessions.append(session)
+            return sessions
+        return []
+
+    def _create_list_indexes(self) -> None:
+        """
+        Create the indexes used by `list_sessions` if they are missing, e.g. on a table created before they were added.
+        """
+        try:
+            with self.Session() as sess, sess.begin():
+                # The composite indexes on (user_id / entity id, created_at)
+                for idx in self.table.indexes:
+                    if len(idx.columns) > 1:
+                        columns = ", ".join(column.name for column in idx.columns)
+                        sess.execute(
+                            text(f"CREATE INDEX IF NOT EXISTS {idx.name} ON {self.table.fullname} ({columns})")
+                        )
+            self._list_indexes_created = True
+        except Exception as e:
+            log_debug(f"Could not create the indexes to list sessions: {e}")
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """
+        List summaries of the sessions, ordered by created_at descending.
+        Only the requested columns are read, and only the first run of each session for `first_run`, or the first run
+        with a user message for `title_run`.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): Maximum number of sessions in the page. Defaults to all sessions.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            fields (Optional[Sequence[str]]): The fields of the summaries, from `SESSION_SUMMARY_FIELDS`.
+
+        Returns:
+            SessionPage: The session summaries, and the cursor of the next page.
+        """
+        if not self._list_indexes_created:
+            self._create_list_indexes()
+        summary_fields = get_summary_fields(fields)
+        start_after = decode_cursor(cursor)
+        entity_id_column = self.table.c[get_entity_id_field(self.mode)]
+        try:
+            with self.Session() as sess, sess.begin():
+                columns: List[Any] = []
+                for field in summary_fields:
+                    if field == "entity_id":
+                        columns.append(entity_id_column.label("entity_id"))
+                    elif field == "first_run":
+                        columns.append(self.table.c.memory["runs"][0].label("first_run"))
+                    elif field == "title_run":
+                        columns.append(self._get_title_run().label("title_run"))
+                    else:
+                        columns.append(self.table.c[field])
+                stmt = select(*columns)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if entity_id is not None:
+                    stmt = stmt.where(entity_id_column == entity_id)
+                # Start after the last session of the previous page
+                if start_after is not None:
+                    created_at, session_id = start_after
+                    stmt = stmt.where(
+                        or_(
+                            self.table.c.created_at < created_at,
+                            and_(self.table.c.created_at == created_at, self.table.c.session_id < session_id),
+                        )
+                    )
+                stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id.desc())
+                if limit is not None:
+                    # Read one more session to know if there is a next page
+                    stmt = stmt.limit(limit + 1)
+
+                summaries = [dict(row._mapping) for row in sess.execute(stmt)]
+                if self.runs_table is not None:
+                    for field in ("first_run", "title_run"):
+                        if field in summary_fields:
+                            self._add_first_runs(sess, summaries, field)
+                return get_page(summaries, limit)
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            log_debug(f"Table does not exist: {self.table.name}")
+            log_debug("Creating table for future transactions")
+            self.create()
+        return SessionPage()
+
+    def _add_first_runs(self, sess: SqlSession, summaries: List[Dict[str, Any]], field: str = "first_run") -> None:
+        """Add the first run (or first run with a user message, for `title_run`) of sessions that store their runs
+        separately to their summaries"""
+        if self.runs_table is None:
+            return
+        session_ids = [summary["session_id"] for summary in summaries if summary.get(field) is None]
+        if not session_ids:
+            return
+        runs = self.runs_table
+        if field == "title_run":
+            title_runs = (
+                select(runs.c.session_id, func.min(runs.c.run_index).label("run_index"))
+                .where(runs.c.session_id.in_(session_ids), self._has_user_message(runs.c.run_data))
+                .group_by(runs.c.session_id)
+                .subquery()
+            )
+            stmt = select(runs.c.session_id, runs.c.run_data).join(
+                title_runs,
+                and_(runs.c.session_id == title_runs.c.session_id, runs.c.run_index == title_runs.c.run_index),
+            )
+        else:
+            stmt = select(runs.c.session_id, runs.c.run_data).where(
+                runs.c.session_id.in_(session_ids), runs.c.run_index == 0
+            )
+        first_runs = dict(sess.execute(stmt).fetchall())
+        for summary in summaries:
+            if summary.get(field) is None:
+                summary[field] = first_runs.get(summary["session_id"])
+
+    def _get_title_run(self) -> Any:
+        """Returns the first run with a user message in the memory of a session, as a correlated subquery"""
+        runs = (
+            func.jsonb_array_elements(self.table.c.memory["runs"])
+            .table_valued("value", with_ordinality="ordinality")
+            .alias("runs")
+        )
+        run = type_coerce(runs.c.value, postgresql.JSONB)
+        title_run = (
+            select(run).where(self._has_user_message(run)).order_by(runs.c.ordinality).limit(1)
+        ).scalar_subquery()
+        return type_coerce(title_run, postgresql.JSONB)
+
+    def _has_user_message(self, run: Any) -> Any:
+        """Returns the SQL condition that a JSONB run has a user message, like `has_user_message`"""
+        return or_(
+            run.contains({"message": {"role": "user"}}),
+            run.contains({"messages": [{"role": "user"}]}),
+        )
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema to the latest version.
-        Currently handles adding the team_session_id column for agent mode.
+        Currently handles adding the team_session_id column for agent mode, and the indexes used to list sessions.
         """
         if not self.auto_upgrade_schema:
             log_debug("Auto schema upgrade disabled. Skipping upgrade.")
             return
 
+        if not self._list_indexes_created and self.table_exists():
+            self._create_list_indexes()
+
         try:
             if self.mode == "agent" and self.table_exists():
                 with self.Session() as sess:
@@ -470,89 +742,15 @@ class PostgresStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        memory, runs = split_runs(session.memory) if self.separate_runs else (session.memory, None)
+
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                if self.mode == "agent":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "team":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                else:
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-
-                sess.execute(stmt)
+                upserted_session, run_hashes = self._upsert(sess, session, memory, runs)
         except Exception as e:
-            if create_and_retry and not self.table_exists():
+            if create_and_retry and (
+                not self.table_exists() or (self.runs_table is not None and not self.table_exists(self.runs_table.name))
+            ):
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table and retrying upsert")
                 self.create()
@@ -563,7 +761,282 @@ class PostgresStorage(Storage):
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
-        return self.read(session_id=session.session_id)
+        if run_hashes is not None:
+            self._run_hashes.set(session.session_id, run_hashes)
+        return upserted_session
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Async version of upsert"""
+        async_session = self.AsyncSession.get()
+        if async_session is None:
+            return await asyncio.to_thread(self.upsert, session, create_and_retry)
+
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await asyncio.to_thread(self.upgrade_schema)
+
+        memory, runs = split_runs(session.memory) if self.separate_runs else (session.memory, None)
+
+        try:
+            async with async_session() as sess, sess.begin():
+                upserted_session, run_hashes = await sess.run_sync(self._upsert, session, memory, runs)
+        except Exception as e:
+            if create_and_retry and (
+                not await asyncio.to_thread(self.table_exists)
+                or (
+                    self.runs_table is not None and not await asyncio.to_thread(self.table_exists, self.runs_table.name)
+                )
+            ):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        if run_hashes is not None:
+            self._run_hashes.set(session.session_id, run_hashes)
+        return upserted_session
+
+    def _upsert(
+        self,
+        sess: SqlSession,
+        session: Session,
+        memory: Optional[Dict[str, Any]],
+        runs: Optional[List[Optional[Dict[str, Any]]]],
+    ) -> Tuple[Session, Optional[Dict[int, str]]]:
+        """
+        Write a session and its changed runs.
+
+        Returns:
+            Tuple[Session, Optional[Dict[int, str]]]: The written session with its timestamps, and the hashes of its
+                stored runs if runs are stored separately.
+        """
+        # Create an insert statement
+        if self.mode == "agent":
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=memory,
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=memory,
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "team":
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=memory,
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=memory,
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        else:
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=memory,
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=memory,
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+
+        sess.execute(stmt)
+        run_hashes = self._upsert_runs(sess, session.session_id, runs) if runs is not None else None
+
+        # Return the session as written instead of reading it back with its runs, only the timestamps are set by the db
+        created_at, updated_at = sess.execute(
+            select(self.table.c.created_at, self.table.c.updated_at).where(
+                self.table.c.session_id == session.session_id
+            )
+        ).one()
+        upserted_session = replace(
+            session, memory=refresh_run_ids(session.memory), created_at=created_at, updated_at=updated_at
+        )
+        return upserted_session, run_hashes
+
+    def _upsert_runs(
+        self, sess: SqlSession, session_id: str, runs: List[Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[int, str]]:
+        """
+        Write only the runs of a session that are new or changed since the last upsert.
+
+        Args:
+            sess (SqlSession): The database session to write with.
+            session_id (str): ID of the session the runs belong to.
+            runs (List[Optional[Dict[str, Any]]]): All runs of the session, in order. None for runs that were not loaded.
+
+        Returns:
+            Optional[Dict[int, str]]: The hashes of the stored runs by run index.
+        """
+        if self.runs_table is None:
+            return None
+
+        # Use the run hashes of the last upsert of the session, if it was written by this storage
+        existing_hashes = self._run_hashes.get(session_id)
+        if existing_hashes is None:
+            existing_hashes = {
+                row.run_index: row.run_hash
+                for row in sess.execute(
+                    select(self.runs_table.c.run_index, self.runs_table.c.run_hash).where(
+                        self.runs_table.c.session_id == session_id
+                    )
+                )
+            }
+        changed_runs = get_changed_runs(session_id, runs, existing_hashes)
+        if changed_runs:
+            stmt = postgresql.insert(self.runs_table).values(changed_runs)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_index"],
+                set_=dict(
+                    run_id=stmt.excluded.run_id,
+                    run_hash=stmt.excluded.run_hash,
+                    run_data=stmt.excluded.run_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+            sess.execute(stmt)
+            log_debug(f"Wrote {len(changed_runs)} of {len(runs)} runs for session: {session_id}")
+
+        # Remove runs that are no longer part of the session
+        if any(run_index >= len(runs) for run_index in existing_hashes):
+            sess.execute(
+                self.runs_table.delete().where(
+                    self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= len(runs)
+                )
+            )
+        return get_run_hashes(existing_hashes, changed_runs, len(runs))
+
+    def _with_runs(
+        self, sess: SqlSession, rows: Sequence[Any], last_n_runs: Optional[int] = None
+    ) -> List[Mapping[str, Any]]:
+        """
+        Add the separately stored runs back into the memory of each session row.
+
+        Args:
+            sess (SqlSession): The database session to read with.
+            rows (Sequence[Any]): Session rows read from the sessions table.
+            last_n_runs (Optional[int]): Only load the last n runs of each session, and add the ids of all runs.
+
+        Returns:
+            List[Mapping[str, Any]]: The session rows as mappings, with runs in their memory.
+        """
+        if self.runs_table is None or len(rows) == 0:
+            return [row._mapping for row in rows]
+
+        session_ids = [row.session_id for row in rows]
+        runs_by_session: Dict[str, List[Optional[Dict[str, Any]]]] = {}
+        run_ids_by_session: Dict[str, List[Optional[str]]] = {}
+        if last_n_runs is None:
+            stmt = (
+                select(self.runs_table.c.session_id, self.runs_table.c.run_data)
+                .where(self.runs_table.c.session_id.in_(session_ids))
+                .order_by(self.runs_table.c.session_id, self.runs_table.c.run_index)
+            )
+            for session_id, run_data in sess.execute(stmt):
+                runs_by_session.setdefault(session_id, []).append(run_data)
+        else:
+            stmt = (
+                select(self.runs_table.c.session_id, self.runs_table.c.run_id)
+                .where(self.runs_table.c.session_id.in_(session_ids))
+                .order_by(self.runs_table.c.session_id, self.runs_table.c.run_index)
+            )
+            for session_id, run_id in sess.execute(stmt):
+                run_ids_by_session.setdefault(session_id, []).append(run_id)
+            for session_id, run_ids in run_ids_by_session.items():
+                start = max(0, len(run_ids) - last_n_runs)
+                runs_by_session[session_id] = [None] * start + self._read_runs(sess, session_id, start)
+
+        data: List[Mapping[str, Any]] = []
+        for row in rows:
+            if row.session_id in runs_by_session:
+                row_data = dict(row._mapping)
+                row_data["memory"] = merge_runs(
+                    row_data.get("memory"), runs_by_session[row.session_id], run_ids_by_session.get(row.session_id)
+                )
+                data.append(row_data)
+            else:
+                # Sessions written before runs were stored separately keep their runs in memory
+                data.append(row._mapping)
+        return data
+
+    def _read_runs(
+        self, sess: SqlSession, session_id: str, start: int = 0, end: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        if self.runs_table is None:
+            return []
+        stmt = select(self.runs_table.c.run_data).where(
+            self.runs_table.c.session_id == session_id, self.runs_table.c.run_index >= start
+        )
+        if end is not None:
+            stmt = stmt.where(self.runs_table.c.run_index < end)
+        return [run_data for (run_data,) in sess.execute(stmt.order_by(self.runs_table.c.run_index))]
+
+    def read_runs(self, session_id: str, start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read the separately stored runs of a session with a run index in [start, end).
+
+        Args:
+            session_id (str): ID of the session to read the runs of.
+            start (int): Index of the first run to read.
+            end (Optional[int]): Index after the last run to read. Defaults to the end of the session.
+
+        Returns:
+            List[Dict[str, Any]]: The runs, in order.
+        """
+        with self.Session() as sess:
+            return self._read_runs(sess, session_id, start, end)
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -584,6 +1057,9 @@ class PostgresStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    self._run_hashes.delete(session_id)
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -595,6 +1071,9 @@ class PostgresStorage(Storage):
         """
         Drop the table from the database if it exists.
         """
+        if self.runs_table is not None:
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+            self._run_hashes.delete()
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
@@ -602,6 +1081,7 @@ class PostgresStorage(Storage):
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData(schema=self.schema)
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table() if self.separate_runs else None
 
     def __deepcopy__(self, memo):
         """
@@ -622,10 +1102,10 @@ class PostgresStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            # Reuse db_engine, Session and the run hashes of the same database without copying
+            elif k in {"db_engine", "SqlSession", "_run_hashes"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -634,5 +1114,6 @@ class PostgresStorage(Storage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table() if copied_obj.separate_runs else None
 
         return copied_obj
@@ -1,7 +1,8 @@
+import asyncio
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, cast
 from uuid import UUID
 
 from agno.storage.base import Storage
@@ -9,13 +10,27 @@ from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.summary import (
+    SessionCursor,
+    SessionPage,
+    decode_cursor,
+    get_entity_id_field,
+    get_page,
+    get_summary_fields,
+    to_summary,
+)
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.loop import LoopLocal
 
 try:
-    from redis import ConnectionError, Redis
+    from redis import ConnectionError, Redis, WatchError
+    from redis.asyncio import Redis as AsyncRedis
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
+# Number of session ids read from an index, or keys scanned, per round trip
+INDEX_BATCH_SIZE = 500
+
 
 class UUIDEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -39,6 +54,9 @@ class RedisStorage(Storage):
         """
         Initialize Redis storage for sessions.
 
+        Sessions are listed with sorted sets scored by created_at, one for all sessions, and one per user, entity
+        and user + entity, stored under the `{prefix}_index:` keys.
+
         Args:
             prefix (str): Prefix for Redis keys to namespace the sessions
             host (str): Redis host address
@@ -52,6 +70,8 @@ class RedisStorage(Storage):
         super().__init__(mode)
         self.prefix = prefix
         self.expire = expire
+        # Whether the sessions stored before the indexes were added have been indexed
+        self._index_built = False
         self.redis_client = Redis(
             host=host,
             port=port,
@@ -60,8 +80,17 @@ class RedisStorage(Storage):
             decode_responses=True,  # Automatically decode responses to str
             ssl=ssl,
         )
+        # Async clients used by the async methods, one per event loop as connections can not be shared
+        self._async_clients: LoopLocal[AsyncRedis] = LoopLocal(
+            lambda: AsyncRedis(host=host, port=port, db=db, password=password, decode_responses=True, ssl=bool(ssl))
+        )
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """The async Redis client of the running event loop."""
+        return self._async_clients.get()
+
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
@@ -109,92 +138,201 @@ class RedisStorage(Storage):
             logger.error(f"Error reading session: {e}")
             return None
 
-    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
-        """Get all session IDs, optionally filtered by user_id and/or entity_id."""
-        session_ids = []
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis, with the async client."""
         try:
-            # Get all keys matching the prefix pattern
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
-                    session_ids.append(data["session_id"])
+            # The clients decode responses, so values are str
+            data = cast(Optional[str], await self.async_redis_client.get(self._get_key(session_id)))
+            if data is None:
+                return None
 
+            session_data = self.deserialize(data)
+            if user_id and session_data.get("user_id") != user_id:
+                return None
+            return self._to_session(session_data)
         except Exception as e:
-            logger.error(f"Error getting session IDs: {e}")
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    def _get_index_key(self, *parts: str) -> str:
+        """Generate Redis key for a session index. Index keys do not match the `{prefix}:*` pattern of session keys."""
+        return ":".join((f"{self.prefix}_index", *parts))
+
+    def _get_index_keys(self, data: dict) -> List[str]:
+        """Get the keys of the indexes a session belongs to."""
+        user_id = data.get("user_id")
+        entity_id = data.get(get_entity_id_field(self.mode))
+        index_keys = [self._get_index_key("all")]
+        if user_id:
+            index_keys.append(self._get_index_key("user", str(user_id)))
+        if entity_id:
+            index_keys.append(self._get_index_key(self.mode, str(entity_id)))
+            if user_id:
+                index_keys.append(self._get_index_key("user", str(user_id), self.mode, str(entity_id)))
+        return index_keys
+
+    def _get_filter_index_key(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> str:
+        """Get the key of the index holding the sessions of a user and/or entity."""
+        if user_id and entity_id:
+            return self._get_index_key("user", str(user_id), self.mode, str(entity_id))
+        if user_id:
+            return self._get_index_key("user", str(user_id))
+        if entity_id:
+            return self._get_index_key(self.mode, str(entity_id))
+        return self._get_index_key("all")
+
+    def _ensure_index(self) -> None:
+        """
+        Index the sessions stored before the indexes were added.
+        This scans the keyspace once, then the built marker is set and sessions are indexed on upsert.
+        """
+        if self._index_built:
+            return
+        built_key = self._get_index_key("built")
+        if not self.redis_client.exists(built_key):
+            log_debug(f"Building session indexes for prefix: '{self.prefix}'")
+            keys: List[str] = []
+            for key in self.redis_client.scan_iter(match=f"{self.prefix}:*", count=INDEX_BATCH_SIZE):
+                keys.append(key)
+                if len(keys) >= INDEX_BATCH_SIZE:
+                    self._index_keys(keys)
+                    keys = []
+            if keys:
+                self._index_keys(keys)
+            self.redis_client.set(built_key, int(time.time()))
+        self._index_built = True
+
+    def _index_keys(self, keys: List[str]) -> None:
+        """Add the sessions stored at these keys to their indexes."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        # The client decodes responses, so values are str
+        for value in cast(List[Optional[str]], self.redis_client.mget(keys)):
+            if value is None:
+                continue
+            data = self.deserialize(value)
+            session_id = data["session_id"]
+            score = data.get("created_at") or 0
+            index_keys = self._get_index_keys(data)
+            for index_key in index_keys:
+                pipe.zadd(index_key, {session_id: score})
+            meta_key = self._get_index_key("session", session_id)
+            pipe.hset(meta_key, mapping={"score": score, "keys": json.dumps(index_keys)})
+            if self.expire is not None:
+                pipe.expire(meta_key, self.expire)
+        pipe.execute()
+
+    def _read_index(
+        self, index_key: str, limit: Optional[int] = None, start_after: Optional[SessionCursor] = None
+    ) -> List[dict]:
+        """
+        Read the sessions in an index, ordered by (created_at, session_id) descending.
+        The session ids are read from the sorted set in batches, and their sessions are read with a single MGET per
+        batch. Sessions that expired are removed from the index.
+
+        Args:
+            index_key (str): The key of the index to read
+            limit (Optional[int]): Maximum number of sessions to read. Defaults to all sessions.
+            start_after (Optional[SessionCursor]): Only read the sessions after this (created_at, session_id)
+        """
+        sessions: List[dict] = []
+        max_score = "+inf" if start_after is None else start_after[0]
+        offset = 0
+        while limit is None or len(sessions) < limit:
+            num = INDEX_BATCH_SIZE if limit is None else min(INDEX_BATCH_SIZE, limit - len(sessions))
+            entries = self.redis_client.zrevrangebyscore(
+                index_key, max_score, "-inf", start=offset, num=num, withscores=True
+            )
+            if not entries:
+                break
+            offset += len(entries)
+            session_ids = self._get_ids_after(cast(List[Tuple[str, float]], entries), start_after)
+            if not session_ids:
+                continue
+
+            values = cast(List[Optional[str]], self.redis_client.mget([self._get_key(s) for s in session_ids]))
+            expired = self._add_sessions(sessions, session_ids, values)
+            if expired:
+                self.redis_client.zrem(index_key, *expired)
+                offset -= len(expired)
+        return sessions
+
+    async def _aread_index(
+        self, index_key: str, limit: Optional[int] = None, start_after: Optional[SessionCursor] = None
+    ) -> List[dict]:
+        """Async version of _read_index"""
+        client = self.async_redis_client
+        sessions: List[dict] = []
+        max_score = "+inf" if start_after is None else start_after[0]
+        offset = 0
+        while limit is None or len(sessions) < limit:
+            num = INDEX_BATCH_SIZE if limit is None else min(INDEX_BATCH_SIZE, limit - len(sessions))
+            entries = await client.zrevrangebyscore(
+                index_key, max_score, "-inf", start=offset, num=num, withscores=True
+            )
+            if not entries:
+                break
+            offset += len(entries)
+            session_ids = self._get_ids_after(cast(List[Tuple[str, float]], entries), start_after)
+            if not session_ids:
+                continue
+
+            values = cast(List[Optional[str]], await client.mget([self._get_key(s) for s in session_ids]))
+            expired = self._add_sessions(sessions, session_ids, values)
+            if expired:
+                await client.zrem(index_key, *expired)
+                offset -= len(expired)
+        return sessions
 
-        return session_ids
+    def _get_ids_after(
+        self, entries: List[Tuple[str, float]], start_after: Optional[SessionCursor] = None
+    ) -> List[str]:
+        """Get the session ids of index entries after the cursor. Sessions with the same created_at as the cursor
+        are ordered by session_id."""
+        return [
+            session_id for session_id, score in entries if start_after is None or (int(score), session_id) < start_after
+        ]
+
+    def _add_sessions(self, sessions: List[dict], session_ids: List[str], values: List[Optional[str]]) -> List[str]:
+        """Add the sessions read with MGET, and return the ids of the sessions that expired."""
+        expired: List[str] = []
+        for session_id, value in zip(session_ids, values):
+            if value is None:
+                expired.append(session_id)
+            else:
+                sessions.append(self.deserialize(value))
+        return expired
+
+    def _to_session(self, data: dict) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
+    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Get all session IDs, optionally filtered by user_id and/or entity_id, ordered by created_at descending."""
+        try:
+            self._ensure_index()
+            index_key = self._get_filter_index_key(user_id=user_id, entity_id=entity_id)
+            if self.expire is None:
+                return cast(List[str], self.redis_client.zrevrange(index_key, 0, -1))
+            # Skip the sessions that expired
+            return [data["session_id"] for data in self._read_index(index_key)]
+        except Exception as e:
+            logger.error(f"Error getting session IDs: {e}")
+            return []
 
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
-        """Get all sessions, optionally filtered by user_id and/or entity_id."""
+        """Get all sessions, optionally filtered by user_id and/or entity_id, ordered by created_at descending."""
         sessions: List[Session] = []
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    _session = None
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
-
+            self._ensure_index()
+            for data in self._read_index(self._get_filter_index_key(user_id=user_id, entity_id=entity_id)):
+                _session = self._to_session(data)
+                if _session is not None:
+                    sessions.append(_session)
         except Exception as e:
             logger.error(f"Error getting all sessions: {e}")
 
@@ -209,7 +347,7 @@ class RedisStorage(Storage):
         """Get the last N sessions, ordered by created_at descending.
 
         Args:
-            num_history_sessions: Number of most recent sessions to return
+            limit: Number of most recent sessions to return
             user_id: Filter by user ID
             entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
 
@@ -217,93 +355,188 @@ class RedisStorage(Storage):
             List[Session]: List of most recent sessions
         """
         sessions: List[Session] = []
-        # List of (created_at, data) tuples for sorting
-        session_data: List[tuple[int, dict]] = []
-
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                try:
-                    data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                    # Apply filters
-                    if user_id and data["user_id"] != user_id:
-                        continue
-
-                    if entity_id:
-                        if self.mode == "agent" and data["agent_id"] != entity_id:
-                            continue
-                        elif self.mode == "team" and data["team_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow" and data["workflow_id"] != entity_id:
-                            continue
-
-                    # Store with created_at for sorting
-                    created_at = data.get("created_at", 0)
-                    session_data.append((created_at, data))
-
-                except Exception as e:
-                    logger.error(f"Error processing session data: {e}")
-                    continue
-
-            # Sort by created_at descending and take only num_history_sessions
-            session_data.sort(key=lambda x: x[0], reverse=True)
-            if limit is not None:
-                session_data = session_data[:limit]
-
-            # Convert filtered and sorted data to Session objects
-            for _, data in session_data:
-                session: Optional[Session] = None
-                if self.mode == "agent":
-                    session = AgentSession.from_dict(data)
-                elif self.mode == "team":
-                    session = TeamSession.from_dict(data)
-                elif self.mode == "workflow":
-                    session = WorkflowSession.from_dict(data)
-
+            self._ensure_index()
+            index_key = self._get_filter_index_key(user_id=user_id, entity_id=entity_id)
+            for data in self._read_index(index_key, limit=limit):
+                session = self._to_session(data)
                 if session is not None:
                     sessions.append(session)
+        except Exception as e:
+            logger.error(f"Error getting last {limit} sessions: {e}")
 
+        return sessions
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Get the last N sessions, ordered by created_at descending, with the async client."""
+        sessions: List[Session] = []
+        try:
+            if not self._index_built:
+                await asyncio.to_thread(self._ensure_index)
+            index_key = self._get_filter_index_key(user_id=user_id, entity_id=entity_id)
+            for data in await self._aread_index(index_key, limit=limit):
+                session = self._to_session(data)
+                if session is not None:
+                    sessions.append(session)
         except Exception as e:
             logger.error(f"Error getting last {limit} sessions: {e}")
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> SessionPage:
+        """List summaries of the sessions, ordered by created_at descending.
+        The page is read from the index, and only the sessions in the page are read."""
+        summary_fields = get_summary_fields(fields)
+        start_after = decode_cursor(cursor)
+        entity_id_field = get_entity_id_field(self.mode)
+        try:
+            self._ensure_index()
+            index_key = self._get_filter_index_key(user_id=user_id, entity_id=entity_id)
+            # Read one more session to know if there is a next page
+            sessions = self._read_index(index_key, limit=None if limit is None else limit + 1, start_after=start_after)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionPage()
+        return get_page([to_summary(data, entity_id_field, summary_fields) for data in sessions], limit)
+
     def upsert(self, session: Session) -> Optional[Session]:
-        """Insert or update a Session in Redis."""
+        """
+        Insert or update a Session in Redis.
+        The session and its index entries are written in a single MULTI / EXEC transaction.
+        """
         try:
-            data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data:
-                data["created_at"] = data["updated_at"]
+            self._write_session(session.session_id, lambda pipe, meta: self._queue_upsert(pipe, session, meta))
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
 
-            key = self._get_key(session.session_id)
-            if self.expire is not None:
-                self.redis_client.set(key, self.serialize(data), ex=self.expire)
-            else:
-                self.redis_client.set(key, self.serialize(data))
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis, with the async client."""
+        try:
+            await self._awrite_session(session.session_id, lambda pipe, meta: self._queue_upsert(pipe, session, meta))
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
             return None
 
+    def _write_session(self, session_id: str, queue: Callable[[Any, Dict[str, str]], None]) -> None:
+        """
+        Run the commands queued by `queue` for a session in a MULTI / EXEC transaction.
+
+        The index metadata of the session, passed to `queue`, is read after a WATCH of its key, so the transaction
+        is retried, instead of leaving stale index entries, if another client writes the session in between.
+        """
+        meta_key = self._get_index_key("session", session_id)
+        with self.redis_client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(meta_key)
+                    meta = cast(Dict[str, str], pipe.hgetall(meta_key))
+                    pipe.multi()
+                    queue(pipe, meta)
+                    pipe.execute()
+                    return
+                except WatchError:
+                    log_debug(f"Session {session_id} was written during the transaction, retrying")
+
+    async def _awrite_session(self, session_id: str, queue: Callable[[Any, Dict[str, str]], None]) -> None:
+        """Async version of `_write_session`"""
+        meta_key = self._get_index_key("session", session_id)
+        async with self.async_redis_client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(meta_key)
+                    meta = cast(Dict[str, str], await pipe.hgetall(meta_key))
+                    pipe.multi()
+                    queue(pipe, meta)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    log_debug(f"Session {session_id} was written during the transaction, retrying")
+
+    def _queue_upsert(self, pipe: Any, session: Session, meta: Dict[str, str]) -> None:
+        """
+        Queue the commands writing a session and its index entries on a pipeline.
+
+        Args:
+            pipe: The sync or async pipeline
+            session (Session): The session to write
+            meta (Dict[str, str]): The index metadata of the session, empty for a new session
+        """
+        data = asdict(session)
+        data["updated_at"] = int(time.time())
+        # Keep the created_at of the session, it is the score of the session in its indexes
+        if data.get("created_at") is None:
+            data["created_at"] = int(meta["score"]) if meta.get("score") else data["updated_at"]
+        index_keys = self._get_index_keys(data)
+
+        # Remove the session from the indexes of its previous user or entity
+        for index_key in json.loads(meta["keys"]) if meta.get("keys") else []:
+            if index_key not in index_keys:
+                pipe.zrem(index_key, session.session_id)
+        for index_key in index_keys:
+            pipe.zadd(index_key, {session.session_id: data["created_at"]})
+            if self.expire is not None:
+                pipe.expire(index_key, self.expire)
+
+        key = self._get_key(session.session_id)
+        meta_key = self._get_index_key("session", session.session_id)
+        pipe.hset(meta_key, mapping={"score": data["created_at"], "keys": json.dumps(index_keys)})
+        if self.expire is not None:
+            pipe.expire(meta_key, self.expire)
+            pipe.set(key, self.serialize(data), ex=self.expire)
+        else:
+            pipe.set(key, self.serialize(data))
+
     def delete_session(self, session_id: Optional[str] = None):
-        """Delete a session from Redis."""
+        """Delete a session and its index entries from Redis."""
+        if session_id is None:
+            return
+        try:
+            self._write_session(session_id, lambda pipe, meta: self._queue_delete(pipe, session_id, meta))
+            log_debug(f"Deleted session: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Delete a session and its index entries from Redis, with the async client."""
         if session_id is None:
             return
         try:
-            key = self._get_key(session_id)
-            self.redis_client.delete(key)
+            await self._awrite_session(session_id, lambda pipe, meta: self._queue_delete(pipe, session_id, meta))
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
+    def _queue_delete(self, pipe: Any, session_id: str, meta: Dict[str, str]) -> None:
+        """Queue the commands deleting a session and its index entries on a pipeline."""
+        for index_key in json.loads(meta["keys"]) if meta.get("keys") else []:
+            pipe.zrem(index_key, session_id)
+        pipe.delete(self._get_index_key("session", session_id))
+        pipe.delete(self._get_key(session_id))
+
     def drop(self) -> None:
-        """Drop all sessions from storage."""
+        """Drop all sessions and their indexes from storage."""
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                self.redis_client.delete(key)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for pattern in (f"{self.prefix}:*", self._get_index_key("*")):
+                for key in self.redis_client.scan_iter(match=pattern, count=INDEX_BATCH_SIZE):
+                    pipe.delete(key)
+            pipe.execute()
+            self._index_built = False
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
@@ -0,0 +1,153 @@
+"""Helpers for storage backends that keep session runs outside the session row.
+
+Sessions carry their runs in `memory["runs"]`. When runs are stored separately, the session row is written
+without them and each run is stored as its own record keyed by `(session_id, run_index)`, so that an upsert only
+writes the runs that are new or have changed since the last write.
+
+Sessions can also be read with only their most recent runs loaded. The runs that are not loaded are None in
+`memory["runs"]`, `memory["run_ids"]` holds the run_id of every run, and the same None placeholders are skipped
+when the session is written back.
+"""
+
+import json
+from collections import OrderedDict
+from hashlib import md5
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def split_runs(
+    memory: Optional[Dict[str, Any]],
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[Optional[Dict[str, Any]]]]]:
+    """Split the runs out of a session memory dict.
+
+    Returns:
+        The memory dict without runs, and the runs (None if the memory has no runs key). Runs that are not loaded are None.
+    """
+    if memory is None or "runs" not in memory:
+        return memory, None
+    memory_without_runs = {k: v for k, v in memory.items() if k not in ("runs", "run_ids")}
+    return memory_without_runs, memory.get("runs") or []
+
+
+def merge_runs(
+    memory: Optional[Dict[str, Any]],
+    runs: List[Optional[Dict[str, Any]]],
+    run_ids: Optional[List[Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """Returns a copy of the session memory dict with the runs added back, and the run ids if only some runs are loaded"""
+    merged = dict(memory) if memory is not None else {}
+    merged["runs"] = runs
+    if run_ids is not None:
+        merged["run_ids"] = run_ids
+    return merged
+
+
+def get_num_loaded_runs(runs: Optional[List[Optional[Dict[str, Any]]]]) -> Optional[int]:
+    """Returns the number of most recent runs that are loaded, or None if every run is loaded"""
+    if runs is None or None not in runs:
+        return None
+    num_loaded = 0
+    for run in reversed(runs):
+        if run is None:
+            break
+        num_loaded += 1
+    return num_loaded
+
+
+def get_run_hash(run: Dict[str, Any]) -> str:
+    """Returns a stable hash of a serialized run, used to detect runs that changed since the last write"""
+    return md5(json.dumps(run, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_run_id(run: Dict[str, Any]) -> Optional[str]:
+    """Returns the run_id of a serialized run (a RunResponse dict, or a legacy AgentRun dict with a response)"""
+    if run.get("run_id") is not None:
+        return run["run_id"]
+    response = run.get("response")
+    if isinstance(response, dict):
+        return response.get("run_id")
+    return None
+
+
+def refresh_run_ids(memory: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Returns a copy of the session memory dict with `run_ids` matching its runs, e.g. after runs were added to a
+    session that was read with only some runs loaded"""
+    if memory is None or "run_ids" not in memory:
+        return memory
+    run_ids = memory["run_ids"] or []
+    return {
+        **memory,
+        "run_ids": [
+            get_run_id(run) if run is not None else (run_ids[i] if i < len(run_ids) else None)
+            for i, run in enumerate(memory.get("runs") or [])
+        ],
+    }
+
+
+def get_run_hashes(
+    existing_hashes: Dict[int, str], changed_runs: List[Dict[str, Any]], num_runs: int
+) -> Dict[int, str]:
+    """Returns the run hashes stored after writing the changed runs of a session with num_runs runs"""
+    run_hashes = {run_index: run_hash for run_index, run_hash in existing_hashes.items() if run_index < num_runs}
+    for run in changed_runs:
+        run_hashes[run["run_index"]] = run["run_hash"]
+    return run_hashes
+
+
+def get_changed_runs(
+    session_id: str, runs: List[Optional[Dict[str, Any]]], existing_hashes: Dict[int, str]
+) -> List[Dict[str, Any]]:
+    """Returns the run records that are new or changed compared to the stored run hashes.
+    Runs that are None were never loaded, and are left unchanged."""
+    changed: List[Dict[str, Any]] = []
+    for run_index, run in enumerate(runs):
+        if run is None:
+            continue
+        run_hash = get_run_hash(run)
+        if existing_hashes.get(run_index) != run_hash:
+            changed.append(
+                {
+                    "session_id": session_id,
+                    "run_index": run_index,
+                    "run_id": get_run_id(run),
+                    "run_hash": run_hash,
+                    "run_data": run,
+                }
+            )
+    return changed
+
+
+class RunHashCache:
+    """The stored run hashes of the most recently written sessions, so an upsert does not read them from the database.
+
+    Hashes are only added after the upsert that wrote them is committed. Runs carry a unique run_id, so a stale entry
+    at worst causes a run to be written again.
+    """
+
+    def __init__(self, max_sessions: int = 1000):
+        self.max_sessions = max_sessions
+        self._hashes: "OrderedDict[str, Dict[int, str]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, session_id: str) -> Optional[Dict[int, str]]:
+        with self._lock:
+            run_hashes = self._hashes.get(session_id)
+            if run_hashes is not None:
+                self._hashes.move_to_end(session_id)
+            return run_hashes
+
+    def set(self, session_id: str, run_hashes: Dict[int, str]) -> None:
+        with self._lock:
+            self._hashes[session_id] = run_hashes
+            self._hashes.move_to_end(session_id)
+            while len(self._hashes) > self.max_sessions:
+                self._hashes.popitem(last=False)
+
+    def delete(self, session_id: Optional[str] = None) -> None:
+        """Forget the run hashes of a session, or of all sessions if no session_id is given"""
+        with self._lock:
+            if session_id is None:
+                self._hashes.clear()
+            else:
+                self._hashes.pop(session_id, None)
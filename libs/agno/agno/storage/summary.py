@@ -0,0 +1,131 @@
+"""Helpers for listing lightweight session summaries with `Storage.list_sessions`.
+
+A session summary is a dict with a subset of the session columns, that can be read without loading the memory of the
+session. The `first_run` field holds only the first run of the session, and the `title_run` field only the first run
+with a user message, which gives an agent or team session its title. In team sessions, the first runs stored can be
+member runs without a user message.
+
+Summaries are ordered by (created_at, session_id) descending, and paginated with keyset cursors: the cursor of a page
+encodes the sort key of its last session, and the next page starts after it. Unlike offsets, cursors stay valid when
+sessions are added or deleted between requests, and the next page is read from the index instead of being skipped to.
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
+
+# Fields that can be requested in a session summary. `entity_id` is the agent_id, team_id or workflow_id of the session.
+SESSION_SUMMARY_FIELDS = (
+    "session_id",
+    "user_id",
+    "entity_id",
+    "session_data",
+    "created_at",
+    "updated_at",
+    "first_run",
+    "title_run",
+)
+# Fields returned when no fields are requested
+DEFAULT_SESSION_SUMMARY_FIELDS = ("session_id", "user_id", "entity_id", "session_data", "created_at", "updated_at")
+
+SessionCursor = Tuple[int, str]
+
+
+@dataclass
+class SessionPage:
+    """A page of session summaries"""
+
+    sessions: List[Dict[str, Any]] = field(default_factory=list)
+    # Cursor of the next page, None if this is the last page
+    next_cursor: Optional[str] = None
+
+
+def get_entity_id_field(mode: Literal["agent", "team", "workflow"]) -> str:
+    """Returns the name of the entity id column of sessions stored in this mode"""
+    return f"{mode}_id"
+
+
+def get_summary_fields(fields: Optional[Sequence[str]] = None) -> List[str]:
+    """Returns the fields of the summaries to read. The session_id and created_at are always included for the cursor."""
+    requested = list(fields) if fields is not None else list(DEFAULT_SESSION_SUMMARY_FIELDS)
+    unknown = [f for f in requested if f not in SESSION_SUMMARY_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown session summary fields: {unknown}. Valid fields are: {SESSION_SUMMARY_FIELDS}")
+    return [f for f in SESSION_SUMMARY_FIELDS if f in requested or f in ("session_id", "created_at")]
+
+
+def encode_cursor(summary: Mapping[str, Any]) -> str:
+    """Returns the cursor of the page after this session summary"""
+    key = [summary.get("created_at") or 0, summary["session_id"]]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[SessionCursor]:
+    """Returns the (created_at, session_id) sort key encoded in a cursor"""
+    if cursor is None:
+        return None
+    try:
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(created_at), str(session_id)
+    except Exception:
+        raise ValueError(f"Invalid session cursor: {cursor}")
+
+
+def get_first_run(memory: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Returns the first run in a session memory dict"""
+    if not memory:
+        return None
+    runs = memory.get("runs")
+    return runs[0] if runs else None
+
+
+def has_user_message(run: Mapping[str, Any]) -> bool:
+    """Returns True if a run (a RunResponse dict, or a legacy AgentRun dict with a message) has a user message"""
+    message = run.get("message")
+    if isinstance(message, dict) and message.get("role") == "user":
+        return True
+    return any(isinstance(m, dict) and m.get("role") == "user" for m in run.get("messages") or [])
+
+
+def get_title_run(memory: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Returns the first run with a user message in a session memory dict"""
+    if not memory:
+        return None
+    return next((run for run in memory.get("runs") or [] if run and has_user_message(run)), None)
+
+
+def to_summary(data: Mapping[str, Any], entity_id_field: str, fields: Sequence[str]) -> Dict[str, Any]:
+    """Returns the summary of a session dict, or of a row that already has `first_run` / `title_run` for `memory`"""
+    summary: Dict[str, Any] = {}
+    for f in fields:
+        if f == "entity_id":
+            summary["entity_id"] = data.get(entity_id_field)
+        elif f == "first_run" and "first_run" not in data:
+            summary["first_run"] = get_first_run(data.get("memory"))
+        elif f == "title_run" and "title_run" not in data:
+            summary["title_run"] = get_title_run(data.get("memory"))
+        else:
+            summary[f] = data.get(f)
+    return summary
+
+
+def get_sort_key(summary: Mapping[str, Any]) -> SessionCursor:
+    return summary.get("created_at") or 0, summary["session_id"]
+
+
+def paginate(summaries: List[Dict[str, Any]], limit: Optional[int], cursor: Optional[str]) -> SessionPage:
+    """Sorts and paginates summaries in memory, for backends that can not do it in their query"""
+    start_after = decode_cursor(cursor)
+    summaries = sorted(summaries, key=get_sort_key, reverse=True)
+    if start_after is not None:
+        summaries = [s for s in summaries if get_sort_key(s) < start_after]
+    return get_page(summaries, limit)
+
+
+def get_page(summaries: List[Dict[str, Any]], limit: Optional[int]) -> SessionPage:
+    """Returns the page of the sorted summaries. Backends read `limit + 1` sessions to know if there is a next page."""
+    if limit is None or len(summaries) <= limit:
+        return SessionPage(sessions=summaries)
+    sessions = summaries[:limit]
+    return SessionPage(sessions=sessions, next_cursor=encode_cursor(sessions[-1]) if sessions else None)
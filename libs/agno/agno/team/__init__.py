@@ -1,21 +1,27 @@
-from agno.run.team import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunResponseCancelledEvent,
-    RunResponseCompletedEvent,
-    RunResponseContentEvent,
-    RunResponseErrorEvent,
-    RunResponseStartedEvent,
-    TeamRunEvent,
-    TeamRunResponse,
-    TeamRunResponseEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
-)
-from agno.team.team import RunResponse, Team
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.run.response import RunResponse
+    from agno.run.team import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunResponseCancelledEvent,
+        RunResponseCompletedEvent,
+        RunResponseContentEvent,
+        RunResponseErrorEvent,
+        RunResponseStartedEvent,
+        TeamRunEvent,
+        TeamRunResponse,
+        TeamRunResponseEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
+    from agno.team.team import Team
 
 __all__ = [
     "Team",
@@ -36,3 +42,28 @@ __all__ = [
     "ToolCallStartedEvent",
     "ToolCallCompletedEvent",
 ]
+
+# Exports are imported on first access, so importing a module of the package does not import them all
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "RunResponse": "agno.run.response",
+        "MemoryUpdateCompletedEvent": "agno.run.team",
+        "MemoryUpdateStartedEvent": "agno.run.team",
+        "ReasoningCompletedEvent": "agno.run.team",
+        "ReasoningStartedEvent": "agno.run.team",
+        "ReasoningStepEvent": "agno.run.team",
+        "RunResponseCancelledEvent": "agno.run.team",
+        "RunResponseCompletedEvent": "agno.run.team",
+        "RunResponseContentEvent": "agno.run.team",
+        "RunResponseErrorEvent": "agno.run.team",
+        "RunResponseStartedEvent": "agno.run.team",
+        "TeamRunEvent": "agno.run.team",
+        "TeamRunResponse": "agno.run.team",
+        "TeamRunResponseEvent": "agno.run.team",
+        "ToolCallCompletedEvent": "agno.run.team",
+        "ToolCallStartedEvent": "agno.run.team",
+        "Team": "agno.team.team",
+    },
+)
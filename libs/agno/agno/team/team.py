@@ -1,9 +1,12 @@
 import asyncio
 import json
 from collections import ChainMap, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from copy import deepcopy
 from dataclasses import asdict, dataclass, replace
 from os import getenv
+from queue import Empty, Queue
 from textwrap import dedent
 from typing import (
     Any,
@@ -27,10 +30,10 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
+import agno.knowledge
 from agno.agent import Agent
 from agno.agent.metrics import SessionMetrics
 from agno.exceptions import ModelProviderError, RunCancelledException
-from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
 from agno.memory.agent import AgentMemory
 from agno.memory.team import TeamMemory, TeamRun
@@ -47,6 +50,8 @@ from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.tracing.exporter import SpanExporter, export_trace
+from agno.tracing.span import NOOP_SPAN, Span, atrace_iterator, span, start_trace, trace_iterator
 from agno.utils.events import (
     create_team_memory_update_completed_event,
     create_team_memory_update_started_event,
@@ -72,7 +77,7 @@ from agno.utils.log import (
     use_agent_logger,
     use_team_logger,
 )
-from agno.utils.merge_dict import merge_dictionaries
+from agno.utils.merge_dict import get_changed_items, merge_dictionaries
 from agno.utils.message import get_text_from_message
 from agno.utils.response import (
     async_generator_wrapper,
@@ -98,6 +103,12 @@ class Team:
 
     mode: Literal["route", "coordinate", "collaborate"] = "coordinate"
 
+    # --- Collaborate mode settings (sync runs) ---
+    # Maximum number of members to run at the same time (None runs all members at once)
+    max_concurrent_members: Optional[int] = None
+    # Seconds to wait for a member run before giving up on it
+    member_timeout: Optional[float] = None
+
     # Model for this Team
     model: Optional[Model] = None
 
@@ -166,7 +177,7 @@ class Team:
     add_context: bool = False
 
     # --- Agent Knowledge ---
-    knowledge: Optional[AgentKnowledge] = None
+    knowledge: Optional["agno.knowledge.AgentKnowledge"] = None
     # Add knowledge_filters to the Agent class attributes
     knowledge_filters: Optional[Dict[str, Any]] = None
     # Let the agent choose the knowledge filters
@@ -211,6 +222,9 @@ class Team:
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from a single model response to run in parallel (sync runs only).
+    # Async runs always run tool calls concurrently.
+    max_parallel_tool_calls: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
 
@@ -283,6 +297,10 @@ class Team:
     # telemetry=True logs minimal telemetry for analytics
     # This helps us improve the Teams implementation and provide better support
     telemetry: bool = True
+    # tracing=True records the timings of the phases of each run in TeamRunResponse.trace
+    tracing: bool = False
+    # Exporters that receive the trace of each run, e.g. to send it to OpenTelemetry
+    span_exporters: Optional[List[SpanExporter]] = None
 
     def __init__(
         self,
@@ -310,7 +328,7 @@ class Team:
         system_message_role: str = "system",
         context: Optional[Dict[str, Any]] = None,
         add_context: bool = False,
-        knowledge: Optional[AgentKnowledge] = None,
+        knowledge: Optional["agno.knowledge.AgentKnowledge"] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         add_references: bool = False,
         enable_agentic_knowledge_filters: Optional[bool] = False,
@@ -324,6 +342,7 @@ class Team:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         response_model: Optional[Type[BaseModel]] = None,
@@ -351,14 +370,20 @@ class Team:
         store_events: bool = False,
         events_to_skip: Optional[List[Union[RunEvent, TeamRunEvent]]] = None,
         stream_member_events: bool = True,
+        max_concurrent_members: Optional[int] = None,
+        member_timeout: Optional[float] = None,
         debug_mode: bool = False,
         show_members_responses: bool = False,
         monitoring: bool = False,
         telemetry: bool = True,
+        tracing: bool = False,
+        span_exporters: Optional[List[SpanExporter]] = None,
     ):
         self.members = members
 
         self.mode = mode
+        self.max_concurrent_members = max_concurrent_members
+        self.member_timeout = member_timeout
 
         self.model = model
 
@@ -404,6 +429,7 @@ class Team:
         self.show_tool_calls = show_tool_calls
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
+        self.max_parallel_tool_calls = max_parallel_tool_calls
         self.tool_hooks = tool_hooks
 
         self.response_model = response_model
@@ -449,6 +475,8 @@ class Team:
 
         self.monitoring = monitoring
         self.telemetry = telemetry
+        self.tracing = tracing
+        self.span_exporters = span_exporters
 
         # --- Params not to be set by user ---
         self.session_metrics: Optional[SessionMetrics] = None
@@ -480,6 +508,9 @@ class Team:
 
         self._memory_deepcopy_done: bool = False
 
+        # Root span of the current run, a no-op span if tracing is disabled
+        self._run_trace: Span = NOOP_SPAN
+
     def _set_team_id(self) -> str:
         if self.team_id is None:
             self.team_id = str(uuid4())
@@ -508,7 +539,9 @@ class Team:
         if telemetry_env is not None:
             self.telemetry = telemetry_env.lower() == "true"
 
-    def _initialize_member(self, member: Union["Team", Agent], session_id: Optional[str] = None) -> None:
+    def _initialize_member(
+        self, member: Union["Team", Agent], session_id: Optional[str] = None, copy_team_session_state: bool = False
+    ) -> None:
         # Set debug mode for all members
         if self.debug_mode:
             member.debug_mode = True
@@ -521,7 +554,12 @@ class Team:
             member.team_session_id = session_id
 
         # Set the team session state on members
-        if self.team_session_state is not None:
+        if self.team_session_state is not None and copy_team_session_state:
+            # Members that run concurrently get their own copy, and their changes are merged back one at a time
+            member_session_state = deepcopy(member.team_session_state) if member.team_session_state is not None else {}
+            merge_dictionaries(member_session_state, deepcopy(self.team_session_state))
+            member.team_session_state = member_session_state
+        elif self.team_session_state is not None:
             if member.team_session_state is None:
                 member.team_session_state = self.team_session_state
             else:
@@ -581,6 +619,113 @@ class Team:
         self.run_input = None
         self.run_messages = None
         self.run_response = None
+        self._run_trace = NOOP_SPAN
+
+    def _start_run_trace(self) -> Span:
+        """Start the trace of a run. It is nested in the current span if the Team runs inside a traced run."""
+        self._run_trace = start_trace("team.run", enabled=self.tracing, team_id=self.team_id, team_name=self.name)
+        return self._run_trace
+
+    def _end_run_trace(self, run_response: TeamRunResponse) -> None:
+        """End the trace of the run, add it to the run response and export it"""
+        trace, self._run_trace = self._run_trace, NOOP_SPAN
+        if not trace.is_recording:
+            return
+        trace.set_attribute("run_id", run_response.run_id)
+        export_trace(trace, self.span_exporters)
+        run_response.trace = trace.to_dict()
+
+    def deep_copy(self, *, update: Optional[Dict[str, Any]] = None) -> "Team":
+        """Create and return a deep copy of this Team and its members, optionally updating fields.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Team.
+
+        Returns:
+            Team: A new Team instance.
+        """
+        from dataclasses import fields
+
+        from agno.utils.common import split_init_kwargs
+
+        # Extract the fields to set for the new Team
+        fields_for_new_team: Dict[str, Any] = {}
+
+        for f in fields(self):
+            # Fields that are updated are not copied
+            if update and f.name in update:
+                continue
+            field_value = getattr(self, f.name)
+            if field_value is not None:
+                fields_for_new_team[f.name] = self._deep_copy_field(f.name, field_value)
+
+        # Update fields if provided
+        if update:
+            fields_for_new_team.update(update)
+        # Fields that are not arguments of __init__ (e.g. parent_team_id) are set on the new Team
+        init_kwargs, attributes = split_init_kwargs(self.__class__, fields_for_new_team)
+        # Create a new Team
+        new_team = self.__class__(**init_kwargs)
+        for field_name, field_value in attributes.items():
+            setattr(new_team, field_name, field_value)
+        log_debug(f"Created new {self.__class__.__name__}")
+        return new_team
+
+    def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
+        """Helper method to deep copy a field based on its type."""
+        from copy import copy, deepcopy
+
+        # For members, use their deep_copy methods
+        if field_name == "members":
+            return [member.deep_copy() for member in field_value]
+
+        # For memory and reasoning_agent, use their deep_copy methods
+        if field_name in ("memory", "reasoning_agent"):
+            return field_value.deep_copy()
+
+        # Span exporters are shared, so copies export to the same destination
+        elif field_name == "span_exporters":
+            return copy(field_value)
+
+        # For storage, model and reasoning_model, use a deep copy
+        elif field_name in ("storage", "model", "reasoning_model"):
+            try:
+                return deepcopy(field_value)
+            except Exception:
+                try:
+                    return copy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # For compound types, attempt a deep copy
+        elif isinstance(field_value, (list, dict, set)):
+            try:
+                return deepcopy(field_value)
+            except Exception:
+                try:
+                    return copy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # For pydantic models, attempt a model_copy
+        elif isinstance(field_value, BaseModel):
+            try:
+                return field_value.model_copy(deep=True)
+            except Exception:
+                try:
+                    return field_value.model_copy(deep=False)
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+                    return field_value
+
+        # For other types, attempt a shallow copy first
+        try:
+            return copy(field_value)
+        except Exception:
+            # If copy fails, return as is
+            return field_value
 
     def initialize_team(self, session_id: Optional[str] = None) -> None:
         self._set_defaults()
@@ -708,6 +853,9 @@ class Team:
         # Initialize Team
         self.initialize_team(session_id=session_id)
 
+        # Start the trace of the run, a no-op if tracing is disabled
+        trace = self._start_run_trace()
+
         # Initialize Knowledge Filters
         effective_filters = knowledge_filters
 
@@ -745,7 +893,8 @@ class Team:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        with trace.span("storage.read"):
+            self.read_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -761,18 +910,19 @@ class Team:
         response_format: Optional[Union[Dict, Type[BaseModel]]] = self._get_response_format()
 
         self.model = cast(Model, self.model)
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=False,
-            knowledge_filters=effective_filters,
-            message=message,
-            images=images,
-            videos=videos,
-            audio=audio,
-            files=files,
-        )
+        with trace.span("tools.determine"):
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=False,
+                knowledge_filters=effective_filters,
+                message=message,
+                images=images,
+                videos=videos,
+                audio=audio,
+                files=files,
+            )
 
         # Create a run_id for this specific run
         run_id = str(uuid4())
@@ -816,30 +966,31 @@ class Team:
             # Run the team
             try:
                 # Prepare run messages
-                if self.mode == "route":
-                    run_messages: RunMessages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
-                else:
-                    run_messages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
+                with trace.span("messages.build"):
+                    if self.mode == "route":
+                        run_messages: RunMessages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
+                    else:
+                        run_messages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
                 self.run_messages = run_messages
                 if len(run_messages.messages) == 0:
                     log_error("No messages to be sent to the model.")
@@ -918,6 +1069,8 @@ class Team:
         6. Parse any structured outputs
         7. Log the team run
         """
+        trace = self._run_trace
+
         # 1. Reason about the task(s) if reasoning is enabled
         self._handle_reasoning(run_response=run_response, run_messages=run_messages)
 
@@ -926,14 +1079,16 @@ class Team:
 
         # 2. Get the model response for the team leader
         self.model = cast(Model, self.model)
-        model_response: ModelResponse = self.model.response(
-            messages=run_messages.messages,
-            response_format=response_format,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-        )
+        with trace.span("model.response"):
+            model_response: ModelResponse = self.model.response(
+                messages=run_messages.messages,
+                response_format=response_format,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                max_parallel_tool_calls=self.max_parallel_tool_calls,
+            )
 
         #  Update TeamRunResponse
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -947,16 +1102,18 @@ class Team:
         )
 
         # 4. Update Team Memory
-        response_iterator = self._update_memory(
-            run_response=run_response,
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
-        )
-        deque(response_iterator, maxlen=0)
+        with trace.span("memory.update"):
+            response_iterator = self._update_memory(
+                run_response=run_response,
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+            )
+            deque(response_iterator, maxlen=0)
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        with trace.span("storage.write"):
+            self.write_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Parse team response model
         self._convert_response_to_structured_format(run_response=run_response)
@@ -965,6 +1122,7 @@ class Team:
         self._log_team_run(session_id=session_id, user_id=user_id)
 
         log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
         return run_response
 
@@ -986,6 +1144,7 @@ class Team:
         4. Save session to storage
         5. Log Team Run
         """
+        trace = self._run_trace
 
         # 1. Reason about the task(s) if reasoning is enabled
         yield from self._handle_reasoning_stream(
@@ -1001,11 +1160,14 @@ class Team:
             yield self._handle_event(create_team_run_response_started_event(run_response), run_response)
 
         # 2. Get a response from the model
-        yield from self._handle_model_response_stream(
-            run_response=run_response,
-            run_messages=run_messages,
-            response_format=response_format,
-            stream_intermediate_steps=stream_intermediate_steps,
+        yield from trace_iterator(
+            trace.span("model.response"),
+            self._handle_model_response_stream(
+                run_response=run_response,
+                run_messages=run_messages,
+                response_format=response_format,
+                stream_intermediate_steps=stream_intermediate_steps,
+            ),
         )
 
         # 3. Add the run to memory
@@ -1017,11 +1179,14 @@ class Team:
         )
 
         # 4. Update Team Memory
-        yield from self._update_memory(
-            run_response=run_response,
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
+        yield from trace_iterator(
+            trace.span("memory.update"),
+            self._update_memory(
+                run_response=run_response,
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+            ),
         )
 
         if stream_intermediate_steps:
@@ -1033,12 +1198,14 @@ class Team:
             )
 
         # 4. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        with trace.span("storage.write"):
+            self.write_to_storage(session_id=session_id, user_id=user_id)
 
         # 5. Log Team Run
         self._log_team_run(session_id=session_id, user_id=user_id)
 
         log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
     @overload
     async def arun(
@@ -1121,6 +1288,9 @@ class Team:
 
         self.initialize_team(session_id=session_id)
 
+        # Start the trace of the run, a no-op if tracing is disabled
+        trace = self._start_run_trace()
+
         effective_filters = knowledge_filters
 
         # When filters are passed manually
@@ -1152,7 +1322,8 @@ class Team:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        with trace.span("storage.read"):
+            await self.aread_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -1168,18 +1339,19 @@ class Team:
         response_format = self._get_response_format()
 
         self.model = cast(Model, self.model)
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=True,
-            knowledge_filters=effective_filters,
-            message=message,
-            images=images,
-            videos=videos,
-            audio=audio,
-            files=files,
-        )
+        with trace.span("tools.determine"):
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=True,
+                knowledge_filters=effective_filters,
+                message=message,
+                images=images,
+                videos=videos,
+                audio=audio,
+                files=files,
+            )
 
         # Create a run_id for this specific run
         run_id = str(uuid4())
@@ -1221,31 +1393,32 @@ class Team:
             # Run the team
             try:
                 # Prepare run messages
-                if self.mode == "route":
-                    # In route mode the model shouldn't get images/audio/video
-                    run_messages: RunMessages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
-                else:
-                    run_messages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
+                with trace.span("messages.build"):
+                    if self.mode == "route":
+                        # In route mode the model shouldn't get images/audio/video
+                        run_messages: RunMessages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
+                    else:
+                        run_messages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
 
                 if stream:
                     response_iterator = self._arun_stream(
@@ -1323,6 +1496,7 @@ class Team:
         """
 
         self.model = cast(Model, self.model)
+        trace = self._run_trace
 
         # 1. Reason about the task(s) if reasoning is enabled
         await self._ahandle_reasoning(run_response=run_response, run_messages=run_messages)
@@ -1331,14 +1505,15 @@ class Team:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Get the model response for the team leader
-        model_response = await self.model.aresponse(
-            messages=run_messages.messages,
-            response_format=response_format,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-        )  # type: ignore
+        with trace.span("model.response"):
+            model_response = await self.model.aresponse(
+                messages=run_messages.messages,
+                response_format=response_format,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+            )  # type: ignore
 
         # Update TeamRunResponse
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -1351,16 +1526,18 @@ class Team:
             index_of_last_user_message=index_of_last_user_message,
         )
         # 4. Update Team Memory
-        async for _ in self._aupdate_memory(
-            run_response=run_response,
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
-        ):
-            pass
+        with trace.span("memory.update"):
+            async for _ in self._aupdate_memory(
+                run_response=run_response,
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+            ):
+                pass
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        with trace.span("storage.write"):
+            await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Parse team response model
         self._convert_response_to_structured_format(run_response=run_response)
@@ -1369,6 +1546,7 @@ class Team:
         await self._alog_team_run(session_id=session_id, user_id=user_id)
 
         log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
         return run_response
 
@@ -1390,6 +1568,7 @@ class Team:
         4. Save session to storage
         5. Log Team Run
         """
+        trace = self._run_trace
 
         # 1. Reason about the task(s) if reasoning is enabled
         async for item in self._ahandle_reasoning_stream(run_response=run_response, run_messages=run_messages):
@@ -1405,11 +1584,14 @@ class Team:
             )
 
         # 2. Get a response from the model
-        async for event in self._ahandle_model_response_stream(
-            run_response=run_response,
-            run_messages=run_messages,
-            response_format=response_format,
-            stream_intermediate_steps=stream_intermediate_steps,
+        async for event in atrace_iterator(
+            trace.span("model.response"),
+            self._ahandle_model_response_stream(
+                run_response=run_response,
+                run_messages=run_messages,
+                response_format=response_format,
+                stream_intermediate_steps=stream_intermediate_steps,
+            ),
         ):
             yield event
 
@@ -1422,11 +1604,14 @@ class Team:
         )
 
         # 4. Update Team Memory
-        async for event in self._aupdate_memory(
-            run_response=run_response,
-            run_messages=run_messages,
-            session_id=session_id,
-            user_id=user_id,
+        async for event in atrace_iterator(
+            trace.span("memory.update"),
+            self._aupdate_memory(
+                run_response=run_response,
+                run_messages=run_messages,
+                session_id=session_id,
+                user_id=user_id,
+            ),
         ):
             yield event
 
@@ -1436,12 +1621,14 @@ class Team:
             )
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        with trace.span("storage.write"):
+            await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
 
         log_debug(f"Team Run End: {self.run_id}", center=True, symbol="*")
+        self._end_run_trace(run_response)
 
     def _update_run_response(
         self, model_response: ModelResponse, run_response: TeamRunResponse, run_messages: RunMessages
@@ -1658,6 +1845,7 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
         ):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
@@ -3875,31 +4063,35 @@ class Team:
 
     def _handle_reasoning(self, run_response: TeamRunResponse, run_messages: RunMessages) -> None:
         if self.reasoning or self.reasoning_model is not None:
-            reasoning_generator = self._reason(run_response=run_response, run_messages=run_messages)
+            with self._run_trace.span("reasoning"):
+                reasoning_generator = self._reason(run_response=run_response, run_messages=run_messages)
 
-            # Consume the generator without yielding
-            deque(reasoning_generator, maxlen=0)
+                # Consume the generator without yielding
+                deque(reasoning_generator, maxlen=0)
 
     def _handle_reasoning_stream(
         self, run_response: TeamRunResponse, run_messages: RunMessages
     ) -> Iterator[TeamRunResponseEvent]:
         if self.reasoning or self.reasoning_model is not None:
-            reasoning_generator = self._reason(run_response=run_response, run_messages=run_messages)
-            yield from reasoning_generator
+            yield from trace_iterator(
+                self._run_trace.span("reasoning"), self._reason(run_response=run_response, run_messages=run_messages)
+            )
 
     async def _ahandle_reasoning(self, run_response: TeamRunResponse, run_messages: RunMessages) -> None:
         if self.reasoning or self.reasoning_model is not None:
-            reason_generator = self._areason(run_response=run_response, run_messages=run_messages)
-            # Consume the generator without yielding
-            async for _ in reason_generator:
-                pass
+            with self._run_trace.span("reasoning"):
+                reason_generator = self._areason(run_response=run_response, run_messages=run_messages)
+                # Consume the generator without yielding
+                async for _ in reason_generator:
+                    pass
 
     async def _ahandle_reasoning_stream(
         self, run_response: TeamRunResponse, run_messages: RunMessages
     ) -> AsyncIterator[TeamRunResponseEvent]:
         if self.reasoning or self.reasoning_model is not None:
-            reason_generator = self._areason(run_response=run_response, run_messages=run_messages)
-            async for item in reason_generator:
+            async for item in atrace_iterator(
+                self._run_trace.span("reasoning"), self._areason(run_response=run_response, run_messages=run_messages)
+            ):
                 yield item
 
     def _calculate_session_metrics(self, messages: List[Message]) -> SessionMetrics:
@@ -4899,7 +5091,8 @@ class Team:
             if isinstance(self.memory, Memory) and self.add_memory_references:
                 if not user_id:
                     user_id = "default"
-                user_memories = self.memory.get_user_memories(user_id=user_id)  # type: ignore
+                with span("memory.retrieve"):
+                    user_memories = self.memory.get_user_memories(user_id=user_id)  # type: ignore
                 if user_memories and len(user_memories) > 0:
                     system_message_content += (
                         "You have access to memories from previous interactions with the user that you can use:\n\n"
@@ -5021,9 +5214,10 @@ class Team:
         run_messages = RunMessages()
 
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(
-            session_id=session_id, user_id=user_id, images=images, audio=audio, videos=videos, files=files
-        )
+        with span("system_message"):
+            system_message = self.get_system_message(
+                session_id=session_id, user_id=user_id, images=images, audio=audio, videos=videos, files=files
+            )
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -5467,13 +5661,39 @@ class Team:
 
         return set_shared_context
 
-    def _update_team_session_state(self, member_agent: Union[Agent, "Team"]) -> None:
-        """Update team session state from either an Agent or nested Team member"""
+    def _update_team_session_state(
+        self, member_agent: Union[Agent, "Team"], initial_session_state: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Update team session state from either an Agent or nested Team member.
+        If the member ran on a copy of the state, only the changes it made to `initial_session_state` are merged.
+        """
         if member_agent.team_session_state is not None:
+            member_session_state = member_agent.team_session_state
+            if initial_session_state is not None:
+                member_session_state = get_changed_items(initial_session_state, member_session_state)
             if self.team_session_state is None:
-                self.team_session_state = member_agent.team_session_state
+                self.team_session_state = member_session_state
             else:
-                merge_dictionaries(self.team_session_state, member_agent.team_session_state)
+                merge_dictionaries(self.team_session_state, member_session_state)
+
+    def _get_member_wait_timeout(self, member_timers: Dict[int, Timer], pending_members: Set[int]) -> Optional[float]:
+        """Returns how long to wait for member output before the next running member times out"""
+        if self.member_timeout is None:
+            return None
+        remaining = [self.member_timeout - member_timers[i].elapsed for i in pending_members if i in member_timers]
+        return max(0.0, min(remaining)) if remaining else self.member_timeout
+
+    def _add_member_metrics(self, member_index: int, member_name: str, timer: Timer, timed_out: bool = False) -> None:
+        """Record the wall time of a member run on the team run response"""
+        if self.run_response is None:
+            return
+        if self.run_response.member_metrics is None:
+            self.run_response.member_metrics = {}
+        self.run_response.member_metrics[member_index] = {
+            "member_name": member_name,
+            "time": timer.elapsed,
+            "timed_out": timed_out,
+        }
 
     def get_run_member_agents_function(
         self,
@@ -5554,88 +5774,154 @@ class Team:
                 task_description, expected_output, team_context_str, team_member_interactions_str
             )
 
+            # Session state of each member before its run, to merge only the changes of the member back
+            initial_session_states: Dict[int, Dict[str, Any]] = {}
             for member_agent_index, member_agent in enumerate(self.members):
-                self._initialize_member(member_agent, session_id=session_id)
-
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
-                        member_agent_task,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session_id,
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=True,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                    )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        yield member_agent_run_response_chunk
-                else:
-                    member_agent_run_response = member_agent.run(
-                        member_agent_task,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session_id,
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=False,
-                    )
+                self._initialize_member(member_agent, session_id=session_id, copy_team_session_state=True)
+                if member_agent.team_session_state is not None:
+                    initial_session_states[member_agent_index] = deepcopy(member_agent.team_session_state)
 
-                    check_if_run_cancelled(member_agent_run_response)
+            def run_member_agent(member_agent_index: int, member_agent: Union[Agent, "Team"]) -> None:
+                member_queue.put((member_agent_index, "started", None))
+                try:
+                    if stream:
+                        member_agent_run_response_stream = member_agent.run(
+                            member_agent_task,
+                            user_id=user_id,
+                            # All members have the same session_id
+                            session_id=session_id,
+                            images=images,
+                            videos=videos,
+                            audio=audio,
+                            files=files,
+                            stream=True,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                        )
+                        for member_agent_run_response_chunk in member_agent_run_response_stream:
+                            member_queue.put((member_agent_index, "chunk", member_agent_run_response_chunk))
+                        member_queue.put((member_agent_index, "completed", None))
+                    else:
+                        member_agent_run_response = member_agent.run(
+                            member_agent_task,
+                            user_id=user_id,
+                            # All members have the same session_id
+                            session_id=session_id,
+                            images=images,
+                            videos=videos,
+                            audio=audio,
+                            files=files,
+                            stream=False,
+                        )
+                        member_queue.put((member_agent_index, "completed", member_agent_run_response))
+                except Exception as e:
+                    member_queue.put((member_agent_index, "error", e))
+
+            # Run the members in a thread pool, handling their output in the order it arrives
+            member_queue: Queue = Queue()
+            member_timers: Dict[int, Timer] = {}
+            pending_members = set(range(len(self.members)))
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_concurrent_members or len(self.members), len(self.members)))
+            )
+            try:
+                for member_agent_index, member_agent in enumerate(self.members):
+                    # Run each member in a copy of the current context, so its run is added to the team's trace
+                    executor.submit(copy_context().run, run_member_agent, member_agent_index, member_agent)
 
+                while pending_members:
                     try:
-                        if member_agent_run_response.content is None and (
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):
-                            if len(member_agent_run_response.content.strip()) > 0:
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0
+                        member_agent_index, event, data = member_queue.get(
+                            timeout=self._get_member_wait_timeout(member_timers, pending_members)
+                        )
+                    except Empty:
+                        # Give up on the members that ran past the timeout
+                        for member_agent_index in sorted(pending_members):
+                            timer = member_timers.get(member_agent_index)
+                            if timer is not None and timer.elapsed >= self.member_timeout:  # type: ignore
+                                pending_members.discard(member_agent_index)
+                                member_agent = self.members[member_agent_index]
+                                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                                log_warning(f"Member {member_name} timed out after {self.member_timeout}s")
+                                self._add_member_metrics(member_agent_index, member_name, timer, timed_out=True)
+                                yield f"Agent {member_agent.name}: Error - Timed out after {self.member_timeout}s"
+                        continue
+
+                    member_agent = self.members[member_agent_index]
+                    if event == "started":
+                        member_timers[member_agent_index] = Timer()
+                        member_timers[member_agent_index].start()
+                        continue
+                    if member_agent_index not in pending_members:
+                        # Output from a member that already timed out
+                        continue
+                    if event == "error":
+                        raise data
+                    if event == "chunk":
+                        check_if_run_cancelled(data)
+                        yield data
+                        continue
+
+                    # The member run completed
+                    pending_members.discard(member_agent_index)
+                    member_timers[member_agent_index].stop()
+                    member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                    self._add_member_metrics(member_agent_index, member_name, member_timers[member_agent_index])
+
+                    if not stream:
+                        member_agent_run_response = data
+                        check_if_run_cancelled(member_agent_run_response)
+
+                        try:
+                            if member_agent_run_response.content is None and (
+                                member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
                             ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
+                                yield f"Agent {member_agent.name}: No response from the member agent."
+                            elif isinstance(member_agent_run_response.content, str):
+                                if len(member_agent_run_response.content.strip()) > 0:
+                                    yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
+                                elif (
+                                    member_agent_run_response.tools is not None
+                                    and len(member_agent_run_response.tools) > 0
+                                ):
+                                    yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
+                            elif issubclass(type(member_agent_run_response.content), BaseModel):
+                                yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+                            else:
+                                import json
 
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
+                                yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
+                        except Exception as e:
+                            yield f"Agent {member_agent.name}: Error - {str(e)}"
 
-                # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                if isinstance(self.memory, TeamMemory):
-                    self.memory = cast(TeamMemory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
-                else:
-                    self.memory = cast(Memory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        session_id=session_id,
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
+                    # Update the memory
+                    if isinstance(self.memory, TeamMemory):
+                        self.memory = cast(TeamMemory, self.memory)
+                        self.memory.add_interaction_to_team_context(
+                            member_name=member_name,
+                            task=task_description,
+                            run_response=member_agent.run_response,  # type: ignore
+                        )
+                    else:
+                        self.memory = cast(Memory, self.memory)
+                        self.memory.add_interaction_to_team_context(
+                            session_id=session_id,
+                            member_name=member_name,
+                            task=task_description,
+                            run_response=member_agent.run_response,  # type: ignore
+                        )
 
-                # Add the member run to the team run response
-                self.run_response = cast(TeamRunResponse, self.run_response)
-                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                    # Add the member run to the team run response
+                    self.run_response = cast(TeamRunResponse, self.run_response)
+                    self.run_response.add_member_run(member_agent.run_response)  # type: ignore
 
-                # Update team session state
-                self._update_team_session_state(member_agent)
+                    # Update team session state
+                    self._update_team_session_state(member_agent, initial_session_states.get(member_agent_index))
 
-                # Update the team media
-                self._update_team_media(member_agent.run_response)  # type: ignore
+                    # Update the team media
+                    self._update_team_media(member_agent.run_response)  # type: ignore
+            finally:
+                # Don't wait for members that timed out
+                executor.shutdown(wait=False, cancel_futures=True)
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -5671,9 +5957,16 @@ class Team:
                 # We cannot stream responses with async gather
                 current_agent = member_agent  # Create a reference to the current agent
                 current_index = member_agent_index  # Create a reference to the current index
-                self._initialize_member(current_agent, session_id=session_id)
+                self._initialize_member(current_agent, session_id=session_id, copy_team_session_state=True)
+                initial_session_state = (
+                    deepcopy(current_agent.team_session_state) if current_agent.team_session_state is not None else None
+                )
 
-                async def run_member_agent(agent=current_agent, idx=current_index) -> str:
+                async def run_member_agent(
+                    agent=current_agent, idx=current_index, initial_session_state=initial_session_state
+                ) -> str:
+                    member_timer = Timer()
+                    member_timer.start()
                     response = await agent.arun(
                         member_agent_task,
                         user_id=user_id,
@@ -5685,9 +5978,11 @@ class Team:
                         files=files,
                         stream=False,
                     )
+                    member_timer.stop()
                     check_if_run_cancelled(response)
 
                     member_name = agent.name if agent.name else f"agent_{idx}"
+                    self._add_member_metrics(idx, member_name, member_timer)
                     self.memory = cast(TeamMemory, self.memory)
                     if isinstance(self.memory, TeamMemory):
                         self.memory = cast(TeamMemory, self.memory)
@@ -5708,7 +6003,7 @@ class Team:
                     self.run_response.add_member_run(agent.run_response)
 
                     # Update team session state
-                    self._update_team_session_state(current_agent)
+                    self._update_team_session_state(agent, initial_session_state)
 
                     # Update the team media
                     self._update_team_media(agent.run_response)
@@ -6459,6 +6754,21 @@ class Team:
                 self.session_name = None
         return self.team_session
 
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage, without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The loaded TeamSession or None if not found.
+        """
+        if self.storage is not None and session_id is not None:
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.team_session
+
     def write_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
         """Save the TeamSession to storage
 
@@ -6471,6 +6781,19 @@ class Team:
             )
         return self.team_session
 
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage, without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The saved TeamSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.team_session = cast(
+                TeamSession,
+                await self.storage.aupsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+            )
+        return self.team_session
+
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
         """Rename the current session and save to storage"""
         if self.session_id is None and session_id is None:
@@ -6990,7 +7313,8 @@ class Team:
                 if "filters" in sig.parameters:
                     retriever_kwargs["filters"] = filters
                 retriever_kwargs.update({"query": query, "num_documents": num_documents, **kwargs})
-                return self.retriever(**retriever_kwargs)
+                with span("knowledge.search", retriever=True):
+                    return self.retriever(**retriever_kwargs)
             except Exception as e:
                 log_warning(f"Retriever failed: {e}")
                 raise e
@@ -7002,9 +7326,10 @@ class Team:
                 num_documents = self.knowledge.num_documents
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = self.knowledge.search(
-                query=query, num_documents=num_documents, filters=filters
-            )
+            with span("knowledge.search", num_documents=num_documents):
+                relevant_docs: List[Document] = self.knowledge.search(
+                    query=query, num_documents=num_documents, filters=filters
+                )
 
             if not relevant_docs or len(relevant_docs) == 0:
                 log_debug("No relevant documents found for query")
@@ -7048,7 +7373,8 @@ class Team:
                 if "filters" in sig.parameters:
                     retriever_kwargs["filters"] = filters
                 retriever_kwargs.update({"query": query, "num_documents": num_documents, **kwargs})
-                return self.retriever(**retriever_kwargs)
+                with span("knowledge.search", retriever=True):
+                    return self.retriever(**retriever_kwargs)
             except Exception as e:
                 log_warning(f"Retriever failed: {e}")
                 raise e
@@ -7061,9 +7387,10 @@ class Team:
                 num_documents = self.knowledge.num_documents
 
             log_debug(f"Searching knowledge base with filters: {filters}")
-            relevant_docs: List[Document] = await self.knowledge.async_search(
-                query=query, num_documents=num_documents, filters=filters
-            )
+            with span("knowledge.search", num_documents=num_documents):
+                relevant_docs: List[Document] = await self.knowledge.async_search(
+                    query=query, num_documents=num_documents, filters=filters
+                )
 
             if not relevant_docs or len(relevant_docs) == 0:
                 log_debug("No relevant documents found for query")
@@ -1,6 +1,11 @@
-from agno.tools.decorator import tool
-from agno.tools.function import Function, FunctionCall
-from agno.tools.toolkit import Toolkit
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.tools.decorator import tool
+    from agno.tools.function import Function, FunctionCall
+    from agno.tools.toolkit import Toolkit
 
 __all__ = [
     "tool",
@@ -8,3 +13,15 @@ __all__ = [
     "FunctionCall",
     "Toolkit",
 ]
+
+# Exports are imported on first access, so importing a module of the package does not import them all
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "tool": "agno.tools.decorator",
+        "Function": "agno.tools.function",
+        "FunctionCall": "agno.tools.function",
+        "Toolkit": "agno.tools.toolkit",
+    },
+)
@@ -0,0 +1,45 @@
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from agno.utils.cache import Cache, FileCache, InMemoryCache, RedisCache, SqliteCache
+
+# Tool results are stored in the caches of agno.utils.cache, which are shared with the model and embedder caches.
+# The SQLite and Redis tool caches only differ by storing results apart from the other caches by default.
+ToolCache = Cache
+InMemoryToolCache = InMemoryCache
+FileToolCache = FileCache
+
+
+class SqliteToolCache(SqliteCache):
+    """Cache of tool results in a SQLite database, shared by the processes on one machine."""
+
+    def __init__(self, db_file: Union[str, Path], table_name: str = "agno_tool_cache"):
+        super().__init__(db_file, table_name=table_name)
+
+
+class RedisToolCache(RedisCache):
+    """Cache of tool results in Redis, shared by processes across machines."""
+
+    def __init__(self, prefix: str = "agno:tool_cache", **kwargs: Any):
+        super().__init__(prefix=prefix, **kwargs)
+
+
+_default_tool_cache: Optional[ToolCache] = None
+_default_tool_cache_lock = threading.Lock()
+
+
+def get_default_tool_cache() -> ToolCache:
+    """Returns the process-wide tool result cache used by functions without a cache of their own"""
+    global _default_tool_cache
+    if _default_tool_cache is None:
+        with _default_tool_cache_lock:
+            if _default_tool_cache is None:
+                _default_tool_cache = InMemoryToolCache()
+    return _default_tool_cache
+
+
+def set_default_tool_cache(cache: ToolCache) -> None:
+    """Replace the process-wide tool result cache, e.g. with a SqliteToolCache or RedisToolCache"""
+    global _default_tool_cache
+    _default_tool_cache = cache
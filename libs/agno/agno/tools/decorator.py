@@ -1,6 +1,7 @@
 from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, overload
 
+from agno.tools.cache import ToolCache
 from agno.tools.function import Function, get_entrypoint_docstring
 from agno.utils.log import logger
 
@@ -34,6 +35,8 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    cache: Optional[ToolCache] = None,
+    parallel_safe: bool = True,
 ) -> Callable[[F], Function]: ...
 
 
@@ -63,6 +66,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        cache: Optional[ToolCache] - Cache backend to store results in
+        parallel_safe: bool - If False, the function is never run in parallel with other tool calls
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -101,6 +106,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "cache",
+            "parallel_safe",
         }
     )
 
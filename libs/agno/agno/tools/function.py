@@ -1,13 +1,20 @@
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
+from inspect import ismethod, unwrap
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
 from pydantic._internal._validate_call import ValidateCallWrapper
 
 from agno.exceptions import AgentRunException
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.utils.log import log_debug, log_exception, log_warning
+
+if TYPE_CHECKING:
+    from agno.tools.cache import ToolCache
 
 T = TypeVar("T")
 
@@ -34,6 +41,164 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     return "\n".join(lines)
 
 
+@dataclass
+class EntrypointSchema:
+    """The parsed signature and docstring of a tool entrypoint"""
+
+    # JSON schema of the parameters
+    parameters: Dict[str, Any]
+    description: str
+    # Names of all parameters in the signature
+    param_names: List[str]
+    # Parameters without a default value that are not excluded
+    required: List[str]
+    # Docstring description of each parameter
+    param_descriptions: Dict[str, Optional[str]]
+    type_hints: Dict[str, Any]
+
+
+# Parsed entrypoints, keyed by the code of the entrypoint so the functions created anew on every run
+# (e.g. closures over the agent) share one entry. Shared by all agents and teams in the process.
+_schema_cache: "OrderedDict[Tuple[Any, ...], EntrypointSchema]" = OrderedDict()
+_schema_cache_lock = threading.Lock()
+_SCHEMA_CACHE_MAX_SIZE = 4096
+
+
+def _get_schema_cache_key(entrypoint: Callable) -> Optional[Tuple[Any, ...]]:
+    """Returns the code of the function behind the entrypoint, whether it is bound to an instance, and the docstring,
+    defaults and annotations that functions sharing the code (e.g. closures) can set differently.
+    Callables whose signature is not defined by their code, or with unhashable defaults, are not cached."""
+    is_method = ismethod(entrypoint)
+    func = entrypoint.__func__ if is_method else entrypoint  # type: ignore
+    try:
+        func = unwrap(func)
+    except ValueError:
+        return None
+    if getattr(entrypoint, "__signature__", None) is not None or getattr(func, "__signature__", None) is not None:
+        return None
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    key = (
+        code,
+        is_method,
+        entrypoint.__doc__,
+        func.__defaults__,
+        tuple(func.__kwdefaults__.items()) if func.__kwdefaults__ else None,
+        tuple(func.__annotations__.items()) if func.__annotations__ else None,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_entrypoint_schema(
+    entrypoint: Callable,
+    strict: bool = False,
+    excluded_params: Optional[List[str]] = None,
+    prefix_all_param_types: bool = True,
+) -> EntrypointSchema:
+    """Parse the signature, type hints and docstring of an entrypoint into the JSON schema of its parameters.
+
+    The result is cached per entrypoint code and arguments, and must not be modified.
+
+    Args:
+        entrypoint: The function to parse.
+        strict: Mark all parameters as required.
+        excluded_params: Parameters to leave out of the schema. Defaults to return, agent and team.
+        prefix_all_param_types: Prefix the description of each parameter with its docstring type, even if it has none.
+    """
+    excluded_params = excluded_params if excluded_params is not None else ["return", "agent", "team"]
+    code_key = _get_schema_cache_key(entrypoint)
+    cache_key = (*code_key, strict, tuple(excluded_params), prefix_all_param_types) if code_key is not None else None
+    if cache_key is not None:
+        with _schema_cache_lock:
+            schema = _schema_cache.get(cache_key)
+            if schema is not None:
+                _schema_cache.move_to_end(cache_key)
+                return schema
+
+    schema = _parse_entrypoint(entrypoint, strict, excluded_params, prefix_all_param_types)
+    if cache_key is not None:
+        with _schema_cache_lock:
+            _schema_cache[cache_key] = schema
+            if len(_schema_cache) > _SCHEMA_CACHE_MAX_SIZE:
+                _schema_cache.popitem(last=False)
+    return schema
+
+
+def clear_entrypoint_schema_cache() -> None:
+    with _schema_cache_lock:
+        _schema_cache.clear()
+
+
+def _parse_entrypoint(
+    entrypoint: Callable, strict: bool, excluded_params: List[str], prefix_all_param_types: bool
+) -> EntrypointSchema:
+    from inspect import getdoc, signature
+
+    from agno.utils.json_schema import get_json_schema
+
+    sig = signature(entrypoint)
+    type_hints = get_type_hints(entrypoint)
+
+    # If function has an the agent argument, remove the agent parameter from the type hints
+    if "agent" in sig.parameters:
+        del type_hints["agent"]
+    if "team" in sig.parameters:
+        del type_hints["team"]
+
+    # Get filtered list of parameter types
+    param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
+
+    # Parse docstring for parameters
+    param_descriptions: Dict[str, Any] = {}
+    param_descriptions_clean: Dict[str, Optional[str]] = {}
+    if docstring := getdoc(entrypoint):
+        parsed_doc = parse(docstring)
+        param_docs = parsed_doc.params
+
+        if param_docs is not None:
+            for param in param_docs:
+                param_name = param.arg_name
+                param_type = param.type_name
+
+                # TODO: We should use type hints first, then map param types in docs to json schema types.
+                # This is temporary to not lose information
+                if param_type is None and not prefix_all_param_types:
+                    param_descriptions[param_name] = param.description
+                else:
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+                param_descriptions_clean[param_name] = param.description
+
+    # Get JSON schema for parameters only
+    parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+    # Mark a field as required if it has no default value (this would include optional fields)
+    required = [
+        name
+        for name, param in sig.parameters.items()
+        if param.default == param.empty and name != "self" and name not in excluded_params
+    ]
+    # If strict=True mark all fields as required
+    # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+    if strict:
+        parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
+    else:
+        parameters["required"] = required
+
+    return EntrypointSchema(
+        parameters=parameters,
+        description=get_entrypoint_docstring(entrypoint),
+        param_names=list(sig.parameters),
+        required=list(required),
+        param_descriptions=param_descriptions_clean,
+        type_hints=type_hints,
+    )
+
+
 @dataclass
 class UserInputField:
     name: str
@@ -112,16 +277,26 @@ class Function(BaseModel):
     # If True, the function will be executed outside the agent's control.
     external_execution: Optional[bool] = None
 
+    # If False, the function is never run in a worker thread alongside other tool calls.
+    # Set this for functions that are not thread-safe.
+    parallel_safe: bool = True
+
     # Caching configuration
     cache_results: bool = False
+    # If set, results are cached as JSON files in this directory
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # The ToolCache to store results in. Defaults to the process-wide in-memory cache.
+    cache: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
     # The team that the function is associated with
     _team: Optional[Any] = None
+    # Cache hits and misses for this function
+    _cache_hits: int = 0
+    _cache_misses: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(
@@ -131,63 +306,13 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
+        description = None
         try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {function_name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name)
-                for name in sig.parameters
-                if name != "return" and name not in ["agent", "team"]
-            }
-
-            # Parse docstring for parameters
-            param_descriptions: Dict[str, Any] = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-                        if param_type is None:
-                            param_descriptions[param_name] = param.description
-                        else:
-                            param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in ["agent", "team"]]
-            else:
-                # Mark a field as required if it has no default value (this would include optional fields)
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in ["agent", "team"]
-                ]
-
-            # log_debug(f"JSON schema for {function_name}: {parameters}")
+            schema = get_entrypoint_schema(c, strict=strict, prefix_all_param_types=False)
+            parameters = deepcopy(schema.parameters)
+            description = schema.description
         except Exception as e:
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
 
@@ -195,17 +320,13 @@ class Function(BaseModel):
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description if description is not None else get_entrypoint_docstring(entrypoint=c),
             parameters=parameters,
             entrypoint=entrypoint,
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.skip_entrypoint_processing:
             if strict:
                 self.process_schema_for_strict()
@@ -224,72 +345,26 @@ class Function(BaseModel):
         if self.requires_user_input:
             self.user_input_schema = self.user_input_schema or []
 
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            excluded_params = ["return", "agent", "team"]
-            if self.requires_user_input and self.user_input_fields:
-                if len(self.user_input_fields) == 0:
-                    excluded_params.extend(list(type_hints.keys()))
-                else:
-                    excluded_params.extend(self.user_input_fields)
+        # Filter out return type and only process parameters
+        excluded_params = ["return", "agent", "team"]
+        if self.requires_user_input and self.user_input_fields:
+            excluded_params.extend(self.user_input_fields)
 
-            # Get filtered list of parameter types
-            param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            param_descriptions_clean = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-                        param_descriptions_clean[param_name] = param.description
+        try:
+            schema = get_entrypoint_schema(self.entrypoint, strict=strict, excluded_params=excluded_params)
 
             # If the function requires user input, we should set the user_input_schema to all parameters. The arguments provided by the model are filled in later.
             if self.requires_user_input:
                 self.user_input_schema = [
                     UserInputField(
                         name=name,
-                        description=param_descriptions_clean.get(name),
-                        field_type=type_hints.get(name, str),
+                        description=schema.param_descriptions.get(name),
+                        field_type=schema.type_hints.get(name, str),
                     )
-                    for name in sig.parameters
+                    for name in schema.param_names
                 ]
 
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in excluded_params
-                ]
+            parameters = deepcopy(schema.parameters)
 
             if params_set_by_user:
                 self.parameters["additionalProperties"] = False
@@ -299,15 +374,9 @@ class Function(BaseModel):
                     ]
                 else:
                     # Mark a field as required if it has no default value
-                    self.parameters["required"] = [
-                        name
-                        for name, param in sig.parameters.items()
-                        if param.default == param.empty and name != "self" and name not in excluded_params
-                    ]
+                    self.parameters["required"] = list(schema.required)
 
-            self.description = self.description or get_entrypoint_docstring(self.entrypoint)
-
-            # log_debug(f"JSON schema for {self.name}: {parameters}")
+            self.description = self.description or schema.description
         except Exception as e:
             log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
 
@@ -340,67 +409,75 @@ class Function(BaseModel):
 
     def _get_cache_key(self, entrypoint_args: Dict[str, Any], call_args: Optional[Dict[str, Any]] = None) -> str:
         """Generate a cache key based on function name and arguments."""
+        import json
         from hashlib import md5
 
-        copy_entrypoint_args = entrypoint_args.copy()
-        # Remove agent from entrypoint_args
-        if "agent" in copy_entrypoint_args:
-            del copy_entrypoint_args["agent"]
-        if "team" in copy_entrypoint_args:
-            del copy_entrypoint_args["team"]
-        args_str = str(copy_entrypoint_args)
+        # Remove agent, team and fc from entrypoint_args, they are not part of the call
+        copy_entrypoint_args = {k: v for k, v in entrypoint_args.items() if k not in ("agent", "team", "fc")}
 
-        kwargs_str = str(sorted((call_args or {}).items()))
-        key_str = f"{self.name}:{args_str}:{kwargs_str}"
+        # Canonical JSON, so the same arguments always produce the same key
+        key_str = json.dumps(
+            {"name": self.name, "args": copy_entrypoint_args, "kwargs": call_args or {}},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
+    def get_cache(self) -> "ToolCache":
+        """Returns the cache that results of this function are stored in."""
+        from agno.tools.cache import FileToolCache, get_default_tool_cache
 
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+        if self.cache is None:
+            if self.cache_dir is None:
+                return get_default_tool_cache()
+            self.cache = FileToolCache(self._get_cache_dir())
+        return self.cache
 
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
-        """Retrieve cached result if valid."""
-        import json
+    def get_cache_stats(self) -> Dict[str, int]:
+        return {"hits": self._cache_hits, "misses": self._cache_misses}
+
+    def _get_cached_result_for_key(self, cache_key: str) -> Optional[Any]:
+        cached_result = self.get_cache().lookup(cache_key)
+        if cached_result is None:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+        return cached_result
+
+    def _save_result_for_key(self, cache_key: str, result: Any) -> None:
+        self.get_cache().set(cache_key, result, ttl=self.cache_ttl)
+
+    def _get_cache_dir(self) -> str:
         from pathlib import Path
-        from time import time
+        from tempfile import gettempdir
 
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
+        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
+        return str(Path(base_cache_dir) / "functions" / self.name)
 
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
+    def _get_cache_file_path(self, cache_key: str) -> str:
+        """Get the full path for the cache file."""
+        from agno.tools.cache import FileToolCache
 
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
+        return str(FileToolCache(self._get_cache_dir()).get_file_path(cache_key))
 
-            if time() - timestamp <= self.cache_ttl:
-                return result
+    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
+        """Retrieve cached result from a cache file if valid."""
+        from pathlib import Path
 
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
+        from agno.tools.cache import FileToolCache
 
-        return None
+        cache_path = Path(cache_file)
+        return FileToolCache(cache_path.parent).read(cache_path, ttl=self.cache_ttl)
 
     def _save_to_cache(self, cache_file: str, result: Any):
-        """Save result to cache."""
-        import json
-        from time import time
+        """Save result to a cache file."""
+        from pathlib import Path
 
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+        from agno.tools.cache import FileToolCache
+
+        cache_path = Path(cache_file)
+        FileToolCache(cache_path.parent).write(cache_path, result, ttl=self.cache_ttl)
 
 
 class FunctionExecutionResult(BaseModel):
@@ -576,11 +653,14 @@ class FunctionCall(BaseModel):
 
         entrypoint_args = self._build_entrypoint_args()
 
+        # Build the cache key before the entrypoint args are updated with the call arguments
+        cache_key = (
+            self.function._get_cache_key(entrypoint_args, self.arguments) if self.function.cache_results else None
+        )
+
         # Check cache if enabled and not a generator function
-        if self.function.cache_results and not isgenerator(self.function.entrypoint):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+        if cache_key is not None and not isgenerator(self.function.entrypoint):
+            cached_result = self.function._get_cached_result_for_key(cache_key)
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -605,10 +685,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if cache_key is not None:
+                    self.function._save_result_for_key(cache_key, self.result)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -757,13 +835,15 @@ class FunctionCall(BaseModel):
 
         entrypoint_args = self._build_entrypoint_args()
 
+        cache_key = (
+            self.function._get_cache_key(entrypoint_args, self.arguments) if self.function.cache_results else None
+        )
+
         # Check cache if enabled and not a generator function
-        if self.function.cache_results and not (
+        if cache_key is not None and not (
             isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
         ):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = self.function._get_cached_result_for_key(cache_key)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -787,10 +867,8 @@ class FunctionCall(BaseModel):
                     self.result = await result
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if cache_key is not None and not (isgenerator(self.result) or isasyncgen(self.result)):
+                self.function._save_result_for_key(cache_key, self.result)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
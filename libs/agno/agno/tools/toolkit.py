@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
+from agno.tools.cache import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_warning, logger
 
@@ -22,6 +23,8 @@ class Toolkit:
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
         auto_register: bool = True,
+        cache: Optional[ToolCache] = None,
+        parallel_safe: bool = True,
     ):
         """Initialize a new Toolkit.
 
@@ -36,8 +39,10 @@ class Toolkit:
             external_execution_required_tools: List of tool names that will be executed outside of the agent loop
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
-            cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache_dir (Optional[str]): Directory to store cache files. Defaults to the in-memory cache.
             auto_register (bool): Whether to automatically register all methods in the class.
+            cache (Optional[ToolCache]): Cache backend to store results in, e.g. a SqliteToolCache or RedisToolCache.
+            parallel_safe (bool): Whether the toolkit's functions can run in parallel with other tool calls.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
         """
@@ -63,6 +68,9 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache: Optional[ToolCache] = cache
+
+        self.parallel_safe: bool = parallel_safe
 
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
@@ -128,10 +136,12 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache=self.cache,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
                 show_result=tool_name in self.show_result_tools,
+                parallel_safe=self.parallel_safe,
             )
             self.functions[f.name] = f
             log_debug(f"Function: {f.name} registered with {self.name}")
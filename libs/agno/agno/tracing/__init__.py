@@ -0,0 +1,31 @@
+from agno.tracing.exporter import (
+    InMemorySpanExporter,
+    JsonLogSpanExporter,
+    OpenTelemetrySpanExporter,
+    SpanExporter,
+    export_trace,
+)
+from agno.tracing.span import (
+    NOOP_SPAN,
+    Span,
+    atrace_iterator,
+    get_current_span,
+    span,
+    start_trace,
+    trace_iterator,
+)
+
+__all__ = [
+    "InMemorySpanExporter",
+    "JsonLogSpanExporter",
+    "NOOP_SPAN",
+    "OpenTelemetrySpanExporter",
+    "Span",
+    "SpanExporter",
+    "atrace_iterator",
+    "export_trace",
+    "get_current_span",
+    "span",
+    "start_trace",
+    "trace_iterator",
+]
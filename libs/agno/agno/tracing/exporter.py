@@ -0,0 +1,113 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from agno.tracing.span import Span
+from agno.utils.log import log_info, log_warning
+
+
+class SpanExporter(ABC):
+    """Receives the root span of every traced run once the run completes"""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        raise NotImplementedError
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the last `max_spans` root spans in memory, e.g. for tests and benchmarks"""
+
+    def __init__(self, max_spans: Optional[int] = 1000):
+        self.max_spans: Optional[int] = max_spans
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+            if self.max_spans is not None and len(self.spans) > self.max_spans:
+                del self.spans[: len(self.spans) - self.max_spans]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonLogSpanExporter(SpanExporter):
+    """Writes every root span as one line of JSON, to a file if `path` is set and to the logs otherwise"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        if self.path is None:
+            log_info(line)
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Replays every span tree on an OpenTelemetry tracer, keeping the recorded start and end times"""
+
+    def __init__(self, tracer: Optional[Any] = None, tracer_name: str = "agno"):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("`opentelemetry-api` not installed. Please install using `pip install opentelemetry-api`")
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer(tracer_name)
+
+    def export(self, span: Span) -> None:
+        self._export_span(span, context=None)
+
+    def _export_span(self, span: Span, context: Optional[Any]) -> None:
+        otel_span = self.tracer.start_span(
+            span.name,
+            context=context,
+            start_time=span.start_time_ns,
+            attributes=_get_otel_attributes(span.attributes),
+        )
+        if span.error is not None:
+            from opentelemetry.trace import Status, StatusCode
+
+            otel_span.set_status(Status(StatusCode.ERROR, span.error))
+        child_context = self._trace.set_span_in_context(otel_span)
+        for child in span.children:
+            self._export_span(child, context=child_context)
+        otel_span.end(end_time=span.end_time_ns)
+
+
+def _get_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenTelemetry only accepts primitive attribute values"""
+    otel_attributes: Dict[str, Any] = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, (str, bool, int, float)):
+            otel_attributes[key] = value
+        else:
+            otel_attributes[key] = str(value)
+    return otel_attributes
+
+
+def export_trace(span: Span, exporters: Optional[Sequence[SpanExporter]]) -> None:
+    """End the span of a run and send it to the exporters if it is the root of its trace.
+
+    Spans of nested runs are exported with the root. Exporter errors never fail the run.
+    """
+    span.end()
+    if not span.is_root:
+        return
+    for exporter in exporters or []:
+        try:
+            exporter.export(span)
+        except Exception as e:
+            log_warning(f"Failed to export trace with {exporter.__class__.__name__}: {e}")
@@ -0,0 +1,243 @@
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter_ns, time_ns
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    """Timing of one phase of a run, e.g. building the system message, a model call or a tool call.
+
+    Spans are nested: the span of a run is the root, and the phases of the run are its children.
+    Entering a span makes it the current span, so spans started with `span()` are added as its children.
+    """
+
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # Wall clock time the span started at, in nanoseconds since the epoch
+    start_time_ns: int = 0
+    # Duration of the span in nanoseconds, set when the span ends
+    duration_ns: Optional[int] = None
+    # Error raised inside the span, if any
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.start_time_ns:
+            self.start_time_ns = time_ns()
+        self._start_counter_ns: int = perf_counter_ns()
+        self._token: Optional[Token] = None
+        self._parent: Optional["Span"] = None
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    @property
+    def is_root(self) -> bool:
+        return self._parent is None
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        return self.start_time_ns + self.duration_ns if self.duration_ns is not None else None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration of the span in seconds"""
+        return self.duration_ns / 1e9 if self.duration_ns is not None else None
+
+    def span(self, name: str, **attributes: Any) -> "Span":
+        """Start a child of this span. Use it as a context manager to make it the current span."""
+        child = Span(name=name, attributes=attributes)
+        child._parent = self
+        self.children.append(child)
+        return child
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        if self.duration_ns is None:
+            self.duration_ns = perf_counter_ns() - self._start_counter_ns
+
+    def walk(self) -> Iterator["Span"]:
+        """Yield this span and all its descendants, depth first"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def find(self, name: str) -> List["Span"]:
+        """Return all spans in this tree with the given name"""
+        return [s for s in self.walk() if s.name == name]
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict: Dict[str, Any] = {
+            "name": self.name,
+            "start_time_ns": self.start_time_ns,
+            "duration": self.duration,
+        }
+        if self.attributes:
+            _dict["attributes"] = self.attributes
+        if self.error is not None:
+            _dict["error"] = self.error
+        if self.children:
+            _dict["children"] = [child.to_dict() for child in self.children]
+        return _dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Span":
+        duration = data.get("duration")
+        return cls(
+            name=data["name"],
+            attributes=data.get("attributes") or {},
+            start_time_ns=data.get("start_time_ns") or 0,
+            duration_ns=int(duration * 1e9) if duration is not None else None,
+            error=data.get("error"),
+            children=[cls.from_dict(child) for child in data.get("children") or []],
+        )
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_value is not None:
+            self.error = f"{exc_type.__name__}: {exc_value}"
+        self.end()
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # The span was entered in another context, e.g. a generator resumed on another thread
+                _current_span.set(self._parent or NOOP_SPAN)
+            self._token = None
+
+
+class NoopSpan(Span):
+    """Span used when tracing is disabled. It records nothing and all its children are itself."""
+
+    def __init__(self):
+        self.name = ""
+        self.attributes = {}
+        self.start_time_ns = 0
+        self.duration_ns = None
+        self.error = None
+        self.children = []
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    @property
+    def is_root(self) -> bool:
+        return False
+
+    def span(self, name: str, **attributes: Any) -> "Span":
+        return self
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+_current_span: ContextVar[Span] = ContextVar("agno_current_span", default=NOOP_SPAN)
+
+
+def get_current_span() -> Span:
+    """Return the current span, or a no-op span if no run is being traced"""
+    return _current_span.get()
+
+
+def span(name: str, **attributes: Any) -> Span:
+    """Start a child of the current span. Costs a context variable lookup when no run is being traced.
+
+    Example:
+        with span("knowledge.search", num_documents=5):
+            ...
+    """
+    return _current_span.get().span(name, **attributes)
+
+
+def start_trace(name: str, enabled: bool = True, **attributes: Any) -> Span:
+    """Start the span of a run. Returns a no-op span if tracing is disabled.
+
+    If the run is part of a traced run, e.g. a team member run in a tool call of the team, its span is a child of
+    the current span. Otherwise it is the root of a new trace.
+    """
+    if not enabled:
+        return NOOP_SPAN
+    parent = _current_span.get()
+    if parent.is_recording:
+        return parent.span(name, **attributes)
+    return Span(name=name, attributes=attributes)
+
+
+def trace_iterator(span: Span, iterator: Iterator[T]) -> Iterator[T]:
+    """Iterate in a span, e.g. over a stream of model response chunks.
+
+    The span is only the current span while the next item is produced, not while the consumer handles it. A
+    `with span(...)` around a `yield` would keep the span current in the consumer, which then adds its own spans to it.
+
+    Example:
+        yield from trace_iterator(span("model.response"), self._handle_model_response_stream(...))
+    """
+    if not span.is_recording:
+        yield from iterator
+        return
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            except Exception as e:
+                span.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                _current_span.reset(token)
+            yield item
+    finally:
+        # Close the iterator if the consumer stops early
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        span.end()
+
+
+async def atrace_iterator(span: Span, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Async version of `trace_iterator`"""
+    if not span.is_recording:
+        async for item in iterator:
+            yield item
+        return
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                span.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                _current_span.reset(token)
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        span.end()
@@ -0,0 +1,277 @@
+import json
+import math
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_error
+
+
+class Cache:
+    """Base class of the caches of tool results, model responses and query embeddings"""
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value for the key, or None if it is missing or expired"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value for the key, expiring after `ttl` seconds"""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def lookup(self, key: str) -> Optional[Any]:
+        """Get a cached value and count the hit or miss"""
+        result = self.get(key)
+        with self._stats_lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __deepcopy__(self, memo):
+        # Caches are shared, copies of agents, tools and models keep using the same cache
+        return self
+
+
+class InMemoryCache(Cache):
+    """Least-recently-used cache held in process memory, bounded by the size of the values."""
+
+    def __init__(self, max_size_bytes: int = 64 * 1024 * 1024, default_ttl: Optional[float] = None):
+        """
+        Args:
+            max_size_bytes (int): Approximate maximum size of the cached values, in bytes.
+            default_ttl (Optional[float]): Seconds to keep values when `set` is called without a ttl.
+        """
+        super().__init__()
+        self.max_size_bytes: int = max_size_bytes
+        self.default_ttl: Optional[float] = default_ttl
+        self.size_bytes: int = 0
+        # key -> (value, expires_at, size_bytes)
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            result, expires_at, _ = entry
+            if expires_at is not None and expires_at < time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        size_bytes = _get_size_bytes(value)
+        if size_bytes > self.max_size_bytes:
+            log_debug(f"Value of {size_bytes} bytes is too large to cache")
+            return
+        ttl = ttl if ttl is not None else self.default_ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time() + ttl if ttl is not None else None, size_bytes)
+            self.size_bytes += size_bytes
+            # Evict the least recently used values
+            while self.size_bytes > self.max_size_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size_bytes = self._entries.pop(key)
+        self.size_bytes -= size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCache(Cache):
+    """Cache stored as one JSON file per key. Used by functions that set a `cache_dir`."""
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        super().__init__()
+        self.cache_dir: Path = Path(cache_dir)
+        # Create the cache directory once, not on every lookup
+        self._dir_created: bool = False
+
+    def get_file_path(self, key: str) -> Path:
+        if not self._dir_created:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_created = True
+        return self.cache_dir / f"{key}.json"
+
+    def read(self, cache_file: Path, ttl: Optional[float] = None) -> Optional[Any]:
+        try:
+            with cache_file.open("r") as f:
+                cache_data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return None
+
+        # Older cache files store the time they were written instead of their expiry
+        expires_at = cache_data.get("expires_at")
+        if expires_at is None and ttl is not None:
+            expires_at = cache_data.get("timestamp", 0) + ttl
+        if expires_at is None or time() <= expires_at:
+            return cache_data.get("result")
+
+        # Remove expired entry
+        cache_file.unlink(missing_ok=True)
+        return None
+
+    def write(self, cache_file: Path, value: Any, ttl: Optional[float] = None) -> None:
+        now = time()
+        try:
+            with open(cache_file, "w") as f:
+                json.dump({"timestamp": now, "expires_at": now + ttl if ttl is not None else None, "result": value}, f)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.read(self.get_file_path(key))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.write(self.get_file_path(key), value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.get_file_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for cache_file in self.cache_dir.glob("**/*.json"):
+            cache_file.unlink(missing_ok=True)
+
+
+class SqliteCache(Cache):
+    """Cache in a SQLite database, shared by the processes on one machine."""
+
+    def __init__(self, db_file: Union[str, Path], table_name: str = "agno_cache"):
+        import sqlite3
+
+        super().__init__()
+        self.db_file: Path = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.table_name: str = table_name
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < time():
+                self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+            return
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, serialized, time() + ttl if ttl is not None else None),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+
+class RedisCache(Cache):
+    """Cache in Redis, shared by processes across machines."""
+
+    def __init__(
+        self,
+        prefix: str = "agno:cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        client: Optional[Any] = None,
+    ):
+        try:
+            from redis import Redis
+        except ImportError:
+            raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+        super().__init__()
+        self.prefix: str = prefix
+        self.client = client or Redis(host=host, port=port, db=db, password=password, decode_responses=True)
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.client.get(self._get_key(key))
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+            return
+        # Expire in milliseconds, so a sub-second ttl is not rounded down to no expiry (or an invalid expiry of 0)
+        px = max(1, math.ceil(ttl * 1000)) if ttl is not None else None
+        self.client.set(self._get_key(key), serialized, px=px)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._get_key(key))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            self.client.delete(key)
+
+
+def _get_size_bytes(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, bytes):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str).encode())
+    except Exception:
+        return len(str(value).encode())
@@ -1,5 +1,5 @@
 from dataclasses import asdict
-from typing import Any, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 
 def isinstanceany(obj: Any, class_list: List[Type]) -> bool:
@@ -59,3 +59,15 @@ def nested_model_dump(value):
     elif isinstance(value, list):
         return [nested_model_dump(item) for item in value]
     return value
+
+
+def split_init_kwargs(cls: Type, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split kwargs into the arguments accepted by cls.__init__ and the attributes to set after construction."""
+    from inspect import Parameter, signature
+
+    init_params = signature(cls.__init__).parameters
+    if any(param.kind == Parameter.VAR_KEYWORD for param in init_params.values()):
+        return kwargs, {}
+    init_kwargs = {k: v for k, v in kwargs.items() if k in init_params}
+    attributes = {k: v for k, v in kwargs.items() if k not in init_params}
+    return init_kwargs, attributes
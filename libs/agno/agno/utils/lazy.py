@@ -0,0 +1,33 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str, package_globals: Dict[str, Any], exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return the `__getattr__` and `__dir__` of a package that imports its exports on first access (PEP 562).
+
+    Importing a package, or any module inside it, then only runs the package's `__init__`, instead of importing
+    every module it re-exports.
+
+    Args:
+        package_name (str): `__name__` of the package.
+        package_globals (Dict[str, Any]): `globals()` of the package, where imported exports are cached.
+        exports (Dict[str, str]): Map of exported name to the module it is defined in.
+
+    Example:
+        __getattr__, __dir__ = lazy_exports(__name__, globals(), {"Agent": "agno.agent.agent"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import weakref
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """Holds one value per event loop, like async clients whose connections can not be shared between loops.
+
+    Example:
+        clients = LoopLocal(lambda: AsyncRedis(host=host))
+        client = clients.get()
+    """
+
+    def __init__(self, factory: Callable[[], T], on_evict: Optional[Callable[[T], None]] = None):
+        self.factory = factory
+        # Called with the values of closed event loops when they are forgotten, from the running event loop
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        # id(loop) -> (loop reference, value)
+        self._values: Dict[int, Tuple[weakref.ref, T]] = {}
+
+    def get(self) -> T:
+        """Returns the value of the running event loop, creating it with `factory` the first time"""
+        loop = asyncio.get_running_loop()
+        entry = self._values.get(id(loop))
+        if entry is not None and entry[0]() is loop:
+            return entry[1]
+        with self._lock:
+            # Forget the values of event loops that are closed
+            evicted = []
+            for loop_id, (loop_ref, value) in list(self._values.items()):
+                closed_loop = loop_ref()
+                if closed_loop is None or closed_loop.is_closed():
+                    del self._values[loop_id]
+                    evicted.append(value)
+            entry = self._values.get(id(loop))
+            if entry is None:
+                entry = (weakref.ref(loop), self.factory())
+                self._values[id(loop)] = entry
+        if self.on_evict is not None:
+            for value in evicted:
+                self.on_evict(value)
+        return entry[1]
+
+    def __deepcopy__(self, memo):
+        # Values are connections shared by copies
+        return self
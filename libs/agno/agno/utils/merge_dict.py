@@ -18,3 +18,27 @@ def merge_dictionaries(a: Dict[str, Any], b: Dict[str, Any]) -> None:
             merge_dictionaries(a[key], b[key])
         else:
             a[key] = b[key]
+
+
+def get_changed_items(original: Dict[str, Any], updated: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the items of 'updated' that are new or differ from 'original', recursing into nested dictionaries.
+
+    Args:
+        original (Dict[str, Any]): The dictionary before the changes.
+        updated (Dict[str, Any]): The dictionary after the changes.
+
+    Returns:
+        Dict[str, Any]: The changed items, which can be merged into another copy of 'original' with merge_dictionaries.
+    """
+    changed: Dict[str, Any] = {}
+    for key, value in updated.items():
+        if key not in original:
+            changed[key] = value
+        elif isinstance(value, dict) and isinstance(original[key], dict):
+            changed_items = get_changed_items(original[key], value)
+            if changed_items:
+                changed[key] = changed_items
+        elif value != original[key]:
+            changed[key] = value
+    return changed
@@ -0,0 +1,131 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from agno.utils.log import log_debug, log_warning
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Fields shared by the template and its copies: handles to external resources that do not hold run state
+DEFAULT_SHARED_FIELDS = ("knowledge", "storage", "retriever")
+
+# Fields that are expensive to copy and are reused as they are when an instance is returned to the pool.
+# They are configured again by every run, like when one instance serves many requests.
+REUSED_FIELDS = {"model", "reasoning_model", "parser_model", "tools", "members", "reasoning_agent", "team"}
+
+
+class InstancePool(Generic[T]):
+    """Bounded pool of copies of an Agent, Team or Workflow, so every request runs on an instance of its own.
+
+    Copies are made with `deep_copy` the first time the pool runs out of idle instances, sharing the `shared_fields`
+    of the template instead of copying them. When an instance is released, its session and run state is reset to
+    the template's, which only copies the small per-request fields, and it is kept for the next request.
+
+    Example:
+        pool = InstancePool(workflow, update={"workflow_id": workflow.workflow_id})
+        with pool.instance() as workflow_instance:
+            workflow_instance.run(...)
+    """
+
+    def __init__(
+        self,
+        template: T,
+        max_size: int = 16,
+        update: Optional[Dict[str, Any]] = None,
+        shared_fields: Sequence[str] = DEFAULT_SHARED_FIELDS,
+    ):
+        """
+        Args:
+            template (T): The Agent, Team or Workflow to copy. It is never run by the pool.
+            max_size (int): Maximum number of idle instances to keep.
+            update (Optional[Dict[str, Any]]): Fields to set on every instance.
+            shared_fields (Sequence[str]): Fields of the template to share with the instances instead of copying.
+        """
+        self.template: T = template
+        self.max_size: int = max_size
+        self.update: Dict[str, Any] = update or {}
+        self.shared_fields: Sequence[str] = tuple(shared_fields)
+        self.num_created: int = 0
+        self._idle: List[T] = []
+        self._lock = threading.Lock()
+
+    def _create(self) -> T:
+        update = {name: getattr(self.template, name, None) for name in self.shared_fields}
+        update = {name: value for name, value in update.items() if value is not None}
+        update.update(self.update)
+        instance = self.template.deep_copy(update=update)  # type: ignore
+        with self._lock:
+            self.num_created += 1
+        log_debug(f"Created pooled {self.template.__class__.__name__} instance")
+        return instance
+
+    def acquire(self) -> T:
+        """Returns an idle instance, or a new copy of the template if there is none"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._create()
+
+    def release(self, instance: T) -> None:
+        """Reset the instance and return it to the pool"""
+        try:
+            reset_instance(instance, self.template, self.shared_fields, self.update)
+        except Exception as e:
+            log_warning(f"Could not reset pooled instance, discarding it: {e}")
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(instance)
+
+    @contextmanager
+    def instance(self) -> Iterator[T]:
+        """Acquire an instance for the duration of the block"""
+        instance = self.acquire()
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def release_after(self, instance: T, iterable: Iterable[R]) -> Iterator[R]:
+        """Yield from the iterable, e.g. a streamed run, and release the instance once it is exhausted or closed"""
+        try:
+            yield from iterable
+        finally:
+            self.release(instance)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+
+def reset_instance(
+    instance: Any, template: Any, shared_fields: Sequence[str] = (), update: Optional[Dict[str, Any]] = None
+) -> None:
+    """Reset the session and run state of an Agent, Team or Workflow copied from the template"""
+    # Clear the state that is not a field, e.g. the loaded session
+    for method_name in ("reset_session_state", "reset_run_state", "_reset_session_state", "_reset_run_state"):
+        method = getattr(instance, method_name, None)
+        if callable(method):
+            method()
+    if hasattr(instance, "workflow_session"):
+        instance.workflow_session = None
+
+    for f in fields(template):
+        if f.name in shared_fields or f.name in REUSED_FIELDS:
+            continue
+        if update and f.name in update:
+            setattr(instance, f.name, update[f.name])
+            continue
+        value = getattr(template, f.name)
+        setattr(instance, f.name, template._deep_copy_field(f.name, value) if value is not None else None)
+
+    # The memory was copied from the template, so it is not shared with other instances
+    if hasattr(instance, "_memory_deepcopy_done"):
+        instance._memory_deepcopy_done = True
+
+    # Members of teams were copied with the team
+    instance_members = getattr(instance, "members", None) or []
+    template_members = getattr(template, "members", None) or []
+    for instance_member, template_member in zip(instance_members, template_members):
+        reset_instance(instance_member, template_member)
@@ -0,0 +1,148 @@
+import asyncio
+from typing import Any, Callable, Optional, Set
+
+from agno.utils.log import log_debug
+from agno.utils.loop import LoopLocal
+
+# Async drivers used for the databases of sync engines
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+}
+
+
+def create_in_memory_sqlite_engine() -> Any:
+    """
+    Returns an engine for a new in-memory SQLite database.
+
+    Every connection to `sqlite://` opens its own empty database, so the engine keeps a single connection
+    that is shared by all threads.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    return create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+
+def is_in_memory_sqlite(engine: Any) -> bool:
+    """Returns True if the engine is connected to an in-memory SQLite database"""
+    from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+    url = engine.url
+    if url.get_backend_name() != "sqlite":
+        return False
+    if url.database in (None, "", ":memory:") or url.query.get("mode") == "memory":
+        return True
+    return isinstance(engine.pool, (StaticPool, SingletonThreadPool))
+
+
+def get_async_engine(engine: Any) -> Optional[Any]:
+    """
+    Returns a SQLAlchemy AsyncEngine for the database of a sync engine.
+
+    Returns None if the database has no async driver, or the driver is not installed.
+    In-memory SQLite databases are not shared between engines, so they have no async engine.
+    """
+    url = engine.url
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        return None
+    if backend == "sqlite" and is_in_memory_sqlite(engine):
+        return None
+    # psycopg (v3) and asyncpg engines support async themselves
+    if url.get_driver_name() in ("psycopg", "asyncpg", "aiosqlite"):
+        async_url = url
+    else:
+        async_url = url.set(drivername=ASYNC_DRIVERS[backend])
+
+    try:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        return create_async_engine(async_url)
+    except Exception as e:
+        log_debug(f"Async driver not available for {backend}, async methods run in a thread: {e}")
+        return None
+
+
+class AsyncSessionFactory:
+    """
+    Creates SQLAlchemy AsyncSessions for the database of a sync engine.
+
+    Pooled async connections can not be used from another event loop, so an AsyncEngine is created per event loop,
+    unless an async engine is provided. Engines are created with `create_async_engine` if provided, otherwise for the
+    database of the sync engine. The engines of closed event loops are disposed when the next event loop uses the
+    factory, which releases their connections.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        async_engine: Optional[Any] = None,
+        create_async_engine: Optional[Callable[[], Optional[Any]]] = None,
+        **session_kwargs: Any,
+    ):
+        self.engine = engine
+        self.async_engine = async_engine
+        self.create_async_engine = create_async_engine
+        self.session_kwargs = session_kwargs
+        self._sessions: LoopLocal[Optional[Any]] = LoopLocal(self._create_session, on_evict=self._dispose_session)
+        # Tasks disposing the engines of closed event loops
+        self._disposing: Set[asyncio.Task] = set()
+        # Set to False when the database has no async driver installed
+        self._available: bool = True
+
+    def _create_session(self) -> Optional[Any]:
+        try:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+        except ImportError as e:
+            # sqlalchemy.ext.asyncio requires greenlet
+            log_debug(f"SQLAlchemy asyncio not available, async methods run in a thread: {e}")
+            self._available = False
+            return None
+
+        if self.async_engine is not None:
+            async_engine = self.async_engine
+        elif self.create_async_engine is not None:
+            async_engine = self.create_async_engine()
+        else:
+            async_engine = get_async_engine(self.engine)
+        if async_engine is None:
+            self._available = False
+            return None
+        return async_sessionmaker(bind=async_engine, **self.session_kwargs)
+
+    def _dispose_session(self, async_session: Optional[Any]) -> None:
+        """Disposes the engine of the async_sessionmaker of a closed event loop, unless the engine was provided"""
+        if async_session is None or async_session.kw["bind"] is self.async_engine:
+            return
+        task = asyncio.get_running_loop().create_task(self._dispose_engine(async_session.kw["bind"]))
+        self._disposing.add(task)
+        task.add_done_callback(self._disposing.discard)
+
+    async def _dispose_engine(self, async_engine: Any) -> None:
+        try:
+            await async_engine.dispose()
+        except Exception as e:
+            log_debug(f"Exception disposing async engine of a closed event loop: {e}")
+
+    def get(self) -> Optional[Any]:
+        """Returns the async_sessionmaker for the running event loop, or None if async is not available"""
+        if not self._available:
+            return None
+        return self._sessions.get()
+
+    def get_engine(self) -> Optional[Any]:
+        """Returns the AsyncEngine for the running event loop, or None if async is not available"""
+        async_session = self.get()
+        return async_session.kw["bind"] if async_session is not None else None
+
+    def __call__(self) -> Any:
+        """Returns a new AsyncSession for the running event loop"""
+        async_session = self.get()
+        if async_session is None:
+            raise RuntimeError("No async engine available")
+        return async_session()
+
+    def __deepcopy__(self, memo):
+        # Engines and their connection pools are shared by copies
+        return self
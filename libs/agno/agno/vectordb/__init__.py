@@ -1,3 +1,21 @@
-from agno.vectordb.base import VectorDb
+from typing import TYPE_CHECKING
 
-__all__ = ["VectorDb"]
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.vectordb.base import VectorDb, content_hash
+
+__all__ = [
+    "VectorDb",
+    "content_hash",
+]
+
+# Exports are imported on first access, so importing a module of the package does not import them all
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "VectorDb": "agno.vectordb.base",
+        "content_hash": "agno.vectordb.base",
+    },
+)
@@ -1,9 +1,17 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
 
+def content_hash(document: Document) -> str:
+    """Returns the hash of the document content, as used by vector dbs to identify stored documents"""
+    cleaned_content = document.content.replace("\x00", "\ufffd")
+    return md5(cleaned_content.encode()).hexdigest()
+
+
 class VectorDb(ABC):
     """Base class for Vector Databases"""
 
@@ -34,6 +42,13 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        """Returns the subset of content hashes that already exist in the vector db"""
+        raise NotImplementedError
+
+    async def async_existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        return await asyncio.to_thread(self.existing_content_hashes, hashes)
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
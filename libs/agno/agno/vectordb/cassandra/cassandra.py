@@ -3,6 +3,7 @@ from typing import Any, Dict, Iterable, List, Optional
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import get_query_embedding
 from agno.utils.log import log_debug, log_info
 from agno.vectordb.base import VectorDb
 from agno.vectordb.cassandra.index import AgnoMetadataVectorCassandraTable
@@ -140,7 +141,7 @@ class Cassandra(VectorDb):
 
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         """Vector similarity search implementation."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         hits = list(
             self.table.metric_ann_search(
                 vector=query_embedding,
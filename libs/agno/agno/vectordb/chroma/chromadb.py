@@ -1,6 +1,6 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -14,6 +14,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -113,6 +114,25 @@ class ChromaDb(VectorDb):
             logger.error(f"Document does not exist: {e}")
         return False
 
+    def existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """Get the content hashes that already exist in the collection, looking up ids in batches.
+        Args:
+            hashes (List[str]): Content hashes to check.
+            batch_size (int): Number of ids to look up in each request.
+        Returns:
+            Set[str]: The subset of hashes that exist in the collection.
+        """
+        existing: Set[str] = set()
+        if not self.client:
+            logger.warning("Client not initialized")
+            return existing
+
+        collection: Collection = self.client.get_collection(name=self.collection_name)
+        for i in range(0, len(hashes), batch_size):
+            result: GetResult = collection.get(ids=hashes[i : i + batch_size], include=[])
+            existing.update(result.get("ids", []))
+        return existing
+
     async def async_doc_exists(self, document: Document) -> bool:
         """Check if a document exists asynchronously."""
         return await asyncio.to_thread(self.doc_exists, document)
@@ -236,7 +256,7 @@ class ChromaDb(VectorDb):
         Returns:
             List[Document]: List of search results.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -1,6 +1,7 @@
 from hashlib import md5
 from typing import Any, Dict, List, Optional
 
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.vectordb.clickhouse.index import HNSW
 
 try:
@@ -405,7 +406,7 @@ class Clickhouse(VectorDb):
         )
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -469,7 +470,7 @@ class Clickhouse(VectorDb):
         """Search for documents asynchronously."""
         async_client = await self._ensure_async_client()
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await async_get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
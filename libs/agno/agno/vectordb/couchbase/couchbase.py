@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.embedder.openai import OpenAIEmbedder
 from agno.utils.log import log_debug, logger
 from agno.vectordb.base import VectorDb
@@ -435,7 +436,7 @@ class CouchbaseSearch(VectorDb):
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Search the Couchbase bucket for documents relevant to the query."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -945,7 +946,7 @@ class CouchbaseSearch(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await async_get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"[async] Failed to generate embedding for query: {query}")
             return []
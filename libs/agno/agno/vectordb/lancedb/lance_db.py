@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -10,6 +10,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -190,6 +191,31 @@ class LanceDb(VectorDb):
 
         return False
 
+    def existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """
+        Get the content hashes that already exist in the table, one `IN` query per batch
+
+        Args:
+            hashes (List[str]): Content hashes to check
+            batch_size (int): Number of hashes to check in each query
+        """
+        existing: Set[str] = set()
+        if self.table is None:
+            return existing
+
+        for i in range(0, len(hashes), batch_size):
+            batch = hashes[i : i + batch_size]
+            ids = ", ".join(f"'{content_hash}'" for content_hash in batch)
+            try:
+                result = (
+                    self.table.search().where(f"{self._id} IN ({ids})").select([self._id]).limit(len(batch)).to_arrow()
+                )
+            except Exception:
+                # Search sometimes fails with stale cache data, it means the docs don't exist
+                continue
+            existing.update(result.column(self._id).to_pylist())
+        return existing
+
     async def async_doc_exists(self, document: Document) -> bool:
         """
         Asynchronously validate if the document exists
@@ -448,13 +474,13 @@ class LanceDb(VectorDb):
             search_results = filtered_results
 
         if self.reranker and search_results:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = await self.reranker.arerank(query=query, documents=search_results)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return None
@@ -474,7 +500,7 @@ class LanceDb(VectorDb):
         return results.to_pandas()
 
     def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -11,6 +11,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -533,7 +534,7 @@ class Milvus(VectorDb):
         if self.search_type == SearchType.hybrid:
             return self.hybrid_search(query, limit)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -570,7 +571,7 @@ class Milvus(VectorDb):
         if self.search_type == SearchType.hybrid:
             return self.hybrid_search(query, limit, filters)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await async_get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -616,7 +617,7 @@ class Milvus(VectorDb):
         from pymilvus import AnnSearchRequest, RRFRanker
 
         # Get query embeddings
-        dense_vector = self.embedder.get_embedding(query)
+        dense_vector = get_query_embedding(self.embedder, query)
         sparse_vector = self._get_sparse_vector(query)
 
         if dense_vector is None:
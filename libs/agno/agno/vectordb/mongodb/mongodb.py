@@ -1,11 +1,12 @@
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from bson import ObjectId
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
@@ -463,6 +464,15 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    def existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """Get the content hashes that already exist in the collection, one `$in` query per batch."""
+        collection = self._get_collection()
+        existing: Set[str] = set()
+        for i in range(0, len(hashes), batch_size):
+            cursor = collection.find({"_id": {"$in": hashes[i : i + batch_size]}}, {"_id": 1})
+            existing.update(doc["_id"] for doc in cursor)
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection."""
         try:
@@ -537,7 +547,7 @@ class MongoDb(VectorDb):
         if self.search_type == SearchType.hybrid:
             return self.hybrid_search(query, limit=limit, filters=filters)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -694,7 +704,7 @@ class MongoDb(VectorDb):
 
         log_debug(f"Performing hybrid search for query: '{query}' with limit: {limit}")
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -962,6 +972,16 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence asynchronously: {e}")
             return False
 
+    async def async_existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """Get the content hashes that already exist in the collection asynchronously."""
+        collection = await self._get_async_collection()
+        existing: Set[str] = set()
+        for i in range(0, len(hashes), batch_size):
+            cursor = collection.find({"_id": {"$in": hashes[i : i + batch_size]}}, {"_id": 1})
+            async for doc in cursor:
+                existing.add(doc["_id"])
+        return existing
+
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
@@ -1007,7 +1027,7 @@ class MongoDb(VectorDb):
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Search for documents asynchronously."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await async_get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
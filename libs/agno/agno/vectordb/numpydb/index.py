@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class Ivf(BaseModel):
+    """Inverted file index: vectors are clustered into `lists` and a search only scores the `probes` closest lists"""
+
+    lists: int = 1024
+    probes: int = 16
+    # Only build the index once the collection holds this many vectors, below that exact search is fast enough
+    min_vectors: int = 100_000
+    # Number of vectors sampled to train the cluster centroids
+    sample_size: int = 100_000
+    iterations: int = 10
@@ -0,0 +1,596 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document, async_embed_documents, embed_documents
+from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.vectordb.base import VectorDb, content_hash
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb.index import Ivf
+
+
+class NumpyDb(VectorDb):
+    """Vector db that runs in process, with the embeddings in a float32 matrix memory-mapped from a .npy file.
+
+    A collection is a directory holding the embeddings matrix and their norms as .npy files, a JSON lines file with
+    the content and metadata of each document, and a manifest with the number of documents and of lines in that file.
+    Upserts append the records they replace, tagged with their row, and the file is compacted once most of its lines
+    are replaced records. Opening a collection
+    maps the matrix instead of reading it, and a search scores all vectors (or, with an Ivf index, the vectors in
+    the lists closest to the query) in one matrix product. With `path=None` the collection only lives in memory.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        path: Optional[Union[str, Path]] = "tmp/numpydb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        index: Optional[Ivf] = None,
+        reranker: Optional[Reranker] = None,
+    ):
+        """
+        Args:
+            collection (str): Name of the collection, and of its directory under `path`.
+            path (Optional[Union[str, Path]]): Directory to store collections in. Keep the collection in memory if None.
+            embedder (Optional[Embedder]): Embedder used to embed the documents and queries.
+            distance (Distance): Distance metric used to rank the documents.
+            index (Optional[Ivf]): Approximate index, built by `optimize` for large collections.
+            reranker (Optional[Reranker]): Reranker applied to the search results.
+        """
+        self.collection: str = collection
+        self.path: Optional[Path] = Path(path) / collection if path is not None else None
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.distance: Distance = distance
+        self.index: Optional[Ivf] = index
+        self.reranker: Optional[Reranker] = reranker
+
+        self._lock = threading.RLock()
+        self._loaded: bool = False
+        self._created: bool = False
+        self._count: int = 0
+        # Number of lines of the records file, the records of the rows and the records they replaced
+        self._lines: int = 0
+        # Matrices with room for more rows than `_count`, so inserts rarely have to copy them
+        self._vectors: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+        self._records: List[Dict[str, Any]] = []
+        # Indices of the records: content hash -> row, and metadata key -> value -> rows
+        self._hash_rows: Dict[str, int] = {}
+        self._ids: Set[str] = set()
+        self._names: Dict[str, int] = {}
+        self._meta_index: Dict[str, Dict[str, Set[int]]] = {}
+        # Ivf index: the centroid of each list and the list of each row
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: Optional[np.ndarray] = None
+
+    def _get_file(self, name: str) -> Path:
+        return self.path / name  # type: ignore
+
+    def _load(self) -> None:
+        """Open the collection on disk, mapping the matrices and indexing the records"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if self.path is None or not self._get_file("manifest.json").exists():
+                return
+            log_debug(f"Opening collection: {self.path}")
+            self._created = True
+            manifest = json.loads(self._get_file("manifest.json").read_text())
+            self._count = manifest["count"]
+            self._lines = manifest.get("lines", self._count)
+            self._load_records()
+            if self._count == 0:
+                return
+            self._vectors = np.load(self._get_file("embeddings.npy"), mmap_mode="r+")
+            self._norms = np.load(self._get_file("norms.npy"), mmap_mode="r+")
+            if self._get_file("ivf_centroids.npy").exists():
+                # Search the index with the parameters it was built with, unless the collection is opened with an index
+                if self.index is None and manifest.get("index") is not None:
+                    self.index = Ivf(**manifest["index"])
+                if self.index is not None:
+                    self._centroids = np.load(self._get_file("ivf_centroids.npy"))
+                    self._lists = np.load(self._get_file("ivf_lists.npy"), mmap_mode="r+")
+
+    def _load_records(self) -> None:
+        """Index the records of the first `_lines` lines, and drop the lines written after the manifest was last
+        updated. A line with a row replaces the record of that row, other lines add the next row.
+        """
+        records_file = self._get_file("records.jsonl")
+        if not records_file.exists():
+            return
+        with records_file.open("rb+") as f:
+            for num_lines in range(self._lines):
+                line = f.readline()
+                # A compaction that ended before its manifest was written leaves fewer lines
+                if not line:
+                    self._lines = num_lines
+                    break
+                record = json.loads(line)
+                row = record.pop("row", None)
+                if row is None:
+                    self._records.append(record)
+                else:
+                    self._records[row] = record
+            for row, record in enumerate(self._records):
+                self._index_record(row, record)
+            # Later records are incomplete writes. Truncate them, so the next write appends at the row of its vectors
+            end = f.tell()
+            if f.read(1):
+                log_debug(f"Dropping records of incomplete writes: {records_file}")
+                f.truncate(end)
+
+    def _index_record(self, row: int, record: Dict[str, Any]) -> None:
+        self._hash_rows[record["content_hash"]] = row
+        if record.get("id") is not None:
+            self._ids.add(record["id"])
+        if record.get("name") is not None:
+            self._names[record["name"]] = self._names.get(record["name"], 0) + 1
+        for key, value in (record.get("meta_data") or {}).items():
+            values = self._meta_index.setdefault(key, {})
+            for index_value in _get_index_values(value):
+                values.setdefault(index_value, set()).add(row)
+
+    def _unindex_record(self, row: int, record: Dict[str, Any]) -> None:
+        self._hash_rows.pop(record["content_hash"], None)
+        self._ids.discard(record.get("id"))  # type: ignore
+        name = record.get("name")
+        if name is not None:
+            self._names[name] -= 1
+            if self._names[name] == 0:
+                del self._names[name]
+        for key, value in (record.get("meta_data") or {}).items():
+            for index_value in _get_index_values(value):
+                self._meta_index[key][index_value].discard(row)
+
+    def _grow(self, name: str, array: Optional[np.ndarray], shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+        """Returns a copy of the first `_count` rows of the array, with room for `shape[0]` rows"""
+        if self.path is None:
+            grown = np.zeros(shape, dtype=dtype)
+            if array is not None:
+                grown[: self._count] = array[: self._count]
+            return grown
+        tmp_file = self._get_file(f"{name}.tmp.npy")
+        grown = np.lib.format.open_memmap(tmp_file, mode="w+", dtype=dtype, shape=shape)
+        if array is not None:
+            grown[: self._count] = array[: self._count]
+        grown.flush()
+        del grown
+        os.replace(tmp_file, self._get_file(f"{name}.npy"))
+        return np.load(self._get_file(f"{name}.npy"), mmap_mode="r+")
+
+    def _reserve(self, num_rows: int, dimensions: int) -> None:
+        capacity = len(self._vectors) if self._vectors is not None else 0
+        if self._count + num_rows <= capacity:
+            return
+        capacity = max(2 * capacity, self._count + num_rows, 1024)
+        log_debug(f"Growing collection to {capacity} rows")
+        self._vectors = self._grow("embeddings", self._vectors, (capacity, dimensions), np.float32)
+        self._norms = self._grow("norms", self._norms, (capacity,), np.float32)
+        if self._centroids is not None:
+            self._lists = self._grow("ivf_lists", self._lists, (capacity,), np.int32)
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "count": self._count,
+            "lines": self._lines,
+            "dimensions": self._vectors.shape[1] if self._vectors is not None else None,
+            "index": self.index.model_dump() if self.index is not None and self._centroids is not None else None,
+        }
+        tmp_file = self._get_file("manifest.json.tmp")
+        tmp_file.write_text(json.dumps(manifest))
+        os.replace(tmp_file, self._get_file("manifest.json"))
+
+    def _compact_records(self) -> None:
+        """Rewrite the records file with one line per row, dropping the replaced records"""
+        log_debug(f"Compacting records of collection: {self.collection}")
+        tmp_file = self._get_file("records.jsonl.tmp")
+        with tmp_file.open("w") as f:
+            for record in self._records:
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_file, self._get_file("records.jsonl"))
+        self._lines = self._count
+        self._write_manifest()
+
+    def _persist(self, lines: List[Dict[str, Any]]) -> None:
+        """Flush the matrices, then append the records and last write the manifest, which makes the new rows visible.
+        The records file is compacted when more than half of its lines are replaced records.
+        """
+        if self.path is None:
+            return
+        for array in (self._vectors, self._norms, self._lists):
+            if isinstance(array, np.memmap):
+                array.flush()
+        with self._get_file("records.jsonl").open("a") as f:
+            for line in lines:
+                f.write(json.dumps(line) + "\n")
+        self._lines += len(lines)
+        self._write_manifest()
+        if self._lines > 2 * self._count:
+            self._compact_records()
+
+    def create(self) -> None:
+        """Create the collection, or open it if it exists"""
+        self._load()
+        with self._lock:
+            if self._created:
+                log_debug(f"Collection already exists: {self.collection}")
+                return
+            log_debug(f"Creating collection: {self.collection}")
+            if self.path is not None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                self._get_file("records.jsonl").touch()
+                self._write_manifest()
+            self._created = True
+
+    async def async_create(self) -> None:
+        await asyncio.to_thread(self.create)
+
+    def doc_exists(self, document: Document) -> bool:
+        self._load()
+        return content_hash(document) in self._hash_rows
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        self._load()
+        return name in self._names
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._load()
+        return id in self._ids
+
+    def existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        self._load()
+        return {content_hash for content_hash in hashes if content_hash in self._hash_rows}
+
+    async def async_existing_content_hashes(self, hashes: List[str]) -> Set[str]:
+        return self.existing_content_hashes(hashes)
+
+    def _get_pending_documents(self, documents: List[Document], upsert: bool) -> List[Document]:
+        """Returns the documents that have to be embedded and written"""
+        self._load()
+        if upsert:
+            return documents
+        return [document for document in documents if content_hash(document) not in self._hash_rows]
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]], upsert: bool) -> None:
+        """Write embedded documents, replacing the rows with the same content when upserting"""
+        # Only the last document with the same content is written
+        documents_by_hash: Dict[str, Document] = {}
+        for document in documents:
+            documents_by_hash[content_hash(document)] = document
+        with self._lock:
+            self.create()
+            rows: List[Tuple[Optional[int], str, Document]] = []
+            for doc_hash, document in documents_by_hash.items():
+                row = self._hash_rows.get(doc_hash)
+                if row is None or upsert:
+                    rows.append((row, doc_hash, document))
+            if not rows:
+                return
+
+            vectors = np.asarray([document.embedding for _, _, document in rows], dtype=np.float32)
+            if vectors.ndim != 2:
+                raise ValueError("Every document must have an embedding of the same dimensions")
+            if self._vectors is not None and vectors.shape[1] != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Expected embeddings with {self._vectors.shape[1]} dimensions, but got {vectors.shape[1]}"
+                )
+            num_new_rows = sum(1 for row, _, _ in rows if row is None)
+            self._reserve(num_new_rows, vectors.shape[1])
+            lists = self._assign_lists(vectors) if self._centroids is not None else None
+
+            # Lines appended to the records file, replaced rows are tagged with their row
+            lines: List[Dict[str, Any]] = []
+            for i, (row, doc_hash, document) in enumerate(rows):
+                meta_data = {**(document.meta_data or {}), **(filters or {})}
+                record = {
+                    "id": document.id,
+                    "name": document.name,
+                    "content": document.content,
+                    "meta_data": meta_data,
+                    "content_hash": doc_hash,
+                }
+                if row is None:
+                    row = self._count
+                    self._count += 1
+                    self._records.append(record)
+                    lines.append(record)
+                else:
+                    self._unindex_record(row, self._records[row])
+                    self._records[row] = record
+                    lines.append({"row": row, **record})
+                self._index_record(row, record)
+                self._vectors[row] = vectors[i]  # type: ignore
+                self._norms[row] = np.linalg.norm(vectors[i])  # type: ignore
+                if lists is not None:
+                    self._lists[row] = lists[i]  # type: ignore
+
+            self._persist(lines)
+            log_debug(f"Wrote {len(rows)} documents to collection: {self.collection}")
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, skipping the documents with content that is already in the collection.
+
+        Args:
+            documents (List[Document]): Documents to insert.
+            filters (Optional[Dict[str, Any]]): Metadata added to every document.
+        """
+        pending = self._get_pending_documents(documents, upsert=False)
+        embed_documents(pending, self.embedder)
+        self._write(pending, filters, upsert=False)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        pending = self._get_pending_documents(documents, upsert=False)
+        await async_embed_documents(pending, self.embedder)
+        await asyncio.to_thread(self._write, pending, filters, False)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, replacing the documents with the same content.
+
+        Args:
+            documents (List[Document]): Documents to upsert.
+            filters (Optional[Dict[str, Any]]): Metadata added to every document.
+        """
+        pending = self._get_pending_documents(documents, upsert=True)
+        embed_documents(pending, self.embedder)
+        self._write(pending, filters, upsert=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        pending = self._get_pending_documents(documents, upsert=True)
+        await async_embed_documents(pending, self.embedder)
+        await asyncio.to_thread(self._write, pending, filters, True)
+
+    def _get_filter_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Returns the rows matching every filter, looked up in the metadata indices.
+        A filter with a list value matches documents with any of the values."""
+        rows: Optional[Set[int]] = None
+        for key, value in filters.items():
+            values = self._meta_index.get(key, {})
+            key_rows: Set[int] = set()
+            for filter_value in value if isinstance(value, (list, tuple, set)) else [value]:
+                key_rows.update(values.get(_get_index_value(filter_value), ()))
+            rows = key_rows if rows is None else rows & key_rows
+            if not rows:
+                break
+        return np.fromiter(sorted(rows or ()), dtype=np.int64)
+
+    def _get_scores(self, vectors: np.ndarray, norms: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Returns the similarity of each vector to the query, higher is closer"""
+        dots = vectors @ query
+        if self.distance == Distance.max_inner_product:
+            return dots
+        query_norm = np.linalg.norm(query)
+        if self.distance == Distance.l2:
+            return -(norms**2 - 2 * dots + query_norm**2)
+        return dots / np.maximum(norms * query_norm, 1e-12)
+
+    def _search_embedding(
+        self, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Document]:
+        self._load()
+        with self._lock:
+            count, vectors, norms = self._count, self._vectors, self._norms
+            centroids, lists, records = self._centroids, self._lists, self._records
+            rows = self._get_filter_rows(filters) if filters else None
+        if count == 0 or vectors is None or norms is None or limit <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        # Use the index, unless the filters already select few enough rows to score them all
+        index = self.index
+        if (
+            index is not None
+            and centroids is not None
+            and lists is not None
+            and (rows is None or len(rows) > index.min_vectors)
+        ):
+            probe_rows = np.flatnonzero(np.isin(lists[:count], self._get_probe_lists(query, centroids, index)))
+            rows = probe_rows if rows is None else np.intersect1d(rows, probe_rows, assume_unique=True)
+
+        if rows is None:
+            scores = self._get_scores(vectors[:count], norms[:count], query)
+        else:
+            scores = self._get_scores(vectors[rows], norms[rows], query)
+        k = min(limit, len(scores))
+        if k == 0:
+            return []
+        # Select the top k without sorting all scores
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        top_rows = top if rows is None else rows[top]
+
+        search_results: List[Document] = []
+        for row in top_rows:
+            record = records[row]
+            search_results.append(
+                Document(
+                    id=record["id"],
+                    name=record["name"],
+                    meta_data=dict(record["meta_data"]),
+                    content=record["content"],
+                    embedder=self.embedder,
+                    embedding=vectors[row].tolist(),
+                )
+            )
+        return search_results
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search the collection for the documents closest to the query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata values the documents must have.
+
+        Returns:
+            List[Document]: The closest documents, closest first.
+        """
+        query_embedding = get_query_embedding(self.embedder, query)
+        if not query_embedding:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        search_results = self._search_embedding(query_embedding, limit, filters)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.search(query, limit)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        query_embedding = await async_get_query_embedding(self.embedder, query)
+        if not query_embedding:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+        search_results = await asyncio.to_thread(self._search_embedding, query_embedding, limit, filters)
+        if self.reranker:
+            search_results = await self.reranker.arerank(query=query, documents=search_results)
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def _prepare_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """Vectors are clustered by direction for cosine distance, and by position otherwise"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.distance != Distance.cosine:
+            return vectors
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _assign_lists(self, vectors: np.ndarray, centroids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns the list of the closest centroid for each vector"""
+        centroids = centroids if centroids is not None else self._centroids
+        centroid_norms = (centroids**2).sum(axis=1)  # type: ignore
+        lists = np.empty(len(vectors), dtype=np.int32)
+        # Assign in blocks to bound the memory used by the distance matrix
+        for start in range(0, len(vectors), 65536):
+            block = self._prepare_vectors(vectors[start : start + 65536])
+            lists[start : start + len(block)] = np.argmin(centroid_norms - 2 * block @ centroids.T, axis=1)  # type: ignore
+        return lists
+
+    def _get_probe_lists(self, query: np.ndarray, centroids: np.ndarray, index: Ivf) -> np.ndarray:
+        query = self._prepare_vectors(query)
+        distances = (centroids**2).sum(axis=1) - 2 * centroids @ query
+        probes = min(index.probes, len(centroids))
+        return np.argpartition(distances, probes - 1)[:probes]
+
+    def _train_index(self, vectors: np.ndarray) -> np.ndarray:
+        """Cluster a sample of the vectors with k-means, returning the centroids"""
+        index: Ivf = self.index  # type: ignore
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(rng.choice(len(vectors), min(len(vectors), index.sample_size), replace=False))
+        sample = self._prepare_vectors(vectors[sample_rows])
+        num_lists = min(index.lists, len(sample))
+        centroids = sample[rng.choice(len(sample), num_lists, replace=False)].copy()
+        for _ in range(index.iterations):
+            assignments = self._assign_lists(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=num_lists)
+            # Lists without vectors keep their centroid
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+            if self.distance == Distance.cosine:
+                centroids = self._prepare_vectors(centroids)
+        return centroids
+
+    def optimize(self) -> None:
+        """Build the Ivf index, if the collection has an index and at least `index.min_vectors` vectors"""
+        self._load()
+        if self.index is None:
+            return
+        with self._lock:
+            if self._count < self.index.min_vectors or self._vectors is None:
+                log_debug(f"Not building index for {self._count} vectors, below {self.index.min_vectors}")
+                return
+            log_info(f"Building index for {self._count} vectors in {self.index.lists} lists")
+            centroids = self._train_index(self._vectors[: self._count])
+            lists = self._grow("ivf_lists", None, (len(self._vectors),), np.int32)
+            lists[: self._count] = self._assign_lists(self._vectors[: self._count], centroids)
+            self._centroids, self._lists = centroids, lists
+            if self.path is not None:
+                np.save(self._get_file("ivf_centroids.npy"), centroids)
+                if isinstance(lists, np.memmap):
+                    lists.flush()
+                # The manifest records the index parameters, to search the index when reopened without an index
+                self._write_manifest()
+
+    def get_count(self) -> int:
+        self._load()
+        return self._count
+
+    def drop(self) -> None:
+        """Delete the collection and its files"""
+        with self._lock:
+            if self.path is not None and self.path.exists():
+                log_debug(f"Deleting collection: {self.collection}")
+                shutil.rmtree(self.path)
+            self._vectors = self._norms = self._centroids = self._lists = None
+            self._count = self._lines = 0
+            self._records = []
+            self._hash_rows, self._ids, self._names, self._meta_index = {}, set(), {}, {}
+            self._created = False
+            self._loaded = True
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def exists(self) -> bool:
+        self._load()
+        return self._created
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def delete(self) -> bool:
+        try:
+            self.drop()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting collection: {e}")
+            return False
+
+
+def _get_index_value(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _get_index_values(value: Any) -> List[str]:
+    """Metadata values are indexed as a whole, and list values also by each of their items"""
+    index_values = [_get_index_value(value)]
+    if isinstance(value, list):
+        index_values.extend(_get_index_value(item) for item in value)
+    return index_values
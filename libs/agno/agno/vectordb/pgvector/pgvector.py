@@ -1,15 +1,16 @@
 import asyncio
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import Engine, create_engine, make_url
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
+    from sqlalchemy.pool import QueuePool
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.sql.expression import Select, TextClause, bindparam, desc, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
@@ -19,10 +20,15 @@ try:
 except ImportError:
     raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
 
-from agno.document import Document
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+from agno.document import Document, async_embed_documents, embed_documents
 from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.reranker.base import Reranker
-from agno.utils.log import log_debug, log_info, logger
+from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.utils.sql import AsyncSessionFactory
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
@@ -43,6 +49,9 @@ class PgVector(VectorDb):
         schema: str = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
+        async_engine_kwargs: Optional[Dict[str, Any]] = None,
         embedder: Optional[Embedder] = None,
         search_type: SearchType = SearchType.vector,
         vector_index: Union[Ivfflat, HNSW] = HNSW(),
@@ -62,6 +71,14 @@ class PgVector(VectorDb):
             schema (str): Database schema name.
             db_url (Optional[str]): Database connection URL.
             db_engine (Optional[Engine]): SQLAlchemy database engine.
+            async_db_url (Optional[str]): Database connection URL with an async driver, used by the async methods.
+                Defaults to `db_url` when it uses an async capable driver (psycopg or asyncpg).
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async database engine, used by the async methods.
+                Async engines created by PgVector are bound to their event loop. They are disposed after the loop is
+                closed, when another event loop uses PgVector. Provide an engine to share one pool across the app.
+            async_engine_kwargs (Optional[Dict[str, Any]]): Keyword arguments of `create_async_engine` for the async
+                engines created by PgVector, e.g. `max_overflow` or `pool_recycle`. Defaults to the pool size and
+                timeout of the sync engine.
             embedder (Optional[Embedder]): Embedder instance for creating embeddings.
             search_type (SearchType): Type of search to perform.
             vector_index (Union[Ivfflat, HNSW]): Vector index configuration.
@@ -129,10 +146,66 @@ class PgVector(VectorDb):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database sessions. Without an async engine or database URL, the async methods run the sync ones in
+        # threads. Pooled async connections are bound to their event loop, so an engine is created per event loop.
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self.async_engine_kwargs: Optional[Dict[str, Any]] = async_engine_kwargs
+        self.AsyncSession: Optional[AsyncSessionFactory] = None
+        if self.async_db_engine is not None or self._get_async_db_url() is not None:
+            self.AsyncSession = AsyncSessionFactory(
+                self.db_engine,
+                self.async_db_engine,
+                create_async_engine=self._create_async_engine,
+                expire_on_commit=False,
+            )
         # Database table
         self.table: Table = self.get_table()
         log_debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
 
+    def _get_async_db_url(self) -> Optional[str]:
+        """Returns the async_db_url, or the db_url if its driver supports async"""
+        if self.async_db_url is not None:
+            return self.async_db_url
+        if self.db_url is None or make_url(self.db_url).get_driver_name() not in ("psycopg", "asyncpg"):
+            return None
+        return self.db_url
+
+    def _create_async_engine(self) -> Optional["AsyncEngine"]:
+        """
+        Create an async engine with the `async_engine_kwargs`, or the pool size and timeout of the sync engine.
+        Called once per event loop by `AsyncSession`.
+
+        Returns:
+            Optional[AsyncEngine]: The async engine, or None if no async capable database URL is available.
+        """
+        async_db_url = self._get_async_db_url()
+        if async_db_url is None:
+            return None
+
+        engine_kwargs: Dict[str, Any] = {}
+        pool = self.db_engine.pool
+        if isinstance(pool, QueuePool):
+            engine_kwargs = {"pool_size": pool.size(), "pool_timeout": pool.timeout()}
+        if self.async_engine_kwargs is not None:
+            engine_kwargs.update(self.async_engine_kwargs)
+
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            return create_async_engine(async_db_url, **engine_kwargs)
+        except Exception as e:
+            log_warning(f"Could not create async engine, async methods will run in threads: {e}")
+            return None
+
+    def _use_async_engine(self) -> bool:
+        """Returns True if the async methods can use an async engine in the running event loop"""
+        return self.AsyncSession is not None and self.AsyncSession.get() is not None
+
+    def _get_async_engine(self) -> "AsyncEngine":
+        """Returns the async engine of the running event loop. Only called when `_use_async_engine` is True."""
+        return cast("AsyncEngine", cast(AsyncSessionFactory, self.AsyncSession).get_engine())
+
     def get_table_v1(self) -> Table:
         """
         Get the SQLAlchemy Table object for schema version 1.
@@ -205,9 +278,43 @@ class PgVector(VectorDb):
             log_debug(f"Creating table: {self.table_name}")
             self.table.create(self.db_engine)
 
+    async def async_table_exists(self) -> bool:
+        """
+        Check if the table exists in the database using the async engine.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.table_exists)
+
+        log_debug(f"Checking if table '{self.table.fullname}' exists.")
+        try:
+            async with self._get_async_engine().connect() as conn:
+                return await conn.run_sync(
+                    lambda sync_conn: inspect(sync_conn).has_table(self.table_name, schema=self.schema)
+                )
+        except Exception as e:
+            logger.error(f"Error checking if table exists: {e}")
+            return False
+
     async def async_create(self) -> None:
-        """Create the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.create)
+        """
+        Create the table and its indexes if it does not exist, using the async engine.
+        """
+        if not self._use_async_engine():
+            await asyncio.to_thread(self.create)
+            return
+
+        if not await self.async_table_exists():
+            async with self._get_async_engine().begin() as conn:
+                log_debug("Creating extension: vector")
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+                if self.schema is not None:
+                    log_debug(f"Creating schema: {self.schema}")
+                    await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+                log_debug(f"Creating table: {self.table_name}")
+                await conn.run_sync(self.table.create)
 
     def _record_exists(self, column, value) -> bool:
         """
@@ -243,9 +350,66 @@ class PgVector(VectorDb):
         content_hash = md5(cleaned_content.encode()).hexdigest()
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    async def _async_record_exists(self, column, value) -> bool:
+        """
+        Check if a record with the given column value exists in the table, using the async engine.
+
+        Args:
+            column: The column to check.
+            value: The value to search for.
+
+        Returns:
+            bool: True if the record exists, False otherwise.
+        """
+        try:
+            async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+                stmt = select(1).where(column == value).limit(1)
+                result = (await sess.execute(stmt)).first()
+                return result is not None
+        except Exception as e:
+            logger.error(f"Error checking if record exists: {e}")
+            return False
+
     async def async_doc_exists(self, document: Document) -> bool:
-        """Check if document exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        """Check if a document with the same content hash exists in the table."""
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.doc_exists, document)
+        content_hash = md5(self._clean_content(document.content).encode()).hexdigest()
+        return await self._async_record_exists(self.table.c.content_hash, content_hash)
+
+    def existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """
+        Get the content hashes that already exist in the table.
+
+        Args:
+            hashes (List[str]): The content hashes to check.
+            batch_size (int): Number of hashes to check in each query.
+
+        Returns:
+            Set[str]: The subset of hashes that exist in the table.
+        """
+        existing: Set[str] = set()
+        with self.Session() as sess, sess.begin():
+            for i in range(0, len(hashes), batch_size):
+                stmt = select(self.table.c.content_hash).where(
+                    self.table.c.content_hash.in_(hashes[i : i + batch_size])
+                )
+                existing.update(row[0] for row in sess.execute(stmt))
+        return existing
+
+    async def async_existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """Get the content hashes that already exist in the table."""
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.existing_content_hashes, hashes)
+
+        existing: Set[str] = set()
+        async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+            for i in range(0, len(hashes), batch_size):
+                stmt = select(self.table.c.content_hash).where(
+                    self.table.c.content_hash.in_(hashes[i : i + batch_size])
+                )
+                existing.update(row[0] for row in await sess.execute(stmt))
+        return existing
 
     def name_exists(self, name: str) -> bool:
         """
@@ -260,8 +424,10 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.name, name)
 
     async def async_name_exists(self, name: str) -> bool:
-        """Check if name exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.name_exists, name)
+        """Check if a document with the given name exists in the table."""
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.name_exists, name)
+        return await self._async_record_exists(self.table.c.name, name)
 
     def id_exists(self, id: str) -> bool:
         """
@@ -287,6 +453,139 @@ class PgVector(VectorDb):
         """
         return content.replace("\x00", "\ufffd")
 
+    def _embed_batch(self, documents: List[Document]) -> bool:
+        """
+        Embed a batch of documents with as few embedder requests as possible.
+
+        Args:
+            documents (List[Document]): List of documents to embed.
+
+        Returns:
+            bool: True if the batch was embedded, False if documents should be embedded one at a time.
+        """
+        try:
+            embed_documents(documents, self.embedder)
+            return True
+        except Exception as e:
+            logger.warning(f"Error embedding batch, falling back to embedding documents individually: {e}")
+            return False
+
+    def _get_document_record(
+        self, doc: Document, filters: Optional[Dict[str, Any]] = None, use_content_hash_id: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build the table record for an embedded document.
+
+        Args:
+            doc (Document): The document to build the record for.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the document.
+            use_content_hash_id (bool): Use the content hash as the id, so that upserts of the same content do not
+                create duplicates.
+
+        Returns:
+            Dict[str, Any]: The record to write to the table.
+        """
+        cleaned_content = self._clean_content(doc.content)
+        content_hash = md5(cleaned_content.encode()).hexdigest()
+        _id = content_hash if use_content_hash_id else (doc.id or content_hash)
+
+        meta_data = doc.meta_data or {}
+        if filters:
+            meta_data.update(filters)
+
+        return {
+            "id": _id,
+            "name": doc.name,
+            "meta_data": doc.meta_data,
+            "filters": filters,
+            "content": cleaned_content,
+            "embedding": doc.embedding,
+            "usage": doc.usage,
+            "content_hash": content_hash,
+        }
+
+    def _get_batch_records(
+        self,
+        batch_docs: List[Document],
+        batch_embedded: bool,
+        filters: Optional[Dict[str, Any]] = None,
+        use_content_hash_id: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the table records for a batch of documents, embedding them one at a time if the batch was not embedded.
+
+        Args:
+            batch_docs (List[Document]): The documents in the batch.
+            batch_embedded (bool): True if the documents were already embedded as a batch.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            use_content_hash_id (bool): Use the content hash as the id of each record.
+
+        Returns:
+            List[Dict[str, Any]]: The records to write to the table.
+        """
+        batch_records = []
+        for doc in batch_docs:
+            try:
+                if not batch_embedded:
+                    doc.embed(embedder=self.embedder)
+                batch_records.append(self._get_document_record(doc, filters, use_content_hash_id))
+            except Exception as e:
+                logger.error(f"Error processing document '{doc.name}': {e}")
+        return batch_records
+
+    def _get_upsert_stmt(self, batch_records: List[Dict[str, Any]]):
+        """
+        Build the statement that inserts a batch of records, updating records with the same id.
+
+        Args:
+            batch_records (List[Dict[str, Any]]): The records to upsert.
+
+        Returns:
+            The upsert statement.
+        """
+        insert_stmt = postgresql.insert(self.table).values(batch_records)
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "name": insert_stmt.excluded.name,
+                "meta_data": insert_stmt.excluded.meta_data,
+                "filters": insert_stmt.excluded.filters,
+                "content": insert_stmt.excluded.content,
+                "embedding": insert_stmt.excluded.embedding,
+                "usage": insert_stmt.excluded.usage,
+                "content_hash": insert_stmt.excluded.content_hash,
+            },
+        )
+
+    async def _async_embed_batch(self, documents: List[Document]) -> bool:
+        """
+        Embed a batch of documents with as few embedder requests as possible, without blocking the event loop.
+
+        Args:
+            documents (List[Document]): List of documents to embed.
+
+        Returns:
+            bool: True if the batch was embedded, False if documents should be embedded one at a time.
+        """
+        try:
+            await async_embed_documents(documents, self.embedder)
+            return True
+        except Exception as e:
+            logger.warning(f"Error embedding batch, falling back to embedding documents individually: {e}")
+            return False
+
+    async def _async_get_batch_records(
+        self,
+        batch_docs: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        use_content_hash_id: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Embed a batch of documents and build their table records without blocking the event loop."""
+        batch_embedded = await self._async_embed_batch(batch_docs)
+        if batch_embedded:
+            return self._get_batch_records(batch_docs, True, filters, use_content_hash_id)
+        return await asyncio.to_thread(self._get_batch_records, batch_docs, False, filters, use_content_hash_id)
+
     def insert(
         self,
         documents: List[Document],
@@ -307,32 +606,9 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        batch_embedded = self._embed_batch(batch_docs)
                         # Prepare documents for insertion
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = md5(cleaned_content.encode()).hexdigest()
-                                _id = doc.id or content_hash
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": _id,
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_records = self._get_batch_records(batch_docs, batch_embedded, filters)
 
                         # Insert the batch of records
                         insert_stmt = postgresql.insert(self.table)
@@ -347,9 +623,41 @@ class PgVector(VectorDb):
             logger.error(f"Error inserting documents: {e}")
             raise
 
-    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+    async def async_insert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Insert documents into the database using the async engine.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+        """
+        if not self._use_async_engine():
+            await asyncio.to_thread(self.insert, documents, filters)
+            return
+
+        try:
+            async with self.AsyncSession() as sess:  # type: ignore
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        batch_records = await self._async_get_batch_records(batch_docs, filters)
+                        await sess.execute(postgresql.insert(self.table), batch_records)
+                        await sess.commit()  # Commit batch independently
+                        log_info(f"Inserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()  # Rollback the current batch if there's an error
+                        raise
+        except Exception as e:
+            logger.error(f"Error inserting documents: {e}")
+            raise
 
     def upsert_available(self) -> bool:
         """
@@ -380,47 +688,14 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
-                        # Prepare documents for upserting
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = md5(cleaned_content.encode()).hexdigest()
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": content_hash,  # use content_hash as a reproducible id to avoid duplicates while upsert
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_embedded = self._embed_batch(batch_docs)
+                        # Prepare documents for upserting, using content_hash as a reproducible id to avoid duplicates
+                        batch_records = self._get_batch_records(
+                            batch_docs, batch_embedded, filters, use_content_hash_id=True
+                        )
 
                         # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                            },
-                        )
-                        sess.execute(upsert_stmt)
+                        sess.execute(self._get_upsert_stmt(batch_records))
                         sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
@@ -431,9 +706,43 @@ class PgVector(VectorDb):
             logger.error(f"Error upserting documents: {e}")
             raise
 
-    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+    async def async_upsert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Upsert (insert or update) documents in the database using the async engine.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to upsert in each batch.
+        """
+        if not self._use_async_engine():
+            await asyncio.to_thread(self.upsert, documents, filters)
+            return
+
+        try:
+            async with self.AsyncSession() as sess:  # type: ignore
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        batch_records = await self._async_get_batch_records(
+                            batch_docs, filters, use_content_hash_id=True
+                        )
+                        await sess.execute(self._get_upsert_stmt(batch_records))
+                        await sess.commit()  # Commit batch independently
+                        log_info(f"Upserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()  # Rollback the current batch if there's an error
+                        raise
+        except Exception as e:
+            logger.error(f"Error upserting documents: {e}")
+            raise
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -460,8 +769,104 @@ class PgVector(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """
+        Perform a search based on the configured search type, using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.search, query, limit, filters)
+
+        if self.search_type == SearchType.vector:
+            return await self.async_vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            return await self.async_keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            return await self.async_hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+
+    def _get_search_columns(self) -> List[Column]:
+        """Returns the columns selected by searches."""
+        return [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.embedding,
+            self.table.c.usage,
+        ]
+
+    def _get_index_settings_stmt(self) -> Optional[TextClause]:
+        """Returns the statement that sets the vector index query parameters for the current transaction."""
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            return text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}")
+        return None
+
+    def _get_vector_search_stmt(
+        self, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the vector similarity search statement.
+
+        Args:
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The search statement, or None if the distance metric is unknown.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results based on the distance metric
+        if self.distance == Distance.l2:
+            stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+        elif self.distance == Distance.cosine:
+            stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+        elif self.distance == Distance.max_inner_product:
+            stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Limit the number of results
+        stmt = stmt.limit(limit)
+
+        # Log the query for debugging
+        log_debug(f"Vector search query: {stmt}")
+        return stmt
+
+    def _to_documents(self, results: Sequence[Any]) -> List[Document]:
+        """Convert search result rows to Document objects."""
+        search_results: List[Document] = []
+        for result in results:
+            search_results.append(
+                Document(
+                    id=result.id,
+                    name=result.name,
+                    meta_data=result.meta_data,
+                    content=result.content,
+                    embedder=self.embedder,
+                    embedding=result.embedding,
+                    usage=result.usage,
+                )
+            )
+        return search_results
 
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -477,53 +882,21 @@ class PgVector(VectorDb):
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = get_query_embedding(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_vector_search_stmt(query_embedding, limit, filters)
+            if stmt is None:
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
-            # Log the query for debugging
-            log_debug(f"Vector search query: {stmt}")
-
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_settings_stmt = self._get_index_settings_stmt()
+                    if index_settings_stmt is not None:
+                        sess.execute(index_settings_stmt)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
@@ -532,19 +905,7 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -555,6 +916,56 @@ class PgVector(VectorDb):
             logger.error(f"Error during vector search: {e}")
             return []
 
+    async def async_vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a vector similarity search using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.vector_search, query, limit, filters)
+
+        try:
+            query_embedding = await async_get_query_embedding(self.embedder, query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
+
+            stmt = self._get_vector_search_stmt(query_embedding, limit, filters)
+            if stmt is None:
+                return []
+
+            try:
+                async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+                    index_settings_stmt = self._get_index_settings_stmt()
+                    if index_settings_stmt is not None:
+                        await sess.execute(index_settings_stmt)
+                    results = (await sess.execute(stmt)).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            search_results = self._to_documents(results)
+
+            if self.reranker:
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return []
+
     def enable_prefix_matching(self, query: str) -> str:
         """
         Preprocess the query for prefix matching.
@@ -570,6 +981,48 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
+    def _get_text_rank(self, query: str):
+        """Returns the full-text search rank of the 'content' column for the query."""
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+        # Compute the text rank
+        return func.ts_rank_cd(ts_vector, ts_query)
+
+    def _get_keyword_search_stmt(self, query: str, limit: int, filters: Optional[Dict[str, Any]] = None) -> Select:
+        """
+        Build the keyword search statement.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Select: The search statement.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        text_rank = self._get_text_rank(query)
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(text_rank.desc())
+
+        # Limit the number of results
+        stmt = stmt.limit(limit)
+
+        # Log the query for debugging
+        log_debug(f"Keyword search query: {stmt}")
+        return stmt
+
     def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
@@ -583,40 +1036,7 @@ class PgVector(VectorDb):
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
-            # Log the query for debugging
-            log_debug(f"Keyword search query: {stmt}")
+            stmt = self._get_keyword_search_stmt(query, limit, filters)
 
             # Execute the query
             try:
@@ -629,19 +1049,44 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during keyword search: {e}")
+            return []
+
+    async def async_keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a keyword search on the 'content' column using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.keyword_search, query, limit, filters)
+
+        try:
+            stmt = self._get_keyword_search_stmt(query, limit, filters)
+
+            try:
+                async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+                    results = (await sess.execute(stmt)).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing keyword search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            search_results = self._to_documents(results)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -649,6 +1094,72 @@ class PgVector(VectorDb):
             logger.error(f"Error during keyword search: {e}")
             return []
 
+    def _get_hybrid_search_stmt(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the hybrid search statement, combining vector similarity and full-text search.
+
+        Args:
+            query (str): The search query.
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The search statement, or None if the distance metric is unknown.
+        """
+        text_rank = self._get_text_rank(query)
+
+        # Compute the vector similarity score
+        if self.distance == Distance.l2:
+            # For L2 distance, smaller distances are better
+            vector_distance = self.table.c.embedding.l2_distance(query_embedding)
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.cosine:
+            # For cosine distance, smaller distances are better
+            vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
+            # Normalize to range [0, 1]
+            vector_score = (raw_vector_score + 1) / 2
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*self._get_search_columns(), hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        stmt = stmt.limit(limit)
+
+        # Log the query for debugging
+        log_debug(f"Hybrid search query: {stmt}")
+        return stmt
+
     def hybrid_search(
         self,
         query: str,
@@ -668,104 +1179,76 @@ class PgVector(VectorDb):
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = get_query_embedding(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_hybrid_search_stmt(query, query_embedding, limit, filters)
+            if stmt is None:
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            # Execute the query
+            try:
+                with self.Session() as sess, sess.begin():
+                    index_settings_stmt = self._get_index_settings_stmt()
+                    if index_settings_stmt is not None:
+                        sess.execute(index_settings_stmt)
+                    results = sess.execute(stmt).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing hybrid search: {e}")
+                return []
 
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+            # Process the results and convert to Document objects
+            search_results = self._to_documents(results)
 
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
 
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+    async def async_hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Perform a hybrid search combining vector similarity and full-text search, using the async engine.
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
 
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.hybrid_search, query, limit, filters)
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+        try:
+            query_embedding = await async_get_query_embedding(self.embedder, query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
 
-            # Log the query for debugging
-            log_debug(f"Hybrid search query: {stmt}")
+            stmt = self._get_hybrid_search_stmt(query, query_embedding, limit, filters)
+            if stmt is None:
+                return []
 
-            # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+                    index_settings_stmt = self._get_index_settings_stmt()
+                    if index_settings_stmt is not None:
+                        await sess.execute(index_settings_stmt)
+                    results = (await sess.execute(stmt)).fetchall()
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
-            # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -789,8 +1272,24 @@ class PgVector(VectorDb):
             log_info(f"Table '{self.table.fullname}' does not exist.")
 
     async def async_drop(self) -> None:
-        """Drop the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.drop)
+        """
+        Drop the table from the database using the async engine.
+        """
+        if not self._use_async_engine():
+            await asyncio.to_thread(self.drop)
+            return
+
+        if await self.async_table_exists():
+            try:
+                log_debug(f"Dropping table '{self.table.fullname}'.")
+                async with self._get_async_engine().begin() as conn:
+                    await conn.run_sync(self.table.drop)
+                log_info(f"Table '{self.table.fullname}' dropped successfully.")
+            except Exception as e:
+                logger.error(f"Error dropping table '{self.table.fullname}': {e}")
+                raise
+        else:
+            log_info(f"Table '{self.table.fullname}' does not exist.")
 
     def exists(self) -> bool:
         """
@@ -802,8 +1301,15 @@ class PgVector(VectorDb):
         return self.table_exists()
 
     async def async_exists(self) -> bool:
-        """Check if table exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.exists)
+        """
+        Check if the table exists in the database using the async engine.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        if not self._use_async_engine():
+            return await asyncio.to_thread(self.exists)
+        return await self.async_table_exists()
 
     def get_count(self) -> int:
         """
@@ -1060,8 +1566,8 @@ class PgVector(VectorDb):
         for k, v in self.__dict__.items():
             if k in {"metadata", "table"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            # Reuse the engines and sessions without copying
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession", "embedder"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
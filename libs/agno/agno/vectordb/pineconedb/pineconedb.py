@@ -24,6 +24,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -401,7 +402,7 @@ class PineconeDb(VectorDb):
             List[Document]: The list of matching documents.
 
         """
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = get_query_embedding(self.embedder, query)
 
         if self.use_hybrid_search:
             sparse_embedding = self.sparse_encoder.encode_queries(query)
@@ -1,5 +1,6 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -11,6 +12,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info
 from agno.vectordb.base import VectorDb
@@ -260,6 +262,39 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """
+        Get the content hashes that already exist in the collection, retrieving points in batches
+
+        Args:
+            hashes (List[str]): Content hashes to check
+            batch_size (int): Number of points to retrieve in each request
+        """
+        existing: Set[str] = set()
+        for i in range(0, len(hashes), batch_size):
+            batch = hashes[i : i + batch_size]
+            points = self.client.retrieve(
+                collection_name=self.collection, ids=batch, with_payload=False, with_vectors=False
+            )
+            existing.update(self._hashes_from_points(batch, points))
+        return existing
+
+    async def async_existing_content_hashes(self, hashes: List[str], batch_size: int = 1000) -> Set[str]:
+        """Get the content hashes that already exist in the collection asynchronously."""
+        existing: Set[str] = set()
+        for i in range(0, len(hashes), batch_size):
+            batch = hashes[i : i + batch_size]
+            points = await self.async_client.retrieve(
+                collection_name=self.collection, ids=batch, with_payload=False, with_vectors=False
+            )
+            existing.update(self._hashes_from_points(batch, points))
+        return existing
+
+    def _hashes_from_points(self, hashes: List[str], points: List[Any]) -> Set[str]:
+        # Qdrant returns the md5 hex ids in UUID format, so map them back to the hashes that were requested
+        hash_by_point_id = {str(UUID(content_hash)): content_hash for content_hash in hashes}
+        return {hash_by_point_id[str(point.id)] for point in points if str(point.id) in hash_by_point_id}
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -484,7 +519,7 @@ class Qdrant(VectorDb):
         limit: int,
         filters: Optional[Dict[str, Any]],
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = get_query_embedding(self.embedder, query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = self.client.query_points(
             collection_name=self.collection,
@@ -510,7 +545,7 @@ class Qdrant(VectorDb):
         limit: int,
         filters: Optional[Dict[str, Any]],
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = get_query_embedding(self.embedder, query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
@@ -559,7 +594,7 @@ class Qdrant(VectorDb):
         limit: int,
         filters: Optional[Dict[str, Any]],
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = await async_get_query_embedding(self.embedder, query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
@@ -608,7 +643,7 @@ class Qdrant(VectorDb):
         limit: int,
         filters: Optional[Dict[str, Any]],
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = await async_get_query_embedding(self.embedder, query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
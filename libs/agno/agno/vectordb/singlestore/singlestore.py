@@ -15,6 +15,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import get_query_embedding
 from agno.reranker.base import Reranker
 
 # from agno.vectordb.singlestore.index import Ivfflat, HNSWFlat
@@ -265,7 +266,7 @@ class SingleStore(VectorDb):
         Returns:
             List[Document]: List of documents that match the query.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
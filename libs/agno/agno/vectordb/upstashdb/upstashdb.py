@@ -10,6 +10,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_info, logger
 from agno.vectordb.base import VectorDb
@@ -258,7 +259,7 @@ class UpstashVectorDb(VectorDb):
         # filter_str = "" if filters is None else str(filters)
 
         if not self.use_upstash_embeddings and self.embedder is not None:
-            dense_embedding = self.embedder.get_embedding(query)
+            dense_embedding = get_query_embedding(self.embedder, query)
 
             if dense_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
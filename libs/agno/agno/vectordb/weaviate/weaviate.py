@@ -19,6 +19,7 @@ except ImportError:
 
 from agno.document import Document
 from agno.embedder import Embedder
+from agno.embedder.cache import async_get_query_embedding, get_query_embedding
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -430,7 +431,7 @@ class Weaviate(VectorDb):
 
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = get_query_embedding(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -473,7 +474,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await async_get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -495,7 +496,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -565,7 +566,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -578,7 +579,7 @@ class Weaviate(VectorDb):
 
     def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = get_query_embedding(self.embedder, query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -624,7 +625,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await async_get_query_embedding(self.embedder, query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -649,7 +650,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -739,6 +739,9 @@ class Workflow:
         fields_for_new_workflow: Dict[str, Any] = {}
 
         for f in fields(self):
+            # Fields that are updated are not copied
+            if update and f.name in update:
+                continue
             field_value = getattr(self, f.name)
             if field_value is not None:
                 if isinstance(field_value, Agent):
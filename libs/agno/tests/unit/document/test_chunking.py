@@ -0,0 +1,42 @@
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+
+
+def test_fixed_size_chunking_spans():
+    """Test that chunks end at word boundaries and are read from the spans of the content"""
+    content = "alpha beta gamma delta epsilon"
+    chunking = FixedSizeChunking(chunk_size=12)
+
+    assert chunking.get_spans(content) == [(0, 10), (10, 22), (22, 30)]
+    chunks = chunking.chunk(Document(content=content, name="doc", meta_data={"source": "test"}))
+    assert [chunk.content for chunk in chunks] == ["alpha beta", " gamma delta", " epsilon"]
+    assert [chunk.id for chunk in chunks] == ["doc_1", "doc_2", "doc_3"]
+    assert chunks[1].meta_data == {"source": "test", "chunk": 2, "chunk_size": 12}
+
+
+def test_fixed_size_chunking_splits_long_words():
+    chunking = FixedSizeChunking(chunk_size=4)
+    assert [chunk.content for chunk in chunking.chunk(Document(content="abcdefghij"))] == ["abcd", "efgh", "ij"]
+
+
+def test_fixed_size_chunking_overlap_always_moves_forward():
+    """Test that a chunk ending within the overlap does not move the next chunk backwards"""
+    content = "a " * 50 + "abcdefghijklmnopqrstuvwxyz"
+    spans = FixedSizeChunking(chunk_size=30, overlap=10).get_spans(content)
+    assert all(next_start > start for (start, _), (next_start, _) in zip(spans, spans[1:]))
+    assert spans[-1][1] >= len(content)
+
+
+def test_recursive_chunking_spans():
+    """Test that chunks end after the last separator in the chunk"""
+    content = "First sentence. Second sentence. Third sentence."
+    chunking = RecursiveChunking(chunk_size=20)
+
+    assert chunking.get_spans(content) == [(0, 15), (15, 32), (32, 48)]
+    chunks = chunking.chunk(Document(content=content, id="doc", meta_data={"source": "test"}))
+    assert [chunk.content for chunk in chunks] == ["First sentence.", " Second sentence.", " Third sentence."]
+    assert [chunk.meta_data for chunk in chunks] == [
+        {"source": "test", "chunk": i, "chunk_size": size} for i, size in [(1, 15), (2, 17), (3, 16)]
+    ]
+    assert chunks[0].id == "doc_1"
@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.document import Document, embed_documents
+from agno.document.chunking.semantic import SemanticChunking
+from agno.embedder.base import Embedder
+
+
+@dataclass
+class TopicEmbedder(Embedder):
+    """Embeds sentences about cats and about finance in orthogonal directions"""
+
+    id: str = "topic-embedder"
+    dimensions: Optional[int] = 2
+    calls: int = 0
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [1.0, 0.0] if "cat" in text else [0.0, 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls += 1
+        return self.get_embedding(text), None
+
+
+def test_streaming_semantic_chunking_splits_on_topic_changes():
+    embedder = TopicEmbedder()
+    chunker = SemanticChunking(embedder=embedder, streaming=True, window_size=2, chunk_size=1000)
+    document = Document(
+        id="doc",
+        name="doc",
+        content="The cat sleeps. A cat purrs. Another cat eats. Stocks fell today. Bonds rallied. The cat woke up.",
+    )
+
+    chunks = chunker.chunk(document)
+
+    assert [chunk.content for chunk in chunks] == [
+        "The cat sleeps. A cat purrs. Another cat eats.",
+        "Stocks fell today. Bonds rallied.",
+        "The cat woke up.",
+    ]
+    assert [chunk.id for chunk in chunks] == ["doc_1", "doc_2", "doc_3"]
+    assert chunks[0].meta_data["chunk_size"] == len(chunks[0].content)
+    assert chunks[0].embedding == [1.0, 0.0]
+    assert chunks[1].embedding == [0.0, 1.0]
+
+
+def test_streaming_semantic_chunking_respects_chunk_size():
+    chunker = SemanticChunking(embedder=TopicEmbedder(), streaming=True, chunk_size=30)
+    chunks = chunker.chunk(Document(content="The cat sleeps. A cat purrs. Another cat eats."))
+    assert [chunk.content for chunk in chunks] == ["The cat sleeps. A cat purrs.", "Another cat eats."]
+
+
+def test_chunk_embeddings_are_reused():
+    embedder = TopicEmbedder()
+    chunker = SemanticChunking(embedder=embedder, streaming=True)
+    chunks = chunker.chunk(Document(content="The cat sleeps. Stocks fell today."))
+    sentence_calls = embedder.calls
+
+    # The same embedder, or an equivalent one, does not embed the chunks again
+    embed_documents(chunks, embedder)
+    chunks[0].embed(TopicEmbedder())
+    assert embedder.calls == sentence_calls
+
+    # Chunks without reusable embeddings are embedded
+    chunker = SemanticChunking(embedder=embedder, streaming=True, reuse_embeddings=False)
+    chunks = chunker.chunk(Document(content="The cat sleeps. Stocks fell today."))
+    assert all(chunk.embedding is None for chunk in chunks)
+    embed_documents(chunks, embedder)
+    assert all(chunk.embedding is not None for chunk in chunks)
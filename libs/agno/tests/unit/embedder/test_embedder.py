@@ -0,0 +1,128 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document, async_embed_documents, embed_documents
+from agno.embedder.base import Embedder, get_batch_usage
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that embeds one text per request, recording every request"""
+
+    dimensions: int = 2
+    requests: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests.append(text)
+        return [float(len(text)), 1.0], {"total_tokens": len(text)}
+
+
+@dataclass
+class BatchEmbedder(CountingEmbedder):
+    """Embedder with a native multi-input request"""
+
+    batches: List[List[str]] = field(default_factory=list)
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(texts)
+        usage = {"total_tokens": sum(len(text) for text in texts)}
+        return [[float(len(text)), 1.0] for text in texts], get_batch_usage(usage, len(texts))
+
+
+def test_fallback_embeds_each_text():
+    """Test that embedders without a native batch API fall back to one request per text"""
+    embedder = CountingEmbedder()
+    embeddings, usage = embedder.get_embeddings_and_usage(["a", "bb", "ccc"])
+
+    assert embeddings == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert usage == [{"total_tokens": 1}, {"total_tokens": 2}, {"total_tokens": 3}]
+    assert embedder.requests == ["a", "bb", "ccc"]
+
+
+def test_batches_respect_batch_size():
+    """Test that texts are split into batches of at most batch_size"""
+    embedder = BatchEmbedder(batch_size=2)
+    embeddings, usage = embedder.get_embeddings_and_usage(["a", "b", "c", "d", "e"])
+
+    assert embedder.batches == [["a", "b"], ["c", "d"], ["e"]]
+    assert len(embeddings) == 5
+    # The usage of each request is recorded once, on the first text of its batch
+    assert usage == [{"total_tokens": 2}, None, {"total_tokens": 2}, None, {"total_tokens": 1}]
+
+
+def test_batches_respect_batch_max_tokens():
+    """Test that a batch is closed before it exceeds the token budget"""
+    embedder = BatchEmbedder(batch_size=100, batch_max_tokens=5)
+    # Each text is estimated at 3 tokens
+    embedder.get_embeddings_and_usage(["x" * 8, "y" * 8, "z" * 8])
+
+    assert embedder.batches == [["x" * 8], ["y" * 8], ["z" * 8]]
+
+
+def test_oversized_text_gets_its_own_batch():
+    """Test that a text larger than the token budget is still embedded"""
+    embedder = BatchEmbedder(batch_max_tokens=2)
+    embeddings, _ = embedder.get_embeddings_and_usage(["x" * 100])
+
+    assert embedder.batches == [["x" * 100]]
+    assert embeddings == [[100.0, 1.0]]
+
+
+def test_empty_texts():
+    """Test that embedding no texts makes no requests"""
+    embedder = BatchEmbedder()
+    assert embedder.get_embeddings_and_usage([]) == ([], [])
+    assert embedder.batches == []
+
+
+def test_embed_documents():
+    """Test that embed_documents sets embedding and usage on every document"""
+    embedder = BatchEmbedder()
+    documents = [Document(content="one"), Document(content="three")]
+    embed_documents(documents, embedder)
+
+    assert [document.embedding for document in documents] == [[3.0, 1.0], [5.0, 1.0]]
+    assert documents[0].usage == {"total_tokens": 8}
+    assert documents[1].usage is None
+    assert len(embedder.batches) == 1
+
+
+def test_openai_batch_usage_is_recorded_once():
+    """Test that the usage of a batch request is not copied to every text of the batch"""
+    from openai.types import CreateEmbeddingResponse
+
+    from agno.embedder.openai import OpenAIEmbedder
+
+    client = MagicMock()
+    client.embeddings.create.return_value = CreateEmbeddingResponse(
+        data=[
+            {"object": "embedding", "index": 1, "embedding": [0.0, 1.0]},
+            {"object": "embedding", "index": 0, "embedding": [1.0, 0.0]},
+        ],
+        model="text-embedding-3-small",
+        object="list",
+        usage={"prompt_tokens": 5, "total_tokens": 5},
+    )
+    embedder = OpenAIEmbedder(openai_client=client)
+    embeddings, usage = embedder.get_embeddings_and_usage(["first", "second"])
+
+    assert embeddings == [[1.0, 0.0], [0.0, 1.0]]
+    assert usage == [{"prompt_tokens": 5, "total_tokens": 5}, None]
+    client.embeddings.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_embed_documents():
+    """Test the async fallback produces the same result as the sync path"""
+    embedder = CountingEmbedder(batch_size=1)
+    documents = [Document(content="one"), Document(content="three")]
+    await async_embed_documents(documents, embedder)
+
+    assert [document.embedding for document in documents] == [[3.0, 1.0], [5.0, 1.0]]
+    assert embedder.requests == ["one", "three"]
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.embedder.cache import QueryEmbeddingCache, async_get_query_embedding, get_query_embedding
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that records every text it embeds"""
+
+    id: str = "counting"
+    dimensions: int = 2
+    requests: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests.append(text)
+        return [float(len(text)), 1.0], None
+
+
+def test_query_embedding_is_cached():
+    """Test that the same query is embedded once, ignoring whitespace differences"""
+    cache = QueryEmbeddingCache()
+    embedder = CountingEmbedder(query_cache=cache)
+
+    first = get_query_embedding(embedder, "what is agno?")
+    second = get_query_embedding(embedder, "  what is\nagno? ")
+
+    assert first == second == [13.0, 1.0]
+    assert embedder.requests == ["what is agno?"]
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_query_cache_key_includes_embedder():
+    """Test that embedders with a different id or dimensions do not share embeddings"""
+    cache = QueryEmbeddingCache()
+    small = CountingEmbedder(query_cache=cache)
+    large = CountingEmbedder(dimensions=4, query_cache=cache)
+    other = CountingEmbedder(id="other", query_cache=cache)
+
+    for embedder in (small, large, other):
+        get_query_embedding(embedder, "query")
+        assert embedder.requests == ["query"]
+
+
+@dataclass
+class InputTypeEmbedder(CountingEmbedder):
+    """Embedder whose embeddings depend on the input type"""
+
+    cache_key_settings: ClassVar[Tuple[str, ...]] = ("input_type",)
+    input_type: str = "search_query"
+
+
+def test_query_cache_key_includes_settings():
+    """Test that embedders with settings that change the embeddings do not share embeddings"""
+    from agno.embedder.openai import OpenAIEmbedder
+
+    cache = QueryEmbeddingCache()
+    query_embedder = InputTypeEmbedder(query_cache=cache)
+    document_embedder = InputTypeEmbedder(input_type="search_document", query_cache=cache)
+
+    get_query_embedding(query_embedder, "query")
+    get_query_embedding(document_embedder, "query")
+    get_query_embedding(InputTypeEmbedder(query_cache=cache), "query")
+    assert query_embedder.requests == ["query"]
+    assert document_embedder.requests == ["query"]
+    assert cache.get_stats()["hits"] == 1
+
+    assert QueryEmbeddingCache.get_key(OpenAIEmbedder(), "query") != QueryEmbeddingCache.get_key(
+        OpenAIEmbedder(base_url="http://localhost:8000/v1"), "query"
+    )
+
+
+def test_query_cache_is_bounded():
+    """Test that the least recently used embeddings are evicted when the cache is full"""
+    cache = QueryEmbeddingCache(max_size_bytes=25)
+    embedder = CountingEmbedder(query_cache=cache)
+
+    get_query_embedding(embedder, "first")
+    get_query_embedding(embedder, "second")
+    get_query_embedding(embedder, "third")
+    get_query_embedding(embedder, "first")
+
+    assert embedder.requests == ["first", "second", "third", "first"]
+
+
+def test_query_cache_ttl():
+    """Test that expired embeddings are embedded again"""
+    cache = QueryEmbeddingCache(ttl=-1)
+    embedder = CountingEmbedder(query_cache=cache)
+
+    get_query_embedding(embedder, "query")
+    get_query_embedding(embedder, "query")
+
+    assert embedder.requests == ["query", "query"]
+
+
+def test_query_cache_persists_to_disk(tmp_path):
+    """Test that embeddings written to disk are used by a new cache"""
+    db_file = tmp_path / "embeddings.db"
+    get_query_embedding(CountingEmbedder(query_cache=QueryEmbeddingCache(db_file=db_file)), "query")
+
+    embedder = CountingEmbedder(query_cache=QueryEmbeddingCache(db_file=db_file))
+    assert get_query_embedding(embedder, "query") == [5.0, 1.0]
+    assert embedder.requests == []
+
+
+def test_query_cache_disabled():
+    """Test that embedders with cache_queries=False embed every query"""
+    cache = QueryEmbeddingCache()
+    embedder = CountingEmbedder(cache_queries=False, query_cache=cache)
+
+    get_query_embedding(embedder, "query")
+    get_query_embedding(embedder, "query")
+
+    assert embedder.requests == ["query", "query"]
+    assert cache.get_stats()["misses"] == 0
+
+
+def test_empty_embedding_is_not_cached():
+    """Test that failed embeddings are not cached"""
+    cache = QueryEmbeddingCache()
+    embedder = CountingEmbedder(query_cache=cache)
+    embedder.get_embedding = MagicMock(return_value=[])
+
+    get_query_embedding(embedder, "query")
+    get_query_embedding(embedder, "query")
+
+    assert embedder.get_embedding.call_count == 2
+
+
+def test_non_embedder_is_called_directly():
+    """Test that objects that are not embedders are not cached"""
+    embedder = MagicMock()
+    embedder.get_embedding.return_value = [0.1, 0.2]
+
+    assert get_query_embedding(embedder, "query") == [0.1, 0.2]
+    assert get_query_embedding(embedder, "query") == [0.1, 0.2]
+    assert embedder.get_embedding.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_query_embedding_is_cached():
+    """Test that async searches share the cache with sync searches"""
+    cache = QueryEmbeddingCache()
+    embedder = CountingEmbedder(query_cache=cache)
+
+    get_query_embedding(embedder, "query")
+    assert await async_get_query_embedding(embedder, "query") == [5.0, 1.0]
+    assert await async_get_query_embedding(embedder, "other") == [5.0, 1.0]
+
+    assert embedder.requests == ["query", "other"]
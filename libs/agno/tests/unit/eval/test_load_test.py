@@ -0,0 +1,133 @@
+import json
+
+import pytest
+
+from agno.agent import Agent
+from agno.eval.performance import LoadTestResult, PerformanceEval
+from agno.exceptions import EvalError
+from agno.models.mock import MockModel
+
+
+def get_weather(city: str) -> str:
+    """Get the weather in a city"""
+    return f"Sunny in {city}"
+
+
+def get_agent() -> Agent:
+    return Agent(
+        model=MockModel(tool_calls=[{"name": "get_weather", "arguments": {"city": "Paris"}}]),
+        tools=[get_weather],
+        telemetry=False,
+    )
+
+
+def test_load_test_result_stats():
+    result = LoadTestResult(latencies=[0.4, 0.1, 0.3, 0.2], num_errors=1, concurrency=2, duration=2.0)
+
+    assert result.num_requests == 5
+    assert result.throughput == 2.5
+    assert result.error_rate == 0.2
+    assert result.p50_latency == pytest.approx(0.25)
+    assert result.p90_latency == pytest.approx(0.37)
+    assert result.max_latency == 0.4
+    assert result.rss_growth is None
+
+
+def test_load_test_regressions():
+    result = LoadTestResult(latencies=[0.2] * 10, concurrency=2, duration=1.0)
+    baseline = result.get_summary()
+
+    assert result.get_regressions(baseline) == []
+    slower = LoadTestResult(latencies=[0.3] * 8, num_errors=2, concurrency=2, duration=1.0)
+    regressions = slower.get_regressions(baseline, threshold=0.2)
+    assert [regression.split()[0] for regression in regressions] == [
+        "p50_latency",
+        "p90_latency",
+        "p99_latency",
+        "error_rate",
+    ]
+
+
+def test_run_load_test_with_mock_model():
+    def run_agent():
+        response = get_agent().run("What is the weather in Paris?")
+        assert response.content == "This is a mock response."
+
+    evaluation = PerformanceEval(func=run_agent, warmup_runs=1, concurrency=4, num_requests=20, monitoring=False)
+    result = evaluation.run_load_test()
+
+    assert evaluation.load_result is result
+    assert result.num_requests == 20
+    assert result.num_errors == 0
+    assert result.throughput > 0
+    assert result.p99_latency >= result.p50_latency > 0
+
+
+def test_run_load_test_counts_errors():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) % 2 == 0:
+            raise RuntimeError("boom")
+
+    result = PerformanceEval(
+        func=flaky, warmup_runs=0, concurrency=1, num_requests=10, monitoring=False
+    ).run_load_test()
+
+    assert result.num_requests == 10
+    assert result.error_rate == 0.5
+
+
+def test_run_load_test_for_duration():
+    result = PerformanceEval(
+        func=lambda: None, warmup_runs=0, concurrency=2, duration=0.05, monitoring=False
+    ).run_load_test()
+
+    assert result.duration >= 0.05
+    assert result.num_requests > 0
+
+
+def test_load_test_baseline(tmp_path):
+    baseline_file_path = tmp_path / "baseline.json"
+    evaluation = PerformanceEval(
+        func=lambda: None,
+        warmup_runs=0,
+        concurrency=1,
+        num_requests=10,
+        baseline_file_path=str(baseline_file_path),
+        monitoring=False,
+    )
+
+    # The first run stores the baseline
+    evaluation.run_load_test()
+    baseline = json.loads(baseline_file_path.read_text())
+    assert baseline["num_requests"] == 10
+
+    baseline_file_path.write_text(json.dumps({**baseline, "throughput": 1e12}))
+    with pytest.raises(EvalError):
+        evaluation.run_load_test()
+    # Regressions are only logged if fail_on_regression is not set
+    evaluation.run_load_test(fail_on_regression=False)
+
+
+@pytest.mark.asyncio
+async def test_arun_load_test_with_mock_model():
+    async def run_agent():
+        response = await get_agent().arun("What is the weather in Paris?")
+        assert response.content == "This is a mock response."
+
+    result = await PerformanceEval(
+        func=run_agent, warmup_runs=0, concurrency=4, num_requests=12, monitoring=False
+    ).arun_load_test()
+
+    assert result.num_requests == 12
+    assert result.num_errors == 0
+
+
+def test_mock_model_stream():
+    agent = Agent(model=MockModel(content="Streaming works", stream_chunk_size=4), telemetry=False)
+    chunks = [event.content for event in agent.run("Hello", stream=True)]
+
+    assert chunks == ["Stre", "amin", "g wo", "rks"]
+    assert agent.run_response.metrics["output_tokens"] == [2]
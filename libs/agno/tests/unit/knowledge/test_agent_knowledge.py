@@ -0,0 +1,265 @@
+from typing import Any, AsyncIterator, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.reader.base import Reader
+from agno.knowledge.agent import AgentKnowledge
+from agno.vectordb.base import VectorDb, content_hash
+
+
+class ListKnowledge(AgentKnowledge):
+    """Knowledge base over in-memory lists of documents"""
+
+    lists: List[List[Document]] = []
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        for document_list in self.lists:
+            yield document_list
+
+    @property
+    async def async_document_lists(self) -> AsyncIterator[List[Document]]:
+        for document_list in self.lists:
+            yield document_list
+
+
+class ContentReader(Reader):
+    """Reader of documents from their content"""
+
+    def read(self, obj: Any) -> List[Document]:
+        documents = [Document(name=f"doc-{obj[0]}", content=obj)]
+        if self.chunk:
+            return [chunk for document in documents for chunk in self.chunk_document(document)]
+        return documents
+
+    async def async_read(self, obj: Any) -> List[Document]:
+        return self.read(obj)
+
+
+class ReaderKnowledge(AgentKnowledge):
+    """Knowledge base reading contents with its reader"""
+
+    contents: List[str] = []
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        for content in self.contents:
+            yield self.reader.read(content)  # type: ignore
+
+    @property
+    async def async_document_lists(self) -> AsyncIterator[List[Document]]:
+        for content in self.contents:
+            yield await self.reader.async_read(content)  # type: ignore
+
+
+def make_lists(num_lists: int, docs_per_list: int) -> List[List[Document]]:
+    return [
+        [Document(content=f"doc {i}-{j}", meta_data={"chunk": j}) for j in range(docs_per_list)]
+        for i in range(num_lists)
+    ]
+
+
+@pytest.fixture
+def vector_db():
+    db = MagicMock(spec=VectorDb)
+    db.exists.return_value = True
+    db.doc_exists.return_value = False
+    db.existing_content_hashes.return_value = set()
+    db.async_existing_content_hashes.return_value = set()
+    db.upsert_available.return_value = True
+    return db
+
+
+def test_load_inserts_in_batches(vector_db):
+    """Test that documents across document lists are inserted in batches of load_batch_size"""
+    knowledge = ListKnowledge(vector_db=vector_db, lists=make_lists(5, 3), load_batch_size=4)
+    knowledge.load()
+
+    batch_sizes = [len(call.kwargs["documents"]) for call in vector_db.insert.call_args_list]
+    assert batch_sizes == [4, 4, 4, 3]
+    inserted = [doc.content for call in vector_db.insert.call_args_list for doc in call.kwargs["documents"]]
+    assert inserted == [doc.content for document_list in knowledge.lists for doc in document_list]
+    assert knowledge.valid_metadata_filters == {"chunk"}
+
+
+def test_load_passes_shared_meta_data_as_filters(vector_db):
+    """Test that each batch is written in one call, with the meta_data shared by its documents as filters"""
+    documents = [
+        Document(content="a", meta_data={"source": "x", "chunk": 1}),
+        Document(content="b", meta_data={"source": "x", "chunk": 2}),
+        Document(content="c", meta_data={"source": "y", "chunk": 1}),
+    ]
+    knowledge = ListKnowledge(vector_db=vector_db, lists=[documents], load_batch_size=2)
+    knowledge.load()
+
+    calls = [
+        ([doc.content for doc in call.kwargs["documents"]], call.kwargs["filters"])
+        for call in vector_db.insert.call_args_list
+    ]
+    assert calls == [(["a", "b"], {"source": "x"}), (["c"], {"source": "y", "chunk": 1})]
+
+    knowledge.load(upsert=True)
+    assert vector_db.upsert.call_args_list[0].kwargs["filters"] == {"source": "x"}
+
+
+def test_load_upserts_in_batches(vector_db):
+    """Test that upsert also writes whole batches"""
+    knowledge = ListKnowledge(vector_db=vector_db, lists=make_lists(2, 3), load_batch_size=10)
+    knowledge.load(upsert=True)
+
+    assert vector_db.upsert.call_count == 1
+    assert len(vector_db.upsert.call_args.kwargs["documents"]) == 6
+    vector_db.insert.assert_not_called()
+
+
+def test_load_propagates_reader_errors(vector_db):
+    """Test that an error while reading documents is raised from load"""
+
+    class FailingKnowledge(AgentKnowledge):
+        @property
+        def document_lists(self) -> Iterator[List[Document]]:
+            yield [Document(content="ok")]
+            raise RuntimeError("read failed")
+
+    knowledge = FailingKnowledge(vector_db=vector_db)
+    with pytest.raises(RuntimeError, match="read failed"):
+        knowledge.load()
+
+
+@pytest.mark.asyncio
+async def test_aload_inserts_in_batches(vector_db):
+    """Test that the async load writes the same batches as the sync load"""
+    knowledge = ListKnowledge(vector_db=vector_db, lists=make_lists(3, 3), load_batch_size=5)
+    await knowledge.aload(skip_existing=False)
+
+    batch_sizes = [len(call.kwargs["documents"]) for call in vector_db.async_insert.call_args_list]
+    assert batch_sizes == [5, 4]
+
+
+def test_filter_existing_documents_uses_bulk_lookup(vector_db):
+    """Test that existing documents are found with one bulk lookup and duplicates are dropped"""
+    documents = [Document(content="a"), Document(content="b"), Document(content="a"), Document(content="c")]
+    vector_db.existing_content_hashes.return_value = {content_hash(Document(content="b"))}
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    filtered = knowledge.filter_existing_documents(documents)
+
+    assert [doc.content for doc in filtered] == ["a", "c"]
+    vector_db.existing_content_hashes.assert_called_once()
+    assert sorted(vector_db.existing_content_hashes.call_args.args[0]) == sorted(
+        content_hash(Document(content=content)) for content in ["a", "b", "c"]
+    )
+    vector_db.doc_exists.assert_not_called()
+
+
+def test_filter_existing_documents_falls_back_to_doc_exists(vector_db):
+    """Test the per-document fallback for vector dbs without a bulk lookup"""
+    vector_db.existing_content_hashes.side_effect = NotImplementedError
+    vector_db.doc_exists.side_effect = lambda doc: doc.content == "b"
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    filtered = knowledge.filter_existing_documents(
+        [Document(content="a"), Document(content="b"), Document(content="a")]
+    )
+
+    assert [doc.content for doc in filtered] == ["a"]
+    assert vector_db.doc_exists.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_filter_existing_documents(vector_db):
+    """Test the async bulk lookup"""
+    vector_db.async_existing_content_hashes.return_value = {content_hash(Document(content="a"))}
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    filtered = await knowledge.async_filter_existing_documents([Document(content="a"), Document(content="b")])
+
+    assert [doc.content for doc in filtered] == ["b"]
+
+
+def make_reader_knowledge(vector_db, **kwargs) -> ReaderKnowledge:
+    contents = [" ".join(f"word{i}-{j}" for j in range(200)) for i in range(6)]
+    return ReaderKnowledge(
+        vector_db=vector_db,
+        reader=ContentReader(),
+        chunking_strategy=FixedSizeChunking(chunk_size=100),
+        contents=contents,
+        load_batch_size=1000,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("chunking_processes", [None, 2])
+def test_load_writes_chunked_documents_in_one_call_per_batch(vector_db, chunking_processes):
+    """Test that chunks, which all have different meta_data, are still written in batches of load_batch_size"""
+    knowledge = make_reader_knowledge(vector_db, chunking_processes=chunking_processes)
+    knowledge.load_batch_size = 50
+    knowledge.load(skip_existing=False)
+
+    batch_sizes = [len(call.kwargs["documents"]) for call in vector_db.insert.call_args_list]
+    num_chunks = sum(batch_sizes)
+    assert num_chunks > 50
+    assert batch_sizes == [50] * (num_chunks // 50) + ([num_chunks % 50] if num_chunks % 50 else [])
+    assert all(call.kwargs["filters"] == {} for call in vector_db.insert.call_args_list)
+
+
+def test_load_chunks_in_processes(vector_db):
+    """Test that chunking in processes loads the same chunks, in the same order, as chunking in the reader"""
+    expected = [
+        doc
+        for content in make_reader_knowledge(vector_db).contents
+        for doc in ContentReader(chunking_strategy=FixedSizeChunking(chunk_size=100)).read(content)
+    ]
+
+    knowledge = make_reader_knowledge(vector_db, chunking_processes=2, chunking_task_size=1, load_read_ahead=2)
+    knowledge.load(skip_existing=False)
+
+    inserted = [doc for call in vector_db.insert.call_args_list for doc in call.kwargs["documents"]]
+    assert [(doc.name, doc.content, doc.meta_data) for doc in inserted] == [
+        (doc.name, doc.content, doc.meta_data) for doc in expected
+    ]
+    assert len(inserted) > len(knowledge.contents)
+    assert knowledge.reader.chunk is True  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_aload_chunks_in_processes(vector_db):
+    """Test that the async load also chunks in processes"""
+    knowledge = make_reader_knowledge(vector_db, chunking_processes=2)
+    await knowledge.aload(skip_existing=False)
+
+    inserted = [doc for call in vector_db.async_insert.call_args_list for doc in call.kwargs["documents"]]
+    assert all(len(doc.content) <= 100 for doc in inserted)
+    assert [doc.meta_data["chunk"] for doc in inserted if doc.name == "doc-w"][:3] == [1, 2, 3]
+    assert knowledge.reader.chunk is True  # type: ignore
+
+
+def test_load_chunks_in_processes_does_not_change_the_reader(vector_db):
+    """Test that the reader, which may be shared by other knowledge bases, still chunks while loading"""
+    knowledge = make_reader_knowledge(vector_db, chunking_processes=2)
+    reader = knowledge.reader
+    chunked_while_loading = []
+    vector_db.insert.side_effect = lambda **kwargs: chunked_while_loading.append(
+        all(len(doc.content) <= 100 for doc in reader.read("x" * 300))  # type: ignore
+    )
+    knowledge.load(skip_existing=False)
+
+    assert chunked_while_loading and all(chunked_while_loading)
+    assert knowledge.reader is reader
+    assert reader.chunk is True  # type: ignore
+
+
+def test_load_chunks_in_reader_when_strategy_can_not_be_pickled(vector_db):
+    """Test that strategies which can not be sent to other processes are run by the reader"""
+
+    class LocalChunking(FixedSizeChunking):
+        pass
+
+    knowledge = make_reader_knowledge(vector_db, chunking_processes=2)
+    knowledge.reader.chunking_strategy = LocalChunking(chunk_size=100)  # type: ignore
+    knowledge.load(skip_existing=False)
+
+    assert all(len(doc.content) <= 100 for call in vector_db.insert.call_args_list for doc in call.kwargs["documents"])
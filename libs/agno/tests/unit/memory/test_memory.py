@@ -6,6 +6,7 @@ import pytest
 from agno.memory.v2 import MemoryManager, SessionSummarizer
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.memory import Memory
+from agno.memory.v2.runs import SessionRuns
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.models.message import Message
 from agno.models.openai.chat import OpenAIChat
@@ -759,3 +760,45 @@ def test_clear(memory_with_model, sample_user_memory):
     # Verify data is cleared
     assert memory_with_model.memories == {}
     assert memory_with_model.summaries == {}
+
+
+def test_session_runs_load_only_recent_runs(memory_with_model):
+    """Test that history only loads and deserializes the runs it needs from storage."""
+    session_id = "test_session"
+    stored_runs = [
+        RunResponse(
+            run_id=f"run-{i}",
+            session_id=session_id,
+            messages=[
+                Message(role="user", content=f"Question {i}", tool_calls=[{"id": f"call-{i}"}]),
+                Message(role="assistant", content=f"Answer {i}"),
+            ],
+        ).to_dict()
+        for i in range(50)
+    ]
+    loader = Mock(side_effect=lambda start, end: stored_runs[start:end])
+    memory_with_model.runs = {
+        session_id: SessionRuns(
+            runs=[None] * 48 + stored_runs[48:],
+            run_ids=[run["run_id"] for run in stored_runs],
+            loader=loader,
+            page_size=10,
+        )
+    }
+
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, last_n=2)
+    assert [m.content for m in messages] == ["Question 48", "Answer 48", "Question 49", "Answer 49"]
+    loader.assert_not_called()
+
+    # Tool calls are read from storage one page at a time
+    assert len(memory_with_model.get_tool_calls(session_id, num_calls=5)) == 5
+    loader.assert_called_once_with(38, 48)
+
+    # Replacing a run by run_id does not load the session
+    memory_with_model.add_run(session_id, RunResponse(run_id="run-0", session_id=session_id, content="Updated"))
+    assert loader.call_count == 1
+    assert memory_with_model.runs[session_id].to_dicts()[1] is None
+
+    # Walking the full session pages through storage
+    assert len(memory_with_model.get_messages_for_session(session_id)) == 98
+    assert memory_with_model.get_runs(session_id)[0].content == "Updated"
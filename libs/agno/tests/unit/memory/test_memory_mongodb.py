@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.memory.v2.db.mongodb import MongoMemoryDb
+from agno.memory.v2.db.schema import MemoryRow
+
+
+@pytest.fixture
+def mock_collection():
+    return MagicMock()
+
+
+@pytest.fixture
+def memory_db(mock_collection):
+    """Memory database with only a sync client, so the async methods run the sync methods in a thread"""
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = mock_collection
+    return MongoMemoryDb(client=client)
+
+
+@pytest.mark.asyncio
+async def test_async_methods_run_in_a_thread_without_async_client(memory_db, mock_collection):
+    assert memory_db.async_collection is None
+
+    mock_collection.find.return_value.sort.return_value = [{"_id": "x", "user_id": "u", "memory": {"memory": "m"}}]
+    memories = await memory_db.aread_memories(user_id="u")
+    assert [(m.user_id, m.memory) for m in memories] == [("u", {"memory": "m"})]
+    mock_collection.find.assert_called_once_with({"user_id": "u"})
+
+    mock_collection.find_one.return_value = None
+    await memory_db.aupsert_memory(MemoryRow(id="m1", user_id="u", memory={"memory": "m"}))
+    assert mock_collection.update_one.call_args.args[0] == {"id": "m1"}
+
+    mock_collection.delete_one.return_value.deleted_count = 1
+    await memory_db.adelete_memory("m1")
+    mock_collection.delete_one.assert_called_once_with({"id": "m1"})
@@ -0,0 +1,93 @@
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+from agno.models.aws import AwsBedrock
+from agno.models.clients import ClientRegistry, get_client_key, set_client_registry
+from agno.models.openai import OpenAIChat
+
+
+@pytest.fixture
+def registry():
+    registry = ClientRegistry()
+    set_client_registry(registry)
+    yield registry
+    registry.close()
+    set_client_registry(ClientRegistry())
+
+
+def test_client_key_depends_on_params():
+    assert get_client_key("openai", {"api_key": "a", "timeout": 1}) == get_client_key(
+        "openai", {"timeout": 1, "api_key": "a"}
+    )
+    assert get_client_key("openai", {"api_key": "a"}) != get_client_key("openai", {"api_key": "b"})
+    assert get_client_key("openai", {"api_key": "a"}) != get_client_key("groq", {"api_key": "a"})
+    # Credentials are not kept in the key
+    assert "secret" not in str(get_client_key("openai", {"api_key": "secret"}))
+
+
+def test_openai_clients_are_shared(registry):
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+    client = model.get_client()
+
+    assert model.get_client() is client
+    assert deepcopy(model).get_client() is client
+    assert OpenAIChat(id="gpt-4o-mini", api_key="test-key").get_client() is client
+    assert client._client is registry.get_http_client()
+
+    # Different credentials or endpoints get their own client, on the same connection pool
+    other_client = OpenAIChat(id="gpt-4o", api_key="other-key").get_client()
+    assert other_client is not client
+    assert other_client._client is client._client
+
+
+def test_async_clients_are_shared_per_event_loop(registry):
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+
+    async def get_clients():
+        return model.get_async_client(), deepcopy(model).get_async_client()
+
+    first_loop_clients = asyncio.run(get_clients())
+    assert first_loop_clients[0] is first_loop_clients[1]
+
+    # A new event loop gets new clients, as async connections can not move between loops
+    second_loop_clients = asyncio.run(get_clients())
+    assert second_loop_clients[0] is not first_loop_clients[0]
+    assert len(registry._loop_clients) == 1
+
+
+def test_close_clients(registry):
+    client = OpenAIChat(id="gpt-4o", api_key="test-key").get_client()
+    http_client = registry.get_http_client()
+    registry.close()
+
+    assert http_client.is_closed
+    assert OpenAIChat(id="gpt-4o", api_key="test-key").get_client() is not client
+
+    async def aclose():
+        OpenAIChat(id="gpt-4o", api_key="test-key").get_async_client()
+        async_http_client = registry.get_async_http_client()
+        await registry.aclose()
+        return async_http_client
+
+    assert asyncio.run(aclose()).is_closed
+
+
+def test_aws_bedrock_clients_are_shared(registry):
+    credentials = {"aws_region": "us-east-1", "aws_access_key_id": "key-id", "aws_secret_access_key": "secret"}
+    model = AwsBedrock(id="amazon.nova-lite-v1:0", **credentials)
+    client = model.get_client()
+
+    assert deepcopy(model).get_client() is client
+    assert AwsBedrock(id="amazon.nova-pro-v1:0", **credentials).get_client() is client
+    assert client.meta.config.max_pool_connections == registry.settings.max_keepalive_connections
+
+    # Other regions and credentials get their own client
+    assert (
+        AwsBedrock(id="amazon.nova-lite-v1:0", **{**credentials, "aws_region": "eu-west-1"}).get_client() is not client
+    )
+    assert (
+        AwsBedrock(id="amazon.nova-lite-v1:0", **{**credentials, "aws_secret_access_key": "other"}).get_client()
+        is not client
+    )
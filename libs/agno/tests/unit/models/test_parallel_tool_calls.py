@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.exceptions import StopAgentRun
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+class MockModel(Model):
+    def invoke(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def invoke_stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def parse_provider_response(self, response, **kwargs):
+        raise NotImplementedError
+
+    def parse_provider_response_delta(self, response):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def model() -> MockModel:
+    return MockModel(id="mock")
+
+
+def make_function_call(function: Function, call_id: str, **arguments) -> FunctionCall:
+    function.process_entrypoint()
+    return FunctionCall(function=function, arguments=arguments, call_id=call_id)
+
+
+def run(model: MockModel, function_calls: List[FunctionCall], **kwargs):
+    function_call_results: List[Message] = []
+    events = list(
+        model.run_function_calls(function_calls=function_calls, function_call_results=function_call_results, **kwargs)
+    )
+    return events, function_call_results
+
+
+def test_parallel_tool_calls_run_concurrently(model):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_others(value: str) -> str:
+        barrier.wait()
+        return value
+
+    function = Function.from_callable(wait_for_others)
+    function_calls = [make_function_call(function, f"call-{i}", value=str(i)) for i in range(3)]
+
+    events, results = run(model, function_calls, max_parallel_tool_calls=3)
+
+    # Results are added in the order the calls were requested
+    assert [r.tool_call_id for r in results] == ["call-0", "call-1", "call-2"]
+    assert [r.content for r in results] == ["0", "1", "2"]
+    completed = [e for e in events if e.event == ModelResponseEvent.tool_call_completed.value]
+    assert [e.tool_executions[0].tool_call_id for e in completed] == ["call-0", "call-1", "call-2"]
+
+
+def test_sequential_by_default(model):
+    active = []
+    max_active = []
+
+    def track(value: str) -> str:
+        active.append(value)
+        max_active.append(len(active))
+        time.sleep(0.01)
+        active.remove(value)
+        return value
+
+    function = Function.from_callable(track)
+    _, results = run(model, [make_function_call(function, f"call-{i}", value=str(i)) for i in range(3)])
+
+    assert [r.content for r in results] == ["0", "1", "2"]
+    assert max(max_active) == 1
+
+
+def test_parallel_unsafe_functions_run_on_calling_thread(model):
+    thread_ids = {}
+
+    def unsafe(value: str) -> str:
+        thread_ids[value] = threading.get_ident()
+        return value
+
+    def safe(value: str) -> str:
+        thread_ids[value] = threading.get_ident()
+        return value
+
+    unsafe_function = Function.from_callable(unsafe)
+    unsafe_function.parallel_safe = False
+    safe_function = Function.from_callable(safe)
+    function_calls = [
+        make_function_call(unsafe_function, "call-0", value="a"),
+        make_function_call(safe_function, "call-1", value="b"),
+        make_function_call(unsafe_function, "call-2", value="c"),
+    ]
+
+    _, results = run(model, function_calls, max_parallel_tool_calls=4)
+
+    assert [r.content for r in results] == ["a", "b", "c"]
+    assert thread_ids["a"] == thread_ids["c"] == threading.get_ident()
+    assert thread_ids["b"] != threading.get_ident()
+
+
+def test_parallel_preserves_pause_and_limit(model):
+    def echo(value: str) -> str:
+        return value
+
+    function = Function.from_callable(echo)
+    confirm_function = Function.from_callable(echo, name="confirm_echo")
+    confirm_function.requires_confirmation = True
+    function_calls = [
+        make_function_call(function, "call-0", value="0"),
+        make_function_call(confirm_function, "call-1", value="1"),
+        make_function_call(function, "call-2", value="2"),
+        make_function_call(function, "call-3", value="3"),
+    ]
+
+    events, results = run(model, function_calls, max_parallel_tool_calls=4, function_call_limit=3)
+
+    paused = [
+        e for e in events if isinstance(e, ModelResponse) and e.event == ModelResponseEvent.tool_call_paused.value
+    ]
+    assert [e.tool_executions[0].tool_call_id for e in paused] == ["call-1"]
+    assert [(r.tool_call_id, r.tool_call_error) for r in results] == [
+        ("call-3", True),
+        ("call-0", False),
+        ("call-2", False),
+    ]
+
+
+def test_parallel_agent_run_exception_adds_messages(model):
+    def stop(value: str) -> str:
+        raise StopAgentRun("stop", agent_message="Stopping")
+
+    function = Function.from_callable(stop)
+    _, results = run(model, [make_function_call(function, "call-0", value="0")], max_parallel_tool_calls=2)
+
+    assert results[0].tool_call_error is True
+    assert results[-1].content == "Stopping"
+    assert results[-1].stop_after_tool_call is True
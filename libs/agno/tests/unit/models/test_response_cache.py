@@ -0,0 +1,191 @@
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.embedder.base import Embedder
+from agno.models.cache import ResponseCache
+from agno.models.message import Message
+from agno.models.mock import MockModel
+from agno.utils.cache import SqliteCache
+
+
+@dataclass
+class CountingModel(MockModel):
+    def __post_init__(self):
+        super().__post_init__()
+        # Not a dataclass field, so it is not part of the cache key
+        self.num_calls = 0
+
+    def invoke(self, *args, **kwargs):
+        self.num_calls += 1
+        return super().invoke(*args, **kwargs)
+
+    async def ainvoke(self, *args, **kwargs):
+        self.num_calls += 1
+        return await super().ainvoke(*args, **kwargs)
+
+    def invoke_stream(self, *args, **kwargs):
+        self.num_calls += 1
+        yield from super().invoke_stream(*args, **kwargs)
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds text by the keywords it contains"""
+
+    dimensions: Optional[int] = 2
+
+    def get_embedding(self, text: str) -> List[float]:
+        text = text.lower()
+        return [float("weather" in text), float("paris" in text)]
+
+    def get_embedding_and_usage(self, text: str):
+        return self.get_embedding(text), None
+
+
+def user_messages(content: str) -> List[Message]:
+    return [Message(role="system", content="You are helpful."), Message(role="user", content=content)]
+
+
+def test_exact_match_skips_model_call():
+    cache = ResponseCache()
+    model = CountingModel(content="Hello!", response_cache=cache)
+
+    first = model.response(messages=user_messages("Hi"))
+    second = model.response(messages=user_messages("Hi"))
+
+    assert first.content == second.content == "Hello!"
+    assert model.num_calls == 1
+    assert cache.get_stats()["hits"] == 1
+
+    model.response(messages=user_messages("Hi there"))
+    assert model.num_calls == 2
+
+
+def test_key_includes_model_settings():
+    cache = ResponseCache()
+    CountingModel(content="A", response_cache=cache).response(messages=user_messages("Hi"))
+
+    model = CountingModel(id="other-model", content="B", response_cache=cache)
+    assert model.response(messages=user_messages("Hi")).content == "B"
+    assert model.num_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_response_uses_cache():
+    model = CountingModel(content="Hello!", response_cache=ResponseCache())
+
+    model.response(messages=user_messages("Hi"))
+    response = await model.aresponse(messages=user_messages("Hi"))
+
+    assert response.content == "Hello!"
+    assert model.num_calls == 1
+
+
+def test_stream_replays_cached_response():
+    model = CountingModel(
+        content="A streamed response that is cached", response_cache=ResponseCache(stream_chunk_size=4)
+    )
+
+    first = "".join(r.content for r in model.response_stream(messages=user_messages("Hi")) if r.content)
+    messages = user_messages("Hi")
+    chunks = [r.content for r in model.response_stream(messages=messages) if r.content]
+
+    assert first == "".join(chunks) == "A streamed response that is cached"
+    assert len(chunks) > 1
+    assert model.num_calls == 1
+    assert messages[-1].role == "assistant"
+    assert messages[-1].content == first
+
+
+def test_cached_tool_calls_are_executed():
+    calls = []
+
+    def get_weather(city: str) -> str:
+        """Get the weather of a city"""
+        calls.append(city)
+        return "Sunny"
+
+    model = CountingModel(
+        content="It is sunny.",
+        tool_calls=[{"name": "get_weather", "arguments": {"city": "Paris"}}],
+        response_cache=ResponseCache(),
+    )
+    agent = Agent(model=model, tools=[get_weather])
+
+    assert agent.run("Weather in Paris?").content == "It is sunny."
+    assert agent.run("Weather in Paris?").content == "It is sunny."
+
+    # The tool is called on every run, the model only on the first one
+    assert calls == ["Paris", "Paris"]
+    assert model.num_calls == 2
+
+
+def test_structured_output_is_parsed_from_cache():
+    class Answer(BaseModel):
+        value: int
+
+    @dataclass
+    class StructuredModel(CountingModel):
+        supports_native_structured_outputs: bool = True
+
+        def parse_provider_response(self, response, response_format=None, **kwargs):
+            response.parsed = response_format.model_validate_json(response.content)
+            return response
+
+    model = StructuredModel(content='{"value": 42}', response_cache=ResponseCache())
+    model.response(messages=user_messages("Answer?"), response_format=Answer)
+    response = model.response(messages=user_messages("Answer?"), response_format=Answer)
+
+    assert response.parsed == Answer(value=42)
+    assert model.num_calls == 1
+
+
+def test_ttl_expires_responses():
+    model = CountingModel(response_cache=ResponseCache(ttl=0.05))
+
+    model.response(messages=user_messages("Hi"))
+    time.sleep(0.1)
+    model.response(messages=user_messages("Hi"))
+
+    assert model.num_calls == 2
+
+
+def test_semantic_match():
+    model = CountingModel(
+        content="It is sunny in Paris.",
+        response_cache=ResponseCache(mode="semantic", embedder=KeywordEmbedder(), similarity_threshold=0.9),
+    )
+
+    model.response(messages=user_messages("What is the weather in Paris?"))
+    response = model.response(messages=user_messages("Paris weather today"))
+    assert response.content == "It is sunny in Paris."
+    assert model.num_calls == 1
+
+    # Unrelated questions and different contexts are not matched
+    model.response(messages=user_messages("What is the capital of France?"))
+    model.response(
+        messages=[Message(role="system", content="Be brief."), Message(role="user", content="Paris weather")]
+    )
+    assert model.num_calls == 3
+
+
+def test_semantic_mode_requires_embedder():
+    with pytest.raises(ValueError):
+        ResponseCache(mode="semantic")
+
+
+def test_sqlite_backend_is_shared(tmp_path):
+    db_file = tmp_path / "responses.db"
+    model = CountingModel(response_cache=ResponseCache(backend=SqliteCache(db_file)))
+    model.response(messages=user_messages("Hi"))
+
+    other_model = CountingModel(response_cache=ResponseCache(backend=SqliteCache(db_file)))
+    other_model.response(messages=user_messages("Hi"))
+
+    assert model.num_calls == 1
+    assert other_model.num_calls == 0
@@ -0,0 +1,74 @@
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.app.playground.operator import NEXT_CURSOR_HEADER, get_session_list_fields, get_session_title_from_summary
+from agno.models.mock import MockModel
+from agno.playground import Playground
+from agno.storage.session.agent import AgentSession
+from agno.storage.session.team import TeamSession
+from agno.storage.session.workflow import WorkflowSession
+from agno.storage.sqlite import SqliteStorage
+
+
+def get_member_run() -> Dict[str, Any]:
+    return {"agent_id": "member", "session_id": "session_1", "messages": [{"role": "system", "content": "You help"}]}
+
+
+def get_team_run() -> Dict[str, Any]:
+    return {"team_id": "team_1", "session_id": "session_1", "messages": [{"role": "user", "content": "Plan a trip"}]}
+
+
+def test_team_session_title_from_first_run_with_user_message():
+    storage = SqliteStorage(table_name="team_sessions", mode="team")
+    storage.upsert(
+        TeamSession(session_id="session_1", team_id="team_1", memory={"runs": [get_member_run(), get_team_run()]})
+    )
+    storage.upsert(TeamSession(session_id="session_2", team_id="team_1", memory={"runs": [get_member_run()]}))
+    storage.upsert(
+        TeamSession(session_id="session_3", team_id="team_1", session_data={"session_name": "Renamed"}, memory={})
+    )
+
+    with patch.object(storage, "read") as read:
+        summaries = storage.list_sessions(entity_id="team_1", fields=get_session_list_fields("team")).sessions
+        titles = {s["session_id"]: get_session_title_from_summary(s, mode="team") for s in summaries}
+    read.assert_not_called()
+    assert titles == {"session_1": "Plan a trip", "session_2": "Unnamed session", "session_3": "Renamed"}
+
+
+def test_workflow_session_title_from_first_run():
+    storage = SqliteStorage(table_name="workflow_sessions", mode="workflow")
+    storage.upsert(
+        WorkflowSession(
+            session_id="session_1", workflow_id="workflow_1", memory={"runs": [{"content": "Report\nBody"}]}
+        )
+    )
+
+    summaries = storage.list_sessions(fields=get_session_list_fields("workflow")).sessions
+    assert get_session_title_from_summary(summaries[0], mode="workflow") == "Report"
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_agent_sessions_endpoint_pagination(use_async: bool):
+    storage = SqliteStorage(table_name="agent_sessions", mode="agent")
+    for i in range(3):
+        storage.upsert(AgentSession(session_id=f"session_{i}", agent_id="agent_1", memory={"runs": []}))
+    agent = Agent(agent_id="agent_1", model=MockModel(), storage=storage, telemetry=False)
+    client = TestClient(Playground(agents=[agent]).get_app(use_async=use_async))
+
+    session_ids = []
+    response = client.get("/v1/playground/agents/agent_1/sessions", params={"limit": 2})
+    session_ids += [session["session_id"] for session in response.json()]
+    assert len(response.json()) == 2
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+
+    response = client.get("/v1/playground/agents/agent_1/sessions", params={"limit": 2, "cursor": cursor})
+    session_ids += [session["session_id"] for session in response.json()]
+    assert NEXT_CURSOR_HEADER not in response.headers
+    assert sorted(session_ids) == ["session_0", "session_1", "session_2"]
+
+    response = client.get("/v1/playground/agents/agent_1/sessions", params={"cursor": "invalid"})
+    assert response.status_code == 400
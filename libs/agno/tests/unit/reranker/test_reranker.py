@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from copy import deepcopy
+from typing import List, Optional
+
+import pytest
+
+from agno.document import Document
+from agno.reranker.base import Reranker
+from agno.reranker.batch import PairBatcher
+
+
+class WordOverlapReranker(Reranker):
+    """Scores documents by the number of query words they contain"""
+
+    num_scored: int = 0
+
+    def _score(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+        self.num_scored += len(documents)
+        words = set(query.lower().split())
+        return [float(len(words & set(doc.content.lower().split()))) for doc in documents]
+
+
+def get_documents() -> List[Document]:
+    return [
+        Document(content="the cat sat"),
+        Document(content="a dog and a cat sat on the mat"),
+        Document(content="nothing relevant"),
+        Document(content="the mat"),
+    ]
+
+
+def test_rerank_orders_by_score():
+    reranker = WordOverlapReranker()
+    reranked = reranker.rerank(query="cat sat mat", documents=get_documents())
+    assert [doc.content for doc in reranked] == [
+        "a dog and a cat sat on the mat",
+        "the cat sat",
+        "the mat",
+        "nothing relevant",
+    ]
+    assert reranked[0].reranking_score == 3.0
+
+
+def test_top_n_and_max_candidates():
+    reranker = WordOverlapReranker(top_n=1, max_candidates=2)
+    reranked = reranker.rerank(query="cat sat mat", documents=get_documents())
+    assert [doc.content for doc in reranked] == ["a dog and a cat sat on the mat"]
+    # Only the first max_candidates documents are scored
+    assert reranker.num_scored == 2
+
+
+def test_scores_are_cached():
+    reranker = WordOverlapReranker()
+    reranker.rerank(query="cat sat mat", documents=get_documents())
+    assert reranker.num_scored == 4
+
+    # Same query and content, so nothing is scored again
+    reranked = reranker.rerank(query="cat sat mat", documents=get_documents() + [Document(content="mat mat")])
+    assert reranker.num_scored == 5
+    assert len(reranked) == 5
+    assert reranker.score_cache.get_stats()["hits"] == 4  # type: ignore
+
+    # Copies share the cache
+    copied = deepcopy(reranker)
+    assert copied.score_cache is reranker.score_cache
+
+    # A different query is scored again
+    reranker.rerank(query="dog", documents=get_documents())
+    assert reranker.num_scored == 9
+
+
+def test_score_cache_can_be_disabled():
+    reranker = WordOverlapReranker(score_cache_size=0)
+    reranker.rerank(query="cat", documents=get_documents())
+    reranker.rerank(query="cat", documents=get_documents())
+    assert reranker.score_cache is None
+    assert reranker.num_scored == 8
+
+
+def test_rerank_errors_return_original_documents():
+    class FailingReranker(Reranker):
+        def _score(self, query: str, documents: List[Document]) -> List[Optional[float]]:
+            raise RuntimeError("model unavailable")
+
+    documents = get_documents()
+    assert FailingReranker().rerank(query="cat", documents=documents) is documents
+
+
+@pytest.mark.asyncio
+async def test_arerank():
+    reranker = WordOverlapReranker(top_n=2)
+    results = await asyncio.gather(
+        reranker.arerank(query="cat sat", documents=get_documents()),
+        reranker.arerank(query="mat", documents=get_documents()),
+    )
+    assert [doc.content for doc in results[0]] == ["the cat sat", "a dog and a cat sat on the mat"]
+    assert results[1][0].reranking_score == 1.0
+
+
+def test_pair_batcher_batches_concurrent_calls():
+    batches: List[int] = []
+
+    def score_pairs(pairs):
+        batches.append(len(pairs))
+        return [float(len(document)) for _, document in pairs]
+
+    batcher = PairBatcher(score_pairs, max_wait=0.5, max_batch_pairs=6)
+    results = {}
+
+    def score(query: str):
+        results[query] = batcher.score([(query, "a"), (query, "bb"), (query, "ccc")])
+
+    threads = [threading.Thread(target=score, args=(f"query-{i}",)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Both calls were scored in one batch of 6 pairs, without waiting for the timeout
+    assert batches == [6]
+    assert results["query-0"] == [1.0, 2.0, 3.0]
+    assert results["query-1"] == [1.0, 2.0, 3.0]
+
+
+def test_pair_batcher_propagates_errors():
+    def score_pairs(pairs):
+        raise ValueError("bad batch")
+
+    batcher = PairBatcher(score_pairs)
+    with pytest.raises(ValueError):
+        batcher.score([("query", "document")])
+    assert batcher.score([]) == []
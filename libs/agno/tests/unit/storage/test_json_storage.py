@@ -174,3 +174,36 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_list_sessions(agent_storage: JsonStorage, temp_dir: Path):
+    for i in range(4):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="user-1" if i < 3 else "user-2",
+                memory={"runs": [{"content": f"response {i}"}]},
+                created_at=1000 + i,
+            )
+        )
+    assert (temp_dir / ".sessions_index").exists()
+
+    page = agent_storage.list_sessions(user_id="user-1", limit=2, fields=["session_id", "first_run"])
+    assert [s["session_id"] for s in page.sessions] == ["session-2", "session-1"]
+    assert page.sessions[0]["first_run"] == {"content": "response 2"}
+
+    page = agent_storage.list_sessions(user_id="user-1", limit=2, cursor=page.next_cursor)
+    assert [s["session_id"] for s in page.sessions] == ["session-0"]
+    assert page.next_cursor is None
+
+    # Deleted sessions are removed from the index
+    agent_storage.delete_session("session-0")
+    assert [s["session_id"] for s in agent_storage.list_sessions(user_id="user-1").sessions] == [
+        "session-2",
+        "session-1",
+    ]
+
+    # The index is rebuilt from the session files if it is missing
+    (temp_dir / ".sessions_index").unlink()
+    assert len(JsonStorage(dir_path=temp_dir).list_sessions().sessions) == 3
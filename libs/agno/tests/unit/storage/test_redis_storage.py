@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 from unittest.mock import ANY, MagicMock, patch
 from uuid import uuid4
 
@@ -11,6 +11,46 @@ from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 
 
+class MockPipeline:
+    """Queues commands and runs them on the mock Redis client on execute.
+    After watch and until multi, commands run immediately.
+    Execute fails with a WatchError while the client has `conflicts` left, like when a watched key was written."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands: List[Tuple[str, tuple, dict]] = []
+        self.watching = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.commands, self.watching = [], False
+
+    def __getattr__(self, name):
+        if self.watching:
+            return getattr(self.client, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def watch(self, *keys):
+        self.watching = True
+
+    def multi(self):
+        self.watching = False
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        if self.client.conflicts:
+            self.client.conflicts -= 1
+            raise redis.WatchError("Watched variable changed.")
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+
 @pytest.fixture
 def mock_redis_client():
     """Mock Redis client with in-memory storage for testing."""
@@ -19,11 +59,13 @@ def mock_redis_client():
         client = MagicMock()
 
         # Create an in-memory store to simulate Redis
-        mock_data: Dict[str, str] = {}
+        mock_data: Dict[str, Any] = {}
 
         # Mock Redis client methods
         client.get.side_effect = lambda key: mock_data.get(key)
-        client.set.side_effect = lambda key, value: mock_data.update({key: value})
+        client.set.side_effect = lambda key, value, ex=None: mock_data.update({key: value})
+        client.mget.side_effect = lambda keys: [mock_data.get(key) for key in keys]
+        client.exists.side_effect = lambda key: int(key in mock_data)
 
         # Make delete actually work correctly
         def mock_delete(key):
@@ -36,12 +78,39 @@ def mock_redis_client():
         client.ping.return_value = True
 
         # Mock scan_iter to return keys
-        client.scan_iter.side_effect = lambda match: [
-            k for k in mock_data.keys() if k.startswith(match.replace("*", ""))
+        client.scan_iter.side_effect = lambda match, count=None: [
+            k for k in list(mock_data.keys()) if k.startswith(match.replace("*", ""))
         ]
 
+        # Mock hashes and sorted sets
+        client.hgetall.side_effect = lambda key: dict(mock_data.get(key, {}))
+        client.hset.side_effect = lambda key, mapping: mock_data.setdefault(key, {}).update(
+            {k: str(v) for k, v in mapping.items()}
+        )
+        client.zadd.side_effect = lambda key, mapping: mock_data.setdefault(key, {}).update(mapping)
+
+        def mock_zrem(key, *members):
+            for member in members:
+                mock_data.get(key, {}).pop(member, None)
+
+        def mock_zrevrange_entries(key):
+            # Ordered by score, then member, descending
+            return sorted(((m, float(s)) for m, s in mock_data.get(key, {}).items()), key=lambda e: (e[1], e[0]))[::-1]
+
+        def mock_zrevrangebyscore(key, max, min, start=0, num=None, withscores=False):
+            entries = [e for e in mock_zrevrange_entries(key) if e[1] <= float(max)]
+            entries = entries[start:] if num is None else entries[start : start + num]
+            return entries if withscores else [m for m, _ in entries]
+
+        client.zrem.side_effect = mock_zrem
+        client.zrevrange.side_effect = lambda key, start, end: [m for m, _ in mock_zrevrange_entries(key)]
+        client.zrevrangebyscore.side_effect = mock_zrevrangebyscore
+        client.pipeline.side_effect = lambda transaction=True: MockPipeline(client)
+        client.conflicts = 0
+
         # Return the mock Redis instance when Redis.Redis() is called
         mock_redis.return_value = client
+        client.mock_data = mock_data
         yield client
 
 
@@ -429,3 +498,98 @@ def test_error_handling_with_uuid(agent_storage, mock_redis_client):
     mock_redis_client.get.return_value = "invalid json"
     result = agent_storage.read(str(uuid4()))
     assert result is None
+
+
+def test_sessions_are_listed_from_indexes(agent_storage, mock_redis_client):
+    """Test that sessions are listed from the indexes, without scanning the keyspace."""
+    for i in range(4):
+        session = AgentSession(
+            session_id=f"session-{i}",
+            agent_id="agent-1" if i < 2 else "agent-2",
+            user_id="user-1" if i % 2 == 0 else "user-2",
+            created_at=1000 + i,
+        )
+        agent_storage.upsert(session)
+
+    # Sessions upserted before the first listing are indexed once
+    assert [s.session_id for s in agent_storage.get_all_sessions()] == [f"session-{i}" for i in (3, 2, 1, 0)]
+    mock_redis_client.scan_iter.reset_mock()
+
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["session-2", "session-0"]
+    assert agent_storage.get_all_session_ids(entity_id="agent-1") == ["session-1", "session-0"]
+    assert agent_storage.get_all_session_ids(user_id="user-1", entity_id="agent-2") == ["session-2"]
+    recent = agent_storage.get_recent_sessions(user_id="user-2", limit=1)
+    assert [s.session_id for s in recent] == ["session-3"]
+    mock_redis_client.scan_iter.assert_not_called()
+
+
+def test_indexes_follow_upserts_and_deletes(agent_storage, mock_redis_client):
+    """Test that upsert moves a session between indexes and delete removes it from them."""
+    session = AgentSession(session_id="session-1", agent_id="agent-1", user_id="user-1")
+    agent_storage.upsert(session)
+    created_at = agent_storage.read("session-1").created_at
+    assert created_at is not None
+
+    session.user_id = "user-2"
+    agent_storage.upsert(session)
+    assert agent_storage.get_all_session_ids(user_id="user-1") == []
+    assert agent_storage.get_all_session_ids(user_id="user-2") == ["session-1"]
+    # The created_at of the session is kept on update
+    assert agent_storage.read("session-1").created_at == created_at
+
+    agent_storage.delete_session("session-1")
+    assert agent_storage.get_all_session_ids() == []
+    assert agent_storage.get_all_session_ids(entity_id="agent-1") == []
+    assert not any(key.startswith("test_agent_index:session:") for key in mock_redis_client.mock_data)
+
+
+def test_upsert_is_retried_when_the_session_is_written_concurrently(agent_storage, mock_redis_client):
+    """Test that upsert reads the index metadata again when the session changed before the transaction ran."""
+    agent_storage.upsert(AgentSession(session_id="session-1", agent_id="agent-1", user_id="user-1"))
+
+    mock_redis_client.hgetall.reset_mock()
+    mock_redis_client.conflicts = 1
+    assert agent_storage.upsert(AgentSession(session_id="session-1", agent_id="agent-1", user_id="user-2"))
+    assert mock_redis_client.hgetall.call_count == 2
+    assert agent_storage.get_all_session_ids(user_id="user-1") == []
+    assert agent_storage.get_all_session_ids(user_id="user-2") == ["session-1"]
+
+
+def test_expired_sessions_are_removed_from_indexes(agent_storage, mock_redis_client):
+    """Test that sessions whose key expired are skipped and removed from the index."""
+    for i in range(3):
+        agent_storage.upsert(AgentSession(session_id=f"session-{i}", agent_id="agent-1", created_at=1000 + i))
+    # Simulate the expiry of a session key
+    del mock_redis_client.mock_data["test_agent:session-1"]
+
+    recent = agent_storage.get_recent_sessions(limit=2)
+    assert [s.session_id for s in recent] == ["session-2", "session-0"]
+    assert "session-1" not in mock_redis_client.mock_data["test_agent_index:all"]
+
+
+def test_list_sessions(agent_storage):
+    """Test listing session summaries in pages with a cursor."""
+    for i in range(5):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1",
+                user_id="user-1",
+                # Two sessions share a created_at, they are ordered by session_id
+                created_at=1000 + min(i, 3),
+                memory={"runs": [{"message": {"content": f"hello {i}"}}]},
+            )
+        )
+
+    page = agent_storage.list_sessions(user_id="user-1", limit=2, fields=["first_run"])
+    assert [s["session_id"] for s in page.sessions] == ["session-4", "session-3"]
+    assert page.sessions[0]["first_run"] == {"message": {"content": "hello 4"}}
+    assert page.next_cursor is not None
+
+    page = agent_storage.list_sessions(user_id="user-1", limit=2, cursor=page.next_cursor)
+    assert [s["session_id"] for s in page.sessions] == ["session-2", "session-1"]
+    assert page.sessions[0]["entity_id"] == "agent-1"
+
+    page = agent_storage.list_sessions(user_id="user-1", limit=2, cursor=page.next_cursor)
+    assert [s["session_id"] for s in page.sessions] == ["session-0"]
+    assert page.next_cursor is None
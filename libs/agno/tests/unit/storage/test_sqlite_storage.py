@@ -1,11 +1,17 @@
 import os
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event, text
 
+from agno.agent import Agent
+from agno.models.mock import MockModel
+from agno.storage.runs import get_changed_runs
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.storage.sqlite import SqliteStorage
 
@@ -193,3 +199,221 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_agent_storage_separate_runs(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", separate_runs=True)
+    storage.create()
+    assert storage.runs_table is not None
+    assert storage.table_exists(storage.runs_table.name)
+
+    runs = [{"run_id": f"run-{i}", "content": f"response {i}"} for i in range(3)]
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs, "key": "value"})
+    storage.upsert(session)
+
+    # Runs are not stored in the session row
+    with storage.SqlSession() as sess:
+        row = sess.execute(storage.table.select()).fetchone()
+        assert row.memory == {"key": "value"}
+        run_rows = sess.execute(storage.runs_table.select().order_by(storage.runs_table.c.run_index)).fetchall()
+        assert [r.run_id for r in run_rows] == ["run-0", "run-1", "run-2"]
+        first_updated_at = {r.run_index: r.updated_at for r in run_rows}
+
+    # Runs are reassembled on read
+    read_session = storage.read("test-session")
+    assert read_session is not None
+    assert read_session.memory == {"key": "value", "runs": runs}
+    assert storage.get_all_sessions()[0].memory["runs"] == runs
+
+    # Only the new run is written on the next upsert
+    runs = runs + [{"run_id": "run-3", "content": "response 3"}]
+    session.memory = {"runs": runs, "key": "value"}
+    with storage.SqlSession() as sess:
+        existing = {r.run_index: r.run_hash for r in sess.execute(storage.runs_table.select())}
+    assert [r["run_index"] for r in get_changed_runs("test-session", runs, existing)] == [3]
+    storage.upsert(session)
+    read_session = storage.read("test-session")
+    assert read_session is not None
+    assert read_session.memory["runs"] == runs
+    with storage.SqlSession() as sess:
+        run_rows = sess.execute(storage.runs_table.select()).fetchall()
+        assert all(first_updated_at[r.run_index] == r.updated_at for r in run_rows if r.run_index < 3)
+
+    # Runs removed from memory are removed from storage
+    session.memory = {"runs": runs[:1], "key": "value"}
+    storage.upsert(session)
+    read_session = storage.read("test-session")
+    assert read_session is not None
+    assert read_session.memory["runs"] == runs[:1]
+
+    # Deleting the session deletes its runs
+    storage.delete_session("test-session")
+    assert storage.read("test-session") is None
+    with storage.SqlSession() as sess:
+        assert sess.execute(storage.runs_table.select()).fetchall() == []
+
+
+def test_upsert_returns_session_without_reading_it_back(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", separate_runs=True)
+    storage.create()
+
+    runs = [{"run_id": f"run-{i}", "content": f"response {i}"} for i in range(3)]
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs})
+    with patch.object(storage, "read") as read:
+        upserted_session = storage.upsert(session)
+    read.assert_not_called()
+    assert upserted_session is not None
+    assert upserted_session.memory == {"runs": runs}
+    assert upserted_session.created_at is not None
+    assert upserted_session.created_at == storage.read("test-session").created_at
+
+    # The run hashes of the last upsert are kept, so the stored hashes are not read again
+    session.memory = {"runs": runs + [{"run_id": "run-3", "content": "response 3"}]}
+    statements: List[str] = []
+    listen = event.listens_for(storage.db_engine, "before_cursor_execute")
+    listen(lambda conn, cursor, statement, *args: statements.append(statement))
+    storage.upsert(session)
+    assert not any("run_hash" in statement and statement.startswith("SELECT") for statement in statements)
+    assert [run["run_id"] for run in storage.read("test-session").memory["runs"]] == [f"run-{i}" for i in range(4)]
+
+    # Deleting the session forgets its run hashes, so all runs are written again
+    storage.delete_session("test-session")
+    storage.upsert(session)
+    assert len(storage.read("test-session").memory["runs"]) == 4
+
+
+def test_agent_storage_read_last_n_runs(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", separate_runs=True)
+    storage.create()
+
+    runs = [{"run_id": f"run-{i}", "content": f"response {i}"} for i in range(5)]
+    storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs}))
+
+    # Only the last runs are loaded, older runs are placeholders
+    read_session = storage.read("test-session", last_n_runs=2)
+    assert read_session is not None
+    assert read_session.memory["runs"] == [None, None, None, runs[3], runs[4]]
+    assert read_session.memory["run_ids"] == [f"run-{i}" for i in range(5)]
+    assert storage.read_runs("test-session", 1, 3) == runs[1:3]
+
+    # Placeholders are left unchanged on upsert, and stay unloaded in the returned session
+    new_run = {"run_id": "run-5", "content": "response 5"}
+    read_session.memory["runs"] = read_session.memory["runs"] + [new_run]
+    upserted_session = storage.upsert(read_session)
+    assert upserted_session is not None
+    assert upserted_session.memory["runs"] == [None, None, None, runs[3], runs[4], new_run]
+    assert upserted_session.memory["run_ids"] == [f"run-{i}" for i in range(6)]
+    full_session = storage.read("test-session")
+    assert full_session is not None
+    assert full_session.memory["runs"] == runs + [new_run]
+    assert "run_ids" not in full_session.memory
+
+
+def test_list_sessions_creates_missing_indexes(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    storage.create()
+    index_names = ["idx_agent_sessions_user_id_created_at", "idx_agent_sessions_agent_id_created_at"]
+
+    def get_index_names(storage: SqliteStorage) -> List[str]:
+        with storage.SqlSession() as sess:
+            rows = sess.execute(text("SELECT name FROM sqlite_master WHERE type='index'")).fetchall()
+        return [row.name for row in rows if row.name in index_names]
+
+    # A table created before the indexes were added
+    with storage.SqlSession() as sess, sess.begin():
+        for index_name in index_names:
+            sess.execute(text(f"DROP INDEX {index_name}"))
+    assert get_index_names(storage) == []
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    storage.list_sessions()
+    assert sorted(get_index_names(storage)) == sorted(index_names)
+
+
+@pytest.mark.parametrize("separate_runs", [False, True])
+def test_list_sessions(temp_db_path: Path, separate_runs: bool):
+    storage = SqliteStorage(
+        table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", separate_runs=separate_runs
+    )
+    storage.create()
+    for i in range(5):
+        storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 4 else "agent-2",
+                user_id="user-1",
+                memory={"runs": [{"run_id": f"run-{i}-{j}", "content": f"response {j}"} for j in range(3)]},
+                session_data={"session_name": f"Session {i}"},
+            )
+        )
+
+    # Sessions created in the same second are ordered by session_id
+    page = storage.list_sessions(user_id="user-1", entity_id="agent-1", limit=3, fields=["session_id", "first_run"])
+    assert [s["session_id"] for s in page.sessions] == ["session-3", "session-2", "session-1"]
+    assert page.sessions[0]["first_run"] == {"run_id": "run-3-0", "content": "response 0"}
+    assert "session_data" not in page.sessions[0]
+    assert page.next_cursor is not None
+
+    page = storage.list_sessions(user_id="user-1", entity_id="agent-1", limit=3, cursor=page.next_cursor)
+    assert [s["session_id"] for s in page.sessions] == ["session-0"]
+    assert page.sessions[0]["entity_id"] == "agent-1"
+    assert page.sessions[0]["session_data"] == {"session_name": "Session 0"}
+    assert page.next_cursor is None
+
+    assert len(storage.list_sessions().sessions) == 5
+    assert storage.list_sessions(user_id="user-2").sessions == []
+
+    with pytest.raises(ValueError):
+        storage.list_sessions(fields=["memory"])
+
+
+@pytest.mark.parametrize("separate_runs", [False, True])
+def test_list_sessions_title_run(temp_db_path: Path, separate_runs: bool):
+    storage = SqliteStorage(
+        table_name="team_sessions", db_file=str(temp_db_path), mode="team", separate_runs=separate_runs
+    )
+    storage.create()
+    member_run = {"run_id": "member-run", "messages": [{"role": "system", "content": "You are a member"}]}
+    team_run = {"run_id": "team-run", "messages": [{"role": "system"}, {"role": "user", "content": "hello"}]}
+    storage.upsert(TeamSession(session_id="session-1", team_id="team-1", memory={"runs": [member_run, team_run]}))
+    storage.upsert(TeamSession(session_id="session-2", team_id="team-1", memory={"runs": [member_run]}))
+
+    page = storage.list_sessions(fields=["session_id", "first_run", "title_run"])
+    summaries = {s["session_id"]: s for s in page.sessions}
+    assert summaries["session-1"]["first_run"] == member_run
+    assert summaries["session-1"]["title_run"] == team_run
+    assert summaries["session-2"]["title_run"] is None
+
+
+async def test_agent_storage_async(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent", separate_runs=True)
+    runs = [{"run_id": f"run-{i}", "content": f"response {i}"} for i in range(3)]
+    session = AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user", memory={"runs": runs})
+
+    saved_session = await storage.aupsert(session)
+    assert saved_session is not None
+    assert saved_session.memory["runs"] == runs
+
+    read_session = await storage.aread("test-session", last_n_runs=1)
+    assert read_session is not None
+    assert read_session.memory["runs"] == [None, None, runs[2]]
+    assert [s.session_id for s in await storage.aget_recent_sessions(user_id="test-user")] == ["test-session"]
+    assert storage.read("test-session").memory["runs"] == runs
+
+    await storage.adelete_session("test-session")
+    assert await storage.aread("test-session") is None
+
+
+async def test_in_memory_storage_async():
+    storage = SqliteStorage(table_name="agent_sessions")
+    agent = Agent(model=MockModel(), storage=storage, session_id="session-1", telemetry=False)
+    for _ in range(4):
+        await agent.arun("Hello")
+
+    read_session = storage.read("session-1")
+    assert read_session is not None
+    assert len(read_session.memory["runs"]) == 4
+    for _ in range(5):
+        async_read_session = await storage.aread("session-1")
+        assert async_read_session is not None
+        assert async_read_session.memory["runs"] == read_session.memory["runs"]
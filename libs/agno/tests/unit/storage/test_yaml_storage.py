@@ -174,3 +174,18 @@ def test_workflow_storage_filtering(workflow_storage: YamlStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_list_sessions(workflow_storage: YamlStorage):
+    for i in range(3):
+        workflow_storage.upsert(
+            WorkflowSession(session_id=f"session-{i}", workflow_id="test-workflow", user_id="user-1", created_at=i)
+        )
+
+    page = workflow_storage.list_sessions(entity_id="test-workflow", limit=2)
+    assert [s["session_id"] for s in page.sessions] == ["session-2", "session-1"]
+    assert page.sessions[0]["entity_id"] == "test-workflow"
+
+    page = workflow_storage.list_sessions(entity_id="test-workflow", limit=2, cursor=page.next_cursor)
+    assert [s["session_id"] for s in page.sessions] == ["session-0"]
+    assert page.next_cursor is None
@@ -0,0 +1,112 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.run.response import RunResponse, RunResponseContentEvent
+from agno.run.team import TeamRunResponse
+from agno.team.team import Team
+
+
+def make_member(
+    name: Optional[str], delay: float, barrier: threading.Barrier = None, session_state_update: Dict[str, Any] = None
+) -> Agent:
+    agent = Agent(name=name)
+
+    def run(message, stream=False, **kwargs):
+        if barrier is not None:
+            barrier.wait()
+        if session_state_update is not None:
+            agent.team_session_state.update(session_state_update)  # type: ignore
+        time.sleep(delay)
+        agent.run_response = RunResponse(content=f"{name} done", agent_id=agent.agent_id)
+        if stream:
+            return iter([RunResponseContentEvent(content=f"{name} done", agent_id=agent.agent_id)])
+        return agent.run_response
+
+    agent.run = run  # type: ignore
+    return agent
+
+
+def make_team(members, **kwargs) -> Team:
+    team = Team(members=members, mode="collaborate", **kwargs)
+    team.memory = Memory()
+    team.run_response = TeamRunResponse()
+    return team
+
+
+def run_member_agents(team: Team, stream: bool = False):
+    function = team.get_run_member_agents_function(session_id="test-session", stream=stream)
+    return list(function.entrypoint(task_description="Research the topic"))  # type: ignore
+
+
+def test_collaborate_runs_members_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+    team = make_team([make_member(f"member-{i}", 0.0, barrier) for i in range(3)])
+
+    results = run_member_agents(team)
+
+    assert sorted(results) == [f"Agent member-{i}: member-{i} done" for i in range(3)]
+    assert len(team.run_response.member_responses) == 3
+    assert {i: m["member_name"] for i, m in team.run_response.member_metrics.items()} == {
+        0: "member-0",
+        1: "member-1",
+        2: "member-2",
+    }
+    assert all(m["timed_out"] is False for m in team.run_response.member_metrics.values())
+
+
+def test_collaborate_max_concurrent_members():
+    team = make_team([make_member(f"member-{i}", 0.05) for i in range(2)], max_concurrent_members=1)
+
+    results = run_member_agents(team)
+
+    assert len(results) == 2
+    assert all(m["time"] >= 0.05 for m in team.run_response.member_metrics.values())
+
+
+def test_collaborate_streams_member_chunks():
+    team = make_team([make_member("fast", 0.0), make_member("slow", 0.05)])
+
+    chunks = run_member_agents(team, stream=True)
+
+    assert [chunk.content for chunk in chunks] == ["fast done", "slow done"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_collaborate_member_timeout(stream):
+    team = make_team([make_member("fast", 0.0), make_member("slow", 1.0)], member_timeout=0.2)
+
+    results = run_member_agents(team, stream=stream)
+
+    assert results[-1] == "Agent slow: Error - Timed out after 0.2s"
+    assert team.run_response.member_metrics[1]["timed_out"] is True
+    assert team.run_response.member_metrics[0]["timed_out"] is False
+    assert len(team.run_response.member_responses) == 1
+
+
+def test_collaborate_metrics_of_members_with_the_same_name():
+    team = make_team([make_member("member", 0.0), make_member("member", 0.0), make_member(None, 0.0)])
+
+    run_member_agents(team)
+
+    assert sorted(team.run_response.member_metrics.keys()) == [0, 1, 2]
+    assert [team.run_response.member_metrics[i]["member_name"] for i in range(3)] == ["member", "member", "agent_2"]
+
+
+def test_collaborate_members_update_copies_of_the_team_session_state():
+    barrier = threading.Barrier(2, timeout=5)
+    members = [
+        make_member("first", 0.0, barrier, session_state_update={"first": 1, "shared": "first"}),
+        make_member("second", 0.05, barrier, session_state_update={"second": 2}),
+    ]
+    team = make_team(members, team_session_state={"shared": "initial", "other": "initial"})
+
+    run_member_agents(team)
+
+    # Each member ran on its own copy, and the second member did not undo the change of the first
+    assert members[0].team_session_state is not members[1].team_session_state
+    assert team.team_session_state == {"shared": "first", "other": "initial", "first": 1, "second": 2}
@@ -225,7 +225,10 @@ def test_function_cache_key_generation():
 
     cache_key = func._get_cache_key(entrypoint_args, call_args)
     assert isinstance(cache_key, str)
-    assert cache_key == "12cfb4e42ec8561012d976e2dca0e0c1"
+    assert cache_key == "9ecfddf9e9b284e312b5b1283dfcac1b"
+
+    # Keys don't depend on argument order
+    assert func._get_cache_key({"param2": 42, "param1": "value1"}, call_args) == cache_key
 
 
 def test_function_cache_file_path():
@@ -699,3 +702,84 @@ def test_tool_decorator_with_complex_types():
     assert complex_types_func.parameters["properties"]["param2"]["type"] == "object"
     assert complex_types_func.parameters["properties"]["param3"]["type"] == "boolean"
     assert "param3" not in complex_types_func.parameters["required"]
+
+
+def make_search_function() -> Callable:
+    def search(query: str, limit: int = 5) -> str:
+        """Search for a query.
+
+        Args:
+            query: The query to search for.
+            limit: Maximum number of results.
+        """
+        return query
+
+    return search
+
+
+def test_entrypoint_schema_is_cached(monkeypatch):
+    """Test that functions created from the same code are parsed once"""
+    from agno.tools import function as function_module
+
+    function_module.clear_entrypoint_schema_cache()
+    calls = []
+    parse_entrypoint = function_module._parse_entrypoint
+
+    def counting_parse_entrypoint(*args, **kwargs):
+        calls.append(args[0])
+        return parse_entrypoint(*args, **kwargs)
+
+    monkeypatch.setattr(function_module, "_parse_entrypoint", counting_parse_entrypoint)
+
+    first = Function.from_callable(make_search_function())
+    second = Function.from_callable(make_search_function())
+    strict = Function.from_callable(make_search_function(), strict=True)
+
+    assert len(calls) == 2
+    assert first.parameters == second.parameters
+    assert first.parameters["required"] == ["query"]
+    assert strict.parameters["required"] == ["query", "limit"]
+
+    # Changes to the parameters of one function do not leak into the cache
+    first.process_schema_for_strict()
+    assert Function.from_callable(make_search_function()).parameters == second.parameters
+
+
+def test_entrypoint_schema_cache_for_methods():
+    """Test that bound methods of different instances share the parsed schema, and unbound functions do not"""
+
+    class Tools:
+        def lookup(self, key: str) -> str:
+            """Look up a key."""
+            return key
+
+    first = Function(name="lookup", entrypoint=Tools().lookup)
+    second = Function(name="lookup", entrypoint=Tools().lookup)
+    first.process_entrypoint()
+    second.process_entrypoint()
+
+    assert first.parameters == second.parameters
+    assert first.parameters["required"] == ["key"]
+    assert first.description == "Look up a key."
+    assert "self" in Function.from_callable(Tools.lookup).parameters["properties"]
+    assert "self" not in first.parameters["properties"]
+
+
+def test_entrypoint_schema_cache_keeps_closure_docstrings():
+    """Test that closures sharing code but with a different docstring or defaults are parsed separately"""
+
+    def make_actor_function(actor: str, limit: int = 10):
+        def actor_function(query: str, max_items: int = limit) -> str:
+            return f"{actor}: {query}"
+
+        actor_function.__doc__ = f"{actor} does {actor[-1]}"
+        return actor_function
+
+    first = Function.from_callable(make_actor_function("actorA"))
+    second = Function.from_callable(make_actor_function("actorB", limit=5))
+    assert first.description == "actorA does A"
+    assert second.description == "actorB does B"
+
+    processed = Function(name="actorB", entrypoint=make_actor_function("actorB"))
+    processed.process_entrypoint()
+    assert processed.description == "actorB does B"
@@ -0,0 +1,155 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.tools.cache import FileToolCache, InMemoryToolCache, RedisToolCache, SqliteToolCache
+from agno.tools.function import Function, FunctionCall
+
+
+def test_in_memory_cache_get_set():
+    cache = InMemoryToolCache()
+    assert cache.get("key") is None
+
+    cache.set("key", {"result": "value"})
+    assert cache.get("key") == {"result": "value"}
+
+    cache.delete("key")
+    assert cache.get("key") is None
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolCache(max_size_bytes=10)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    # Use "a" so that "b" is the least recently used
+    assert cache.get("a") == "aaaa"
+
+    cache.set("c", "cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.size_bytes == 8
+
+    # Results larger than the cache are not stored
+    cache.set("d", "d" * 11)
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryToolCache()
+    cache.set("key", "value", ttl=0.05)
+    assert cache.get("key") == "value"
+    time.sleep(0.1)
+    assert cache.get("key") is None
+    assert cache.size_bytes == 0
+
+
+def test_cache_lookup_counts_hits_and_misses():
+    cache = InMemoryToolCache()
+    cache.lookup("key")
+    cache.set("key", "value")
+    cache.lookup("key")
+    cache.lookup("key")
+    assert cache.get_stats() == {"hits": 2, "misses": 1}
+
+
+def test_sqlite_cache(tmp_path):
+    cache = SqliteToolCache(db_file=tmp_path / "cache.db")
+    cache.set("key", {"result": [1, 2, 3]})
+    assert cache.get("key") == {"result": [1, 2, 3]}
+
+    # The cache is shared with other instances using the same database
+    assert SqliteToolCache(db_file=tmp_path / "cache.db").get("key") == {"result": [1, 2, 3]}
+
+    cache.set("expired", "value", ttl=-1)
+    assert cache.get("expired") is None
+
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_redis_cache():
+    client = MagicMock()
+    client.get.return_value = '{"result": "value"}'
+    cache = RedisToolCache(prefix="test", client=client)
+
+    cache.set("key", {"result": "value"}, ttl=60)
+    client.set.assert_called_once_with("test:key", '{"result": "value"}', px=60000)
+    assert cache.get("key") == {"result": "value"}
+    client.get.assert_called_once_with("test:key")
+
+    # Sub-second ttls expire in milliseconds instead of being truncated to 0 seconds
+    cache.set("key", {"result": "value"}, ttl=0.25)
+    assert client.set.call_args.kwargs["px"] == 250
+    cache.set("key", {"result": "value"}, ttl=0.0001)
+    assert client.set.call_args.kwargs["px"] == 1
+    cache.set("key", {"result": "value"})
+    assert client.set.call_args.kwargs["px"] is None
+
+
+def test_file_cache(tmp_path):
+    cache = FileToolCache(tmp_path / "cache")
+    cache.set("key", "value", ttl=60)
+    assert (tmp_path / "cache" / "key.json").exists()
+    assert cache.get("key") == "value"
+
+    cache.set("expired", "value", ttl=-1)
+    assert cache.get("expired") is None
+    assert not (tmp_path / "cache" / "expired.json").exists()
+
+
+@pytest.fixture
+def counting_function():
+    calls = []
+
+    def search(query: str) -> str:
+        calls.append(query)
+        return f"results for {query}"
+
+    function = Function.from_callable(search)
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+    function.process_entrypoint()
+    return function, calls
+
+
+def test_function_call_uses_cache(counting_function):
+    function, calls = counting_function
+
+    for _ in range(3):
+        result = FunctionCall(function=function, arguments={"query": "agno"}).execute()
+        assert result.result == "results for agno"
+    FunctionCall(function=function, arguments={"query": "other"}).execute()
+
+    assert calls == ["agno", "other"]
+    assert function.get_cache_stats() == {"hits": 2, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_function_call_async_uses_cache():
+    calls = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        return f"results for {query}"
+
+    function = Function.from_callable(search)
+    function.cache_results = True
+    function.cache = InMemoryToolCache()
+    function.process_entrypoint()
+
+    await FunctionCall(function=function, arguments={"query": "agno"}).aexecute()
+    result = await FunctionCall(function=function, arguments={"query": "agno"}).aexecute()
+
+    assert result.result == "results for agno"
+    assert calls == ["agno"]
+    assert function.get_cache_stats() == {"hits": 1, "misses": 1}
+
+
+def test_function_cache_dir_uses_file_cache(tmp_path):
+    function = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    cache = function.get_cache()
+    assert isinstance(cache, FileToolCache)
+    assert cache.cache_dir == tmp_path / "functions" / "test_func"
@@ -251,3 +251,29 @@ def test_toolkit_with_none_instructions():
 
     assert toolkit.instructions is None
     assert toolkit.add_instructions is True
+
+
+def test_toolkit_positional_arguments():
+    """Test new parameters are added after the existing ones, so positional arguments keep their meaning."""
+    toolkit = Toolkit(
+        "positional_toolkit",
+        [example_func],
+        None,
+        False,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        False,
+        3600,
+        None,
+        False,
+    )
+
+    assert toolkit.name == "positional_toolkit"
+    # auto_register=False, so the tools are not registered
+    assert len(toolkit.functions) == 0
+    assert toolkit.cache is None
+    assert toolkit.parallel_safe is True
@@ -0,0 +1,306 @@
+import json
+from typing import Any, List
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.team import Team
+from agno.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    JsonLogSpanExporter,
+    Span,
+    atrace_iterator,
+    get_current_span,
+    span,
+    start_trace,
+    trace_iterator,
+)
+
+
+class ScriptedModel(Model):
+    """Calls the `get_weather` tool on the first request and answers on the next one"""
+
+    def _next_response(self, messages) -> ModelResponse:
+        if not any(message.role == "tool" for message in messages):
+            return ModelResponse(
+                role="assistant",
+                tool_calls=[
+                    {
+                        "id": "call-1",
+                        "type": "function",
+                        "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'},
+                    }
+                ],
+            )
+        return ModelResponse(role="assistant", content="It is sunny")
+
+    def invoke(self, messages, **kwargs) -> Any:
+        return self._next_response(messages)
+
+    async def ainvoke(self, messages, **kwargs) -> Any:
+        return self._next_response(messages)
+
+    def invoke_stream(self, messages, **kwargs):
+        yield self._next_response(messages)
+
+    async def ainvoke_stream(self, messages, **kwargs):
+        yield self._next_response(messages)
+
+    def parse_provider_response(self, response, **kwargs) -> ModelResponse:
+        return response
+
+    def parse_provider_response_delta(self, response) -> ModelResponse:
+        return response
+
+
+def get_weather(city: str) -> str:
+    """Get the weather in a city"""
+    return f"Sunny in {city}"
+
+
+def get_names(span_dict) -> List[str]:
+    return [child["name"] for child in span_dict.get("children", [])]
+
+
+def test_span_nesting():
+    root = start_trace("run")
+    with root.span("phase") as phase:
+        assert get_current_span() is phase
+        with span("inner", size=1):
+            pass
+    assert get_current_span() is NOOP_SPAN
+
+    root.end()
+    assert [s.name for s in root.walk()] == ["run", "phase", "inner"]
+    assert root.find("inner")[0].attributes == {"size": 1}
+    assert root.duration >= phase.duration >= 0
+    assert Span.from_dict(root.to_dict()).to_dict() == root.to_dict()
+
+
+def test_span_records_errors():
+    root = start_trace("run")
+    with pytest.raises(ValueError):
+        with root.span("phase"):
+            raise ValueError("boom")
+    assert root.children[0].error == "ValueError: boom"
+
+
+def test_tracing_disabled():
+    assert start_trace("run", enabled=False) is NOOP_SPAN
+    with span("phase") as phase:
+        assert phase is NOOP_SPAN
+
+    agent = Agent(model=ScriptedModel(id="scripted"), tools=[get_weather], telemetry=False)
+    assert agent.run("What is the weather in Paris?").trace is None
+
+
+def test_agent_run_trace():
+    exporter = InMemorySpanExporter()
+    agent = Agent(
+        model=ScriptedModel(id="scripted"),
+        tools=[get_weather],
+        tracing=True,
+        span_exporters=[exporter],
+        telemetry=False,
+    )
+    response = agent.run("What is the weather in Paris?")
+
+    assert response.content == "It is sunny"
+    trace = response.trace
+    assert trace is not None
+    assert trace["name"] == "agent.run"
+    assert trace["attributes"]["run_id"] == response.run_id
+    assert get_names(trace) == [
+        "storage.read",
+        "tools.determine",
+        "messages.build",
+        "model.response",
+        "memory.update",
+        "storage.write",
+    ]
+    model_response = trace["children"][3]
+    assert get_names(model_response) == ["model.invoke", "tool.get_weather", "model.invoke"]
+    assert get_names(trace["children"][2]) == ["system_message"]
+
+    assert len(exporter.spans) == 1
+    assert exporter.spans[0].to_dict() == trace
+
+
+def test_agent_stream_trace():
+    agent = Agent(model=ScriptedModel(id="scripted"), tools=[get_weather], tracing=True, telemetry=False)
+    list(agent.run("What is the weather in Paris?", stream=True))
+
+    trace = agent.run_response.trace
+    assert trace is not None
+    model_response = trace["children"][3]
+    assert model_response["name"] == "model.response"
+    assert get_names(model_response) == ["model.invoke_stream", "tool.get_weather", "model.invoke_stream"]
+
+
+def test_agent_stream_does_not_leak_spans_to_the_consumer():
+    agent = Agent(model=ScriptedModel(id="scripted"), tools=[get_weather], tracing=True, telemetry=False)
+    with start_trace("consumer") as consumer:
+        current_spans = [get_current_span() for _ in agent.run("What is the weather in Paris?", stream=True)]
+
+        with span("handle_response"):
+            pass
+
+    assert len(current_spans) > 0
+    assert all(current is consumer for current in current_spans)
+    assert get_names(consumer.to_dict()) == ["agent.run", "handle_response"]
+
+
+@pytest.mark.asyncio
+async def test_agent_astream_does_not_leak_spans_to_the_consumer():
+    agent = Agent(model=ScriptedModel(id="scripted"), tools=[get_weather], tracing=True, telemetry=False)
+    current_spans = []
+    async for _ in await agent.arun("What is the weather in Paris?", stream=True):
+        current_spans.append(get_current_span())
+
+    assert len(current_spans) > 0
+    assert all(current is NOOP_SPAN for current in current_spans)
+    model_response = agent.run_response.trace["children"][3]
+    assert get_names(model_response) == ["model.invoke_stream", "tool.get_weather", "model.invoke_stream"]
+
+
+def test_trace_iterator():
+    root = start_trace("run")
+    with root:
+        items = trace_iterator(span("stream"), (get_current_span().name for _ in range(2)))
+        assert next(items) == "stream"
+        assert get_current_span() is root
+        items.close()
+
+    stream = root.find("stream")[0]
+    assert stream.duration_ns is not None
+
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    with root:
+        with pytest.raises(ValueError):
+            list(trace_iterator(span("failing"), failing()))
+    assert root.find("failing")[0].error == "ValueError: boom"
+
+
+@pytest.mark.asyncio
+async def test_atrace_iterator():
+    async def names():
+        for _ in range(2):
+            yield get_current_span().name
+
+    root = start_trace("run")
+    with root:
+        consumer_spans = []
+        async for name in atrace_iterator(span("stream"), names()):
+            assert name == "stream"
+            consumer_spans.append(get_current_span())
+
+    assert consumer_spans == [root, root]
+    assert root.find("stream")[0].duration_ns is not None
+
+
+@pytest.mark.asyncio
+async def test_agent_arun_trace():
+    agent = Agent(model=ScriptedModel(id="scripted"), tools=[get_weather], tracing=True, telemetry=False)
+    response = await agent.arun("What is the weather in Paris?")
+
+    model_response = response.trace["children"][3]
+    assert get_names(model_response) == ["model.invoke", "tool.get_weather", "model.invoke"]
+
+
+def test_team_run_trace():
+    exporter = InMemorySpanExporter()
+    team = Team(
+        members=[Agent(name="member", model=ScriptedModel(id="scripted"))],
+        model=ScriptedModel(id="scripted"),
+        tools=[get_weather],
+        tracing=True,
+        span_exporters=[exporter],
+        telemetry=False,
+    )
+    response = team.run("What is the weather in Paris?")
+
+    assert response.trace["name"] == "team.run"
+    model_response = response.trace["children"][get_names(response.trace).index("model.response")]
+    assert get_names(model_response) == ["model.invoke", "tool.get_weather", "model.invoke"]
+    assert [s.name for s in exporter.spans] == ["team.run"]
+
+
+class CollaborateModel(ScriptedModel):
+    """Sends the task to all the members on the first request and answers on the next one"""
+
+    def _next_response(self, messages) -> ModelResponse:
+        if not any(message.role == "tool" for message in messages):
+            return ModelResponse(
+                role="assistant",
+                tool_calls=[
+                    {
+                        "id": "call-1",
+                        "type": "function",
+                        "function": {
+                            "name": "run_member_agents",
+                            "arguments": '{"task_description": "Get the weather in Paris", "expected_output": null}',
+                        },
+                    }
+                ],
+            )
+        return ModelResponse(role="assistant", content="It is sunny")
+
+
+def test_collaborate_team_trace():
+    exporter = InMemorySpanExporter()
+    members = [
+        Agent(name=name, model=ScriptedModel(id="scripted"), tools=[get_weather], tracing=True, telemetry=False)
+        for name in ("first", "second")
+    ]
+    team = Team(
+        members=members,
+        mode="collaborate",
+        model=CollaborateModel(id="scripted"),
+        tracing=True,
+        span_exporters=[exporter],
+        telemetry=False,
+    )
+    response = team.run("What is the weather in Paris?")
+
+    # The member runs in the thread pool are added to the team trace instead of starting their own traces
+    assert [s.name for s in exporter.spans] == ["team.run"]
+    member_spans = exporter.spans[0].find("agent.run")
+    assert sorted(s.attributes["agent_name"] for s in member_spans) == ["first", "second"]
+    assert all(get_names(s.to_dict())[-1] == "storage.write" for s in member_spans)
+    assert response.trace == exporter.spans[0].to_dict()
+
+
+def test_nested_runs_are_added_to_the_outer_trace():
+    exporter = InMemorySpanExporter()
+    agent = Agent(
+        model=ScriptedModel(id="scripted"),
+        tools=[get_weather],
+        tracing=True,
+        span_exporters=[exporter],
+        telemetry=False,
+    )
+    root = start_trace("team.run")
+    with root.span("tool.transfer_task_to_member"):
+        response = agent.run("What is the weather in Paris?")
+
+    assert response.trace["name"] == "agent.run"
+    assert root.find("agent.run")[0].to_dict() == response.trace
+    # Only the root of a trace is exported
+    assert exporter.spans == []
+
+
+def test_json_log_exporter(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    root = start_trace("run")
+    with root.span("phase"):
+        pass
+    root.end()
+    JsonLogSpanExporter(path=path).export(root)
+
+    assert get_names(json.loads(path.read_text())) == ["phase"]
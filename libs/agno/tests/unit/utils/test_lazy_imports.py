@@ -0,0 +1,101 @@
+import json
+import subprocess
+import sys
+from typing import Optional, get_type_hints
+
+import pytest
+
+# Modules that are only needed when an agent uses knowledge or memory v1
+OPTIONAL_MODULES = [
+    "agno.knowledge.agent",
+    "agno.document.base",
+    "agno.embedder.base",
+    "agno.vectordb.base",
+    "agno.memory.agent",
+    "agno.memory.team",
+]
+
+
+def get_imported_modules(code: str) -> dict:
+    """Run the code in a new interpreter and return the agno modules it imported and the import time"""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{code}\n"
+        "duration = time.perf_counter() - start\n"
+        "modules = [m for m in sys.modules if m.startswith('agno')]\n"
+        "print(json.dumps({'modules': modules, 'duration': duration}))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("package", ["agno.agent", "agno.team", "agno.models", "agno.tools", "agno.vectordb"])
+def test_importing_package_does_not_import_exports(package):
+    result = get_imported_modules(f"import {package}")
+    submodules = [m for m in result["modules"] if m.startswith(f"{package}.")]
+    assert submodules == []
+
+
+def test_importing_submodule_does_not_import_siblings():
+    result = get_imported_modules("import agno.tools.function")
+    assert "agno.tools.toolkit" not in result["modules"]
+    assert "agno.tools.decorator" not in result["modules"]
+
+    result = get_imported_modules("import agno.memory.v2.memory")
+    assert "agno.memory.agent" not in result["modules"]
+
+
+def test_embedder_cache_does_not_import_tools():
+    result = get_imported_modules("import agno.embedder.cache")
+    assert "agno.utils.cache" in result["modules"]
+    assert [m for m in result["modules"] if m.startswith("agno.tools")] == []
+
+
+def test_agent_import_does_not_import_optional_modules():
+    result = get_imported_modules("from agno.agent import Agent")
+    assert "agno.agent.agent" in result["modules"]
+    assert [m for m in OPTIONAL_MODULES if m in result["modules"]] == []
+
+
+def test_agent_run_does_not_import_optional_modules():
+    result = get_imported_modules(
+        "from agno.agent import Agent\n"
+        "from agno.models.mock import MockModel\n"
+        "Agent(model=MockModel(), telemetry=False).run('Hello')"
+    )
+    assert [m for m in OPTIONAL_MODULES if m in result["modules"]] == []
+
+
+def test_lazy_exports():
+    import agno.agent
+    import agno.tools
+    from agno.agent.agent import Agent
+    from agno.tools.toolkit import Toolkit
+
+    assert agno.agent.Agent is Agent
+    assert agno.tools.Toolkit is Toolkit
+    assert "Agent" in dir(agno.agent)
+    with pytest.raises(AttributeError):
+        agno.agent.NotAnExport  # noqa: B018
+
+
+def test_agent_type_hints_import_optional_modules():
+    result = get_imported_modules(
+        "import typing\n"
+        "from agno.agent import Agent\n"
+        "hints = typing.get_type_hints(Agent)\n"
+        "typing.get_type_hints(Agent.__init__)\n"
+        "from agno.knowledge.agent import AgentKnowledge\n"
+        "assert hints['knowledge'] == typing.Optional[AgentKnowledge]"
+    )
+    assert "agno.knowledge.agent" in result["modules"]
+    assert "agno.memory.agent" in result["modules"]
+
+
+def test_team_type_hints():
+    from agno.knowledge.agent import AgentKnowledge
+    from agno.team.team import Team
+
+    assert get_type_hints(Team)["knowledge"] == Optional[AgentKnowledge]
+    assert get_type_hints(Team.__init__)["knowledge"] == Optional[AgentKnowledge]
@@ -0,0 +1,43 @@
+import asyncio
+from copy import deepcopy
+
+from agno.utils.loop import LoopLocal
+
+
+def test_loop_local_creates_one_value_per_loop():
+    created = []
+
+    def factory():
+        created.append(object())
+        return created[-1]
+
+    values = LoopLocal(factory)
+
+    async def get_twice():
+        return values.get(), values.get()
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+    other, _ = asyncio.run(get_twice())
+    assert other is not first
+    assert len(created) == 2
+    # Values of closed loops are forgotten
+    assert len(values._values) == 1
+
+
+def test_loop_local_is_shared_by_copies():
+    values = LoopLocal(object)
+    assert deepcopy(values) is values
+
+
+def test_loop_local_evicts_values_of_closed_loops():
+    evicted = []
+    values = LoopLocal(object, on_evict=evicted.append)
+
+    async def get():
+        return values.get()
+
+    first = asyncio.run(get())
+    assert evicted == []
+    asyncio.run(get())
+    assert evicted == [first]
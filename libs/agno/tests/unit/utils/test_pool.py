@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.storage.sqlite import SqliteStorage
+from agno.team import Team
+from agno.utils.pool import InstancePool
+from agno.workflow.workflow import Workflow
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY", "test-key"))
+
+
+def test_pool_reuses_released_instances():
+    template = Agent(name="pooled", model=OpenAIChat(id="gpt-4o-mini"), session_state={"count": 0})
+    pool = InstancePool(template, max_size=1)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first is not template
+    assert first is not second
+    assert pool.num_created == 2
+
+    pool.release(first)
+    pool.release(second)
+    # Only max_size idle instances are kept
+    assert len(pool) == 1
+    assert pool.acquire() is first
+    assert pool.num_created == 2
+
+
+def test_released_instance_is_reset():
+    storage = SqliteStorage(table_name="agent_sessions", db_file=None)
+    template = Agent(
+        name="pooled",
+        model=OpenAIChat(id="gpt-4o-mini"),
+        storage=storage,
+        session_state={"count": 0},
+        instructions=["Be brief"],
+    )
+    pool = InstancePool(template, update={"agent_id": "agent-1"})
+
+    with pool.instance() as agent:
+        # Shared fields are not copied
+        assert agent.storage is storage
+        assert agent.agent_id == "agent-1"
+        agent.session_id = "session-1"
+        agent.user_id = "user-1"
+        agent.session_state["count"] = 1  # type: ignore
+        agent.instructions.append("Be polite")  # type: ignore
+        agent.run_id = "run-1"
+        model = agent.model
+
+    agent = pool.acquire()
+    assert agent.session_id is None
+    assert agent.user_id is None
+    assert agent.session_state == {"count": 0}
+    assert agent.instructions == ["Be brief"]
+    assert agent.run_id is None
+    assert agent.agent_id == "agent-1"
+    assert agent.model is model
+    assert template.session_state == {"count": 0}
+
+
+def test_team_members_are_reset():
+    template = Team(
+        name="team",
+        members=[Agent(name="member", model=OpenAIChat(id="gpt-4o-mini"))],
+        model=OpenAIChat(id="gpt-4o-mini"),
+    )
+    pool = InstancePool(template)
+
+    with pool.instance() as team:
+        assert team.members[0] is not template.members[0]
+        team.session_id = "session-1"
+        team.members[0].session_id = "session-1"
+
+    team = pool.acquire()
+    assert team.session_id is None
+    assert team.members[0].session_id is None
+
+
+def test_release_after_stream():
+    class CountingWorkflow(Workflow):
+        def run(self, count: int = 2):
+            for i in range(count):
+                yield i
+
+    template = CountingWorkflow(workflow_id="counting")
+    pool = InstancePool(template, update={"workflow_id": template.workflow_id})
+    workflow = pool.acquire()
+    workflow.user_id = "user-1"
+
+    stream = pool.release_after(workflow, iter([1, 2]))
+    assert len(pool) == 0
+    assert list(stream) == [1, 2]
+    assert len(pool) == 1
+    assert workflow.user_id is None
+    assert workflow.workflow_id == "counting"
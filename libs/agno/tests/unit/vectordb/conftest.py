@@ -22,4 +22,10 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the get_embeddings_and_usage method
+    mock.get_embeddings_and_usage.side_effect = lambda texts: (
+        [mock_embedding] * len(texts),
+        [mock_usage] * len(texts),
+    )
+
     return mock
@@ -0,0 +1,236 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import Ivf, NumpyDb
+
+VECTORS = {
+    "apple": [1.0, 0.0, 0.0],
+    "banana": [0.9, 0.1, 0.0],
+    "car": [0.0, 1.0, 0.0],
+    "truck": [0.0, 0.9, 0.1],
+    "ocean": [0.0, 0.0, 1.0],
+}
+
+
+@dataclass
+class WordEmbedder(Embedder):
+    """Embeds a text as the vector of the first known word in it"""
+
+    id: str = "word"
+    dimensions: int = 3
+    cache_queries: bool = False
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        for word in text.split():
+            if word in VECTORS:
+                return VECTORS[word], None
+        return [0.1, 0.1, 0.1], None
+
+
+def get_documents() -> List[Document]:
+    return [
+        Document(name=word, content=f"{word} document", meta_data={"kind": kind, "tags": [word, kind]})
+        for word, kind in [
+            ("apple", "fruit"),
+            ("banana", "fruit"),
+            ("car", "vehicle"),
+            ("truck", "vehicle"),
+            ("ocean", "water"),
+        ]
+    ]
+
+
+@pytest.fixture
+def numpy_db(tmp_path) -> NumpyDb:
+    db = NumpyDb(collection="test", path=tmp_path, embedder=WordEmbedder())
+    db.create()
+    return db
+
+
+def test_insert_and_search(numpy_db: NumpyDb):
+    numpy_db.insert(get_documents())
+
+    assert numpy_db.get_count() == 5
+    results = numpy_db.search("apple", limit=2)
+    assert [result.name for result in results] == ["apple", "banana"]
+    assert results[0].embedding == pytest.approx(VECTORS["apple"])
+    assert numpy_db.name_exists("car")
+    assert numpy_db.doc_exists(Document(content="ocean document"))
+
+
+def test_insert_skips_existing_content(numpy_db: NumpyDb):
+    numpy_db.insert(get_documents())
+    numpy_db.insert(get_documents())
+
+    assert numpy_db.get_count() == 5
+
+
+def test_upsert_replaces_existing_content(numpy_db: NumpyDb):
+    numpy_db.insert(get_documents())
+    numpy_db.upsert([Document(name="apple", content="apple document", meta_data={"kind": "tree"})])
+
+    assert numpy_db.get_count() == 5
+    assert [result.meta_data["kind"] for result in numpy_db.search("apple", limit=1)] == ["tree"]
+    assert numpy_db.search("apple", filters={"kind": "fruit"}, limit=5)[0].name == "banana"
+
+
+def test_search_with_filters(numpy_db: NumpyDb):
+    numpy_db.insert(get_documents())
+
+    assert [result.name for result in numpy_db.search("apple", filters={"kind": "vehicle"})] == ["car", "truck"]
+    assert [result.name for result in numpy_db.search("banana", filters={"kind": ["water", "fruit"]}, limit=2)] == [
+        "banana",
+        "apple",
+    ]
+    assert [result.name for result in numpy_db.search("car", filters={"tags": "truck"})] == ["truck"]
+    assert numpy_db.search("car", filters={"kind": "missing"}) == []
+
+
+def test_collection_is_persisted(tmp_path, numpy_db: NumpyDb):
+    numpy_db.insert(get_documents()[:3])
+    numpy_db.upsert([Document(name="apple", content="apple document", meta_data={"kind": "tree"})])
+    numpy_db.insert(get_documents()[3:])
+
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=WordEmbedder())
+    assert reopened.exists()
+    assert reopened.get_count() == 5
+    assert isinstance(reopened._vectors, np.memmap)
+    results = reopened.search("truck", limit=1)
+    assert results[0].name == "truck"
+    assert reopened.search("apple", limit=1)[0].meta_data["kind"] == "tree"
+
+
+def test_upsert_appends_records_and_compacts(tmp_path, numpy_db: NumpyDb):
+    """Test that upserts append the replaced records, and the records file is compacted when mostly replaced"""
+    records_file = numpy_db._get_file("records.jsonl")
+    numpy_db.insert(get_documents())
+    numpy_db.upsert([Document(name="apple", content="apple document", meta_data={"kind": "tree"})])
+
+    lines = records_file.read_text().splitlines()
+    assert len(lines) == 6
+    assert json.loads(lines[-1])["row"] == 0
+
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=WordEmbedder())
+    assert reopened.get_count() == 5
+    assert reopened._records == numpy_db._records
+    assert reopened.search("apple", limit=1)[0].meta_data["kind"] == "tree"
+    assert reopened.search("apple", filters={"kind": "fruit"}, limit=5)[0].name == "banana"
+
+    for kind in ["a", "b", "c", "d", "e"]:
+        reopened.upsert([Document(name="car", content="car document", meta_data={"kind": kind})])
+    assert len(records_file.read_text().splitlines()) == 5
+
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=WordEmbedder())
+    assert reopened.get_count() == 5
+    assert reopened.search("car", filters={"kind": "e"})[0].name == "car"
+    assert reopened.search("car", filters={"kind": "vehicle"})[0].name == "truck"
+
+
+def test_incomplete_write_is_dropped_when_reopened(tmp_path, numpy_db: NumpyDb):
+    numpy_db.insert(get_documents()[:1])
+    # A write interrupted after its records, before the manifest
+    with numpy_db._get_file("records.jsonl").open("a") as f:
+        f.write('{"content": "STALE", "content_hash": "stale"}\n')
+
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=WordEmbedder())
+    assert reopened.get_count() == 1
+    reopened.insert(get_documents()[2:3])
+
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=WordEmbedder())
+    assert reopened.get_count() == 2
+    assert [record["content"] for record in reopened._records] == ["apple document", "car document"]
+    assert reopened.search("car", limit=1)[0].content == "car document"
+    assert reopened.doc_exists(Document(content="car document"))
+    assert not reopened.doc_exists(Document(content="STALE"))
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_distances(distance: Distance):
+    db = NumpyDb(collection="test", path=None, embedder=WordEmbedder(), distance=distance)
+    db.insert(get_documents())
+
+    assert db.search("car", limit=1)[0].name == "car"
+
+
+def test_dimension_mismatch(numpy_db: NumpyDb):
+    numpy_db.insert(get_documents())
+
+    with pytest.raises(ValueError):
+        numpy_db.insert([Document(content="other", embedder=numpy_db.embedder, embedding=[1.0, 0.0])])
+
+
+def test_ivf_index(tmp_path):
+    rng = np.random.default_rng(1)
+    centers = rng.normal(size=(8, 16)).astype(np.float32)
+    vectors = np.concatenate([center + 0.01 * rng.normal(size=(50, 16)) for center in centers])
+    embedder = WordEmbedder(dimensions=16)
+    documents = [
+        Document(content=f"document {i}", embedder=embedder, embedding=vector.tolist())
+        for i, vector in enumerate(vectors)
+    ]
+    db = NumpyDb(
+        collection="test",
+        path=tmp_path,
+        embedder=embedder,
+        index=Ivf(lists=8, probes=1, min_vectors=100, sample_size=400),
+    )
+    db.insert(documents)
+    db.optimize()
+
+    assert db._centroids is not None
+    results = db._search_embedding(vectors[0].tolist(), limit=3, filters=None)
+    assert results[0].content == "document 0"
+    assert all(int(result.content.split()[1]) < 50 for result in results)
+
+    # Vectors inserted after the index is built are assigned to a list
+    db.insert([Document(content="new", embedder=embedder, embedding=(centers[3] * 1.01).tolist())])
+    assert db._search_embedding(centers[3].tolist(), limit=1, filters=None)[0].content == "new"
+
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=embedder, index=Ivf(probes=1, min_vectors=100))
+    assert reopened._search_embedding(centers[3].tolist(), limit=1, filters=None)[0].content == "new"
+
+
+def test_ivf_index_is_searched_when_reopened_without_index(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(200, 3)).astype(np.float32)
+    embedder = WordEmbedder()
+    documents = [
+        Document(content=f"document {i}", embedder=embedder, embedding=vector.tolist())
+        for i, vector in enumerate(vectors)
+    ]
+    db = NumpyDb(collection="test", path=tmp_path, embedder=embedder, index=Ivf(lists=4, probes=2, min_vectors=100))
+    db.insert(documents)
+    db.optimize()
+
+    # The index parameters are restored from the manifest
+    reopened = NumpyDb(collection="test", path=tmp_path, embedder=embedder)
+    assert reopened._search_embedding(vectors[7].tolist(), limit=1, filters=None)[0].content == "document 7"
+    assert reopened.index == Ivf(lists=4, probes=2, min_vectors=100)
+    assert len(reopened.search("apple", limit=2)) == 2
+
+
+def test_drop(tmp_path, numpy_db: NumpyDb):
+    numpy_db.insert(get_documents())
+    numpy_db.drop()
+
+    assert not numpy_db.exists()
+    assert numpy_db.get_count() == 0
+    assert not (tmp_path / "test").exists()
+
+
+@pytest.mark.asyncio
+async def test_async_insert_and_search(numpy_db: NumpyDb):
+    await numpy_db.async_insert(get_documents())
+
+    results = await numpy_db.async_search("truck", limit=2)
+    assert [result.name for result in results] == ["truck", "car"]
@@ -1,5 +1,6 @@
+import asyncio
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.engine import URL, Engine
@@ -385,3 +386,109 @@ async def test_async_exists(mock_pgvector):
         # Check result and that exists was called via to_thread
         assert result is True
         mock_to_thread.assert_called_once_with(mock_pgvector.exists)
+
+
+def test_async_engine_not_created_without_async_driver(mock_pgvector):
+    """Test that async methods fall back to threads when no async capable database URL is configured."""
+    assert mock_pgvector.async_db_engine is None
+    assert mock_pgvector.AsyncSession is None
+
+
+def test_async_engine_created_from_psycopg_url(mock_embedder):
+    """Test that a psycopg database URL creates an async engine per event loop, with the same pool configuration."""
+    db = PgVector(
+        table_name=TEST_TABLE,
+        schema=TEST_SCHEMA,
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        embedder=mock_embedder,
+    )
+    assert db.AsyncSession is not None
+
+    async def get_engine():
+        assert db._use_async_engine()
+        return db._get_async_engine(), db._get_async_engine()
+
+    first, same = asyncio.run(get_engine())
+    second, _ = asyncio.run(get_engine())
+    assert first is same
+    assert first is not second
+    assert first.pool.size() == db.db_engine.pool.size()
+
+
+def test_async_engines_of_closed_loops_are_disposed(mock_embedder):
+    """Test that async engine kwargs are applied, and the async engines of closed event loops are disposed."""
+    db = PgVector(
+        table_name=TEST_TABLE,
+        schema=TEST_SCHEMA,
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        async_engine_kwargs={"pool_size": 2},
+        embedder=mock_embedder,
+    )
+
+    async def get_engine():
+        engine = db._get_async_engine()
+        # Let the engines of closed loops be disposed
+        await asyncio.sleep(0)
+        return engine
+
+    with patch("sqlalchemy.ext.asyncio.AsyncEngine.dispose", new_callable=AsyncMock) as mock_dispose:
+        first = asyncio.run(get_engine())
+        assert first.pool.size() == 2
+        mock_dispose.assert_not_called()
+        asyncio.run(get_engine())
+        mock_dispose.assert_awaited_once()
+
+
+@pytest.fixture
+def mock_async_session():
+    """Create a mock async SQLAlchemy session."""
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.begin.return_value.__aenter__.return_value = session
+    result = MagicMock()
+    result.fetchall.return_value = [
+        MagicMock(id="doc_1", meta_data={}, content="content", embedding=[0.1] * 1024, usage=None)
+    ]
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_async_search_uses_async_engine(mock_pgvector, mock_async_session):
+    """Test that async_search runs on the async engine when one is configured."""
+    mock_pgvector.async_db_engine = MagicMock()
+    mock_pgvector.AsyncSession = MagicMock(return_value=mock_async_session)
+    mock_pgvector.embedder.async_get_embeddings_and_usage = AsyncMock(return_value=([[0.1] * 1024], [None]))
+
+    with (
+        patch.object(mock_pgvector, "_get_vector_search_stmt", return_value=MagicMock()),
+        patch("asyncio.to_thread") as mock_to_thread,
+    ):
+        results = await mock_pgvector.async_search("test query", limit=5)
+
+    mock_to_thread.assert_not_called()
+    mock_async_session.execute.assert_awaited()
+    assert len(results) == 1
+    assert results[0].id == "doc_1"
+
+
+@pytest.mark.asyncio
+async def test_async_insert_uses_async_engine(mock_pgvector, mock_async_session):
+    """Test that async_insert embeds documents and writes batches through the async session."""
+    mock_pgvector.async_db_engine = MagicMock()
+    mock_pgvector.AsyncSession = MagicMock(return_value=mock_async_session)
+    docs = create_test_documents(3)
+
+    with (
+        patch.object(mock_pgvector, "_async_embed_batch", AsyncMock(return_value=True)) as mock_embed_batch,
+        patch("agno.vectordb.pgvector.pgvector.postgresql.insert"),
+    ):
+        await mock_pgvector.async_insert(docs, batch_size=2)
+
+    assert mock_embed_batch.await_count == 2
+    assert mock_async_session.execute.await_count == 2
+    assert mock_async_session.commit.await_count == 2
+    inserted_records = mock_async_session.execute.await_args_list[0].args[1]
+    assert [record["id"] for record in inserted_records] == ["doc_0", "doc_1"]
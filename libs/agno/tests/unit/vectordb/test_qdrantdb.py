@@ -1,10 +1,11 @@
 from typing import List
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from agno.document import Document
 from agno.vectordb.qdrant import Qdrant
+from agno.vectordb.search import SearchType
 
 
 @pytest.fixture
@@ -245,3 +246,21 @@ async def test_async_search(mock_embedder):
         results = await db.async_search("test query", limit=1)
         assert len(results) == 1
         assert results[0].name == "test_doc"
+
+
+@pytest.mark.asyncio
+async def test_async_hybrid_search_embeds_query_asynchronously(mock_embedder):
+    """Test that async hybrid search awaits the async embedding of the query"""
+    db = Qdrant(embedder=mock_embedder, collection="test_collection")
+    # Hybrid search needs fastembed, so its sparse encoder is mocked on a vector search instance
+    db.search_type = SearchType.hybrid
+    db.use_named_vectors = True
+    db.sparse_encoder = Mock()
+    db.sparse_encoder.embed.return_value = iter([Mock(as_object=Mock(return_value={"indices": [0], "values": [1.0]}))])
+    db._async_client = Mock()
+    db._async_client.query_points = AsyncMock(return_value=Mock(points=[]))
+    mock_embedder.async_get_embeddings_and_usage = AsyncMock(return_value=([[0.1] * 1024], [None]))
+
+    assert await db.async_search("test query", limit=1) == []
+    mock_embedder.async_get_embeddings_and_usage.assert_awaited_once_with(["test query"])
+    mock_embedder.get_embedding.assert_not_called()